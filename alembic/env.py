@@ -5,6 +5,7 @@ from sqlalchemy import pool
 from app.shared.infrastructure.database.base import Base
 from app.modules.auth.infrastructure.models.user_model import UserModel
 from app.modules.customer.infrastructure.models.customer_model import CustomerModel
+from app.modules.customer.infrastructure.models.customer_counter_model import CustomerCounterModel
 
 from alembic import context
 
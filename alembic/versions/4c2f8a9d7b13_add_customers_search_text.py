@@ -0,0 +1,55 @@
+"""add customers search_text
+
+Revision ID: 4c2f8a9d7b13
+Revises: e1b11f29aa54
+Create Date: 2026-10-17 11:03:27.514902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c2f8a9d7b13'
+down_revision: Union[str, Sequence[str], None] = 'e1b11f29aa54'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.execute('CREATE EXTENSION IF NOT EXISTS unaccent')
+
+    op.add_column(
+        'customers',
+        sa.Column('search_text', sa.Text(), server_default='', nullable=False),
+    )
+
+    # Backfill único; a partir daqui a aplicação mantém a coluna na escrita
+    # (build_search_text aplica a mesma normalização em Python)
+    op.execute(
+        """
+        UPDATE customers
+           SET search_text = lower(unaccent(
+                   regexp_replace(trim(name || ' ' || email), '\\s+', ' ', 'g')
+               ))
+        """
+    )
+
+    op.create_index(
+        'ix_customers_search_text_trgm',
+        'customers',
+        ['search_text'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'search_text': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_customers_search_text_trgm', table_name='customers')
+    op.drop_column('customers', 'search_text')
@@ -0,0 +1,105 @@
+"""add customer counters
+
+Revision ID: 9a3d5e71c0b8
+Revises: 4c2f8a9d7b13
+Create Date: 2026-10-17 14:21:09.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a3d5e71c0b8'
+down_revision: Union[str, Sequence[str], None] = '4c2f8a9d7b13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Triggers de statement com transition tables: um UPDATE por comando
+# (e não por linha), então imports em lote custam o mesmo que um INSERT.
+# Só as linhas cujo saldo muda são tocadas, reduzindo contenção.
+APPLY_FUNCTION = """
+CREATE OR REPLACE FUNCTION customer_counters_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE customer_counters c
+           SET total = c.total + d.n
+          FROM (SELECT is_active, count(*) AS n FROM new_rows GROUP BY is_active) d
+         WHERE c.is_active = d.is_active;
+
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE customer_counters c
+           SET total = c.total - d.n
+          FROM (SELECT is_active, count(*) AS n FROM old_rows GROUP BY is_active) d
+         WHERE c.is_active = d.is_active;
+
+    ELSE
+        UPDATE customer_counters c
+           SET total = c.total + d.n
+          FROM (
+                SELECT is_active, sum(n) AS n
+                  FROM (
+                        SELECT is_active, 1 AS n FROM new_rows
+                        UNION ALL
+                        SELECT is_active, -1 AS n FROM old_rows
+                  ) delta
+                 GROUP BY is_active
+                HAVING sum(n) <> 0
+          ) d
+         WHERE c.is_active = d.is_active;
+    END IF;
+
+    RETURN NULL;
+END;
+$$
+"""
+
+TRIGGERS = {
+    'customer_counters_insert': 'AFTER INSERT ON customers REFERENCING NEW TABLE AS new_rows',
+    'customer_counters_delete': 'AFTER DELETE ON customers REFERENCING OLD TABLE AS old_rows',
+    'customer_counters_update': (
+        'AFTER UPDATE ON customers REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows'
+    ),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'customer_counters',
+        sa.Column('is_active', sa.Boolean(), nullable=False),
+        sa.Column('total', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('is_active'),
+    )
+
+    # Carga inicial a partir dos dados existentes
+    op.execute(
+        """
+        INSERT INTO customer_counters (is_active, total)
+        SELECT s.is_active, count(c.id)
+          FROM (VALUES (true), (false)) AS s(is_active)
+          LEFT JOIN customers c ON c.is_active = s.is_active
+         GROUP BY s.is_active
+        """
+    )
+
+    op.execute(APPLY_FUNCTION)
+
+    for name, definition in TRIGGERS.items():
+        op.execute(
+            f'CREATE TRIGGER {name} {definition} '
+            'FOR EACH STATEMENT EXECUTE FUNCTION customer_counters_apply()'
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name in TRIGGERS:
+        op.execute(f'DROP TRIGGER IF EXISTS {name} ON customers')
+
+    op.execute('DROP FUNCTION IF EXISTS customer_counters_apply()')
+    op.drop_table('customer_counters')
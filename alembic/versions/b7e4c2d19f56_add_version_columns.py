@@ -0,0 +1,38 @@
+"""add version columns
+
+Revision ID: b7e4c2d19f56
+Revises: 9a3d5e71c0b8
+Create Date: 2026-10-17 15:02:44.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4c2d19f56'
+down_revision: Union[str, Sequence[str], None] = '9a3d5e71c0b8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Versão para lock otimista (UPDATE ... WHERE version = :lida).
+# O server_default preenche as linhas existentes sem reescrever a tabela.
+TABLES = ('customers', 'users')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.add_column(
+            table,
+            sa.Column('version', sa.Integer(), server_default='1', nullable=False),
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.drop_column(table, 'version')
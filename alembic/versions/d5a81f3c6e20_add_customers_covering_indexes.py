@@ -0,0 +1,74 @@
+"""add customers covering indexes
+
+Revision ID: d5a81f3c6e20
+Revises: b7e4c2d19f56
+Create Date: 2026-10-17 15:48:27.530914
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5a81f3c6e20'
+down_revision: Union[str, Sequence[str], None] = 'b7e4c2d19f56'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Índices da listagem com todas as colunas do CustomerSummary (chave ou
+# INCLUDE): as páginas saem de index-only scans, sem sort e sem heap.
+# (nome, colunas-chave, INCLUDE, predicado parcial)
+INDEXES = (
+    # Sem filtro de status — substituem os índices keyset (coluna, id)
+    ('ix_customers_name_id_covering', ['name', 'id'],
+     ['email', 'phone', 'is_active', 'created_at'], None),
+    ('ix_customers_created_at_id_covering', ['created_at', 'id'],
+     ['name', 'email', 'phone', 'is_active'], None),
+    # Filtro de status + ordem por nome (ativos e inativos)
+    ('ix_customers_is_active_name_id', ['is_active', 'name', 'id'],
+     ['email', 'phone', 'created_at'], None),
+    # Ativos por data de cadastro (parcial: só a fração ativa da tabela)
+    ('ix_customers_active_created_at_id', ['created_at', 'id'],
+     ['name', 'email', 'phone', 'is_active'], 'is_active'),
+)
+
+# Índices keyset antigos, cobertos pelos *_covering
+REPLACED = (
+    ('ix_customers_name_id', ['name', 'id']),
+    ('ix_customers_created_at_id', ['created_at', 'id']),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY não roda dentro de transação nem bloqueia escritas
+    with op.get_context().autocommit_block():
+        for name, columns, include, where in INDEXES:
+            # Um build CONCURRENTLY interrompido deixa o índice INVALID
+            op.drop_index(name, table_name='customers', if_exists=True, postgresql_concurrently=True)
+            op.create_index(
+                name,
+                'customers',
+                columns,
+                unique=False,
+                postgresql_include=include,
+                postgresql_where=sa.text(where) if where else None,
+                postgresql_concurrently=True,
+            )
+
+        for name, _ in REPLACED:
+            op.drop_index(name, table_name='customers', if_exists=True, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, columns in REPLACED:
+            op.drop_index(name, table_name='customers', if_exists=True, postgresql_concurrently=True)
+            op.create_index(name, 'customers', columns, unique=False, postgresql_concurrently=True)
+
+        for name, *_ in reversed(INDEXES):
+            op.drop_index(name, table_name='customers', if_exists=True, postgresql_concurrently=True)
@@ -0,0 +1,31 @@
+"""add customers keyset indexes
+
+Revision ID: e1b11f29aa54
+Revises: 79e38e0f0372
+Create Date: 2026-10-17 10:12:40.218311
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1b11f29aa54'
+down_revision: Union[str, Sequence[str], None] = '79e38e0f0372'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Um índice (coluna, id) para cada ordenação da listagem keyset
+    op.create_index('ix_customers_name_id', 'customers', ['name', 'id'], unique=False)
+    op.create_index('ix_customers_created_at_id', 'customers', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_customers_created_at_id', table_name='customers')
+    op.drop_index('ix_customers_name_id', table_name='customers')
@@ -0,0 +1,147 @@
+"""shard customer counters
+
+Revision ID: f3b9d2a6c481
+Revises: d5a81f3c6e20
+Create Date: 2026-10-17 18:05:42.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3b9d2a6c481'
+down_revision: Union[str, Sequence[str], None] = 'd5a81f3c6e20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Com uma linha por status, todo INSERT/DELETE/troca de status travava
+# essa linha até o commit e as escritas concorrentes (lotes do import
+# inclusive) entravam em fila. Agora cada status tem SLOTS linhas e cada
+# conexão escreve na sua (pg_backend_pid() % SLOTS); a leitura soma as
+# linhas. Um slot pode ficar negativo (insere num, apaga noutro) — só a
+# soma tem significado.
+SLOTS = 16
+
+APPLY_FUNCTION = f"""
+CREATE OR REPLACE FUNCTION customer_counters_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+DECLARE
+    my_slot smallint := pg_backend_pid() % {SLOTS};
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE customer_counters c
+           SET total = c.total + d.n
+          FROM (SELECT is_active, count(*) AS n FROM new_rows GROUP BY is_active) d
+         WHERE c.is_active = d.is_active AND c.slot = my_slot;
+
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE customer_counters c
+           SET total = c.total - d.n
+          FROM (SELECT is_active, count(*) AS n FROM old_rows GROUP BY is_active) d
+         WHERE c.is_active = d.is_active AND c.slot = my_slot;
+
+    ELSE
+        UPDATE customer_counters c
+           SET total = c.total + d.n
+          FROM (
+                SELECT is_active, sum(n) AS n
+                  FROM (
+                        SELECT is_active, 1 AS n FROM new_rows
+                        UNION ALL
+                        SELECT is_active, -1 AS n FROM old_rows
+                  ) delta
+                 GROUP BY is_active
+                HAVING sum(n) <> 0
+          ) d
+         WHERE c.is_active = d.is_active AND c.slot = my_slot;
+    END IF;
+
+    RETURN NULL;
+END;
+$$
+"""
+
+# Versão anterior (uma linha por status), para o downgrade
+UNSHARDED_APPLY_FUNCTION = """
+CREATE OR REPLACE FUNCTION customer_counters_apply() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE customer_counters c
+           SET total = c.total + d.n
+          FROM (SELECT is_active, count(*) AS n FROM new_rows GROUP BY is_active) d
+         WHERE c.is_active = d.is_active;
+
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE customer_counters c
+           SET total = c.total - d.n
+          FROM (SELECT is_active, count(*) AS n FROM old_rows GROUP BY is_active) d
+         WHERE c.is_active = d.is_active;
+
+    ELSE
+        UPDATE customer_counters c
+           SET total = c.total + d.n
+          FROM (
+                SELECT is_active, sum(n) AS n
+                  FROM (
+                        SELECT is_active, 1 AS n FROM new_rows
+                        UNION ALL
+                        SELECT is_active, -1 AS n FROM old_rows
+                  ) delta
+                 GROUP BY is_active
+                HAVING sum(n) <> 0
+          ) d
+         WHERE c.is_active = d.is_active;
+    END IF;
+
+    RETURN NULL;
+END;
+$$
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Os totais atuais ficam no slot 0
+    op.add_column(
+        'customer_counters',
+        sa.Column('slot', sa.SmallInteger(), nullable=False, server_default='0'),
+    )
+    op.alter_column('customer_counters', 'slot', server_default=None)
+    op.drop_constraint('customer_counters_pkey', 'customer_counters', type_='primary')
+    op.create_primary_key('customer_counters_pkey', 'customer_counters', ['is_active', 'slot'])
+
+    op.execute(
+        f"""
+        INSERT INTO customer_counters (is_active, slot, total)
+        SELECT s.is_active, g.slot, 0
+          FROM (VALUES (true), (false)) AS s(is_active)
+         CROSS JOIN generate_series(1, {SLOTS - 1}) AS g(slot)
+        """
+    )
+
+    # Os triggers já chamam a função; basta trocá-la
+    op.execute(APPLY_FUNCTION)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(UNSHARDED_APPLY_FUNCTION)
+
+    op.execute(
+        """
+        UPDATE customer_counters c
+           SET total = s.total
+          FROM (SELECT is_active, sum(total) AS total FROM customer_counters GROUP BY is_active) s
+         WHERE c.is_active = s.is_active AND c.slot = 0
+        """
+    )
+    op.execute('DELETE FROM customer_counters WHERE slot <> 0')
+
+    op.drop_constraint('customer_counters_pkey', 'customer_counters', type_='primary')
+    op.create_primary_key('customer_counters_pkey', 'customer_counters', ['is_active'])
+    op.drop_column('customer_counters', 'slot')
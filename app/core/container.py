@@ -0,0 +1,224 @@
+import asyncio
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+import httpx
+from fastapi import Request
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.infra.email.email_outbox_worker import EmailOutboxWorker
+from app.infra.email.logging_email_outbox import LoggingEmailOutbox
+from app.infra.email.smtp_sender import SmtpSender
+from app.infra.redis.email_outbox import RedisEmailOutbox
+from app.infra.redis.redis_client import create_redis_client
+from app.infra.redis.session_repository import RedisSessionRepository
+from app.modules.auth.application.services.email_outbox import EmailOutbox
+from app.modules.auth.application.services.google_token_verifier import GoogleTokenVerifier
+from app.modules.auth.application.services.jwt_service import JwtService
+from app.modules.auth.domain.repositories.session_repository import SessionRepository
+from app.modules.auth.infrastructure.cache.revoked_token_filter import RevokedTokenFilter
+from app.modules.auth.infrastructure.cache.session_epoch_cache import SessionEpochCache
+from app.modules.auth.infrastructure.cache.user_cache import UserCache
+from app.modules.auth.infrastructure.repositories.google_token_verifier_impl import GoogleTokenVerifierImpl
+from app.modules.auth.infrastructure.repositories.jwt_service_impl import JwtServiceImpl
+from app.modules.auth.infrastructure.security.google_cert_cache import GoogleCertCache
+from app.modules.auth.infrastructure.security.jwt_handler import JWTHandler
+from app.modules.auth.infrastructure.security.password_hasher import PasswordHasher
+from app.modules.auth.infrastructure.security.password_hashing_executor import PasswordHashingExecutor
+from app.modules.auth.infrastructure.security.verified_token_cache import VerifiedTokenCache
+from app.shared.infrastructure.database.routing import ReplicaRouter
+from app.shared.infrastructure.database.session import (
+    create_engine,
+    create_replica_router,
+    make_session_factory,
+)
+
+
+@dataclass
+class AppContainer:
+    """
+    Singletons da aplicação, criados uma vez por worker no lifespan.
+
+    As dependencies do FastAPI só leem daqui; por requisição sobram
+    apenas a sessão do banco e os objetos que a usam (repositórios e
+    use cases).
+    """
+
+    redis: Redis
+    engine: AsyncEngine
+    replica_router: ReplicaRouter
+    session_factory: async_sessionmaker[AsyncSession]
+    password_hashing: PasswordHashingExecutor
+    verified_tokens: VerifiedTokenCache
+    jwt_handler: JWTHandler
+    session_epoch_cache: SessionEpochCache
+    revoked_token_filter: RevokedTokenFilter
+    session_repository: SessionRepository
+    jwt_service: JwtService
+    user_cache: UserCache
+    google_http: httpx.AsyncClient
+    google_cert_cache: GoogleCertCache
+    google_token_verifier: GoogleTokenVerifier
+    email_outbox: EmailOutbox
+    email_worker: Optional[EmailOutboxWorker] = None
+
+    _tasks: List[asyncio.Task] = field(default_factory=list)
+
+    @classmethod
+    async def create(cls) -> "AppContainer":
+        """Monta os singletons e inicia caches e tarefas de fundo."""
+        # Um pool de conexões assíncronas por worker, compartilhado por todo o acesso ao Redis
+        redis = create_redis_client()
+
+        # Banco: engine primária, réplicas de leitura e a session factory que roteia entre elas
+        engine = create_engine(settings.DATABASE_URL)
+        replica_router = create_replica_router()
+        session_factory = make_session_factory(engine, replica_router)
+
+        # Custo do hash calibrado para este hardware (opcional; leva ~1s)
+        if settings.PASSWORD_HASH_CALIBRATE:
+            password_hasher = await asyncio.to_thread(PasswordHasher.calibrated)
+        else:
+            password_hasher = PasswordHasher()
+        print(f"Hash de senha: {password_hasher.scheme}, custo {password_hasher.cost}")
+
+        # Hash de senha fora do event loop, com fila limitada (cheia → 503)
+        password_hashing = PasswordHashingExecutor(
+            password_hasher,
+            workers=settings.PASSWORD_HASH_WORKERS,
+            max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+        )
+
+        # Época de sessão por usuário, em memória; atualizada via pub/sub
+        session_epoch_cache = SessionEpochCache(
+            redis,
+            ttl_seconds=settings.SESSION_EPOCH_CACHE_TTL_SECONDS,
+            maxsize=settings.SESSION_EPOCH_CACHE_MAX_SIZE,
+        )
+
+        # Access tokens revogados: filtro de Bloom local, Redis só em provável positivo.
+        # Reconstruído a cada vida útil de um access token (descarta os já expirados).
+        revoked_token_filter = RevokedTokenFilter(
+            redis,
+            capacity=settings.REVOKED_TOKEN_FILTER_CAPACITY,
+            fp_rate=settings.REVOKED_TOKEN_FILTER_FP_RATE,
+            rebuild_interval=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        )
+
+        # Scripts Lua registrados uma vez, não a cada requisição
+        session_repository = RedisSessionRepository(redis, session_epoch_cache, revoked_token_filter)
+
+        # Tokens já verificados (assinatura + claims), por worker
+        verified_tokens = VerifiedTokenCache(maxsize=settings.JWT_VERIFIED_CACHE_SIZE)
+        jwt_handler = JWTHandler(verified_tokens)
+
+        # Usuário autenticado em memória; invalidado entre workers via pub/sub.
+        # Um usuário recém-alterado só volta ao cache após o lag máximo das
+        # réplicas (ou 1s, para leituras que já estavam em andamento).
+        user_cache = UserCache(
+            redis,
+            ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+            maxsize=settings.USER_CACHE_MAX_SIZE,
+            refill_delay=settings.DATABASE_REPLICA_MAX_LAG_SECONDS if replica_router.replicas else 1.0,
+        )
+
+        # Certificados do Google em memória, renovados antes do max-age expirar;
+        # o cliente HTTP mantém as conexões abertas entre renovações
+        google_http = httpx.AsyncClient(timeout=settings.GOOGLE_CERTS_HTTP_TIMEOUT_SECONDS)
+        google_cert_cache = GoogleCertCache(
+            google_http,
+            certs_url=settings.GOOGLE_CERTS_URL,
+            refresh_margin=settings.GOOGLE_CERTS_REFRESH_MARGIN_SECONDS,
+        )
+
+        # Outbox de emails: as rotas só enfileiram; o envio SMTP roda aqui, em lotes.
+        # Sem SMTP não há quem entregue: os emails vão para o log, não para o Redis.
+        email_outbox: EmailOutbox = LoggingEmailOutbox()
+        email_worker = None
+        if settings.SMTP_HOST:
+            email_outbox = RedisEmailOutbox(redis, maxlen=settings.EMAIL_OUTBOX_MAX_LEN)
+            email_worker = EmailOutboxWorker(
+                redis,
+                SmtpSender(
+                    settings.SMTP_HOST,
+                    settings.SMTP_PORT,
+                    sender=settings.EMAIL_FROM,
+                    username=settings.SMTP_USERNAME,
+                    password=settings.SMTP_PASSWORD,
+                    starttls=settings.SMTP_STARTTLS,
+                    use_ssl=settings.SMTP_USE_SSL,
+                    timeout=settings.SMTP_TIMEOUT_SECONDS,
+                    idle_timeout=settings.SMTP_IDLE_TIMEOUT_SECONDS,
+                ),
+                batch_size=settings.EMAIL_BATCH_SIZE,
+                retry_after=settings.EMAIL_RETRY_AFTER_SECONDS,
+                max_attempts=settings.EMAIL_MAX_ATTEMPTS,
+                dead_letter_maxlen=settings.EMAIL_DEAD_LETTER_MAX_LEN,
+                dead_letter_retention=settings.EMAIL_DEAD_LETTER_RETENTION_SECONDS,
+            )
+        else:
+            print("SMTP_HOST não configurado: emails serão escritos no log, não enviados")
+
+        container = cls(
+            redis=redis,
+            engine=engine,
+            replica_router=replica_router,
+            session_factory=session_factory,
+            password_hashing=password_hashing,
+            verified_tokens=verified_tokens,
+            jwt_handler=jwt_handler,
+            session_epoch_cache=session_epoch_cache,
+            revoked_token_filter=revoked_token_filter,
+            session_repository=session_repository,
+            jwt_service=JwtServiceImpl(jwt_handler, session_repository),
+            user_cache=user_cache,
+            google_http=google_http,
+            google_cert_cache=google_cert_cache,
+            google_token_verifier=GoogleTokenVerifierImpl(google_cert_cache),
+            email_outbox=email_outbox,
+            email_worker=email_worker,
+        )
+        await container._start()
+        return container
+
+    async def _start(self) -> None:
+        await self.session_epoch_cache.start()
+        await self.revoked_token_filter.start()
+        await self.user_cache.start()
+
+        self._tasks.append(asyncio.create_task(self.revoked_token_filter.maintain()))
+        self._tasks.append(asyncio.create_task(self.google_cert_cache.maintain()))
+        if self.email_worker:
+            self._tasks.append(asyncio.create_task(self.email_worker.run()))
+
+        # Monitora o atraso das réplicas de leitura (se configuradas)
+        if self.replica_router.replicas:
+            self._tasks.append(asyncio.create_task(
+                self.replica_router.monitor(settings.DATABASE_REPLICA_CHECK_INTERVAL_SECONDS)
+            ))
+
+    async def aclose(self) -> None:
+        """Para as tarefas e libera conexões (banco, Redis, HTTP)."""
+        await self.user_cache.stop()
+        await self.session_epoch_cache.stop()
+
+        for task in self._tasks:
+            task.cancel()
+        # espera o worker de email fechar a conexão SMTP
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+        await self.revoked_token_filter.stop()
+        self.password_hashing.shutdown()
+        await self.google_http.aclose()
+
+        await self.replica_router.dispose()
+        await self.engine.dispose()
+        await self.redis.aclose()
+
+
+def get_container(request: Request) -> AppContainer:
+    # Criado no lifespan (um por worker)
+    return request.app.state.container
@@ -7,6 +7,13 @@ class RedisSettings(BaseSettings):
     db: int = 0
     password: str | None = None
 
+    # Pool de conexões do cliente asyncio (um por worker); cada assinatura
+    # de canal (caches em memória) ocupa uma conexão do pool
+    max_connections: int = 50
+    socket_timeout: float = 2.0
+    socket_connect_timeout: float = 2.0
+    health_check_interval: int = 30
+
     model_config = SettingsConfigDict(
         env_prefix="REDIS_",
         env_file=".env",
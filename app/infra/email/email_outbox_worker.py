@@ -0,0 +1,179 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+from typing import Dict, List, Tuple
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError, ResponseError
+
+from app.infra.email.smtp_sender import SmtpSender, is_permanent_failure
+from app.infra.redis.email_outbox import (
+    EMAIL_DEAD_LETTER_STREAM,
+    EMAIL_OUTBOX_GROUP,
+    EMAIL_OUTBOX_STREAM,
+)
+from app.modules.auth.application.services.email_outbox import EmailMessage
+
+logger = logging.getLogger(__name__)
+
+Entry = Tuple[str, Dict[str, str]]
+
+
+class EmailOutboxWorker:
+    """
+    Esvazia o outbox de emails em segundo plano (uma task por worker).
+
+    - Lê lotes de até `batch_size` do stream pelo consumer group (vários
+      workers dividem a fila) e envia cada lote pela mesma conexão SMTP.
+    - Enviado: XACK + XDEL. Falha temporária: a mensagem fica pendente e
+      é retomada (XAUTOCLAIM) após `retry_after` segundos, por este ou
+      outro worker — inclusive se o worker morrer no meio do envio.
+    - Recusa definitiva (5xx) ou `max_attempts` esgotadas: vai para o
+      stream de dead letter, com o último erro. Ele guarda no máximo
+      ~`dead_letter_maxlen` entradas dos últimos `dead_letter_retention`
+      segundos (os corpos podem ter links de reset).
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        sender: SmtpSender,
+        batch_size: int = 50,
+        retry_after: float = 60.0,
+        max_attempts: int = 5,
+        block_ms: int = 1000,
+        stream: str = EMAIL_OUTBOX_STREAM,
+        group: str = EMAIL_OUTBOX_GROUP,
+        dead_letter_stream: str = EMAIL_DEAD_LETTER_STREAM,
+        dead_letter_maxlen: int = 1_000,
+        dead_letter_retention: float = 86_400.0,
+    ):
+        self._redis = redis
+        self._sender = sender
+        self._batch_size = batch_size
+        self._retry_after_ms = int(retry_after * 1000)
+        self._max_attempts = max_attempts
+        self._block_ms = block_ms
+        self._stream = stream
+        self._group = group
+        self._dead_letter_stream = dead_letter_stream
+        self._dead_letter_maxlen = dead_letter_maxlen
+        self._dead_letter_retention_ms = int(dead_letter_retention * 1000)
+        self._consumer = f"{socket.gethostname()}-{os.getpid()}"
+
+        self.sent = 0
+        self.retried = 0
+        self.dead_lettered = 0
+
+    async def run(self) -> None:
+        """Loop do worker (rodar como task no lifespan)."""
+        while True:
+            try:
+                await self._ensure_group()
+                break
+            except RedisError:
+                logger.warning("Outbox de emails: Redis indisponível; tentando de novo")
+                await asyncio.sleep(1.0)
+
+        try:
+            while True:
+                try:
+                    entries = await self._next_batch()
+                    if entries:
+                        await self._process(entries)
+                except RedisError:
+                    logger.warning("Outbox de emails: falha no Redis", exc_info=True)
+                    await asyncio.sleep(1.0)
+        finally:
+            await asyncio.to_thread(self._sender.close)
+
+    async def _ensure_group(self) -> None:
+        try:
+            await self._redis.xgroup_create(self._stream, self._group, id="0", mkstream=True)
+        except ResponseError as exc:
+            if "BUSYGROUP" not in str(exc):
+                raise
+
+    async def _next_batch(self) -> List[Entry]:
+        # Pendentes há mais de `retry_after` (falharam ou o worker morreu) primeiro
+        claimed = await self._redis.xautoclaim(
+            self._stream,
+            self._group,
+            self._consumer,
+            min_idle_time=self._retry_after_ms,
+            start_id="0-0",
+            count=self._batch_size,
+        )
+        entries = [entry for entry in claimed[1] if entry[1]]
+
+        if len(entries) < self._batch_size:
+            response = await self._redis.xreadgroup(
+                self._group,
+                self._consumer,
+                {self._stream: ">"},
+                count=self._batch_size - len(entries),
+                block=None if entries else self._block_ms,
+            )
+            for _, stream_entries in response or []:
+                entries.extend(stream_entries)
+
+        return entries
+
+    async def _process(self, entries: List[Entry]) -> None:
+        valid = []
+        dead = []
+
+        for entry_id, fields in entries:
+            try:
+                valid.append((entry_id, fields, EmailMessage(fields["to"], fields["subject"], fields["body"])))
+            except KeyError:
+                dead.append((entry_id, fields, "mensagem malformada"))
+
+        results = []
+        if valid:
+            results = await asyncio.to_thread(self._sender.send_batch, [message for _, _, message in valid])
+
+        delivered = []
+        for (entry_id, fields, _), error in zip(valid, results):
+            if error is None:
+                delivered.append(entry_id)
+            elif is_permanent_failure(error) or await self._attempts(entry_id) >= self._max_attempts:
+                dead.append((entry_id, fields, repr(error)))
+            else:
+                self.retried += 1
+                logger.info("Email %s falhou (%r); nova tentativa em breve", entry_id, error)
+
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for entry_id, fields, error in dead:
+                pipe.xadd(
+                    self._dead_letter_stream,
+                    {**fields, "error": error, "entry_id": entry_id},
+                    maxlen=self._dead_letter_maxlen,
+                    approximate=True,
+                )
+            if dead:
+                # Retenção por idade (ids do stream começam pelo horário em ms)
+                cutoff_ms = int(time.time() * 1000) - self._dead_letter_retention_ms
+                pipe.xtrim(self._dead_letter_stream, minid=cutoff_ms, approximate=False)
+
+            done = delivered + [entry_id for entry_id, _, _ in dead]
+            if done:
+                pipe.xack(self._stream, self._group, *done)
+                pipe.xdel(self._stream, *done)
+                await pipe.execute()
+
+        self.sent += len(delivered)
+        self.dead_lettered += len(dead)
+        for entry_id, _, error in dead:
+            logger.error("Email %s descartado para o dead letter: %s", entry_id, error)
+
+    async def _attempts(self, entry_id: str) -> int:
+        pending = await self._redis.xpending_range(
+            self._stream, self._group, min=entry_id, max=entry_id, count=1
+        )
+        return pending[0]["times_delivered"] if pending else self._max_attempts
+
+    def stats(self) -> Dict[str, int]:
+        return {"sent": self.sent, "retried": self.retried, "dead_lettered": self.dead_lettered}
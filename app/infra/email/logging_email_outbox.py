@@ -0,0 +1,22 @@
+import logging
+
+from app.modules.auth.application.services.email_outbox import EmailMessage, EmailOutbox
+
+logger = logging.getLogger(__name__)
+
+
+class LoggingEmailOutbox(EmailOutbox):
+    """
+    Outbox para ambientes sem SMTP (desenvolvimento): escreve o email no log.
+
+    Nada vai para o Redis — sem worker para entregar, a mensagem (e o
+    link de reset dentro dela) ficaria lá sem prazo.
+    """
+
+    async def enqueue(self, message: EmailMessage) -> None:
+        logger.warning(
+            "SMTP não configurado; email não enviado.\nPara: %s\nAssunto: %s\n\n%s",
+            message.to,
+            message.subject,
+            message.body,
+        )
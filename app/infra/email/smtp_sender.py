@@ -0,0 +1,123 @@
+import logging
+import smtplib
+from email.message import EmailMessage as MimeMessage
+from time import monotonic
+from typing import List, Optional, Sequence
+
+from app.modules.auth.application.services.email_outbox import EmailMessage
+
+logger = logging.getLogger(__name__)
+
+
+def is_permanent_failure(exc: Exception) -> bool:
+    """Recusas 5xx (destinatário inválido etc.) não adiantam tentar de novo."""
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in exc.recipients.values())
+    if isinstance(exc, smtplib.SMTPResponseException):
+        return exc.smtp_code >= 500
+    return False
+
+
+class SmtpSender:
+    """
+    Envia lotes de emails por uma conexão SMTP reaproveitada.
+
+    A conexão fica aberta entre lotes e é renovada depois de
+    `idle_timeout` segundos sem uso (antes que o servidor a derrube).
+    Se cair no meio do lote, reconecta uma vez e reenvia a mensagem
+    atual — a entrega é "pelo menos uma vez".
+
+    Síncrono (smtplib): o worker chama `send_batch` numa thread.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        sender: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        starttls: bool = False,
+        use_ssl: bool = False,
+        timeout: float = 10.0,
+        idle_timeout: float = 60.0,
+    ):
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.use_ssl = use_ssl
+        self.timeout = timeout
+        self.idle_timeout = idle_timeout
+
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+        self.connections = 0
+
+    def send_batch(self, messages: Sequence[EmailMessage]) -> List[Optional[Exception]]:
+        """Envia na ordem; para cada mensagem, None (enviada) ou o erro."""
+        results: List[Optional[Exception]] = []
+
+        for index, message in enumerate(messages):
+            try:
+                self._send(self._to_mime(message))
+                results.append(None)
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPResponseException) as exc:
+                results.append(exc)
+            except (smtplib.SMTPException, OSError) as exc:
+                # servidor inacessível: o resto do lote fica para a próxima tentativa
+                self.close()
+                results.extend([exc] * (len(messages) - index))
+                break
+
+        return results
+
+    def _send(self, mime: MimeMessage) -> None:
+        try:
+            self._connection().send_message(mime)
+        except (smtplib.SMTPServerDisconnected, ConnectionError):
+            self.close()
+            self._connection().send_message(mime)
+
+        self._last_used = monotonic()
+
+    def _connection(self) -> smtplib.SMTP:
+        if self._smtp is not None and monotonic() - self._last_used > self.idle_timeout:
+            self.close()
+
+        if self._smtp is None:
+            if self.use_ssl:
+                smtp = smtplib.SMTP_SSL(self.host, self.port, timeout=self.timeout)
+            else:
+                smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+                if self.starttls:
+                    smtp.starttls()
+
+            if self.username:
+                smtp.login(self.username, self.password or "")
+
+            self._smtp = smtp
+            self._last_used = monotonic()
+            self.connections += 1
+
+        return self._smtp
+
+    def _to_mime(self, message: EmailMessage) -> MimeMessage:
+        mime = MimeMessage()
+        mime["From"] = self.sender
+        mime["To"] = message.to
+        mime["Subject"] = message.subject
+        mime.set_content(message.body)
+        return mime
+
+    def close(self) -> None:
+        if self._smtp is None:
+            return
+
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
@@ -0,0 +1,79 @@
+import asyncio
+import logging
+from typing import Callable, Optional
+
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+
+class RedisChannelListener:
+    """
+    Assina um canal do Redis numa task do event loop e repassa cada mensagem.
+
+    Usado pelos caches em memória de cada worker para receber
+    invalidações publicadas pelos demais. Se a conexão cair,
+    `on_reset` é chamado (mensagens podem ter se perdido) e o pub/sub
+    reconecta e reassina o canal sozinho na leitura seguinte.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        channel: str,
+        on_message: Callable[[str], None],
+        on_reset: Callable[[], None],
+    ):
+        self._redis = redis
+        self._channel = channel
+        self._on_message = on_message
+        self._on_reset = on_reset
+        self._pubsub: Optional[PubSub] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def active(self) -> bool:
+        return self._task is not None
+
+    async def start(self) -> bool:
+        """Inicia a assinatura; False se o Redis não estiver acessível."""
+        pubsub = self._redis.pubsub(ignore_subscribe_messages=True)
+
+        try:
+            await pubsub.subscribe(self._channel)
+        except RedisError:
+            logger.exception("Falha ao assinar o canal %s", self._channel)
+            await pubsub.aclose()
+            return False
+
+        self._pubsub = pubsub
+        self._task = asyncio.create_task(self._run(pubsub))
+        return True
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        if self._pubsub is not None:
+            await self._pubsub.aclose()
+            self._pubsub = None
+
+    async def _run(self, pubsub: PubSub) -> None:
+        while True:
+            try:
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            except (RedisError, OSError) as exc:
+                logger.warning("Conexão do canal %s perdida (%r)", self._channel, exc)
+                self._on_reset()
+                await asyncio.sleep(1.0)
+                continue
+
+            if message is not None and message.get("data"):
+                self._on_message(message["data"])
@@ -1,16 +1,7 @@
-from redis import Redis
-from fastapi import Depends
+from fastapi import Request
+from redis.asyncio import Redis
 
-from app.infra.redis.redis_client import RedisClient
-from app.infra.redis.session_repository import RedisSessionRepository
-from app.modules.auth.domain.repositories.session_repository import SessionRepository
 
-
-def get_redis() -> Redis:
-    return RedisClient.get_client()
-
-
-def get_session_repository_dep(
-    redis: Redis = Depends(get_redis),
-) -> SessionRepository:
-    return RedisSessionRepository(redis)
+async def get_redis(request: Request) -> Redis:
+    # Cliente (e pool) do container criado no lifespan
+    return request.app.state.container.redis
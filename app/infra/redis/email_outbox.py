@@ -0,0 +1,40 @@
+import time
+
+from redis.asyncio import Redis
+
+from app.modules.auth.application.services.email_outbox import EmailMessage, EmailOutbox
+
+# Stream com os emails a enviar; lido pelo EmailOutboxWorker via consumer group.
+# Entregues e descartados são removidos (XDEL): o stream só guarda pendências.
+EMAIL_OUTBOX_STREAM = "email:outbox"
+EMAIL_OUTBOX_GROUP = "email-workers"
+# Emails que esgotaram as tentativas (ou foram recusados pelo servidor)
+EMAIL_DEAD_LETTER_STREAM = "email:dead"
+
+
+class RedisEmailOutbox(EmailOutbox):
+    """
+    Enfileira emails com um único XADD.
+
+    O stream é limitado a ~`maxlen` entradas (MAXLEN ~): se os workers
+    ficarem parados, os emails mais antigos — links de reset que já
+    expiraram, em geral — saem da fila em vez de ela crescer sem fim.
+    """
+
+    def __init__(self, redis: Redis, stream: str = EMAIL_OUTBOX_STREAM, maxlen: int = 10_000):
+        self.redis = redis
+        self.stream = stream
+        self.maxlen = maxlen
+
+    async def enqueue(self, message: EmailMessage) -> None:
+        await self.redis.xadd(
+            self.stream,
+            {
+                "to": message.to,
+                "subject": message.subject,
+                "body": message.body,
+                "queued_at": f"{time.time():.3f}",
+            },
+            maxlen=self.maxlen,
+            approximate=True,
+        )
@@ -1,21 +1,25 @@
-import redis
-from redis import Redis
+from redis.asyncio import ConnectionPool, Redis
 
 from app.core.redis_settings import redis_settings
 
 
-class RedisClient:
-    _client: Redis | None = None
+def create_redis_client() -> Redis:
+    """
+    Cliente redis.asyncio com pool de conexões próprio.
 
-    @classmethod
-    def get_client(cls) -> Redis:
-        if cls._client is None:
-            cls._client = redis.Redis(
-                host=redis_settings.host,
-                port=redis_settings.port,
-                db=redis_settings.db,
-                password=redis_settings.password,
-                decode_responses=True,
-            )
+    Criado uma vez por worker no lifespan (AppContainer.redis) e fechado
+    no shutdown com `await client.aclose()`, que também fecha o pool.
+    """
+    pool = ConnectionPool(
+        host=redis_settings.host,
+        port=redis_settings.port,
+        db=redis_settings.db,
+        password=redis_settings.password,
+        max_connections=redis_settings.max_connections,
+        socket_timeout=redis_settings.socket_timeout,
+        socket_connect_timeout=redis_settings.socket_connect_timeout,
+        health_check_interval=redis_settings.health_check_interval,
+        decode_responses=True,
+    )
 
-        return cls._client
+    return Redis.from_pool(pool)
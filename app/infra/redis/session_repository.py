@@ -1,69 +1,348 @@
 from datetime import datetime, timezone
-from redis import Redis
+from typing import List, Optional
 
-from app.modules.auth.domain.repositories.session_repository import SessionRepository
+from redis.asyncio import Redis
+from redis.commands.core import AsyncScript
+from redis.exceptions import ResponseError
+
+from app.core.config import settings
+from app.modules.auth.domain.read_models.session_info import SessionInfo
+
+from app.modules.auth.domain.repositories.session_repository import (
+    RefreshRotation,
+    SessionRepository,
+)
+from app.modules.auth.infrastructure.cache.revoked_token_filter import (
+    REVOKED_TOKEN_CHANNEL,
+    REVOKED_TOKEN_INDEX,
+    REVOKED_TOKEN_KEY,
+    RevokedTokenFilter,
+)
+from app.modules.auth.infrastructure.cache.session_epoch_cache import (
+    SESSION_EPOCH_CHANNEL,
+    SESSION_EPOCH_KEY,
+    SessionEpochCache,
+)
+
+# Índice de sessões por usuário: ZSET user_sessions:<user> com jti → expiração
+# (unix, s). Expirados saem de forma preguiçosa (ZREMRANGEBYSCORE) a cada
+# acesso; a própria chave expira junto com a última sessão. Os scripts só
+# tocam chaves recebidas em KEYS: o índice é quem diz se um refresh vale,
+# então uma sessão removida pelo limite sai só do índice e o refresh:<jti>
+# que sobra apenas expira. O formato antigo (SET sem expiração) não é lido
+# aqui: o script devolve 'legacy_index' e o cliente o converte com
+# MIGRATE_LEGACY_INDEX_LUA, que recebe as chaves refresh:<jti> explícitas.
+LEGACY_INDEX = "legacy_index"
+
+_SESSION_INDEX_LUA = """
+local function now_seconds()
+    return tonumber(redis.call('TIME')[1])
+end
+
+local function touch_index(index)
+    local last = redis.call('ZRANGE', index, -1, -1, 'WITHSCORES')
+    if last[2] then
+        redis.call('EXPIREAT', index, math.ceil(tonumber(last[2])))
+    end
+end
+
+-- Falso se o índice ainda está no formato antigo
+local function load_index(index, now)
+    if redis.call('TYPE', index).ok == 'set' then
+        return false
+    end
+    redis.call('ZREMRANGEBYSCORE', index, '-inf', now)
+    return true
+end
+
+-- Acima do limite, remove as sessões mais antigas (expiram primeiro)
+local function evict_oldest(index, max_sessions)
+    local excess = redis.call('ZCARD', index) - max_sessions
+    if max_sessions > 0 and excess > 0 then
+        redis.call('ZREMRANGEBYRANK', index, 0, excess - 1)
+    end
+end
+"""
+
+# Converte o índice antigo (SET) em ZSET, com a expiração de cada refresh.
+# KEYS[1] = user_sessions:<user>, KEYS[2..n+1] = refresh:<jti>
+# ARGV[1..n] = os jtis do SET, na mesma ordem
+# Devolve 0 se o SET mudou desde que foi lido (o cliente lê de novo)
+MIGRATE_LEGACY_INDEX_LUA = _SESSION_INDEX_LUA + """
+if redis.call('TYPE', KEYS[1]).ok ~= 'set' then
+    return 1
+end
+if redis.call('SCARD', KEYS[1]) ~= #ARGV then
+    return 0
+end
+for _, jti in ipairs(ARGV) do
+    if redis.call('SISMEMBER', KEYS[1], jti) == 0 then
+        return 0
+    end
+end
+
+local now = now_seconds()
+redis.call('DEL', KEYS[1])
+for i, jti in ipairs(ARGV) do
+    local ttl = redis.call('TTL', KEYS[i + 1])
+    if ttl > 0 then
+        redis.call('ZADD', KEYS[1], now + ttl, jti)
+    end
+end
+touch_index(KEYS[1])
+return 1
+"""
+
+# Grava o refresh token e o indexa, respeitando o limite de sessões.
+# KEYS[1] = user_sessions:<user>, KEYS[2] = refresh:<jti>
+# ARGV[1] = user_id, ARGV[2] = jti, ARGV[3] = TTL (s), ARGV[4] = máx. de sessões
+STORE_REFRESH_TOKEN_LUA = _SESSION_INDEX_LUA + """
+local now = now_seconds()
+if not load_index(KEYS[1], now) then
+    return 'legacy_index'
+end
+
+redis.call('SET', KEYS[2], ARGV[1], 'EX', ARGV[3])
+redis.call('ZADD', KEYS[1], now + tonumber(ARGV[3]), ARGV[2])
+evict_oldest(KEYS[1], tonumber(ARGV[4]))
+touch_index(KEYS[1])
+return 'ok'
+"""
+
+# KEYS[1] = user_sessions:<user>, KEYS[2] = refresh:<jti>; ARGV[1] = jti
+REVOKE_REFRESH_TOKEN_LUA = _SESSION_INDEX_LUA + """
+if not load_index(KEYS[1], now_seconds()) then
+    return 'legacy_index'
+end
+redis.call('DEL', KEYS[2])
+redis.call('ZREM', KEYS[1], ARGV[1])
+return 'ok'
+"""
+
+# Sessões vivas, da mais antiga para a mais nova: {jti, expiração, ...}
+# KEYS[1] = user_sessions:<user>
+LIST_SESSIONS_LUA = _SESSION_INDEX_LUA + """
+if not load_index(KEYS[1], now_seconds()) then
+    return 'legacy_index'
+end
+return redis.call('ZRANGE', KEYS[1], 0, -1, 'WITHSCORES')
+"""
+
+# Revoga todos os refresh tokens do usuário e avança a época de sessão.
+# A rotação exige o jti no índice: apagá-lo revoga todas as sessões
+# (também um índice ainda no formato antigo).
+# KEYS[1] = user_sessions:<user>, KEYS[2] = session_epoch:<user>
+# ARGV[1] = user_id, ARGV[2] = canal de épocas
+_REVOKE_ALL_LUA = _SESSION_INDEX_LUA + """
+local function revoke_all()
+    redis.call('DEL', KEYS[1])
+
+    local epoch = redis.call('INCR', KEYS[2])
+    redis.call('PUBLISH', ARGV[2], ARGV[1] .. ':' .. epoch)
+    return epoch
+end
+"""
+
+REVOKE_ALL_SESSIONS_LUA = _REVOKE_ALL_LUA + """
+return revoke_all()
+"""
+
+# Rotação do refresh token em uma ida ao Redis (atômica: dois refresh
+# concorrentes com o mesmo token não geram duas sessões). Um token que
+# existe mas saiu do índice (revogado em massa ou removido pelo limite
+# de sessões) é inválido.
+# KEYS[3] = refresh:<jti atual>, KEYS[4] = used_refresh:<jti atual>,
+# KEYS[5] = refresh:<jti novo>
+# ARGV[3] = jti atual, ARGV[4] = jti novo, ARGV[5] = TTL (s)
+ROTATE_REFRESH_TOKEN_LUA = _REVOKE_ALL_LUA + """
+local now = now_seconds()
+local owner = redis.call('GET', KEYS[3])
+
+if not owner then
+    if redis.call('EXISTS', KEYS[4]) == 1 then
+        return {'reused', revoke_all()}
+    end
+    return {'invalid', 0}
+end
+
+if owner ~= ARGV[1] then
+    return {'invalid', 0}
+end
+
+if not load_index(KEYS[1], now) then
+    return 'legacy_index'
+end
+if not redis.call('ZSCORE', KEYS[1], ARGV[3]) then
+    return {'invalid', 0}
+end
+
+redis.call('DEL', KEYS[3])
+redis.call('ZREM', KEYS[1], ARGV[3])
+redis.call('SET', KEYS[4], 1, 'EX', ARGV[5])
+redis.call('SET', KEYS[5], ARGV[1], 'EX', ARGV[5])
+redis.call('ZADD', KEYS[1], now + tonumber(ARGV[5]), ARGV[4])
+touch_index(KEYS[1])
+return {'rotated', 0}
+"""
 
 
 class RedisSessionRepository(SessionRepository):
 
-    def __init__(self, redis: Redis):
+    def __init__(
+        self,
+        redis: Redis,
+        epoch_cache: Optional[SessionEpochCache] = None,
+        revoked_filter: Optional[RevokedTokenFilter] = None,
+        max_sessions: Optional[int] = None,
+    ):
         self.redis = redis
+        self.epoch_cache = epoch_cache
+        self.revoked_filter = revoked_filter
+        # acima do limite, a sessão mais antiga do usuário é encerrada (0 = sem limite)
+        self.max_sessions = settings.MAX_SESSIONS_PER_USER if max_sessions is None else max_sessions
 
-    def blacklist_access_token(self, token: str, expires_at: datetime) -> None:
-        ttl = int((expires_at - datetime.utcnow()).total_seconds())
+        # EVALSHA, com EVAL automático se o script ainda não estiver no Redis
+        self._store = redis.register_script(STORE_REFRESH_TOKEN_LUA)
+        self._revoke = redis.register_script(REVOKE_REFRESH_TOKEN_LUA)
+        self._list = redis.register_script(LIST_SESSIONS_LUA)
+        self._revoke_all = redis.register_script(REVOKE_ALL_SESSIONS_LUA)
+        self._rotate = redis.register_script(ROTATE_REFRESH_TOKEN_LUA)
+        self._migrate = redis.register_script(MIGRATE_LEGACY_INDEX_LUA)
 
-        if ttl > 0:
-            self.redis.setex(
-                name=f"blacklist:{token}",
-                time=ttl,
-                value="true",
-            )
+    async def blacklist_access_token(self, jti: str, expires_at: datetime) -> None:
+        ttl = int((expires_at - datetime.now(timezone.utc)).total_seconds())
 
-    def is_access_token_blacklisted(self, token: str) -> bool:
-        return self.redis.exists(f"blacklist:{token}") == 1
+        if ttl <= 0:
+            return
 
-    def store_refresh_token(self, jti: str, user_id: str, ttl_seconds: int) -> None:
         pipe = self.redis.pipeline()
 
         pipe.setex(
-            name=f"refresh:{jti}",
-            time=ttl_seconds,
-            value=user_id,
+            name=REVOKED_TOKEN_KEY.format(jti=jti),
+            time=ttl,
+            value="true",
         )
 
-        pipe.sadd(f"user_sessions:{user_id}", jti)
+        # índice para os workers reconstruírem o filtro de revogados
+        pipe.zadd(REVOKED_TOKEN_INDEX, {jti: expires_at.timestamp()})
+        pipe.zremrangebyscore(REVOKED_TOKEN_INDEX, "-inf", datetime.now(timezone.utc).timestamp())
+        pipe.publish(REVOKED_TOKEN_CHANNEL, jti)
 
-        pipe.execute()
+        await pipe.execute()
 
-    def revoke_refresh_token(self, jti: str, user_id: str) -> None:
-        pipe = self.redis.pipeline()
+        if self.revoked_filter is not None:
+            self.revoked_filter.add(jti)
 
-        pipe.delete(f"refresh:{jti}")
-        pipe.srem(f"user_sessions:{user_id}", jti)
+    async def is_access_token_blacklisted(self, jti: str) -> bool:
+        # "ausente" no filtro é definitivo: só um provável positivo vai ao Redis
+        if self.revoked_filter is not None and not self.revoked_filter.might_contain(jti):
+            return False
 
-        pipe.execute()
+        return await self.redis.exists(REVOKED_TOKEN_KEY.format(jti=jti)) == 1
+
+    async def store_refresh_token(self, jti: str, user_id: str, ttl_seconds: int) -> None:
+        await self._run_on_index(
+            self._store,
+            user_id,
+            keys=[f"user_sessions:{user_id}", f"refresh:{jti}"],
+            args=[user_id, jti, ttl_seconds, self.max_sessions],
+        )
 
-    def is_refresh_token_valid(self, jti: str) -> bool:
-        return self.redis.exists(f"refresh:{jti}") == 1
+    async def revoke_refresh_token(self, jti: str, user_id: str) -> None:
+        await self._run_on_index(
+            self._revoke,
+            user_id,
+            keys=[f"user_sessions:{user_id}", f"refresh:{jti}"],
+            args=[jti],
+        )
 
-    def get_user_sessions(self, user_id: str):
-        return self.redis.smembers(f"user_sessions:{user_id}")
+    async def get_user_sessions(self, user_id: str) -> List[SessionInfo]:
+        entries = await self._run_on_index(
+            self._list, user_id, keys=[f"user_sessions:{user_id}"]
+        )
 
-    def revoke_all_sessions(self, user_id: str) -> None:
-        jtis = self.redis.smembers(f"user_sessions:{user_id}")
+        return [
+            SessionInfo(
+                session_id=jti,
+                expires_at=datetime.fromtimestamp(float(expires_at), tz=timezone.utc),
+            )
+            for jti, expires_at in zip(entries[::2], entries[1::2])
+        ]
 
-        pipe = self.redis.pipeline()
+    async def rotate_refresh_token(
+        self,
+        jti: str,
+        user_id: str,
+        new_jti: str,
+        ttl_seconds: int,
+    ) -> RefreshRotation:
+        outcome, epoch = await self._run_on_index(
+            self._rotate,
+            user_id,
+            keys=[
+                f"user_sessions:{user_id}",
+                SESSION_EPOCH_KEY.format(user_id=user_id),
+                f"refresh:{jti}",
+                f"used_refresh:{jti}",
+                f"refresh:{new_jti}",
+            ],
+            args=[user_id, SESSION_EPOCH_CHANNEL, jti, new_jti, ttl_seconds],
+        )
 
-        for jti in jtis:
-            pipe.delete(f"refresh:{jti}")
+        result = RefreshRotation(outcome)
+        if result is RefreshRotation.REUSED:
+            self._remember_epoch(user_id, epoch)
+
+        return result
+
+    async def _run_on_index(
+        self,
+        script: AsyncScript,
+        user_id: str,
+        keys: List[str],
+        args: Optional[list] = None,
+    ):
+        """Roda um script do índice, convertendo antes um índice no formato antigo."""
+        result = await script(keys=keys, args=args)
+
+        if result == LEGACY_INDEX:
+            await self._migrate_legacy_index(user_id)
+            result = await script(keys=keys, args=args)
+
+        return result
+
+    async def _migrate_legacy_index(self, user_id: str) -> None:
+        index = f"user_sessions:{user_id}"
+
+        # O SET pode mudar entre a leitura e o script: lê de novo até bater
+        while True:
+            try:
+                jtis = sorted(await self.redis.smembers(index))
+            except ResponseError:
+                return  # já convertido por outra requisição
+
+            migrated = await self._migrate(
+                keys=[index, *(f"refresh:{jti}" for jti in jtis)],
+                args=jtis,
+            )
+            if migrated:
+                return
+
+    async def revoke_all_sessions(self, user_id: str) -> None:
+        # Nova época: todo access token já emitido para o usuário expira
+        epoch = await self._revoke_all(
+            keys=[f"user_sessions:{user_id}", SESSION_EPOCH_KEY.format(user_id=user_id)],
+            args=[user_id, SESSION_EPOCH_CHANNEL],
+        )
 
-        pipe.delete(f"user_sessions:{user_id}")
+        self._remember_epoch(user_id, epoch)
 
-        pipe.execute()
-    
-    def is_refresh_token_used(self, jti: str) -> bool:
-        return self.redis.exists(f"used_refresh:{jti}") == 1
+    def _remember_epoch(self, user_id: str, epoch: int) -> None:
+        if self.epoch_cache is not None:
+            self.epoch_cache.remember(user_id, int(epoch))
 
+    async def get_session_epoch(self, user_id: str) -> int:
+        if self.epoch_cache is not None:
+            return await self.epoch_cache.get(user_id)
 
-    def mark_refresh_token_used(self, jti: str, ttl_seconds: int) -> None:
-        self.redis.setex(f"used_refresh:{jti}", ttl_seconds, 1)
+        return int(await self.redis.get(SESSION_EPOCH_KEY.format(user_id=user_id)) or 0)
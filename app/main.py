@@ -1,9 +1,11 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+
+from fastapi import Depends, FastAPI
 
 from app.core.config import settings
-from app.infra.redis.redis_client import RedisClient
-from app.infra.redis.session_repository import RedisSessionRepository
+from app.core.container import AppContainer
+from app.modules.auth.infrastructure.security.password_hashing_executor import PasswordHashingBusyError
+from app.modules.auth.presentation.dependencies.auth_deps import get_current_principal
 from app.modules.auth.presentation.routes.auth_routes import router as auth_router
 from app.modules.customer.presentation.routes.customer_routes import router as customer_router
 
@@ -12,6 +14,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from app.shared.presentation.exceptions.exception_handlers import (
     auth_exception_handler,
+    password_hashing_busy_handler,
     validation_exception_handler,
     database_exception_handler,
     generic_exception_handler,
@@ -20,19 +23,25 @@ from app.modules.auth.domain.exceptions.auth_exceptions import AuthException
 from app.modules.customer.domain.exceptions.customers_exceptions import CustomerDomainError
 from app.shared.presentation.exceptions.exception_handlers import customer_exception_handler
 from app.shared.presentation.middlewares.cors_middleware import setup_cors
+from app.shared.presentation.middlewares.rate_limit_middleware import setup_rate_limit
+from app.modules.auth.presentation.rate_limits import AUTH_RATE_LIMITS
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print("Iniciando aplicação...")
 
-    redis = RedisClient.get_client()
-    app.state.session_repository = RedisSessionRepository(redis)
+    # Singletons (Redis, banco, hash de senha, JWT, caches, Google, outbox)
+    container = app.state.container = await AppContainer.create()
+    # o middleware de rate limit lê o cliente direto do estado da app
+    app.state.redis = container.redis
 
     print("Banco e Redis prontos")
     yield
     print("Encerrando aplicação...")
 
+    await container.aclose()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -49,6 +58,21 @@ def health_check():
     }
 
 
+# Métricas internas: só com token válido (expõem carga e tamanho da blacklist)
+@app.get("/health/password-hashing", tags=["health"], dependencies=[Depends(get_current_principal)])
+def password_hashing_metrics():
+    # Fila, rejeições e percentis de espera/tempo de hash do pool de senhas
+    return app.state.container.password_hashing.stats()
+
+
+@app.get("/health/revoked-token-filter", tags=["health"], dependencies=[Depends(get_current_principal)])
+def revoked_token_filter_metrics():
+    # Ocupação, memória e falso positivo estimado do filtro de Bloom do worker
+    return app.state.container.revoked_token_filter.stats()
+
+
+# rate limit antes do CORS: respostas 429 também levam os headers de CORS
+setup_rate_limit(app, AUTH_RATE_LIMITS, prefix="/api/v1")
 setup_cors(app)
 
 # REGISTRA AS ROTAS
@@ -57,6 +81,7 @@ app.include_router(customer_router, prefix="/api/v1")
 
 # domínio
 app.add_exception_handler(AuthException, auth_exception_handler)
+app.add_exception_handler(PasswordHashingBusyError, password_hashing_busy_handler)
 app.add_exception_handler(CustomerDomainError, customer_exception_handler)
 
 # validação pydantic
@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class EmailMessage:
+    to: str
+    subject: str
+    body: str
+
+
+class EmailOutbox(ABC):
+
+    @abstractmethod
+    async def enqueue(self, message: EmailMessage) -> None:
+        """
+        Agenda o envio do email; a entrega acontece fora da requisição
+        """
+        pass
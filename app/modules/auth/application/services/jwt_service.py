@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 class JwtService(ABC):
 
     @abstractmethod
-    def create_access_token(self, subject: str) -> str:
+    async def create_access_token(self, subject: str, is_active: bool = True) -> str:
         pass
 
     @abstractmethod
@@ -1,8 +1,9 @@
 from uuid import uuid4
 
 from app.modules.auth.domain.value_objects.email_vo import Email
-from redis import Redis
+from redis.asyncio import Redis
 
+from app.modules.auth.application.services.email_outbox import EmailMessage, EmailOutbox
 from app.modules.auth.domain.repositories.user_repository import UserRepository
 from app.core.config import settings
 
@@ -12,9 +13,11 @@ class ForgotPasswordUseCase:
         self,
         user_repository: UserRepository,
         redis: Redis,
+        email_outbox: EmailOutbox,
     ):
         self.user_repository = user_repository
         self.redis = redis
+        self.email_outbox = email_outbox
 
     async def execute(self, email: Email):
         # 1. Busca usuário
@@ -28,22 +31,21 @@ class ForgotPasswordUseCase:
         token = uuid4().hex
 
         # 4. Salva no Redis (15 minutos)
-        self.redis.setex(
+        await self.redis.setex(
             name=f"password_reset:{token}",
             time=settings.PASSWORD_RESET_TOKEN_EXPIRE_SECONDS,
             value=str(user.id.value),
         )
 
-        # 5. Enviar email (por enquanto stub)
+        # 5. Enfileira o email; o envio SMTP acontece no worker do outbox
         reset_link = f"{settings.FRONTEND_URL}/reset-password?token={token}"
 
-        # STUB TEMPORÁRIO (email depois)
-        print(f"RESET LINK: {reset_link}")
-       
-        # send_email(
-        #     to=user.email.value,
-        #     subject="Recuperação de senha",
-        #     body=f"Clique no link para redefinir sua senha: {reset_link}"
-        # )
+        await self.email_outbox.enqueue(
+            EmailMessage(
+                to=user.email.value,
+                subject="Recuperação de senha",
+                body=f"Clique no link para redefinir sua senha: {reset_link}",
+            )
+        )
 
         return
@@ -65,7 +65,7 @@ class GetCurrentUserUseCase:
         user_id_vo = UserId(user_id)
 
         # 2. Busca no repositório
-        user = await self._user_repository.get_by_id(user_id_vo)
+        user = await self._user_repository.get_by_id_readonly(user_id_vo)
 
         # 3. Garante existência
         if not user:
@@ -48,8 +48,9 @@ class GoogleLoginUseCase:
             await self.user_repository.create(user)
 
         # Gera tokens
-        access_token = self.jwt_service.create_access_token(
-            subject=str(user.id.value)
+        access_token = await self.jwt_service.create_access_token(
+            subject=str(user.id.value),
+            is_active=user.is_active,
         )
 
         refresh_token = self.jwt_service.create_refresh_token(
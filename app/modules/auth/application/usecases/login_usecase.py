@@ -1,5 +1,6 @@
 from app.modules.auth.application.dtos.logininput_dto import LoginInputDTO
 from app.modules.auth.application.dtos.loginresult_dto import LoginResultDTO
+from app.modules.auth.domain.read_models.user_credentials import UserCredentials
 from app.modules.auth.domain.repositories.user_repository import UserRepository
 from app.modules.auth.domain.value_objects.email_vo import Email
 from app.modules.auth.domain.exceptions.auth_exceptions import (
@@ -7,7 +8,10 @@ from app.modules.auth.domain.exceptions.auth_exceptions import (
     UserNotFoundException,
     InactiveUserException,
 )
-from app.modules.auth.infrastructure.security.password_hasher import PasswordHasher
+from app.modules.auth.infrastructure.security.password_hashing_executor import (
+    PasswordHashingBusyError,
+    PasswordHashingExecutor,
+)
 
 
 class LoginUseCase:
@@ -17,6 +21,7 @@ class LoginUseCase:
     Responsabilidades:
     - Validar credenciais
     - Verificar status do usuário
+    - Refazer o hash da senha se usar parâmetros desatualizados
     - Retornar entidade do usuário autenticado
     
     NÃO gera tokens JWT - isso é responsabilidade da camada de apresentação.
@@ -25,7 +30,7 @@ class LoginUseCase:
     def __init__(
         self,
         user_repository: UserRepository,
-        password_hasher: PasswordHasher,
+        password_hasher: PasswordHashingExecutor,
     ):
         self._user_repository = user_repository
         self._password_hasher = password_hasher
@@ -53,7 +58,8 @@ class LoginUseCase:
         if not credentials:
             raise UserNotFoundException(input_dto.email.value)
 
-        if not self._password_hasher.verify(
+        # bcrypt roda fora do event loop (fila limitada; cheia → 503)
+        if not await self._password_hasher.verify(
             input_dto.password.value,
             credentials.password_hash,
         ):
@@ -62,6 +68,8 @@ class LoginUseCase:
         if not credentials.is_active:
             raise InactiveUserException()
 
+        await self._rehash_if_outdated(input_dto.password.value, credentials)
+
         user = await self._user_repository.get_by_id(credentials.user_id)
 
         return LoginResultDTO(
@@ -70,3 +78,23 @@ class LoginUseCase:
             email=user.email,
             is_active=user.is_active,
         )
+
+    async def _rehash_if_outdated(self, plain_password: str, credentials: UserCredentials) -> None:
+        """
+        Senha acabou de ser confirmada: se o hash usa esquema/custo antigo,
+        grava um novo. Melhor esforço: com o pool de hash cheio, fica para
+        o próximo login.
+        """
+        if not self._password_hasher.needs_rehash(credentials.password_hash):
+            return
+
+        try:
+            new_hash = await self._password_hasher.hash(plain_password)
+        except PasswordHashingBusyError:
+            return
+
+        await self._user_repository.rehash_password(
+            credentials.user_id,
+            old_hash=credentials.password_hash,
+            new_hash=new_hash,
+        )
@@ -2,12 +2,8 @@ from app.modules.auth.application.dtos.registerinput_dto import RegisterInputDTO
 from app.modules.auth.application.dtos.registerresult_dto import RegisterResultDTO
 from app.modules.auth.domain.entities.user_entity import UserEntity
 from app.modules.auth.domain.repositories.user_repository import UserRepository
-
-from app.modules.auth.domain.exceptions.auth_exceptions import (
-    UserAlreadyExistsException,
-)
 from app.modules.auth.domain.value_objects.password_vo import Password
-from app.modules.auth.infrastructure.security.password_hasher import PasswordHasher
+from app.modules.auth.infrastructure.security.password_hashing_executor import PasswordHashingExecutor
 from app.shared.domain.value_objects.id_vo import UserId
 
 
@@ -33,7 +29,7 @@ class RegisterUseCase:
     def __init__(
         self,
         user_repository: UserRepository,
-        password_hasher: PasswordHasher,
+        password_hasher: PasswordHashingExecutor,
     ):
         self._user_repository = user_repository
         self._password_hasher = password_hasher
@@ -44,26 +40,23 @@ class RegisterUseCase:
 
         Fluxo:
         ------
-        1. Verifica se email já existe
-        2. Gera hash da senha
+        1. Gera hash da senha
+        2. Cria o VO Password
         3. Cria entidade UserEntity
-        4. Persiste usuário
+        4. Persiste usuário (e-mail duplicado → UserAlreadyExistsException,
+           detectado pelo índice único no próprio INSERT)
         5. Retorna DTO de saída
         """
 
-        # 1. Verifica duplicidade de email
-        if await self._user_repository.exists_by_email(input_dto.email):
-            raise UserAlreadyExistsException(input_dto.email.value)
-
-        # 2. Gera hash da senha (infra)
-        password_hash = self._password_hasher.hash(
+        # 1. Gera hash da senha (infra)
+        password_hash = await self._password_hasher.hash(
             input_dto.password.value
         )
 
-        # 3. Cria Password (VO definitivo do domínio)
+        # 2. Cria Password (VO definitivo do domínio)
         password = Password(password_hash)
 
-        # 4. Cria entidade de domínio
+        # 3. Cria entidade de domínio
         user = UserEntity(
             id=UserId.new(),
             nome=input_dto.nome,
@@ -71,8 +64,8 @@ class RegisterUseCase:
             password=password,
         )
 
-        # 5. Persiste
+        # 4. Persiste (duplicidade de e-mail → UserAlreadyExistsException)
         created_user = await self._user_repository.create(user)
 
-        # 6. Retorna DTO de saída
+        # 5. Retorna DTO de saída
         return created_user
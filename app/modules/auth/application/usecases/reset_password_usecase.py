@@ -1,8 +1,8 @@
 from app.modules.auth.domain.value_objects.password_vo import Password
 from app.modules.auth.domain.value_objects.plain_password_vo import PlainPassword
-from redis import Redis
+from redis.asyncio import Redis
 from app.modules.auth.domain.repositories.user_repository import UserRepository
-from app.modules.auth.infrastructure.security.password_hasher import PasswordHasher
+from app.modules.auth.infrastructure.security.password_hashing_executor import PasswordHashingExecutor
 from app.shared.domain.value_objects.id_vo import UserId
 
 
@@ -11,7 +11,7 @@ class ResetPasswordUseCase:
         self,
         user_repository: UserRepository,
         redis: Redis,
-        password_hasher: PasswordHasher,
+        password_hasher: PasswordHashingExecutor,
     ):
         self.user_repository = user_repository
         self.redis = redis
@@ -20,7 +20,7 @@ class ResetPasswordUseCase:
     async def execute(self, token: str, new_password: PlainPassword):
         redis_key = f"password_reset:{token}"
 
-        user_id = self.redis.get(redis_key)
+        user_id = await self.redis.get(redis_key)
         if not user_id:
             raise ValueError("Token inválido ou expirado")
 
@@ -28,7 +28,7 @@ class ResetPasswordUseCase:
         if not user:
             raise ValueError("Usuário não encontrado")
 
-        hashed = self.password_hasher.hash(new_password.value)
+        hashed = await self.password_hasher.hash(new_password.value)
         password = Password(hashed)
 
         await self.user_repository.update_password(
@@ -36,6 +36,6 @@ class ResetPasswordUseCase:
             password=password,
         )
 
-        self.redis.delete(redis_key)
+        await self.redis.delete(redis_key)
 
         return user_id
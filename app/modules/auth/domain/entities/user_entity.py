@@ -36,6 +36,7 @@ class UserEntity:
     is_active: bool = True
     created_at: datetime = datetime.now(timezone.utc)
     updated_at: Optional[datetime] = None
+    version: int = 1
 
     # ------------------------------------------------------------------
     # Comportamentos do domínio
@@ -132,4 +133,5 @@ class UserEntity:
             is_active=changes.get("is_active", self.is_active),
             created_at=self.created_at,
             updated_at=changes.get("updated_at", self.updated_at),
+            version=self.version,
         )
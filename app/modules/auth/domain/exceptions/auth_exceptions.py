@@ -80,6 +80,18 @@ class UserNotFoundException(AuthException):
         super().__init__(f"Usuário '{identifier}' não encontrado")
 
 
+class UserConcurrentUpdateException(AuthException):
+    """
+    Exceção lançada quando o usuário foi alterado por outra operação
+    entre a leitura e a gravação (lock otimista por `version`).
+
+    O cliente deve recarregar os dados e repetir a operação.
+    """
+
+    def __init__(self, identifier: str):
+        super().__init__(f"Usuário '{identifier}' foi alterado por outra operação")
+
+
 class InactiveUserException(AuthException):
     """
     Exceção lançada quando um usuário inativo tenta realizar
@@ -112,5 +124,5 @@ class InvalidTokenException(AuthException):
     - Casos de uso que dependem de token válido
     """
 
-    def __init__(self):
-        super().__init__("Token inválido ou expirado")
+    def __init__(self, message: str = "Token inválido ou expirado"):
+        super().__init__(message)
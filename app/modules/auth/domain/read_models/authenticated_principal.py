@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class AuthenticatedPrincipal:
+    """
+    Identidade autenticada da requisição.
+
+    No modo stateless vem apenas das claims do access token (sem
+    consultar o banco); no modo padrão, do usuário carregado.
+    """
+
+    user_id: str
+    is_active: bool
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class SessionInfo:
+    """
+    Sessão ativa do usuário (um refresh token ainda válido).
+
+    `session_id` é o jti do refresh token; `expires_at` em UTC.
+    """
+
+    session_id: str
+    expires_at: datetime
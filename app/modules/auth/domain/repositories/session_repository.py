@@ -1,41 +1,66 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
+from enum import Enum
+from typing import List
+
+from app.modules.auth.domain.read_models.session_info import SessionInfo
+
+
+class RefreshRotation(str, Enum):
+    """Resultado da rotação de um refresh token."""
+
+    ROTATED = "rotated"   # antigo revogado, novo gravado
+    REUSED = "reused"     # antigo já usado: todas as sessões foram revogadas
+    INVALID = "invalid"   # inexistente, expirado ou de outro usuário
 
 
 class SessionRepository(ABC):
 
     @abstractmethod
-    def blacklist_access_token(self, token: str, expires_at: datetime) -> None:
+    async def blacklist_access_token(self, jti: str, expires_at: datetime) -> None:
+        """Revoga o access token (pelo jti) até a sua expiração."""
         pass
 
     @abstractmethod
-    def is_access_token_blacklisted(self, token: str) -> bool:
+    async def is_access_token_blacklisted(self, jti: str) -> bool:
         pass
 
     @abstractmethod
-    def store_refresh_token(self, jti: str, user_id: str, ttl_seconds: int) -> None:
+    async def store_refresh_token(self, jti: str, user_id: str, ttl_seconds: int) -> None:
+        """Grava o refresh token; acima do limite, encerra a sessão mais antiga."""
         pass
 
     @abstractmethod
-    def revoke_refresh_token(self, jti: str, user_id: str) -> None:
+    async def revoke_refresh_token(self, jti: str, user_id: str) -> None:
         pass
 
     @abstractmethod
-    def is_refresh_token_valid(self, jti: str) -> bool:
-        pass
+    async def rotate_refresh_token(
+        self,
+        jti: str,
+        user_id: str,
+        new_jti: str,
+        ttl_seconds: int,
+    ) -> RefreshRotation:
+        """
+        Troca o refresh `jti` por `new_jti` numa única operação atômica.
 
-    @abstractmethod
-    def get_user_sessions(self, user_id: str):
+        Valida o token atual, detecta reuso (revogando todas as sessões),
+        revoga o atual, marca-o como usado e grava o novo.
+        """
         pass
 
     @abstractmethod
-    def revoke_all_sessions(self, user_id: str) -> None:
+    async def get_user_sessions(self, user_id: str) -> List[SessionInfo]:
+        """Sessões ainda válidas do usuário, da mais antiga para a mais nova."""
         pass
 
     @abstractmethod
-    def is_refresh_token_used(self, jti: str) -> bool:
+    async def revoke_all_sessions(self, user_id: str) -> None:
+        """Revoga refresh tokens e avança a época (invalida os access tokens)."""
         pass
 
     @abstractmethod
-    def mark_refresh_token_used(self, jti: str, ttl_seconds: int) -> None:
+    async def get_session_epoch(self, user_id: str) -> int:
+        """Época de sessão vigente do usuário (carimbada nos access tokens)."""
         pass
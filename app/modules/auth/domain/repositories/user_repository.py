@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 from typing import Optional
 
 from app.modules.auth.domain.entities.user_entity import UserEntity
+from app.modules.auth.domain.read_models.user_credentials import UserCredentials
+from app.modules.auth.domain.value_objects.password_vo import Password
 from app.shared.domain.value_objects.id_vo import UserId
 from app.modules.auth.domain.value_objects.email_vo import Email
 
@@ -24,6 +26,15 @@ class UserRepository(ABC):
         """Busca usuário pelo ID."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_by_id_readonly(self, user_id: UserId) -> Optional[UserEntity]:
+        """
+        Busca usuário pelo ID para leitura apenas (pode vir de réplica).
+
+        Não usar quando a entidade for alterada em seguida.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def get_by_email(self, email: Email) -> Optional[UserEntity]:
         """Busca usuário pelo email."""
@@ -34,6 +45,26 @@ class UserRepository(ABC):
         """Verifica se já existe usuário com este email."""
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_credentials_by_email(self, email: Email) -> Optional[UserCredentials]:
+        """Busca apenas ID, hash da senha e status (login)."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_password(self, user_id: UserId, password: Password) -> None:
+        """Troca a senha do usuário."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rehash_password(self, user_id: UserId, old_hash: str, new_hash: str) -> bool:
+        """
+        Substitui o hash da mesma senha por um com parâmetros atuais.
+
+        Só grava se o hash no banco ainda for `old_hash` (uma troca de
+        senha concorrente vence). Retorna True se gravou.
+        """
+        raise NotImplementedError
+
     @abstractmethod
     async def update(self, user: UserEntity) -> UserEntity:
         """Atualiza um usuário existente."""
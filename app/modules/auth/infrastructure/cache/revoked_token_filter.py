@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.infra.redis.channel_listener import RedisChannelListener
+from app.shared.infrastructure.bloom_filter import BloomFilter
+
+logger = logging.getLogger(__name__)
+
+# Marca de revogação por access token (expira junto com o token)
+REVOKED_TOKEN_KEY = "blacklist:{jti}"
+
+# Índice de revogações: jti → exp (score), base para reconstruir o filtro
+REVOKED_TOKEN_INDEX = "blacklist_index"
+
+# Canal em que cada revogação publica o jti
+REVOKED_TOKEN_CHANNEL = "blacklist:added"
+
+
+class RevokedTokenFilter:
+    """
+    Filtro de Bloom, por worker, dos access tokens revogados (por jti).
+
+    Consultado antes do Redis: "ausente" é definitivo e dispensa a ida
+    ao Redis; só um provável positivo é confirmado por lá.
+
+    - Montado a partir do índice no Redis e mantido em dia pelo canal
+      de revogações (cada worker acrescenta o jti publicado).
+    - Bloom não remove itens: o filtro é reconstruído a cada
+      `rebuild_interval` para descartar revogações já expiradas, e
+      redimensionado se o número de revogações passar da capacidade.
+    - Sem filtro confiável (antes da primeira carga ou após perder a
+      conexão do canal) toda consulta vai ao Redis.
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        capacity: int,
+        fp_rate: float,
+        rebuild_interval: float,
+    ):
+        self._redis = redis
+        self._capacity = capacity
+        self._fp_rate = fp_rate
+        self._rebuild_interval = rebuild_interval
+
+        self._filter: Optional[BloomFilter] = None
+        self._pending: Optional[List[str]] = None  # recebidos durante a reconstrução
+        self._generation = 0  # muda a cada descarte; invalida cargas em andamento
+        self._next_rebuild = 0.0
+        self._lock = threading.Lock()  # também chamado fora do loop (threadpool)
+
+        self._listener = RedisChannelListener(
+            redis, REVOKED_TOKEN_CHANNEL, on_message=self.add, on_reset=self._discard
+        )
+
+    @property
+    def ready(self) -> bool:
+        return self._filter is not None
+
+    def might_contain(self, jti: str) -> bool:
+        """False = certamente não revogado; True = confirmar no Redis."""
+        current = self._filter
+        return current is None or jti in current
+
+    def add(self, jti: str) -> None:
+        with self._lock:
+            if self._filter is not None:
+                self._filter.add(jti)
+            if self._pending is not None:
+                self._pending.append(jti)
+
+    def stats(self) -> Dict[str, float]:
+        """Ocupação, memória e taxa de falso positivo estimada do filtro."""
+        current = self._filter
+        if current is None:
+            return {"ready": False}
+
+        return {"ready": True, **current.stats()}
+
+    # ─── Carga / reconstrução ────────────────────────────────────────────────
+
+    async def rebuild(self) -> bool:
+        """
+        Recria o filtro a partir do índice no Redis.
+
+        Revogações publicadas enquanto o índice é lido entram pela lista
+        `_pending`, então nenhuma se perde na troca de filtro.
+        """
+        with self._lock:
+            self._pending = []
+            generation = self._generation
+
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.zremrangebyscore(REVOKED_TOKEN_INDEX, "-inf", time.time())
+                pipe.zrange(REVOKED_TOKEN_INDEX, 0, -1)
+                revoked = (await pipe.execute())[-1]
+        except RedisError:
+            with self._lock:
+                self._pending = None
+            logger.warning("Falha ao carregar revogações; consultas irão ao Redis")
+            return False
+
+        bloom = BloomFilter(max(self._capacity, 2 * len(revoked)), self._fp_rate)
+        for jti in revoked:
+            bloom.add(jti)
+
+        with self._lock:
+            pending, self._pending = self._pending, None
+            if generation != self._generation:
+                return False
+
+            for jti in pending:
+                bloom.add(jti)
+            self._filter = bloom
+
+        self._next_rebuild = time.monotonic() + self._rebuild_interval
+        logger.info("Filtro de tokens revogados reconstruído: %s", bloom.stats())
+        return True
+
+    def _discard(self) -> None:
+        # Conexão do canal perdida: revogações podem ter se perdido
+        with self._lock:
+            self._filter = None
+            self._generation += 1
+
+    async def maintain(self, tick: float = 1.0) -> None:
+        """Mantém o filtro carregado e em dia (rodar como task no lifespan)."""
+        while True:
+            if self._listener.active and (
+                self._filter is None or time.monotonic() >= self._next_rebuild
+            ):
+                await self.rebuild()
+            await asyncio.sleep(tick)
+
+    async def start(self) -> None:
+        """Inscreve o worker no canal antes da primeira carga (chamar no lifespan)."""
+        if not await self._listener.start():
+            logger.warning("Filtro de tokens revogados desligado: sem assinatura do canal")
+            return
+
+        await self.rebuild()
+
+    async def stop(self) -> None:
+        await self._listener.stop()
+        self._discard()
@@ -0,0 +1,91 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from redis.asyncio import Redis
+
+from app.infra.redis.channel_listener import RedisChannelListener
+
+logger = logging.getLogger(__name__)
+
+# Chave com a época de sessão do usuário (ausente = 0)
+SESSION_EPOCH_KEY = "session_epoch:{user_id}"
+
+# Canal em que cada incremento publica "<user_id>:<nova época>"
+SESSION_EPOCH_CHANNEL = "session_epoch:changed"
+
+
+class SessionEpochCache:
+    """
+    Época de sessão de cada usuário, em memória no worker.
+
+    A época é um contador no Redis incrementado ao revogar todas as
+    sessões do usuário; access tokens carregam a época em que foram
+    emitidos e deixam de valer quando ela fica para trás.
+
+    - Cada incremento é publicado com o novo valor e aplicado direto
+      no cache de todos os workers (sem nova leitura no Redis).
+    - Como a época só cresce, o cache guarda sempre o maior valor visto:
+      uma leitura antiga que chegue depois do aviso não a faz regredir.
+    - O TTL limita a defasagem se uma mensagem se perder; sem a
+      assinatura do canal, toda consulta vai ao Redis.
+    """
+
+    def __init__(self, redis: Redis, ttl_seconds: float, maxsize: int):
+        self._redis = redis
+        self._ttl = ttl_seconds
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._listener = RedisChannelListener(
+            redis, SESSION_EPOCH_CHANNEL, on_message=self._on_message, on_reset=self.clear
+        )
+
+    async def get(self, user_id: str) -> int:
+        """Época atual do usuário (cache do worker ou Redis)."""
+        if self._listener.active:
+            with self._lock:
+                entry = self._entries.get(user_id)
+                if entry is not None and time.monotonic() < entry[0]:
+                    self._entries.move_to_end(user_id)
+                    return entry[1]
+
+        epoch = int(await self._redis.get(SESSION_EPOCH_KEY.format(user_id=user_id)) or 0)
+        return self.remember(user_id, epoch)
+
+    def remember(self, user_id: str, epoch: int) -> int:
+        """Registra uma época conhecida (mantém a maior) e devolve a vigente."""
+        if not self._listener.active or self._ttl <= 0 or self._maxsize <= 0:
+            return epoch
+
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None:
+                epoch = max(epoch, entry[1])
+
+            self._entries[user_id] = (time.monotonic() + self._ttl, epoch)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+        return epoch
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    async def start(self) -> None:
+        """Inscreve o worker no canal de épocas (chamar no lifespan)."""
+        if not await self._listener.start():
+            logger.warning("Épocas de sessão sem cache: consultas irão ao Redis")
+
+    async def stop(self) -> None:
+        await self._listener.stop()
+        self.clear()
+
+    def _on_message(self, data: str) -> None:
+        user_id, _, epoch = data.rpartition(":")
+        if user_id and epoch.isdigit():
+            self.remember(user_id, int(epoch))
@@ -0,0 +1,159 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.infra.redis.channel_listener import RedisChannelListener
+from app.modules.auth.domain.entities.user_entity import UserEntity
+
+logger = logging.getLogger(__name__)
+
+# Canal em que cada escrita de usuário publica o ID alterado
+INVALIDATION_CHANNEL = "user_cache:invalidate"
+
+
+class UserCache:
+    """
+    Cache L1 (por worker) de UserEntity para a autenticação de cada requisição.
+
+    - Entradas expiram após `ttl_seconds` e o tamanho é limitado a
+      `maxsize` (sai o usuário usado há mais tempo).
+    - Alterações em um usuário (desativação, troca de senha, remoção...)
+      são publicadas no Redis; todos os workers, inscritos no canal,
+      descartam a entrada. O TTL limita a defasagem se uma mensagem se perder.
+    - Depois de uma invalidação, o usuário não volta ao cache por
+      `refill_delay` segundos: uma leitura em réplica atrasada (ou uma
+      leitura iniciada antes da escrita) não fixa o estado antigo.
+
+    Sem a inscrição no canal ativa o cache fica desligado, pois não
+    haveria como saber de alterações feitas por outros workers.
+    A entidade é imutável, então a mesma instância é compartilhada
+    entre requisições com segurança.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[Redis],
+        ttl_seconds: float,
+        maxsize: int,
+        refill_delay: float = 0.0,
+    ):
+        self._redis = redis
+        self._ttl = ttl_seconds
+        self._maxsize = maxsize
+        self._refill_delay = refill_delay
+
+        self._entries: "OrderedDict[str, Tuple[float, UserEntity]]" = OrderedDict()
+        self._invalidated_at: Dict[str, float] = {}
+        self._lock = threading.Lock()  # também chamado fora do loop (threadpool)
+
+        self._listener: Optional[RedisChannelListener] = None
+        if redis is not None:
+            self._listener = RedisChannelListener(
+                redis, INVALIDATION_CHANNEL, on_message=self.evict, on_reset=self.clear
+            )
+
+    @property
+    def enabled(self) -> bool:
+        return (
+            self._listener is not None
+            and self._listener.active
+            and self._ttl > 0
+            and self._maxsize > 0
+        )
+
+    # ─── Leitura / escrita local ──────────────────────────────────────────────
+
+    def get(self, user_id: str) -> Optional[UserEntity]:
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+
+            expires_at, user = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[user_id]
+                return None
+
+            self._entries.move_to_end(user_id)
+            return user
+
+    def put(self, user: UserEntity) -> None:
+        if not self.enabled:
+            return
+
+        user_id = str(user.id)
+        now = time.monotonic()
+
+        with self._lock:
+            invalidated_at = self._invalidated_at.get(user_id)
+            if invalidated_at is not None:
+                if now - invalidated_at < self._refill_delay:
+                    return
+                del self._invalidated_at[user_id]
+
+            self._entries[user_id] = (now + self._ttl, user)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def evict(self, user_id: str) -> None:
+        """Descarta o usuário apenas neste worker."""
+        with self._lock:
+            self._entries.pop(user_id, None)
+            if self._refill_delay > 0:
+                self._invalidated_at[user_id] = time.monotonic()
+                self._prune_invalidations()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _prune_invalidations(self) -> None:
+        if len(self._invalidated_at) <= self._maxsize:
+            return
+
+        cutoff = time.monotonic() - self._refill_delay
+        self._invalidated_at = {
+            user_id: at for user_id, at in self._invalidated_at.items() if at > cutoff
+        }
+
+    # ─── Invalidação entre workers ───────────────────────────────────────────
+
+    async def invalidate(self, user_id: str) -> None:
+        """
+        Descarta o usuário neste worker e avisa os demais via Redis.
+
+        Falha ao publicar não interrompe a escrita já feita: os outros
+        workers convergem pelo TTL.
+        """
+        self.evict(user_id)
+
+        if self._redis is None:
+            return
+
+        try:
+            await self._redis.publish(INVALIDATION_CHANNEL, user_id)
+        except RedisError:
+            logger.exception("Falha ao publicar invalidação do usuário %s", user_id)
+
+    async def start(self) -> None:
+        """Inscreve o worker no canal de invalidação (chamar no lifespan)."""
+        if self._listener is None or self._ttl <= 0 or self._maxsize <= 0:
+            return
+
+        if not await self._listener.start():
+            logger.warning("Cache de usuários desligado: sem assinatura do canal")
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            await self._listener.stop()
+
+        self.clear()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Boolean
+from sqlalchemy import Column, String, Boolean, Integer
 from sqlalchemy.orm import validates
 
 from app.modules.auth.domain.entities.user_entity import UserEntity
@@ -26,6 +26,8 @@ class UserModel(BaseModel):
     email = Column(String(255), unique=True, nullable=False, index=True)
     password = Column(String(255), nullable=False)
     is_active = Column(Boolean, nullable=False, default=True)
+    # Lock otimista: incrementada a cada UPDATE
+    version = Column(Integer, nullable=False, default=1, server_default="1")
 
     @validates("email")
     def _normalize_email(self, key, email):
@@ -44,11 +46,21 @@ class UserModel(BaseModel):
             is_active=self.is_active,
             created_at=self.created_at,
             updated_at=self.updated_at,
+            version=self.version,
         )
 
     @staticmethod
     def from_entity(user: UserEntity) -> "UserModel":
-        return UserModel(
+        return UserModel(**UserModel.values_from_entity(user))
+
+    @staticmethod
+    def values_from_entity(user: UserEntity) -> dict:
+        """
+        Valores das colunas para um INSERT direto (sem a unit of work do ORM).
+
+        E-mail e nome já chegam normalizados pelos Value Objects.
+        """
+        return dict(
             id=user.id.value,
             nome=user.nome.value,
             email=user.email.value,
@@ -56,4 +68,5 @@ class UserModel(BaseModel):
             is_active=user.is_active,
             created_at=user.created_at,
             updated_at=user.updated_at,
+            version=user.version,
         )
@@ -1,24 +1,35 @@
-from google.oauth2 import id_token
-from google.auth.transport import requests
-from fastapi.concurrency import run_in_threadpool
+from typing import Optional
+
+from google.auth import jwt
 
 from app.modules.auth.application.services.google_token_verifier import GoogleTokenVerifier
 from app.modules.auth.domain.value_objects.email_vo import Email
 from app.modules.auth.domain.value_objects.name_vo import Name
+from app.modules.auth.infrastructure.security.google_cert_cache import GoogleCertCache
+
+GOOGLE_ISSUERS = ("accounts.google.com", "https://accounts.google.com")
 
 
 class GoogleTokenVerifierImpl(GoogleTokenVerifier):
+    """
+    Verifica ID tokens do Google localmente (assinatura RSA, exp, iss).
+
+    Os certificados vêm do GoogleCertCache compartilhado: nenhuma ida
+    ao Google por login enquanto o cache estiver válido.
+    """
+
+    def __init__(self, cert_cache: GoogleCertCache, audience: Optional[str] = None):
+        self.cert_cache = cert_cache
+        # deixa SEM client_id por enquanto (None não confere o `aud`)
+        self.audience = audience
 
     async def verify(self, token: str) -> tuple[Email, Name]:
         try:
-            id_info = await run_in_threadpool(
-                id_token.verify_oauth2_token,
-                token,
-                requests.Request(),
-                # deixa SEM client_id por enquanto
-                None,
-            )
+            certs = await self.cert_cache.get(jwt.decode_header(token).get("kid"))
+            id_info = jwt.decode(token, certs=certs, audience=self.audience)
 
+            if id_info.get("iss") not in GOOGLE_ISSUERS:
+                raise ValueError(f"Emissor inválido: {id_info.get('iss')}")
 
             if not id_info.get("email_verified"):
                 raise ValueError("Email do Google não verificado")
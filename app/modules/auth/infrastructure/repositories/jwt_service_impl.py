@@ -1,13 +1,23 @@
 from app.modules.auth.application.services.jwt_service import JwtService
+from app.modules.auth.domain.repositories.session_repository import SessionRepository
 from app.modules.auth.infrastructure.security.jwt_handler import JWTHandler
 
 
 class JwtServiceImpl(JwtService):
-    def __init__(self, jwt_handler: JWTHandler):
+    def __init__(self, jwt_handler: JWTHandler, session_repository: SessionRepository):
         self.jwt_handler = jwt_handler
+        self.session_repository = session_repository
 
-    def create_access_token(self, subject: str) -> str:
-        return self.jwt_handler.create_access_token(subject)
+    async def create_access_token(self, subject: str, is_active: bool = True) -> str:
+        # Época de sessão e status: permitem validar o token só pelas claims
+        return self.jwt_handler.create_access_token(
+            subject,
+            additional_claims={
+                "epoch": await self.session_repository.get_session_epoch(subject),
+                "active": is_active,
+            },
+        )
 
     def create_refresh_token(self, subject: str) -> str:
-        return self.jwt_handler.create_refresh_token(subject)
+        refresh_token, _ = self.jwt_handler.create_refresh_token(subject)
+        return refresh_token
@@ -1,14 +1,24 @@
 from typing import Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import delete, insert, select, update
 
 from app.modules.auth.domain.entities.user_entity import UserEntity
+from app.modules.auth.domain.exceptions.auth_exceptions import (
+    UserAlreadyExistsException,
+    UserConcurrentUpdateException,
+    UserNotFoundException,
+)
 from app.modules.auth.domain.read_models.user_credentials import UserCredentials
+from app.modules.auth.domain.repositories.session_repository import SessionRepository
 from app.modules.auth.domain.repositories.user_repository import UserRepository
 from app.modules.auth.domain.value_objects.email_vo import Email
 from app.modules.auth.domain.value_objects.password_vo import Password
+from app.modules.auth.infrastructure.cache.user_cache import UserCache
 from app.modules.auth.infrastructure.models.user_model import UserModel
 from app.shared.domain.value_objects.id_vo import UserId
+from app.shared.infrastructure.database.errors import unique_violation_constraint
+from app.shared.infrastructure.database.routing import replica_read
 
 
 
@@ -20,28 +30,51 @@ class UserRepositoryImpl(UserRepository):
     - Converter entre UserEntity (domínio) e UserModel (ORM)
     - Executar operações no banco de dados
     - Tratar erros de persistência
+    - Manter o cache de usuários (se houver) coerente com as escritas
+    - Encerrar as sessões (se houver repositório de sessões) de quem
+      é desativado
     """
 
-    def __init__(self, db: Session):
+    def __init__(
+        self,
+        db: AsyncSession,
+        user_cache: Optional[UserCache] = None,
+        session_repository: Optional[SessionRepository] = None,
+    ):
         self._db = db
+        self._user_cache = user_cache
+        self._session_repository = session_repository
 
     async def create(self, user: UserEntity) -> UserEntity:
         """
-        Cria um novo usuário no banco.
+        Cria um novo usuário com um único INSERT ... RETURNING.
+        
+        A unicidade do e-mail é garantida pelo índice único `ix_users_email`;
+        a violação vira UserAlreadyExistsException (sem consulta prévia).
         
         Args:
             user: Entidade do usuário
             
         Returns:
             UserEntity: Entidade do usuário criado
+
+        Raises:
+            UserAlreadyExistsException: Se o e-mail já estiver cadastrado
         """
-        # Converte entidade para model
-        model = UserModel.from_entity(user)
+        stmt = (
+            insert(UserModel)
+            .values(UserModel.values_from_entity(user))
+            .returning(UserModel)
+        )
 
-        # Persiste no banco
-        self._db.add(model)
-        self._db.commit()
-        self._db.refresh(model)
+        try:
+            model = (await self._db.execute(stmt)).scalar_one()
+            await self._db.commit()
+        except IntegrityError as exc:
+            await self._db.rollback()
+            if unique_violation_constraint(exc) == "ix_users_email":
+                raise UserAlreadyExistsException(user.email.value) from exc
+            raise
 
         # Converte model para entidade
         return model.to_entity()
@@ -57,10 +90,48 @@ class UserRepositoryImpl(UserRepository):
             Optional[UserEntity]: Entidade do usuário ou None
         """
         stmt = select(UserModel).where(UserModel.id == user_id.value)
-        model = self._db.execute(stmt).scalar_one_or_none()
+        model = (await self._db.execute(stmt)).scalar_one_or_none()
 
         return model.to_entity() if model else None
 
+    async def get_by_id_readonly(self, user_id: UserId) -> Optional[UserEntity]:
+        """
+        Busca usuário por ID no cache do worker ou, na falta, em uma réplica.
+
+        Usado na autenticação de cada requisição; não usar antes de
+        alterar a entidade (cache e réplica podem estar defasados).
+
+        Args:
+            user_id: ID do usuário
+
+        Returns:
+            Optional[UserEntity]: Entidade do usuário ou None
+        """
+        if self._user_cache is not None:
+            cached = self._user_cache.get(str(user_id))
+            if cached is not None:
+                return cached
+
+        user = await self._load_readonly(user_id)
+
+        if user is not None and self._user_cache is not None:
+            self._user_cache.put(user)
+
+        return user
+
+    @replica_read
+    async def _load_readonly(self, user_id: UserId) -> Optional[UserEntity]:
+        stmt = select(UserModel).where(UserModel.id == user_id.value)
+        model = (await self._db.execute(stmt)).scalar_one_or_none()
+
+        if not model:
+            return None
+
+        # Fora do identity map: uma leitura posterior no primário não
+        # deve reaproveitar o objeto carregado da réplica
+        self._db.expunge(model)
+        return model.to_entity()
+
     async def get_by_email(self, email: Email) -> Optional[UserEntity]:
         """
         Busca usuário por email.
@@ -72,7 +143,7 @@ class UserRepositoryImpl(UserRepository):
             Optional[UserEntity]: Entidade do usuário ou None
         """
         stmt = select(UserModel).where(UserModel.email == email.value)
-        model = self._db.execute(stmt).scalar_one_or_none()
+        model = (await self._db.execute(stmt)).scalar_one_or_none()
 
         return model.to_entity() if model else None
 
@@ -87,7 +158,7 @@ class UserRepositoryImpl(UserRepository):
             bool: True se email existe
         """
         stmt = select(UserModel.id).where(UserModel.email == email.value)
-        return self._db.execute(stmt).scalar_one_or_none() is not None
+        return (await self._db.execute(stmt)).scalar_one_or_none() is not None
 
     async def get_credentials_by_email(
         self,
@@ -100,7 +171,7 @@ class UserRepositoryImpl(UserRepository):
             UserModel.is_active,
         ).where(UserModel.email == email.value)
 
-        row = self._db.execute(stmt).first()
+        row = (await self._db.execute(stmt)).first()
 
         if not row:
             return None
@@ -113,35 +184,64 @@ class UserRepositoryImpl(UserRepository):
 
     async def update(self, user: UserEntity) -> UserEntity:
         """
-        Atualiza dados do usuário.
+        Atualiza dados do usuário com um único UPDATE ... RETURNING.
+
+        Só grava se a versão no banco ainda for `user.version` (lock
+        otimista) e já incrementa a versão. Se o usuário fica inativo,
+        todas as sessões são revogadas e a época avança: no modo
+        stateless a claim `active` dos tokens já emitidos não vale mais.
         
         Args:
             user: Entidade com dados atualizados
             
         Returns:
             UserEntity: Entidade atualizada
+
+        Raises:
+            UserNotFoundException: Se o usuário não existir
+            UserConcurrentUpdateException: Se a versão mudou desde a leitura
+            UserAlreadyExistsException: Se o novo e-mail já estiver cadastrado
         """
-        
-        stmt = select(UserModel).where(UserModel.id == user.id.value)
-        result = self._db.execute(stmt)
-        user_model = result.scalar_one_or_none()
-        
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == user.id.value, UserModel.version == user.version)
+            .values(
+                nome=user.nome.value,
+                email=user.email.value,
+                is_active=user.is_active,
+                version=UserModel.version + 1,
+            )
+            .returning(UserModel)
+            .execution_options(populate_existing=True)
+        )
+
+        try:
+            user_model = (await self._db.execute(stmt)).scalar_one_or_none()
+        except IntegrityError as exc:
+            await self._db.rollback()
+            if unique_violation_constraint(exc) == "ix_users_email":
+                raise UserAlreadyExistsException(user.email.value) from exc
+            raise
+
         if not user_model:
-            raise ValueError(f"Usuário {user.id} não encontrado")
-        
-        # Atualiza campos
-        user_model.nome = user.nome.value
-        user_model.email = user.email.value
-        user_model.is_active = user.is_active
-        
-        self._db.commit()
-        self._db.refresh(user_model)
-        
+            exists_stmt = select(UserModel.id).where(UserModel.id == user.id.value)
+            exists = (await self._db.execute(exists_stmt)).scalar_one_or_none() is not None
+            await self._db.rollback()
+            if not exists:
+                raise UserNotFoundException(str(user.id))
+            raise UserConcurrentUpdateException(str(user.id))
+
+        await self._db.commit()
+        await self._invalidate(user.id)
+
+        if not user_model.is_active and self._session_repository is not None:
+            await self._session_repository.revoke_all_sessions(str(user.id))
+
         return user_model.to_entity()
     
     async def delete(self, user_id: UserId) -> bool:
         """
-        Remove usuário do banco.
+        Remove usuário com um único DELETE ... RETURNING.
         
         Args:
             user_id: ID do usuário
@@ -149,25 +249,50 @@ class UserRepositoryImpl(UserRepository):
         Returns:
             bool: True se removido com sucesso
         """
+        stmt = delete(UserModel).where(UserModel.id == user_id.value).returning(UserModel.id)
+        deleted = (await self._db.execute(stmt)).scalar_one_or_none()
+        await self._db.commit()
+
+        if deleted is not None:
+            await self._invalidate(user_id)
         
-        stmt = select(UserModel).where(UserModel.id == user_id.value)
-        result = self._db.execute(stmt)
-        user_model = result.scalar_one_or_none()
-        
-        if not user_model:
-            return False
-        
-        self._db.delete(user_model)
-        self._db.commit()
-        
-        return True
+        return deleted is not None
+
+    async def rehash_password(self, user_id: UserId, old_hash: str, new_hash: str) -> bool:
+        # Mesma senha, hash mais forte: não muda a versão (não conflita
+        # com edições do perfil) e só vale se ninguém trocou a senha antes
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == user_id.value, UserModel.password == old_hash)
+            .values(password=new_hash)
+            .returning(UserModel.id)
+        )
+        updated = (await self._db.execute(stmt)).scalar_one_or_none()
+        await self._db.commit()
+
+        if updated is not None:
+            await self._invalidate(user_id)
+
+        return updated is not None
 
     async def update_password(self, user_id: UserId, password: Password) -> None:
-        stmt = select(UserModel).where(UserModel.id == user_id.value)
-        user_model = self._db.execute(stmt).scalar_one_or_none()
+        # Troca de senha é incondicional, mas invalida leituras anteriores (versão)
+        stmt = (
+            update(UserModel)
+            .where(UserModel.id == user_id.value)
+            .values(password=password.value, version=UserModel.version + 1)
+            .returning(UserModel.id)
+        )
+        updated = (await self._db.execute(stmt)).scalar_one_or_none()
 
-        if not user_model:
+        if not updated:
+            await self._db.rollback()
             raise ValueError("Usuário não encontrado")
 
-        user_model.password = password.value
-        self._db.commit()
+        await self._db.commit()
+        await self._invalidate(user_id)
+
+    async def _invalidate(self, user_id: UserId) -> None:
+        """Avisa os workers (após o commit) que o usuário mudou."""
+        if self._user_cache is not None:
+            await self._user_cache.invalidate(str(user_id))
@@ -0,0 +1,115 @@
+import asyncio
+import logging
+import re
+import time
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_CERTS_URL = "https://www.googleapis.com/oauth2/v1/certs"
+
+_MAX_AGE = re.compile(r"max-age=(\d+)")
+
+
+class GoogleCertsUnavailableError(Exception):
+    """Nenhum certificado do Google carregado e o download falhou."""
+
+
+class GoogleCertCache:
+    """
+    Certificados públicos (PEM por `kid`) que assinam os ID tokens do Google.
+
+    - Baixados por um cliente HTTP compartilhado (conexões reaproveitadas)
+      e guardados pelo `Cache-Control: max-age` da resposta.
+    - `maintain` renova `refresh_margin` segundos antes de expirar, então
+      as requisições quase nunca esperam pelo Google.
+    - `kid` desconhecido (o Google trocou as chaves) força uma renovação,
+      no máximo uma a cada `min_refresh_interval` segundos.
+    - Se o download falhar, os certificados anteriores continuam valendo.
+
+    Downloads concorrentes viram um só (lock + checagem do horário da carga).
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        certs_url: str = GOOGLE_CERTS_URL,
+        default_ttl: float = 3600.0,
+        refresh_margin: float = 300.0,
+        min_refresh_interval: float = 30.0,
+    ):
+        self._client = client
+        self._certs_url = certs_url
+        self._default_ttl = default_ttl
+        self._refresh_margin = refresh_margin
+        self._min_refresh_interval = min_refresh_interval
+
+        self._lock = asyncio.Lock()
+        self._certs: Optional[Mapping[str, str]] = None
+        self._fetched_at = 0.0
+        self._expires_at = 0.0
+        self._refresh_at = 0.0
+        self.fetches = 0
+
+    async def get(self, kid: Optional[str] = None) -> Mapping[str, str]:
+        """Certificados vigentes; baixa se expirados ou se `kid` for novo."""
+        now = time.monotonic()
+
+        if self._certs is None or now >= self._expires_at:
+            await self.refresh(now)
+        elif kid is not None and kid not in self._certs and now - self._fetched_at >= self._min_refresh_interval:
+            await self.refresh(now)
+
+        if self._certs is None:
+            raise GoogleCertsUnavailableError("Certificados do Google indisponíveis")
+
+        return self._certs
+
+    async def refresh(self, requested_at: Optional[float] = None) -> bool:
+        """Baixa os certificados; False se falhar (os anteriores são mantidos)."""
+        requested_at = time.monotonic() if requested_at is None else requested_at
+
+        async with self._lock:
+            # outra corrotina já baixou enquanto esta esperava o lock
+            if self._fetched_at > requested_at:
+                return True
+
+            try:
+                response = await self._client.get(self._certs_url)
+                response.raise_for_status()
+                certs = response.json()
+            except (httpx.HTTPError, ValueError):
+                logger.warning("Falha ao baixar certificados do Google", exc_info=True)
+                return False
+
+            fetched_at = time.monotonic()
+            ttl = self._ttl(response.headers)
+            self._certs = MappingProxyType(dict(certs))
+            self._fetched_at = fetched_at
+            self._expires_at = fetched_at + ttl
+            # max-age curto: renova na metade, nunca mais que uma vez por intervalo mínimo
+            self._refresh_at = fetched_at + max(ttl - self._refresh_margin, ttl / 2, self._min_refresh_interval)
+            self.fetches += 1
+            return True
+
+    def _ttl(self, headers: httpx.Headers) -> float:
+        match = _MAX_AGE.search(headers.get("cache-control", ""))
+        if match is None:
+            return self._default_ttl
+
+        # `Age`: tempo que a resposta já passou em caches intermediários
+        age = headers.get("age", "0")
+        return max(int(match.group(1)) - (int(age) if age.isdigit() else 0), 0)
+
+    async def maintain(self, retry_interval: float = 30.0) -> None:
+        """Renova os certificados antes de expirarem (rodar como task no lifespan)."""
+        while True:
+            delay = self._refresh_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            if not await self.refresh():
+                await asyncio.sleep(retry_interval)
@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import uuid
 
 from jose import JWTError, jwt
@@ -7,8 +7,12 @@ from jose import JWTError, jwt
 from app.core.config import settings
 from app.core.constants import TOKEN_TYPE_ACCESS, TOKEN_TYPE_REFRESH
 from app.modules.auth.domain.exceptions.auth_exceptions import InvalidTokenException
+from app.modules.auth.infrastructure.security.verified_token_cache import (
+    VerifiedToken,
+    VerifiedTokenCache,
+)
 
-RESERVED_CLAIMS = {"sub", "exp", "iat", "type"}
+RESERVED_CLAIMS = {"sub", "exp", "iat", "type", "jti"}
 
 class JWTHandler:
     """
@@ -17,11 +21,16 @@ class JWTHandler:
     Tokens contêm:
     - sub: ID do usuário
     - type: tipo do token (access ou refresh)
+    - jti: ID único do token (usado na revogação)
     - exp: timestamp de expiração
     - iat: timestamp de criação
     """
 
-    def __init__(self):
+    def __init__(self, verified_tokens: Optional[VerifiedTokenCache] = None):
+        # A app recebe o cache do container; sem ele, cada instância tem o seu
+        if verified_tokens is None:
+            verified_tokens = VerifiedTokenCache(maxsize=settings.JWT_VERIFIED_CACHE_SIZE)
+        self._verified_tokens = verified_tokens
         self._secret_key = settings.SECRET_KEY
         self._algorithm = settings.ALGORITHM
         self._access_token_expire = settings.ACCESS_TOKEN_EXPIRE_MINUTES
@@ -52,6 +61,7 @@ class JWTHandler:
         claims = {
             "sub": user_id,
             "type": TOKEN_TYPE_ACCESS,
+            "jti": str(uuid.uuid4()),
             "exp": expire,
             "iat": self._now(),
         }
@@ -66,53 +76,94 @@ class JWTHandler:
 
         return jwt.encode(claims, self._secret_key, algorithm=self._algorithm)
 
-    def create_refresh_token(self, user_id: str) -> str:
+    def create_refresh_token(self, user_id: str) -> Tuple[str, str]:
+        """
+        Cria refresh token JWT.
+
+        Args:
+            user_id: ID do usuário
+
+        Returns:
+            Tuple[str, str]: Token JWT e seu jti (para registrar a sessão
+            sem decodificar o token recém-criado)
+        """
         expire = self._now() + timedelta(days=self._refresh_token_expire)
+        jti = str(uuid.uuid4())
 
         payload = {
             "sub": user_id,
             "type": TOKEN_TYPE_REFRESH,
-            "jti": str(uuid.uuid4()),
+            "jti": jti,
             "exp": expire,
             "iat": self._now(),
         }
 
-        return jwt.encode(payload, self._secret_key, algorithm=self._algorithm)
+        return jwt.encode(payload, self._secret_key, algorithm=self._algorithm), jti
 
-    def decode_token(
+    def verify(
         self,
         token: str,
         expected_type: Optional[str] = None,
-    ) -> Dict[str, Any]:
+    ) -> VerifiedToken:
         """
-        Decodifica e valida token JWT.
+        Verifica o token uma única vez e devolve as claims já validadas.
+
+        Um token visto antes (e ainda não expirado) sai do cache em
+        memória, sem refazer o decode nem a verificação HMAC.
 
         Args:
             token: Token JWT
             expected_type: Tipo esperado do token (access ou refresh)
 
         Returns:
-            Dict[str, Any]: Claims do token
+            VerifiedToken: Claims verificadas
 
         Raises:
             InvalidTokenException: Token inválido, expirado ou tipo incorreto
         """
-        try:
-            payload = jwt.decode(
-                token,
-                self._secret_key,
-                algorithms=[self._algorithm],
-            )
-        except JWTError as e:
-            raise InvalidTokenException(f"Token inválido: {str(e)}")
+        verified = self._verified_tokens.get(token)
 
-        token_type = payload.get("type")
-        if expected_type and token_type != expected_type:
+        if verified is None:
+            try:
+                payload = jwt.decode(
+                    token,
+                    self._secret_key,
+                    algorithms=[self._algorithm],
+                )
+            except JWTError as e:
+                raise InvalidTokenException(f"Token inválido: {str(e)}")
+
+            if not isinstance(payload.get("exp"), (int, float)):
+                raise InvalidTokenException("Token não contém expiração")
+
+            verified = self._verified_tokens.put(token, payload)
+
+        if expected_type and verified.token_type != expected_type:
             raise InvalidTokenException(
-                f"Tipo de token inválido. Esperado={expected_type}, recebido={token_type}"
+                f"Tipo de token inválido. Esperado={expected_type}, recebido={verified.token_type}"
             )
 
-        return payload
+        return verified
+
+    def decode_token(
+        self,
+        token: str,
+        expected_type: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Decodifica e valida token JWT.
+
+        Args:
+            token: Token JWT
+            expected_type: Tipo esperado do token (access ou refresh)
+
+        Returns:
+            Dict[str, Any]: Claims do token
+
+        Raises:
+            InvalidTokenException: Token inválido, expirado ou tipo incorreto
+        """
+        return dict(self.verify(token, expected_type).claims)
 
     def get_user_id_from_token(self, token: str) -> str:
         """
@@ -128,8 +179,7 @@ class JWTHandler:
             InvalidTokenException: Token inválido
         """
         
-        payload = self.decode_token(token)
-        user_id = payload.get("sub")
+        user_id = self.verify(token).subject
 
         if not user_id:
             raise InvalidTokenException("Token não contém ID do usuário")
@@ -149,9 +199,7 @@ class JWTHandler:
         """
         
         try:
-            payload = self.decode_token(token)
-            token_type = payload.get("type")
-            return token_type == expected_type
+            return self.verify(token).token_type == expected_type
         except InvalidTokenException:
             return False
 
@@ -168,19 +216,7 @@ class JWTHandler:
         Raises:
             InvalidTokenException: Token inválido
         """
-        payload = self.decode_token(token)
-        exp = payload.get("exp")
-
-        if not exp:
-            raise InvalidTokenException("Token não contém expiração")
-
-        if isinstance(exp, (int, float)):
-            return datetime.fromtimestamp(exp, tz=timezone.utc)
-
-        if isinstance(exp, datetime):
-            return exp
-
-        raise InvalidTokenException("Formato inválido de expiração no token")
+        return self.verify(token).expires_at
 
     def is_token_expired(self, token: str) -> bool:
         """
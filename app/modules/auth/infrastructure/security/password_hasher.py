@@ -1,57 +1,141 @@
+import math
+import statistics
+from time import perf_counter
+from typing import Optional
+
 from passlib.context import CryptContext
 
 from app.core.config import settings
 
+SCHEME_BCRYPT = "bcrypt"
+SCHEME_ARGON2 = "argon2"  # sempre argon2id
+
+SUPPORTED_SCHEMES = (SCHEME_BCRYPT, SCHEME_ARGON2)
+
+# Limite superior do custo na calibração (bcrypt: log2 das rodadas; argon2: passes)
+MAX_COST = {SCHEME_BCRYPT: 31, SCHEME_ARGON2: 64}
+
 
 class PasswordHasher:
     """
     Classe responsável por hash e verificação de senhas.
-    
-    Utiliza bcrypt através da biblioteca passlib.
+
+    Utiliza bcrypt ou argon2id através da biblioteca passlib.
+
+    - `scheme`: algoritmo dos hashes novos; hashes no outro algoritmo
+      continuam sendo verificados, mas pedem rehash
+    - `cost`: rodadas do bcrypt (log2) ou passes (time_cost) do argon2id;
+      hashes com custo menor, ou com memória/paralelismo diferentes no
+      argon2id, pedem rehash
     """
-    
-    def __init__(self):
-        self._pwd_context = CryptContext(
-            schemes=["bcrypt"],
-            deprecated="auto",
-            bcrypt__rounds=settings.BCRYPT_ROUNDS,
-        )
-    
+
+    def __init__(self, scheme: Optional[str] = None, cost: Optional[int] = None):
+        self.scheme = scheme or settings.PASSWORD_HASH_SCHEME
+        if self.scheme not in SUPPORTED_SCHEMES:
+            raise ValueError(f"Esquema de hash não suportado: {self.scheme}")
+
+        self.cost = cost or default_cost(self.scheme)
+
+        if self.scheme == SCHEME_BCRYPT:
+            schemes = [SCHEME_BCRYPT, SCHEME_ARGON2]
+            params = {"bcrypt__rounds": self.cost, "bcrypt__min_rounds": self.cost}
+        else:
+            schemes = [SCHEME_ARGON2, SCHEME_BCRYPT]
+            params = {
+                "argon2__type": "ID",
+                "argon2__rounds": self.cost,
+                "argon2__min_rounds": self.cost,
+                "argon2__memory_cost": settings.ARGON2_MEMORY_KIB,
+                "argon2__parallelism": settings.ARGON2_PARALLELISM,
+            }
+
+        # o primeiro esquema gera os hashes; o outro só verifica (e pede rehash)
+        self._pwd_context = CryptContext(schemes=schemes, deprecated="auto", **params)
+
+    @classmethod
+    def calibrated(cls, scheme: Optional[str] = None, target_ms: Optional[float] = None) -> "PasswordHasher":
+        """Hasher com o custo calibrado para este hardware (ver `calibrate_cost`)."""
+        scheme = scheme or settings.PASSWORD_HASH_SCHEME
+        return cls(scheme, calibrate_cost(scheme, target_ms or settings.PASSWORD_HASH_TARGET_MS))
+
     def hash(self, password: str) -> str:
         """
         Gera hash da senha.
-        
+
         Args:
             password: Senha em texto plano
-            
+
         Returns:
             str: Hash da senha
         """
         return self._pwd_context.hash(password)
-    
+
     def verify(self, plain_password: str, hashed_password: str) -> bool:
         """
         Verifica se senha corresponde ao hash.
-        
+
         Args:
             plain_password: Senha em texto plano
             hashed_password: Hash armazenado
-            
+
         Returns:
             bool: True se senha é válida
         """
         return self._pwd_context.verify(plain_password, hashed_password)
-    
+
     def needs_rehash(self, hashed_password: str) -> bool:
         """
         Verifica se hash precisa ser atualizado.
-        
-        Útil quando mudamos configurações de segurança.
-        
+
+        Verdadeiro para hashes em outro esquema ou com parâmetros
+        abaixo dos atuais (após calibração ou mudança de configuração).
+
         Args:
             hashed_password: Hash armazenado
-            
+
         Returns:
             bool: True se precisa ser rehashed
         """
         return self._pwd_context.needs_update(hashed_password)
+
+
+def default_cost(scheme: str) -> int:
+    return settings.BCRYPT_ROUNDS if scheme == SCHEME_BCRYPT else settings.ARGON2_TIME_COST
+
+
+def measure_hash_ms(scheme: str, cost: int, samples: int = 3) -> float:
+    """Mediana, em ms, de um hash com o esquema e custo informados."""
+    hasher = PasswordHasher(scheme, cost)
+    timings = []
+
+    for _ in range(samples):
+        started = perf_counter()
+        hasher.hash("calibracao-de-custo")
+        timings.append((perf_counter() - started) * 1000)
+
+    return statistics.median(timings)
+
+
+def calibrate_cost(scheme: str, target_ms: float, min_cost: Optional[int] = None) -> int:
+    """
+    Maior custo cujo hash leva até `target_ms` neste hardware.
+
+    - bcrypt: cada rodada a mais dobra o tempo; mede um custo baixo e extrapola
+    - argon2id: tempo ≈ fixo + passes × por-passe (memória fixa); mede 1 e 2 passes
+
+    O custo configurado (`min_cost`, padrão BCRYPT_ROUNDS/ARGON2_TIME_COST)
+    é um piso: em hardware lento o hash fica acima do alvo, mas nunca
+    abaixo do mínimo de segurança.
+    """
+    floor = min_cost or default_cost(scheme)
+
+    if scheme == SCHEME_BCRYPT:
+        base_cost = 8
+        base_ms = measure_hash_ms(scheme, base_cost)
+        cost = base_cost + math.floor(math.log2(max(target_ms / base_ms, 1e-9)))
+    else:
+        one_pass = measure_hash_ms(scheme, 1)
+        per_pass = max(measure_hash_ms(scheme, 2) - one_pass, 1e-3)
+        cost = 1 + math.floor((target_ms - one_pass) / per_pass)
+
+    return min(max(cost, floor), MAX_COST[scheme])
@@ -0,0 +1,119 @@
+import asyncio
+import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import perf_counter
+from typing import Callable, Deque, Dict, Tuple, TypeVar
+
+from app.modules.auth.infrastructure.security.password_hasher import PasswordHasher
+
+T = TypeVar("T")
+
+# Amostras recentes usadas nos percentis das métricas
+METRICS_WINDOW = 1024
+
+
+class PasswordHashingBusyError(Exception):
+    """Fila de hash de senha cheia: o cliente deve tentar de novo mais tarde."""
+
+    def __init__(self, retry_after: int = 1):
+        self.retry_after = retry_after
+        super().__init__("Servidor ocupado processando senhas. Tente novamente em instantes.")
+
+
+class PasswordHashingExecutor:
+    """
+    Executa hash/verificação de senha em threads dedicadas, fora do event loop.
+
+    - bcrypt libera o GIL durante o cálculo, então `workers` threads
+      processam senhas em paralelo enquanto o loop segue atendendo as
+      demais rotas. `workers <= 0` usa núcleos - 1, deixando CPU livre
+      para o loop.
+    - No máximo `workers + max_queue` operações ficam em andamento; além
+      disso a chamada falha na hora com PasswordHashingBusyError (503),
+      em vez de acumular uma fila que só aumenta a latência de todos.
+    - Mede o tempo de espera na fila e o tempo de hash de cada operação.
+
+    Uma operação conta como em andamento até a thread terminar, mesmo que
+    a requisição que a pediu tenha sido cancelada.
+    """
+
+    def __init__(self, hasher: PasswordHasher, workers: int, max_queue: int):
+        if workers <= 0:
+            workers = max(1, (os.cpu_count() or 2) - 1)
+
+        self._hasher = hasher
+        self._workers = workers
+        self._capacity = workers + max_queue
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._completed = 0
+        self._rejected = 0
+        self._samples: Deque[Tuple[float, float]] = deque(maxlen=METRICS_WINDOW)
+
+    async def hash(self, password: str) -> str:
+        return await self._submit(self._hasher.hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(self._hasher.verify, plain_password, hashed_password)
+
+    def needs_rehash(self, hashed_password: str) -> bool:
+        # Só inspeciona o prefixo do hash: barato, roda no próprio loop
+        return self._hasher.needs_rehash(hashed_password)
+
+    async def _submit(self, fn: Callable[..., T], *args) -> T:
+        with self._lock:
+            if self._in_flight >= self._capacity:
+                self._rejected += 1
+                raise PasswordHashingBusyError()
+            self._in_flight += 1
+
+        submitted_at = perf_counter()
+
+        def run() -> T:
+            started_at = perf_counter()
+            try:
+                return fn(*args)
+            finally:
+                self._record(started_at - submitted_at, perf_counter() - started_at)
+
+        future: Future = self._pool.submit(run)
+        future.add_done_callback(self._release)
+
+        return await asyncio.wrap_future(future)
+
+    def _record(self, queue_wait: float, hash_time: float) -> None:
+        with self._lock:
+            self._completed += 1
+            self._samples.append((queue_wait, hash_time))
+
+    def _release(self, _future: Future) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    def stats(self) -> Dict[str, float]:
+        """Fila, rejeições e percentis (ms) de espera e de hash das amostras recentes."""
+        with self._lock:
+            samples = list(self._samples)
+            stats: Dict[str, float] = {
+                "workers": self._workers,
+                "capacity": self._capacity,
+                "in_flight": self._in_flight,
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }
+
+        for index, name in ((0, "queue_wait"), (1, "hash_time")):
+            values = sorted(sample[index] for sample in samples)
+            for label, q in (("p50", 0.50), ("p99", 0.99)):
+                stats[f"{name}_{label}_ms"] = (
+                    values[min(len(values) - 1, int(q * len(values)))] * 1000 if values else 0.0
+                )
+
+        return stats
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,99 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
+
+
+@dataclass(frozen=True)
+class VerifiedToken:
+    """
+    Token JWT já decodificado e com assinatura/expiração verificadas.
+
+    Produzido uma vez por requisição (ou reaproveitado do cache) e
+    repassado a quem precisar das claims, sem novo decode.
+    """
+
+    claims: Mapping[str, Any]
+
+    @property
+    def subject(self) -> Optional[str]:
+        return self.claims.get("sub")
+
+    @property
+    def token_type(self) -> Optional[str]:
+        return self.claims.get("type")
+
+    @property
+    def jti(self) -> Optional[str]:
+        return self.claims.get("jti")
+
+    @property
+    def expires_at(self) -> datetime:
+        return datetime.fromtimestamp(self.claims["exp"], tz=timezone.utc)
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
+        return (time.time() if now is None else now) >= self.claims["exp"]
+
+
+class VerifiedTokenCache:
+    """
+    LRU em memória de tokens já verificados, indexada pelo SHA-256 do token.
+
+    Uma entrada vale até o `exp` do próprio token: expirada, é descartada
+    na leitura e a verificação volta a ser feita (e falha). O tamanho é
+    limitado a `maxsize`; ao exceder, sai o token usado há mais tempo.
+
+    A chave é o digest (32 bytes) e não o token, que fica fora da memória
+    do cache. O lock cobre dependências síncronas rodando no threadpool.
+    """
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._entries: "OrderedDict[bytes, VerifiedToken]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[VerifiedToken]:
+        key = self._key(token)
+
+        with self._lock:
+            verified = self._entries.get(key)
+            if verified is None:
+                return None
+
+            if verified.is_expired():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+            return verified
+
+    def put(self, token: str, claims: Mapping[str, Any]) -> VerifiedToken:
+        verified = VerifiedToken(claims=MappingProxyType(dict(claims)))
+
+        # Sem `exp` numérico não há como expirar a entrada: não cacheia
+        if self._maxsize <= 0 or not isinstance(claims.get("exp"), (int, float)):
+            return verified
+
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = verified
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+        return verified
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -1,16 +1,17 @@
-from typing import Annotated
+from typing import Annotated, Optional
 
-from fastapi import Depends, HTTPException, Security, status
+from fastapi import Depends, HTTPException, Request, Security, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
-from redis import Redis
-from sqlalchemy.orm import Session
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.infra.redis.session_repository import RedisSessionRepository
+from app.core.container import get_container
 from app.infra.redis.dependencies import get_redis
 
 from app.shared.infrastructure.database.session import get_db
 
+from app.modules.auth.application.services.email_outbox import EmailOutbox
 from app.modules.auth.application.services.google_token_verifier import GoogleTokenVerifier
 from app.modules.auth.application.services.jwt_service import JwtService
 
@@ -22,18 +23,20 @@ from app.modules.auth.application.usecases.register_usecase import RegisterUseCa
 from app.modules.auth.application.usecases.getcurrentuser_usecase import GetCurrentUserUseCase
 
 from app.modules.auth.domain.entities.user_entity import UserEntity
+from app.modules.auth.domain.read_models.authenticated_principal import AuthenticatedPrincipal
 from app.modules.auth.domain.repositories.user_repository import UserRepository
 from app.modules.auth.domain.repositories.session_repository import SessionRepository
 
 from app.modules.auth.domain.exceptions.auth_exceptions import InvalidTokenException
 
+from app.modules.auth.infrastructure.cache.user_cache import UserCache
 from app.modules.auth.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
-from app.modules.auth.infrastructure.repositories.google_token_verifier_impl import GoogleTokenVerifierImpl
-from app.modules.auth.infrastructure.repositories.jwt_service_impl import JwtServiceImpl
 
 from app.modules.auth.infrastructure.security.jwt_handler import JWTHandler
-from app.modules.auth.infrastructure.security.password_hasher import PasswordHasher
+from app.modules.auth.infrastructure.security.verified_token_cache import VerifiedToken
+from app.modules.auth.infrastructure.security.password_hashing_executor import PasswordHashingExecutor
 
+from app.core.config import settings
 from app.core.constants import TOKEN_TYPE_ACCESS
 
 
@@ -48,37 +51,55 @@ bearer_scheme = HTTPBearer()
 # Dependencies de Infraestrutura
 # ============================================================
 
-def get_password_hasher() -> PasswordHasher:
-    return PasswordHasher()
+# Singletons do container (lifespan): aqui só há leitura, nada é
+# construído por requisição. `async def` evita o desvio do FastAPI
+# para o threadpool, que ele faz com dependencies síncronas.
 
+async def get_password_hasher(request: Request) -> PasswordHashingExecutor:
+    # Pool de threads compartilhado
+    return get_container(request).password_hashing
 
-def get_jwt_handler() -> JWTHandler:
-    return JWTHandler()
 
+async def get_jwt_handler(request: Request) -> JWTHandler:
+    return get_container(request).jwt_handler
 
-def get_user_repository(db: Session = Depends(get_db)) -> UserRepository:
-    return UserRepositoryImpl(db)
+
+async def get_user_cache(request: Request) -> Optional[UserCache]:
+    return get_container(request).user_cache
+
+
+async def get_session_repository(request: Request) -> SessionRepository:
+    return get_container(request).session_repository
+
+
+async def get_user_repository(
+    db: AsyncSession = Depends(get_db),
+    user_cache: Optional[UserCache] = Depends(get_user_cache),
+    session_repository: SessionRepository = Depends(get_session_repository),
+) -> UserRepository:
+    # Por requisição: depende da sessão do banco
+    return UserRepositoryImpl(db, user_cache, session_repository)
 
 
 # ============================================================
 # UseCases
 # ============================================================
 
-def get_login_usecase(
+async def get_login_usecase(
     user_repository: UserRepository = Depends(get_user_repository),
-    password_hasher: PasswordHasher = Depends(get_password_hasher),
+    password_hasher: PasswordHashingExecutor = Depends(get_password_hasher),
 ) -> LoginUseCase:
     return LoginUseCase(user_repository, password_hasher)
 
 
-def get_register_usecase(
+async def get_register_usecase(
     user_repository: UserRepository = Depends(get_user_repository),
-    password_hasher: PasswordHasher = Depends(get_password_hasher),
+    password_hasher: PasswordHashingExecutor = Depends(get_password_hasher),
 ) -> RegisterUseCase:
     return RegisterUseCase(user_repository, password_hasher)
 
 
-def get_current_user_usecase(
+async def get_current_user_usecase(
     user_repository: UserRepository = Depends(get_user_repository),
 ) -> GetCurrentUserUseCase:
     return GetCurrentUserUseCase(user_repository)
@@ -88,39 +109,75 @@ def get_current_user_usecase(
 # AUTH CORE (🔒 Swagger + JWT)
 # ============================================================
 
-async def get_current_user(
+async def get_access_token(
     credentials: HTTPAuthorizationCredentials = Security(bearer_scheme),
     jwt_handler: JWTHandler = Depends(get_jwt_handler),
+) -> VerifiedToken:
+    """
+    Access token do header Authorization, verificado uma vez por requisição.
+
+    O FastAPI reaproveita o resultado entre as dependências da mesma
+    requisição; entre requisições, o cache do JWTHandler evita refazer
+    a verificação de assinatura para o mesmo token.
+    """
+    try:
+        return jwt_handler.verify(credentials.credentials, expected_type=TOKEN_TYPE_ACCESS)
+    except InvalidTokenException as e:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail=str(e),
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+AccessToken = Annotated[VerifiedToken, Depends(get_access_token)]
+
+
+async def _ensure_current_epoch(access_token: VerifiedToken, session_repo: SessionRepository) -> None:
+    """Recusa tokens emitidos antes da última revogação de todas as sessões."""
+    token_epoch = access_token.claims.get("epoch", 0)
+
+    if token_epoch < await session_repo.get_session_epoch(access_token.subject):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Sessão revogada",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+async def _ensure_not_blacklisted(access_token: VerifiedToken, session_repo: SessionRepository) -> None:
+    """Recusa tokens revogados por logout (filtro local antes do Redis)."""
+    if await session_repo.is_access_token_blacklisted(access_token.jti):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token revogado",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+async def get_current_user(
+    access_token: AccessToken,
     get_user_uc: GetCurrentUserUseCase = Depends(get_current_user_usecase),
-    redis: Redis = Depends(get_redis),
+    session_repo: SessionRepository = Depends(get_session_repository),
 ) -> UserEntity:
 
-    token = credentials.credentials
-
     try:
-        # 1. blacklist
-        if redis.exists(f"blacklist:{token}"):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token revogado",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        # 1. user id e jti (claims já verificadas em get_access_token)
+        user_id = access_token.subject
+        if not user_id:
+            raise InvalidTokenException("Token não contém ID do usuário")
 
-        # 2. tipo do token
-        if not jwt_handler.verify_token_type(token, TOKEN_TYPE_ACCESS):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Token de acesso inválido",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+        if not access_token.jti:
+            raise InvalidTokenException("Token sem identificador; faça login novamente")
 
-        # 3. user id
-        user_id = jwt_handler.get_user_id_from_token(token)
+        # 2. blacklist e época de sessão
+        await _ensure_not_blacklisted(access_token, session_repo)
+        await _ensure_current_epoch(access_token, session_repo)
 
-        # 4. user
+        # 3. user
         user = await get_user_uc.execute(user_id)
 
-        # 5. ativo
+        # 4. ativo
         if not user.can_login():
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -152,21 +209,84 @@ async def get_current_user(
 CurrentUser = Annotated[UserEntity, Depends(get_current_user)]
 
 
+async def get_principal_from_claims(
+    access_token: AccessToken,
+    session_repo: SessionRepository = Depends(get_session_repository),
+) -> AuthenticatedPrincipal:
+    """
+    Modo stateless: valida pelas claims, pela blacklist e pela época de
+    sessão, sem consulta ao banco.
+
+    A blacklist passa antes pelo filtro de revogados em memória, então só
+    um provável positivo chega ao Redis. Tokens emitidos antes das claims
+    `jti`/`epoch`/`active` exigem novo login.
+    """
+    claims = access_token.claims
+
+    if not access_token.subject or "epoch" not in claims or "active" not in claims:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token sem época de sessão; faça login novamente",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    if not access_token.jti:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token sem identificador; faça login novamente",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    await _ensure_not_blacklisted(access_token, session_repo)
+    await _ensure_current_epoch(access_token, session_repo)
+
+    if not claims["active"]:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Usuário inativo",
+        )
+
+    return AuthenticatedPrincipal(user_id=access_token.subject, is_active=True)
+
+
+async def get_principal_from_user(user: CurrentUser) -> AuthenticatedPrincipal:
+    """Modo padrão: principal a partir do usuário carregado (cache/banco)."""
+    return AuthenticatedPrincipal(user_id=str(user.id), is_active=user.is_active)
+
+
+# Rotas que só precisam saber quem é o usuário dependem do principal;
+# AUTH_STATELESS decide se isso custa uma leitura do usuário ou não
+get_current_principal = (
+    get_principal_from_claims if settings.AUTH_STATELESS else get_principal_from_user
+)
+
+CurrentPrincipal = Annotated[AuthenticatedPrincipal, Depends(get_current_principal)]
+
+
 # ============================================================
 # Outros UseCases
 # ============================================================
 
-def get_forgot_password_usecase(
+async def get_email_outbox(request: Request) -> EmailOutbox:
+    return get_container(request).email_outbox
+
+
+async def get_forgot_password_usecase(
     user_repository: UserRepository = Depends(get_user_repository),
     redis: Redis = Depends(get_redis),
+    email_outbox: EmailOutbox = Depends(get_email_outbox),
 ) -> ForgotPasswordUseCase:
-    return ForgotPasswordUseCase(user_repository=user_repository, redis=redis)
+    return ForgotPasswordUseCase(
+        user_repository=user_repository,
+        redis=redis,
+        email_outbox=email_outbox,
+    )
 
 
-def get_reset_password_usecase(
+async def get_reset_password_usecase(
     user_repository: UserRepository = Depends(get_user_repository),
     redis: Redis = Depends(get_redis),
-    password_hasher: PasswordHasher = Depends(get_password_hasher),
+    password_hasher: PasswordHashingExecutor = Depends(get_password_hasher),
 ) -> ResetPasswordUseCase:
     return ResetPasswordUseCase(
         user_repository=user_repository,
@@ -175,17 +295,16 @@ def get_reset_password_usecase(
     )
 
 
-def get_jwt_service(
-    jwt_handler: JWTHandler = Depends(get_jwt_handler),
-) -> JwtService:
-    return JwtServiceImpl(jwt_handler)
+async def get_jwt_service(request: Request) -> JwtService:
+    return get_container(request).jwt_service
 
 
-def get_google_token_verifier() -> GoogleTokenVerifier:
-    return GoogleTokenVerifierImpl()
+async def get_google_token_verifier(request: Request) -> GoogleTokenVerifier:
+    # Certificados em cache compartilhado
+    return get_container(request).google_token_verifier
 
 
-def get_google_login_usecase(
+async def get_google_login_usecase(
     user_repository: UserRepository = Depends(get_user_repository),
     google_token_verifier: GoogleTokenVerifier = Depends(get_google_token_verifier),
     jwt_service: JwtService = Depends(get_jwt_service),
@@ -196,8 +315,3 @@ def get_google_login_usecase(
         jwt_service=jwt_service,
     )
 
-
-def get_session_repository(
-    redis: Redis = Depends(get_redis),
-) -> SessionRepository:
-    return RedisSessionRepository(redis)
@@ -0,0 +1,17 @@
+from app.shared.presentation.middlewares.rate_limit_middleware import RateLimitRule
+
+# Limites das rotas de autenticação (caminhos relativos ao prefixo da API).
+# Regras da mesma rota são avaliadas juntas, em uma ida ao Redis.
+AUTH_RATE_LIMITS = {
+    ("POST", "/auth/login"): (
+        RateLimitRule("login_ip", limit=5, window_seconds=60),
+        RateLimitRule("login_email", limit=5, window_seconds=60, body_field="email"),
+    ),
+    ("POST", "/auth/forgot-password"): (
+        RateLimitRule("forgot_password_ip", limit=5, window_seconds=3600),
+        RateLimitRule("forgot_password_email", limit=3, window_seconds=3600, body_field="email"),
+    ),
+    ("POST", "/auth/google-login"): (
+        RateLimitRule("google_login_ip", limit=10, window_seconds=60),
+    ),
+}
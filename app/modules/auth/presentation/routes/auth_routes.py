@@ -1,17 +1,21 @@
-from fastapi import APIRouter, Depends, Request, status, HTTPException
+from fastapi import APIRouter, Depends, status, HTTPException
 from typing import Annotated
+from pydantic import TypeAdapter
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 import traceback
 from app.modules.auth.application.dtos.logininput_dto import LoginInputDTO
 from app.modules.auth.application.dtos.registerinput_dto import RegisterInputDTO
-from app.modules.auth.domain.repositories.session_repository import SessionRepository
-from app.shared.security.rate_limiter import rate_limit
+from app.modules.auth.domain.repositories.session_repository import (
+    RefreshRotation,
+    SessionRepository,
+)
 
+from app.modules.auth.application.services.jwt_service import JwtService
+from app.modules.auth.application.usecases.getcurrentuser_usecase import GetCurrentUserUseCase
 from app.modules.auth.application.usecases.google_login_usecase import GoogleLoginUseCase
 from app.modules.auth.application.usecases.reset_password_usecase import ResetPasswordUseCase
 from app.modules.auth.presentation.schemas.google_login_request import GoogleLoginRequest
 from app.modules.auth.presentation.schemas.reset_password_request import ResetPasswordRequest
-from redis import Redis
 
 # ===== Presentation (HTTP Schemas) =====
 from app.modules.auth.presentation.schemas.current_user_response_schema import CurrentUserResponse
@@ -23,6 +27,10 @@ from app.modules.auth.presentation.schemas.refresh_token_request import RefreshT
 from app.modules.auth.presentation.schemas.refresh_token_response import RefreshTokenResponse
 from app.modules.auth.presentation.schemas.register_request import RegisterRequest
 from app.modules.auth.presentation.schemas.register_response import RegisterResponse
+from app.modules.auth.presentation.schemas.session_list_response import (
+    SessionListResponse,
+    SessionResponse,
+)
 
 # ===== Application =====
 from app.modules.auth.application.usecases import (
@@ -44,13 +52,20 @@ from app.modules.auth.domain.exceptions.auth_exceptions import UserAlreadyExists
 
 # ===== Infrastructure =====
 from app.modules.auth.infrastructure.security.jwt_handler import JWTHandler
+from app.modules.auth.infrastructure.security.password_hashing_executor import (
+    PasswordHashingBusyError,
+)
 
 # ===== Dependencies & Exceptions =====
 from app.modules.auth.presentation.dependencies.auth_deps import (
+    AccessToken,
+    CurrentPrincipal,
     CurrentUser,
+    get_current_user_usecase,
     get_forgot_password_usecase,
     get_google_login_usecase,
     get_jwt_handler,
+    get_jwt_service,
     get_login_usecase,
     get_register_usecase,
     get_reset_password_usecase,
@@ -62,44 +77,35 @@ from app.shared.presentation.exceptions.http_exceptions import (
     ConflictException,
     BadRequestException,
 )
+from app.shared.presentation.responses.typed_json_response import TypedJSONResponse
 from app.core.config import settings
-from app.core.constants import TOKEN_TYPE_ACCESS, TOKEN_TYPE_REFRESH
+from app.core.constants import TOKEN_TYPE_REFRESH
 
-from app.infra.redis.dependencies import get_redis
 
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 bearer_scheme = HTTPBearer()
 
+# Serializadores pré-compilados: as respostas são montadas aqui mesmo,
+# então vão direto para bytes, sem revalidar contra o response_model
+_LOGIN_JSON = TypeAdapter(LoginResponse)
+_REGISTER_JSON = TypeAdapter(RegisterResponse)
+_CURRENT_USER_JSON = TypeAdapter(CurrentUserResponse)
+_REFRESH_JSON = TypeAdapter(RefreshTokenResponse)
+_SESSION_LIST_JSON = TypeAdapter(SessionListResponse)
+
 @router.post(
     "/login",
     response_model=LoginResponse,
 )
 async def login(
-    request: Request,
     credentials: LoginRequest,
     login_uc: Annotated[LoginUseCase, Depends(get_login_usecase)],
     jwt_handler: Annotated[JWTHandler, Depends(get_jwt_handler)],
+    jwt_service: Annotated[JwtService, Depends(get_jwt_service)],
     session_repo: SessionRepository = Depends(get_session_repository),
-    redis: Redis = Depends(get_redis), 
 ):
-    ip = request.client.host
-    email = credentials.email.strip().lower()
-
-    rate_limit(
-        redis=redis,
-        key=f"login_attempt:{ip}",
-        limit=5,
-        window_seconds=60,
-    )
-
-    rate_limit(
-        redis=redis,
-        key=f"login_email:{email}",
-        limit=5,
-        window_seconds=60,
-    )
-
+    # rate limit por IP e email: RateLimitMiddleware (ver presentation/rate_limits.py)
     input_dto = LoginInputDTO(
         email=Email(credentials.email),
         password=PlainPassword(credentials.senha),
@@ -109,21 +115,14 @@ async def login(
 
     user_id = str(result.user_id.value)
 
-    access_token = jwt_handler.create_access_token(user_id)
-    refresh_token = jwt_handler.create_refresh_token(user_id)
-
-    refresh_payload = jwt_handler.decode_token(
-        refresh_token,
-        expected_type=TOKEN_TYPE_REFRESH,
-    )
-
-    jti = refresh_payload["jti"]
+    access_token = await jwt_service.create_access_token(user_id, is_active=result.is_active)
+    refresh_token, jti = jwt_handler.create_refresh_token(user_id)
 
     # TTL do refresh
     ttl_seconds = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
 
     # usa repository (correto)
-    session_repo.store_refresh_token(
+    await session_repo.store_refresh_token(
         jti=jti,
         user_id=user_id,
         ttl_seconds=ttl_seconds,
@@ -137,12 +136,15 @@ async def login(
         created_at=None,
     )
 
-    return LoginResponse(
-        user=user_response,
-        access_token=access_token,
-        refresh_token=refresh_token,
-        token_type="Bearer",
-        expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    return TypedJSONResponse(
+        LoginResponse(
+            user=user_response,
+            access_token=access_token,
+            refresh_token=refresh_token,
+            token_type="Bearer",
+            expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        ),
+        _LOGIN_JSON,
     )
 
 
@@ -155,6 +157,7 @@ async def register(
     data: RegisterRequest,
     register_uc: Annotated[RegisterUseCase, Depends(get_register_usecase)],
     jwt_handler: Annotated[JWTHandler, Depends(get_jwt_handler)],
+    jwt_service: Annotated[JwtService, Depends(get_jwt_service)],
     session_repo: Annotated[SessionRepository, Depends(get_session_repository)],
 ):
     try:
@@ -167,31 +170,30 @@ async def register(
         user = await register_uc.execute(input_dto)
         user_id = str(user.id.value)
 
-        access_token = jwt_handler.create_access_token(user_id)
-        refresh_token = jwt_handler.create_refresh_token(user_id)
-
-        refresh_payload = jwt_handler.decode_token(
-            refresh_token,
-            expected_type=TOKEN_TYPE_REFRESH,
-        )
-
-        jti = refresh_payload["jti"]
+        access_token = await jwt_service.create_access_token(user_id, is_active=user.is_active)
+        refresh_token, jti = jwt_handler.create_refresh_token(user_id)
 
         ttl_seconds = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
 
         # usa repository (arquitetura correta)
-        session_repo.store_refresh_token(
+        await session_repo.store_refresh_token(
             jti=jti,
             user_id=user_id,
             ttl_seconds=ttl_seconds,
         )
 
-        return RegisterResponse(
-            user=CurrentUserResponse.from_domain(user),
-            access_token=access_token,
-            refresh_token=refresh_token,
+        return TypedJSONResponse(
+            RegisterResponse(
+                user=CurrentUserResponse.from_domain(user),
+                access_token=access_token,
+                refresh_token=refresh_token,
+            ),
+            _REGISTER_JSON,
+            status_code=status.HTTP_201_CREATED,
         )
 
+    except PasswordHashingBusyError:
+        raise
     except UserAlreadyExistsException as e:
         raise ConflictException(str(e))
     except ValueError as e:
@@ -207,7 +209,7 @@ async def register(
     dependencies=[Depends(bearer_scheme)],
 )
 async def get_me(current_user: CurrentUser):
-    return CurrentUserResponse.from_domain(current_user)
+    return TypedJSONResponse(CurrentUserResponse.from_domain(current_user), _CURRENT_USER_JSON)
 
 @router.post(
     "/refresh",
@@ -216,6 +218,8 @@ async def get_me(current_user: CurrentUser):
 async def refresh_token(
     data: RefreshTokenRequest,
     jwt_handler: Annotated[JWTHandler, Depends(get_jwt_handler)],
+    jwt_service: Annotated[JwtService, Depends(get_jwt_service)],
+    get_user_uc: Annotated[GetCurrentUserUseCase, Depends(get_current_user_usecase)],
     session_repo: Annotated[SessionRepository, Depends(get_session_repository)],
 ):
     payload = jwt_handler.decode_token(
@@ -228,45 +232,35 @@ async def refresh_token(
 
     ttl = settings.REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
 
-    # verifica se refresh existe
-    if not session_repo.is_refresh_token_valid(jti):
+    # status atual do usuário vai para a claim `active` do novo access token
+    user = await get_user_uc.execute(user_id)
+    if not user.can_login():
+        raise UnauthorizedException("Usuário inativo")
 
-        # reuse detection
-        if session_repo.is_refresh_token_used(jti):
+    new_refresh_token, new_jti = jwt_handler.create_refresh_token(user_id)
 
-            session_repo.revoke_all_sessions(user_id)
+    # valida, detecta reuso, revoga, marca como usado e grava o novo
+    # numa única operação atômica no Redis
+    rotation = await session_repo.rotate_refresh_token(jti, user_id, new_jti, ttl)
 
-            raise UnauthorizedException(
-                "Refresh token reutilizado. Todas as sessões foram revogadas."
-            )
+    if rotation is RefreshRotation.REUSED:
+        raise UnauthorizedException(
+            "Refresh token reutilizado. Todas as sessões foram revogadas."
+        )
 
+    if rotation is RefreshRotation.INVALID:
         raise UnauthorizedException("Refresh token inválido ou expirado")
 
-    # gera novos tokens
-    new_access_token = jwt_handler.create_access_token(user_id)
-    new_refresh_token = jwt_handler.create_refresh_token(user_id)
-
-    new_payload = jwt_handler.decode_token(
-        new_refresh_token,
-        expected_type=TOKEN_TYPE_REFRESH,
-    )
-
-    new_jti = new_payload["jti"]
-
-    # revoke refresh antigo
-    session_repo.revoke_refresh_token(jti, user_id)
-
-    # marca como usado
-    session_repo.mark_refresh_token_used(jti, ttl)
-
-    # salva novo refresh
-    session_repo.store_refresh_token(new_jti, user_id, ttl)
+    new_access_token = await jwt_service.create_access_token(user_id, is_active=user.is_active)
 
-    return RefreshTokenResponse(
-        access_token=new_access_token,
-        refresh_token=new_refresh_token,
-        token_type="Bearer",
-        expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    return TypedJSONResponse(
+        RefreshTokenResponse(
+            access_token=new_access_token,
+            refresh_token=new_refresh_token,
+            token_type="Bearer",
+            expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+        ),
+        _REFRESH_JSON,
     )
 
 @router.post(
@@ -275,27 +269,19 @@ async def refresh_token(
 )
 async def logout(
     data: LogoutRequest,
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    verified_access: AccessToken,
     jwt_handler: JWTHandler = Depends(get_jwt_handler),
     session_repo: SessionRepository = Depends(get_session_repository),
 ):
-    access_token = credentials.credentials
-
-    # 1 Decodifica access token
-    access_payload = jwt_handler.decode_token(
-        access_token,
-        expected_type=TOKEN_TYPE_ACCESS,
-    )
-
-    user_id = access_payload["sub"]
-
-    # 2 Blacklist do access token
-    expires_at = jwt_handler.get_token_expiration(access_token)
-
-    session_repo.blacklist_access_token(
-        token=access_token,
-        expires_at=expires_at,
-    )
+    # 1 Access token já verificado pela dependência
+    user_id = verified_access.subject
+
+    # 2 Blacklist do access token (tokens antigos, sem jti, só expiram)
+    if verified_access.jti:
+        await session_repo.blacklist_access_token(
+            jti=verified_access.jti,
+            expires_at=verified_access.expires_at,
+        )
 
     # 3 Decodifica refresh token
     refresh_payload = jwt_handler.decode_token(
@@ -308,7 +294,7 @@ async def logout(
         raise UnauthorizedException("Refresh token não pertence ao usuário")
 
     # 5 Revoga refresh token
-    session_repo.revoke_refresh_token(
+    await session_repo.revoke_refresh_token(
         jti=refresh_payload["jti"],
         user_id=user_id,
     )
@@ -317,58 +303,45 @@ async def logout(
     status_code=status.HTTP_204_NO_CONTENT,
 )
 async def logout_all(
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
-    jwt_handler: JWTHandler = Depends(get_jwt_handler),
+    verified_access: AccessToken,
     session_repo: SessionRepository = Depends(get_session_repository),
 ):
-    access_token = credentials.credentials
+    user_id = verified_access.subject
 
-    payload = jwt_handler.decode_token(
-        access_token,
-        expected_type=TOKEN_TYPE_ACCESS,
-    )
+    # revoga todas as sessões do usuário; o avanço da época invalida
+    # também todos os access tokens já emitidos (inclusive o atual)
+    await session_repo.revoke_all_sessions(user_id)
 
-    user_id = payload["sub"]
-
-    # revoga todas as sessões do usuário
-    session_repo.revoke_all_sessions(user_id)
+    return
 
-    # blacklist do access token atual
-    expires_at = jwt_handler.get_token_expiration(access_token)
 
-    session_repo.blacklist_access_token(
-        token=access_token,
-        expires_at=expires_at,
+@router.get(
+    "/sessions",
+    response_model=SessionListResponse,
+    dependencies=[Depends(bearer_scheme)],
+)
+async def list_sessions(
+    principal: CurrentPrincipal,
+    session_repo: Annotated[SessionRepository, Depends(get_session_repository)],
+):
+    # sessões vivas numa ida ao Redis (expiradas são podadas na mesma chamada)
+    sessions = await session_repo.get_user_sessions(principal.user_id)
+
+    return TypedJSONResponse(
+        SessionListResponse(
+            sessions=[SessionResponse.from_domain(session) for session in sessions],
+            total=len(sessions),
+        ),
+        _SESSION_LIST_JSON,
     )
 
-    return
-
 
 @router.post("/forgot-password")
 async def forgot_password(
-    request: Request,
     data: ForgotPasswordRequest,
     forgot_password_uc: Annotated[ForgotPasswordUseCase, Depends(get_forgot_password_usecase)],
-    redis: Annotated[Redis, Depends(get_redis)],
 ):
-    ip = request.client.host
-    email_str = data.email.strip().lower()
-
-    rate_limit(
-        redis,
-        key=f"forgot_password_ip:{ip}",
-        limit=5,
-        window_seconds=3600,
-    )
-
-    rate_limit(
-        redis,
-        key=f"forgot_password_email:{email_str}",
-        limit=3,
-        window_seconds=3600,
-    )
-
-    email = Email(email_str)
+    email = Email(data.email.strip().lower())
 
     await forgot_password_uc.execute(email)
 
@@ -389,7 +362,7 @@ async def reset_password(
     )
 
     # revoga todas as sessões do usuário
-    session_repo.revoke_all_sessions(user_id)
+    await session_repo.revoke_all_sessions(user_id)
 
     return {"message": "Senha alterada com sucesso"}
 
@@ -400,21 +373,10 @@ async def reset_password(
     status_code=status.HTTP_200_OK,
 )
 async def google_login(
-    request: Request,
     body: GoogleLoginRequest,
     usecase: Annotated[GoogleLoginUseCase, Depends(get_google_login_usecase)],
-    redis: Annotated[Redis, Depends(get_redis)],
 ):
     """
     Realiza login ou cadastro usando conta Google.
     """
-    ip = request.client.host
-
-    rate_limit(
-        redis,
-        key=f"google_login_ip:{ip}",
-        limit=10,
-        window_seconds=60,
-    )
-
-    return await usecase.execute(body.id_token)
+    return TypedJSONResponse(await usecase.execute(body.id_token), _LOGIN_JSON)
@@ -0,0 +1,24 @@
+from datetime import datetime
+from typing import List
+
+from pydantic import BaseModel, Field
+
+from app.modules.auth.domain.read_models.session_info import SessionInfo
+
+
+class SessionResponse(BaseModel):
+    id: str = Field(..., description="Identificador da sessão (jti do refresh token)")
+    expires_at: datetime = Field(..., description="Expiração do refresh token (UTC)")
+
+    @classmethod
+    def from_domain(cls, session: SessionInfo):
+        return cls(id=session.session_id, expires_at=session.expires_at)
+
+
+class SessionListResponse(BaseModel):
+    """
+    Schema de resposta com as sessões ativas do usuário.
+    """
+
+    sessions: List[SessionResponse]
+    total: int
@@ -3,6 +3,8 @@ from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
+from app.modules.customer.domain.value_objects.customer_list_cursor import CustomerSort
+
 
 # ─── Input DTOs (requests) ────────────────────────────────────────────────────
 
@@ -48,6 +50,7 @@ class UpdateCustomerInputDTO(BaseModel):
     name: Optional[str] = Field(None, min_length=2, max_length=100)
     phone: Optional[str] = Field(None, description="Telefone com DDD")
     notes: Optional[str] = Field(None, max_length=1000)
+    version: Optional[int] = Field(None, ge=1, description="Versão lida pelo cliente")
 
 
 class UpdateAddressInputDTO(BaseModel):
@@ -62,6 +65,7 @@ class UpdateAddressInputDTO(BaseModel):
     address: Optional[AddressInputDTO] = Field(
         None, description="Novo endereço ou null para remover"
     )
+    version: Optional[int] = Field(None, ge=1, description="Versão lida pelo cliente")
 
 
 class ListCustomersInputDTO(BaseModel):
@@ -73,6 +77,55 @@ class ListCustomersInputDTO(BaseModel):
     is_active: Optional[bool] = Field(None, description="Filtrar por status")
     limit: int = Field(50, ge=1, le=200, description="Registros por página")
     offset: int = Field(0, ge=0, description="Deslocamento para paginação")
+    sort: Optional[CustomerSort] = Field(
+        None, description="Ordenação (padrão: relevance com busca, name sem busca)"
+    )
+    cursor: Optional[str] = Field(
+        None, description="Cursor opaco (next_cursor) — tem precedência sobre offset"
+    )
+    exact_total: bool = Field(
+        True, description="Com busca, False dispensa o total exato (usa apenas has_more)"
+    )
+    fields: Optional[str] = Field(
+        None, max_length=200, description="Campos do item separados por vírgula (None = todos)"
+    )
+
+
+class ExportCustomersInputDTO(BaseModel):
+    """Filtros da exportação de clientes (os mesmos da listagem)."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    search: Optional[str] = Field(None, max_length=100, description="Busca por nome ou e-mail")
+    is_active: Optional[bool] = Field(None, description="Filtrar por status")
+
+
+class ImportCustomerRowDTO(BaseModel):
+    """
+    Linha bruta de um arquivo de importação (CSV/NDJSON).
+
+    Os campos chegam como texto, sem validação: ela é feita pelos Value
+    Objects no caso de uso, para que cada linha inválida vire um item
+    do relatório em vez de abortar a importação. `error` é preenchido
+    quando a própria linha não pôde ser lida (ex: JSON malformado).
+    """
+
+    model_config = ConfigDict(extra="ignore")
+
+    row: int = Field(..., description="Número da linha de dados (1 = primeira)")
+    name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    document: Optional[str] = None
+    notes: Optional[str] = None
+    street: Optional[str] = None
+    number: Optional[str] = None
+    complement: Optional[str] = None
+    neighborhood: Optional[str] = None
+    city: Optional[str] = None
+    state: Optional[str] = None
+    zip_code: Optional[str] = None
+    error: Optional[str] = None
 
 
 # ─── Output DTOs (responses) ──────────────────────────────────────────────────
@@ -112,6 +165,10 @@ class CustomerOutputDTO(BaseModel):
     is_active: bool
     created_at: datetime
     updated_at: datetime
+    version: int
+
+    # Sparse fieldset: a resposta omite os demais campos (None = todos)
+    fields: Optional[frozenset[str]] = Field(None, exclude=True)
 
     @classmethod
     def from_entity(cls, entity) -> "CustomerOutputDTO":
@@ -138,6 +195,7 @@ class CustomerOutputDTO(BaseModel):
             is_active=entity.is_active,
             created_at=entity.created_at,
             updated_at=entity.updated_at,
+            version=entity.version,
         )
 
 
@@ -155,8 +213,14 @@ class CustomerSummaryOutputDTO(BaseModel):
 
     @classmethod
     def from_read_model(cls, read_model) -> "CustomerSummaryOutputDTO":
-        """Constrói o DTO a partir de um CustomerSummary (read model)."""
-        return cls(
+        """
+        Constrói o DTO a partir de um CustomerSummary (read model).
+
+        Sem validação (`model_construct`): os dados vêm do banco, já
+        tipados pelo read model — numa página de 200 itens, validar cada
+        um custaria mais que a própria serialização.
+        """
+        return cls.model_construct(
             customer_id=read_model.customer_id,
             name=read_model.name,
             email=read_model.email,
@@ -170,6 +234,30 @@ class CustomerListOutputDTO(BaseModel):
     """Resposta paginada de listagem de clientes."""
 
     items: list[CustomerSummaryOutputDTO]
-    total: int
+    total: Optional[int]
     limit: int
     offset: int
+    has_more: bool = False
+    next_cursor: Optional[str] = None
+
+    # Sparse fieldset dos itens: a resposta omite os demais (None = todos)
+    fields: Optional[frozenset[str]] = Field(None, exclude=True)
+
+
+class ImportRowErrorDTO(BaseModel):
+    """Erro de uma linha da importação."""
+
+    row: int
+    message: str
+
+
+class ImportCustomersOutputDTO(BaseModel):
+    """Relatório da importação em lote."""
+
+    total_rows: int
+    imported: int
+    failed: int
+    errors: list[ImportRowErrorDTO]
+    errors_truncated: bool = False
+    # Erro de leitura que interrompeu o arquivo (linhas anteriores gravadas)
+    file_error: Optional[ImportRowErrorDTO] = None
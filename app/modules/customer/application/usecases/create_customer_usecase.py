@@ -3,10 +3,6 @@ from app.modules.customer.application.dtos.customer_dtos import (
     CustomerOutputDTO,
 )
 from app.modules.customer.domain.entities.customer_entity import CustomerEntity
-from app.modules.customer.domain.exceptions.customers_exceptions import (
-    CustomerAlreadyExistsError,
-    CustomerDocumentAlreadyExistsError,
-)
 from app.modules.customer.domain.repositories.customer_repository import CustomerRepository
 from app.modules.customer.domain.value_objects.customer_address import CustomerAddress
 from app.modules.customer.domain.value_objects.customer_document import CustomerDocument
@@ -21,9 +17,12 @@ class CreateCustomerUseCase:
 
     Fluxo:
     1. Constrói os Value Objects (validação de formato)
-    2. Verifica unicidade de e-mail e CPF
-    3. Cria a entidade via factory method
-    4. Persiste e retorna o DTO de saída
+    2. Cria a entidade via factory method
+    3. Persiste e retorna o DTO de saída
+
+    A unicidade de e-mail e CPF é garantida na persistência (um único
+    INSERT): o repositório lança CustomerAlreadyExistsError ou
+    CustomerDocumentAlreadyExistsError em caso de duplicidade.
     """
 
     def __init__(self, repository: CustomerRepository):
@@ -48,14 +47,7 @@ class CreateCustomerUseCase:
                 zip_code=dto.address.zip_code,
             )
 
-        # 2. Verifica unicidade
-        if await self._repository.exists_by_email(email):
-            raise CustomerAlreadyExistsError(email=email.value)
-
-        if document and await self._repository.exists_by_document(document):
-            raise CustomerDocumentAlreadyExistsError(document=document.value)
-
-        # 3. Cria entidade
+        # 2. Cria entidade
         customer = CustomerEntity.create(
             name=name,
             email=email,
@@ -65,6 +57,6 @@ class CreateCustomerUseCase:
             notes=dto.notes,
         )
 
-        # 4. Persiste e retorna
+        # 3. Persiste e retorna (duplicidade → exceção de domínio)
         created = await self._repository.create(customer)
         return CustomerOutputDTO.from_entity(created)
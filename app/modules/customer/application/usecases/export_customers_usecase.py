@@ -0,0 +1,24 @@
+from typing import AsyncIterator
+
+from app.modules.customer.application.dtos.customer_dtos import ExportCustomersInputDTO
+from app.modules.customer.domain.read_models.customer_rm import CustomerExportRow
+from app.modules.customer.domain.repositories.customer_repository import CustomerRepository
+
+
+class ExportCustomersUseCase:
+    """
+    Caso de uso: Exportar todos os clientes que atendem aos filtros.
+
+    Devolve um iterador assíncrono de read models: as linhas seguem do
+    cursor do banco direto para a resposta, sem montar a lista inteira
+    em memória nem converter cada linha em DTO.
+    """
+
+    def __init__(self, repository: CustomerRepository):
+        self._repository = repository
+
+    def execute(self, dto: ExportCustomersInputDTO) -> AsyncIterator[CustomerExportRow]:
+        return self._repository.stream_export_rows(
+            is_active=dto.is_active,
+            search=dto.search,
+        )
@@ -1,6 +1,12 @@
+from typing import Optional
+
 from app.modules.customer.application.dtos.customer_dtos import CustomerOutputDTO
-from app.modules.customer.domain.exceptions.customers_exceptions import CustomerNotFoundError
+from app.modules.customer.domain.exceptions.customers_exceptions import (
+    CustomerNotFoundError,
+    CustomerValidationError,
+)
 from app.modules.customer.domain.repositories.customer_repository import CustomerRepository
+from app.modules.customer.domain.value_objects.customer_field_set import CustomerFieldSet
 from app.modules.customer.domain.value_objects.customer_id import CustomerId
 
 
@@ -11,6 +17,9 @@ class GetCustomerUseCase:
     Usa o read model CustomerProfile para evitar reconstituir
     a entidade completa quando o objetivo é apenas leitura.
 
+    Com `fields`, só as colunas dos campos pedidos são lidas e a
+    resposta omite os demais.
+
     Fluxo:
     1. Consulta o perfil via read model (query otimizada)
     2. Lança exceção se não encontrado
@@ -20,8 +29,9 @@ class GetCustomerUseCase:
     def __init__(self, repository: CustomerRepository):
         self._repository = repository
 
-    async def execute(self, customer_id: str) -> CustomerOutputDTO:
-        profile = await self._repository.get_profile(CustomerId(value=customer_id))
+    async def execute(self, customer_id: str, fields: Optional[str] = None) -> CustomerOutputDTO:
+        field_set = self._parse_fields(fields)
+        profile = await self._repository.get_profile(CustomerId(value=customer_id), fields=field_set)
 
         if not profile:
             raise CustomerNotFoundError(identifier=customer_id)
@@ -40,7 +50,8 @@ class GetCustomerUseCase:
                 zip_code=profile.zip_code or "",
             )
 
-        return CustomerOutputDTO(
+        # Dados do banco, sem revalidar (campos fora de `fields` vêm None)
+        return CustomerOutputDTO.model_construct(
             customer_id=profile.customer_id,
             name=profile.name,
             email=profile.email,
@@ -51,4 +62,16 @@ class GetCustomerUseCase:
             is_active=profile.is_active,
             created_at=profile.created_at,
             updated_at=profile.updated_at,
+            version=profile.version,
+            fields=field_set.names if field_set else None,
         )
+
+    @staticmethod
+    def _parse_fields(raw: Optional[str]) -> Optional[CustomerFieldSet]:
+        if raw is None:
+            return None
+
+        try:
+            return CustomerFieldSet.parse(raw)
+        except ValueError as exc:
+            raise CustomerValidationError(field="fields", reason=str(exc))
@@ -0,0 +1,188 @@
+from typing import AsyncIterable, List, Optional, Tuple
+
+from app.modules.customer.application.dtos.customer_dtos import (
+    ImportCustomerRowDTO,
+    ImportCustomersOutputDTO,
+    ImportRowErrorDTO,
+)
+from app.modules.customer.domain.entities.customer_entity import CustomerEntity
+from app.modules.customer.domain.exceptions.customers_exceptions import CustomerValidationError
+from app.modules.customer.domain.repositories.customer_repository import CustomerRepository
+from app.modules.customer.domain.value_objects.customer_address import CustomerAddress
+from app.modules.customer.domain.value_objects.customer_document import CustomerDocument
+from app.modules.customer.domain.value_objects.customer_email import CustomerEmail
+from app.modules.customer.domain.value_objects.customer_name import CustomerName
+from app.modules.customer.domain.value_objects.customer_phone import CustomerPhone
+
+_ADDRESS_FIELDS = ("street", "number", "complement", "neighborhood", "city", "state", "zip_code")
+
+# Mesmos limites dos DTOs de criação (no POST /customers quem valida é o Pydantic)
+_MAX_LENGTHS = {
+    "email": 255,
+    "notes": 1000,
+    "street": 150,
+    "number": 20,
+    "complement": 100,
+    "neighborhood": 100,
+    "city": 100,
+}
+
+
+class ImportCustomersUseCase:
+    """
+    Caso de uso: Importar clientes em lote (CSV/NDJSON).
+
+    Consome as linhas de forma incremental e processa em lotes de
+    `batch_size`, então a memória fica estável independente do tamanho
+    do arquivo. Cada lote custa duas queries (unicidade + INSERT
+    multi-row) em vez de três por cliente. Se o arquivo for interrompido
+    por um erro de leitura, as linhas lidas até ali são gravadas e o
+    relatório parcial volta com `file_error`.
+
+    Fluxo:
+    1. Constrói os Value Objects de cada linha (linha inválida → relatório)
+    2. Descarta e-mails/CPFs repetidos dentro do lote
+    3. Verifica unicidade do lote contra a tabela em uma consulta
+    4. Insere o lote; conflitos de corrida também entram no relatório
+    """
+
+    BATCH_SIZE = 1000
+    MAX_REPORTED_ERRORS = 1000
+
+    def __init__(self, repository: CustomerRepository, batch_size: int = BATCH_SIZE):
+        self._repository = repository
+        self._batch_size = batch_size
+
+    async def execute(self, rows: AsyncIterable[ImportCustomerRowDTO]) -> ImportCustomersOutputDTO:
+        report = ImportCustomersOutputDTO(total_rows=0, imported=0, failed=0, errors=[])
+        batch: List[Tuple[int, CustomerEntity]] = []
+
+        reader = aiter(rows)
+        while True:
+            # Só a leitura do arquivo pode interromper a importação
+            try:
+                row = await anext(reader)
+            except StopAsyncIteration:
+                break
+            except ValueError as exc:
+                # Nada lido ainda (ex: cabeçalho inválido): não há o que relatar
+                if report.total_rows == 0:
+                    raise CustomerValidationError(field="file", reason=str(exc))
+
+                # Lotes anteriores já foram gravados: o relatório parcial diz
+                # o que entrou e onde a leitura parou
+                report.file_error = ImportRowErrorDTO(row=report.total_rows + 1, message=str(exc))
+                break
+
+            report.total_rows += 1
+
+            # 1. Constrói Value Objects
+            customer, error = self._build_customer(row)
+            if error:
+                self._fail(report, row.row, error)
+                continue
+
+            batch.append((row.row, customer))
+            if len(batch) >= self._batch_size:
+                await self._flush(batch, report)
+                batch = []
+
+        await self._flush(batch, report)
+        return report
+
+    async def _flush(
+        self,
+        batch: List[Tuple[int, CustomerEntity]],
+        report: ImportCustomersOutputDTO,
+    ) -> None:
+        if not batch:
+            return
+
+        # 2. Repetidos dentro do lote (mantém a primeira ocorrência)
+        unique: List[Tuple[int, CustomerEntity]] = []
+        seen_emails: dict[str, int] = {}
+        seen_documents: dict[str, int] = {}
+
+        for row, customer in batch:
+            email = customer.email.value
+            document = customer.document.value if customer.document else None
+
+            if email in seen_emails:
+                self._fail(report, row, f"e-mail repetido no arquivo (linha {seen_emails[email]}).")
+                continue
+            if document and document in seen_documents:
+                self._fail(report, row, f"CPF repetido no arquivo (linha {seen_documents[document]}).")
+                continue
+
+            seen_emails[email] = row
+            if document:
+                seen_documents[document] = row
+            unique.append((row, customer))
+
+        # 3. Unicidade contra a tabela
+        existing_emails, existing_documents = await self._repository.find_existing_keys(
+            emails=[customer.email for _, customer in unique],
+            documents=[customer.document for _, customer in unique if customer.document],
+        )
+
+        to_insert: List[Tuple[int, CustomerEntity]] = []
+        for row, customer in unique:
+            if customer.email.value in existing_emails:
+                self._fail(report, row, f"e-mail '{customer.email.value}' já cadastrado.")
+            elif customer.document and customer.document.value in existing_documents:
+                self._fail(report, row, f"CPF '{customer.document.value}' já cadastrado.")
+            else:
+                to_insert.append((row, customer))
+
+        # 4. Insere o lote
+        inserted = await self._repository.create_many([customer for _, customer in to_insert])
+
+        for row, customer in to_insert:
+            if customer.id.value in inserted:
+                report.imported += 1
+            else:
+                self._fail(report, row, "e-mail ou CPF cadastrado durante a importação.")
+
+    @staticmethod
+    def _build_customer(row: ImportCustomerRowDTO) -> Tuple[Optional[CustomerEntity], Optional[str]]:
+        if row.error:
+            return None, row.error
+
+        for field, max_length in _MAX_LENGTHS.items():
+            value = getattr(row, field)
+            if value and len(value) > max_length:
+                return None, f"campo '{field}' excede {max_length} caracteres."
+
+        try:
+            address = None
+            if any(getattr(row, field) for field in _ADDRESS_FIELDS):
+                address = CustomerAddress(
+                    street=row.street,
+                    number=row.number,
+                    complement=row.complement,
+                    neighborhood=row.neighborhood,
+                    city=row.city,
+                    state=row.state,
+                    zip_code=row.zip_code,
+                )
+
+            customer = CustomerEntity.create(
+                name=CustomerName(value=row.name),
+                email=CustomerEmail(value=row.email),
+                phone=CustomerPhone.create_optional(row.phone),
+                document=CustomerDocument.create_optional(row.document),
+                address=address,
+                notes=row.notes,
+            )
+        except ValueError as exc:
+            return None, str(exc)
+
+        return customer, None
+
+    def _fail(self, report: ImportCustomersOutputDTO, row: int, message: str) -> None:
+        report.failed += 1
+
+        if len(report.errors) < self.MAX_REPORTED_ERRORS:
+            report.errors.append(ImportRowErrorDTO(row=row, message=message))
+        else:
+            report.errors_truncated = True
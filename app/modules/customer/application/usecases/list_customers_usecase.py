@@ -1,9 +1,17 @@
+from typing import Optional
+
 from app.modules.customer.application.dtos.customer_dtos import (
     CustomerListOutputDTO,
     CustomerSummaryOutputDTO,
     ListCustomersInputDTO,
 )
+from app.modules.customer.domain.exceptions.customers_exceptions import CustomerValidationError
 from app.modules.customer.domain.repositories.customer_repository import CustomerRepository
+from app.modules.customer.domain.value_objects.customer_field_set import (
+    CUSTOMER_SUMMARY_FIELDS,
+    CustomerFieldSet,
+)
+from app.modules.customer.domain.value_objects.customer_list_cursor import CustomerListCursor
 
 
 class ListCustomersUseCase:
@@ -13,35 +21,116 @@ class ListCustomersUseCase:
     Usa o read model CustomerSummary (query leve) em vez da entidade completa,
     pois listagens não precisam de VOs nem regras de negócio.
 
+    Suporta dois modos de paginação:
+    - offset: compatível com clientes antigos (custo cresce com o offset)
+    - cursor: keyset sobre (coluna de ordenação, id), custo constante
+
+    Com busca textual a ordenação padrão é por relevância.
+
+    O total não custa uma varredura extra:
+    - sem busca: vem dos contadores por status (O(1))
+    - com busca: vem na mesma query da página (window function), ou é
+      omitido quando o cliente envia exact_total=False
+
+    Com `fields`, o SELECT traz só as colunas dos campos pedidos e a
+    resposta omite os demais (visões estreitas, como o seletor do app).
+
     Fluxo:
-    1. Executa a query de listagem e contagem em paralelo
-    2. Converte cada read model em DTO de saída
-    3. Retorna resposta paginada
+    1. Resolve a ordenação, decodifica o cursor e lê `fields` (se enviados)
+    2. Busca limit + 1 itens (e o total, conforme acima)
+    3. Converte cada read model em DTO de saída e monta o next_cursor
     """
 
     def __init__(self, repository: CustomerRepository):
         self._repository = repository
 
     async def execute(self, dto: ListCustomersInputDTO) -> CustomerListOutputDTO:
-        # 1. Busca itens e total (ambos usam os mesmos filtros)
-        summaries = await self._repository.list_summaries(
+        # 1. Resolve ordenação e decodifica cursor
+        sort = self._resolve_sort(dto)
+        after = self._decode_cursor(dto.cursor, sort)
+        fields = self._parse_fields(dto.fields)
+
+        # 2. Busca itens (um a mais para detectar próxima página) e total
+        params = dict(
             is_active=dto.is_active,
             search=dto.search,
-            limit=dto.limit,
+            limit=dto.limit + 1,
             offset=dto.offset,
+            sort=sort,
+            after=after,
+            fields=fields,
         )
-        total = await self._repository.count(
-            is_active=dto.is_active,
-            search=dto.search,
-        )
+        total: Optional[int] = None
+
+        if dto.search and dto.exact_total:
+            summaries, total = await self._repository.list_summaries_with_total(**params)
+        else:
+            summaries = await self._repository.list_summaries(**params)
+            if not dto.search:
+                total = await self._repository.count(is_active=dto.is_active)
 
-        # 2. Converte read models em DTOs
+        has_more = len(summaries) > dto.limit
+        summaries = summaries[: dto.limit]
+
+        # 3. Converte read models em DTOs
         items = [CustomerSummaryOutputDTO.from_read_model(s) for s in summaries]
 
-        # 3. Retorna resposta paginada
+        next_cursor = None
+        if has_more:
+            last = summaries[-1]
+            next_cursor = CustomerListCursor(
+                sort=sort,
+                value=getattr(last, sort.lstrip("-")),
+                customer_id=last.customer_id,
+            ).encode()
+
         return CustomerListOutputDTO(
             items=items,
             total=total,
             limit=dto.limit,
             offset=dto.offset,
+            has_more=has_more,
+            next_cursor=next_cursor,
+            fields=fields.names if fields else None,
         )
+
+    @staticmethod
+    def _resolve_sort(dto: ListCustomersInputDTO) -> str:
+        if dto.sort is None:
+            return "relevance" if dto.search else "name"
+
+        if dto.sort == "relevance" and not dto.search:
+            raise CustomerValidationError(
+                field="sort",
+                reason="ordenação por relevância exige o parâmetro search.",
+            )
+
+        return dto.sort
+
+    @staticmethod
+    def _decode_cursor(token: Optional[str], sort: str) -> Optional[CustomerListCursor]:
+        if not token:
+            return None
+
+        try:
+            cursor = CustomerListCursor.decode(token)
+        except ValueError as exc:
+            raise CustomerValidationError(field="cursor", reason=str(exc))
+
+        if cursor.sort != sort:
+            raise CustomerValidationError(
+                field="cursor",
+                reason=f"cursor gerado para a ordenação '{cursor.sort}'.",
+            )
+
+        return cursor
+
+    @staticmethod
+    def _parse_fields(raw: Optional[str]) -> Optional[CustomerFieldSet]:
+        if raw is None:
+            return None
+
+        try:
+            return CustomerFieldSet.parse(raw, allowed=CUSTOMER_SUMMARY_FIELDS)
+        except ValueError as exc:
+            raise CustomerValidationError(field="fields", reason=str(exc))
@@ -8,49 +8,47 @@ class ActivateCustomerUseCase:
     """
     Caso de uso: Reativar um cliente inativo.
 
-    A regra de negócio (não reativar se já ativo) fica na entidade.
+    Idempotente: reativar um cliente já ativo retorna o estado atual.
+    A troca é um UPDATE condicional no repositório — sem leitura prévia
+    e sem corrida entre requisições simultâneas.
 
     Fluxo:
-    1. Busca a entidade
-    2. Delega activate() à entidade (valida estado)
-    3. Persiste e retorna o DTO de saída
+    1. Ativa via repositório (no-op se já ativo)
+    2. Lança exceção se não encontrado
+    3. Retorna o DTO de saída
     """
 
     def __init__(self, repository: CustomerRepository):
         self._repository = repository
 
     async def execute(self, customer_id: str) -> CustomerOutputDTO:
-        entity = await self._repository.get_by_id(CustomerId(value=customer_id))
+        entity = await self._repository.set_active(CustomerId(value=customer_id), True)
         if not entity:
             raise CustomerNotFoundError(identifier=customer_id)
 
-        entity.activate()
-
-        updated = await self._repository.update(entity)
-        return CustomerOutputDTO.from_entity(updated)
+        return CustomerOutputDTO.from_entity(entity)
 
 
 class DeactivateCustomerUseCase:
     """
     Caso de uso: Desativar um cliente ativo.
 
-    A regra de negócio (não desativar se já inativo) fica na entidade.
+    Idempotente: desativar um cliente já inativo retorna o estado atual.
+    A troca é um UPDATE condicional no repositório — sem leitura prévia
+    e sem corrida entre requisições simultâneas.
 
     Fluxo:
-    1. Busca a entidade
-    2. Delega deactivate() à entidade (valida estado)
-    3. Persiste e retorna o DTO de saída
+    1. Desativa via repositório (no-op se já inativo)
+    2. Lança exceção se não encontrado
+    3. Retorna o DTO de saída
     """
 
     def __init__(self, repository: CustomerRepository):
         self._repository = repository
 
     async def execute(self, customer_id: str) -> CustomerOutputDTO:
-        entity = await self._repository.get_by_id(CustomerId(value=customer_id))
+        entity = await self._repository.set_active(CustomerId(value=customer_id), False)
         if not entity:
             raise CustomerNotFoundError(identifier=customer_id)
 
-        entity.deactivate()
-
-        updated = await self._repository.update(entity)
-        return CustomerOutputDTO.from_entity(updated)
+        return CustomerOutputDTO.from_entity(entity)
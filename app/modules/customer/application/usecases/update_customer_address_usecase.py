@@ -2,9 +2,9 @@ from app.modules.customer.application.dtos.customer_dtos import (
     UpdateAddressInputDTO,
     CustomerOutputDTO,
 )
-from app.modules.customer.domain.exceptions.customers_exceptions import CustomerNotFoundError
 from app.modules.customer.domain.repositories.customer_repository import CustomerRepository
 from app.modules.customer.domain.value_objects.customer_address import CustomerAddress
+from app.modules.customer.domain.value_objects.customer_changes import CustomerChanges
 from app.modules.customer.domain.value_objects.customer_id import CustomerId
 
 
@@ -17,23 +17,19 @@ class UpdateCustomerAddressUseCase:
 
     Enviar address=None remove o endereço existente.
 
+    Mesmo lock otimista do UpdateCustomerUseCase (`version` opcional).
+
     Fluxo:
-    1. Busca a entidade existente
-    2. Constrói o VO de endereço (ou None para remover)
-    3. Delega a mutação à entidade
-    4. Persiste e retorna o DTO de saída
+    1. Constrói o VO de endereço (ou None para remover)
+    2. Persiste só o endereço, sem ler o cliente antes (um UPDATE)
+    3. Retorna o DTO de saída
     """
 
     def __init__(self, repository: CustomerRepository):
         self._repository = repository
 
     async def execute(self, customer_id: str, dto: UpdateAddressInputDTO) -> CustomerOutputDTO:
-        # 1. Busca entidade
-        entity = await self._repository.get_by_id(CustomerId(value=customer_id))
-        if not entity:
-            raise CustomerNotFoundError(identifier=customer_id)
-
-        # 2. Constrói VO ou None
+        # 1. Constrói VO ou None
         address = None
         if dto.address is not None:
             address = CustomerAddress(
@@ -46,9 +42,12 @@ class UpdateCustomerAddressUseCase:
                 zip_code=dto.address.zip_code,
             )
 
-        # 3. Delega à entidade
-        entity.update_address(address=address)
+        # 2. Persiste (404/409 vêm do repositório)
+        updated = await self._repository.update_fields(
+            CustomerId(value=customer_id),
+            CustomerChanges.of(address=address),
+            expected_version=dto.version,
+        )
 
-        # 4. Persiste e retorna
-        updated = await self._repository.update(entity)
+        # 3. Retorna
         return CustomerOutputDTO.from_entity(updated)
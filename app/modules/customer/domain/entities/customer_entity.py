@@ -29,6 +29,7 @@ class CustomerEntity:
     is_active: bool
     created_at: datetime
     updated_at: datetime
+    version: int = 1                           # Lock otimista (versão lida do banco)
 
     @classmethod
     def create(
@@ -27,6 +27,17 @@ class CustomerDocumentAlreadyExistsError(CustomerDomainError):
         super().__init__(f"Já existe um cliente cadastrado com o CPF '{document}'.")
 
 
+class CustomerConcurrentUpdateError(CustomerDomainError):
+    """Levantado quando o cliente foi alterado por outra requisição desde a leitura."""
+
+    def __init__(self, customer_id: str):
+        self.customer_id = customer_id
+        super().__init__(
+            f"O cliente '{customer_id}' foi alterado por outra requisição. "
+            "Recarregue os dados e tente novamente."
+        )
+
+
 class CustomerInactiveError(CustomerDomainError):
     """Levantado quando uma operação é tentada em cliente inativo."""
 
@@ -10,6 +10,8 @@ class CustomerSummary:
     
     Usado em listagens e buscas onde não é necessário carregar
     todos os dados da entidade completa.
+
+    Em projeções parciais (`fields`), os campos não selecionados ficam None.
     """
 
     customer_id: str
@@ -18,6 +20,7 @@ class CustomerSummary:
     phone: Optional[str]
     is_active: bool
     created_at: datetime
+    relevance: Optional[float] = None  # preenchido apenas em buscas por relevância
 
 
 @dataclass(frozen=True)
@@ -27,6 +30,8 @@ class CustomerProfile:
     
     Usado na visualização de detalhes de um cliente específico.
     Inclui endereço e observações internas.
+
+    Em projeções parciais (`fields`), os campos não selecionados ficam None.
     """
 
     customer_id: str
@@ -45,3 +50,24 @@ class CustomerProfile:
     is_active: bool
     created_at: datetime
     updated_at: datetime
+    version: int
+
+
+@dataclass(frozen=True)
+class CustomerExportRow:
+    """
+    Read Model de uma linha da exportação de clientes.
+    
+    Dados de contato e localização para planilhas e ferramentas
+    de e-mail marketing; não inclui observações internas.
+    """
+
+    customer_id: str
+    name: str
+    email: str
+    phone: Optional[str]
+    document: Optional[str]
+    city: Optional[str]
+    state: Optional[str]
+    is_active: bool
+    created_at: datetime
@@ -1,14 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Set, Tuple
 
 from app.modules.customer.domain.entities.customer_entity import CustomerEntity
 from app.modules.customer.domain.read_models.customer_rm import (
+    CustomerExportRow,
     CustomerProfile,
     CustomerSummary,
 )
+from app.modules.customer.domain.value_objects.customer_changes import CustomerChanges
 from app.modules.customer.domain.value_objects.customer_document import CustomerDocument
 from app.modules.customer.domain.value_objects.customer_email import CustomerEmail
+from app.modules.customer.domain.value_objects.customer_field_set import CustomerFieldSet
 from app.modules.customer.domain.value_objects.customer_id import CustomerId
+from app.modules.customer.domain.value_objects.customer_list_cursor import (
+    CustomerListCursor,
+    CustomerSort,
+)
 
 
 class CustomerRepository(ABC):
@@ -29,6 +36,26 @@ class CustomerRepository(ABC):
             
         Returns:
             CustomerEntity: Entidade persistida (com dados atualizados do banco)
+            
+        Raises:
+            CustomerAlreadyExistsError: Se o e-mail já estiver cadastrado
+            CustomerDocumentAlreadyExistsError: Se o CPF já estiver cadastrado
+        """
+        ...
+
+    @abstractmethod
+    async def create_many(self, customers: List[CustomerEntity]) -> Set[str]:
+        """
+        Persiste vários clientes em um único comando (importação em lote).
+        
+        Clientes que violariam a unicidade de e-mail/CPF são ignorados
+        em vez de abortar o lote.
+        
+        Args:
+            customers: Entidades a serem criadas
+            
+        Returns:
+            Set[str]: IDs dos clientes efetivamente inseridos
         """
         ...
 
@@ -97,10 +124,31 @@ class CustomerRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    async def find_existing_keys(
+        self,
+        emails: List[CustomerEmail],
+        documents: List[CustomerDocument],
+    ) -> Tuple[Set[str], Set[str]]:
+        """
+        Verifica em uma única consulta quais e-mails e CPFs já existem.
+        
+        Args:
+            emails: E-mails a verificar
+            documents: CPFs a verificar
+            
+        Returns:
+            Tuple[Set[str], Set[str]]: E-mails e CPFs já cadastrados
+        """
+        ...
+
     @abstractmethod
     async def update(self, customer: CustomerEntity) -> CustomerEntity:
         """
         Atualiza os dados de um cliente existente.
+
+        Só grava se a versão no banco ainda for `customer.version`
+        (lock otimista); a entidade retornada traz a nova versão.
         
         Args:
             customer: Entidade com dados atualizados
@@ -110,6 +158,51 @@ class CustomerRepository(ABC):
             
         Raises:
             CustomerNotFoundError: Se o cliente não existir
+            CustomerConcurrentUpdateError: Se o cliente foi alterado desde a leitura
+        """
+        ...
+
+    @abstractmethod
+    async def update_fields(
+        self,
+        customer_id: CustomerId,
+        changes: CustomerChanges,
+        expected_version: Optional[int] = None,
+    ) -> CustomerEntity:
+        """
+        Grava só os campos alterados, sem ler o cliente antes.
+
+        Com `expected_version`, só grava se a versão no banco ainda for
+        essa (lock otimista); a entidade retornada traz a nova versão.
+
+        Args:
+            customer_id: ID do cliente
+            changes: Campos a alterar
+            expected_version: Versão lida pelo cliente (opcional)
+
+        Returns:
+            CustomerEntity: Entidade atualizada
+
+        Raises:
+            CustomerNotFoundError: Se o cliente não existir
+            CustomerConcurrentUpdateError: Se a versão mudou desde a leitura
+        """
+        ...
+
+    @abstractmethod
+    async def set_active(self, customer_id: CustomerId, is_active: bool) -> Optional[CustomerEntity]:
+        """
+        Ativa ou desativa um cliente de forma idempotente.
+
+        Se o cliente já estiver no estado pedido, nada é gravado e o
+        estado atual é retornado.
+
+        Args:
+            customer_id: ID do cliente
+            is_active: Estado desejado
+
+        Returns:
+            Optional[CustomerEntity]: Cliente no estado pedido ou None se não existir
         """
         ...
 
@@ -135,6 +228,9 @@ class CustomerRepository(ABC):
         search: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
+        sort: CustomerSort = "name",
+        after: Optional[CustomerListCursor] = None,
+        fields: Optional[CustomerFieldSet] = None,
     ) -> List[CustomerSummary]:
         """
         Lista resumos de clientes com filtros opcionais.
@@ -145,13 +241,42 @@ class CustomerRepository(ABC):
             is_active: Filtrar por status ativo/inativo (None = todos)
             search: Busca parcial por nome ou e-mail
             limit: Limite de registros por página
-            offset: Deslocamento para paginação
+            offset: Deslocamento para paginação (ignorado quando há cursor)
+            sort: Ordenação (sempre desempatada pelo id)
+            after: Cursor keyset — retorna apenas itens após esta posição
+            fields: Campos pedidos (None = todos); os demais não são
+                selecionados e ficam None no Read Model
             
         Returns:
             List[CustomerSummary]: Lista de resumos de clientes
         """
         ...
 
+    @abstractmethod
+    async def list_summaries_with_total(
+        self,
+        is_active: Optional[bool] = None,
+        search: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        sort: CustomerSort = "name",
+        after: Optional[CustomerListCursor] = None,
+        fields: Optional[CustomerFieldSet] = None,
+    ) -> Tuple[List[CustomerSummary], int]:
+        """
+        Lista resumos de clientes e o total filtrado em uma única consulta.
+        
+        Indicado para buscas textuais, em que o total não pode vir
+        dos contadores mantidos na escrita.
+        
+        Args:
+            Os mesmos de `list_summaries`
+            
+        Returns:
+            Tuple[List[CustomerSummary], int]: Página de resumos e total filtrado
+        """
+        ...
+
     @abstractmethod
     async def count(
         self,
@@ -161,7 +286,8 @@ class CustomerRepository(ABC):
         """
         Conta o total de clientes com filtros opcionais.
         
-        Usado para calcular totais de paginação.
+        Usado para calcular totais de paginação. Sem busca textual deve
+        ser O(1) (contadores por status mantidos na escrita).
         
         Args:
             is_active: Filtrar por status ativo/inativo (None = todos)
@@ -173,12 +299,39 @@ class CustomerRepository(ABC):
         ...
 
     @abstractmethod
-    async def get_profile(self, customer_id: CustomerId) -> Optional[CustomerProfile]:
+    def stream_export_rows(
+        self,
+        is_active: Optional[bool] = None,
+        search: Optional[str] = None,
+    ) -> AsyncIterator[CustomerExportRow]:
+        """
+        Percorre todos os clientes que atendem aos filtros, em streaming.
+        
+        Implementações não devem materializar o resultado completo:
+        as linhas são entregues conforme chegam do banco.
+        
+        Args:
+            is_active: Filtrar por status ativo/inativo (None = todos)
+            search: Busca parcial por nome ou e-mail
+            
+        Returns:
+            AsyncIterator[CustomerExportRow]: Linhas ordenadas por nome
+        """
+        ...
+
+    @abstractmethod
+    async def get_profile(
+        self,
+        customer_id: CustomerId,
+        fields: Optional[CustomerFieldSet] = None,
+    ) -> Optional[CustomerProfile]:
         """
         Busca o perfil completo do cliente como Read Model.
         
         Args:
             customer_id: ID do cliente
+            fields: Campos pedidos (None = todos); os demais não são
+                selecionados e ficam None no Read Model
             
         Returns:
             Optional[CustomerProfile]: Perfil do cliente ou None
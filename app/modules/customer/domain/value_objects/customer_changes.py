@@ -0,0 +1,40 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+from app.modules.customer.domain.value_objects.customer_address import CustomerAddress
+from app.modules.customer.domain.value_objects.customer_name import CustomerName
+from app.modules.customer.domain.value_objects.customer_phone import CustomerPhone
+
+# Campos que um PATCH pode alterar (mesmos nomes da entidade)
+CUSTOMER_CHANGEABLE_FIELDS: tuple[str, ...] = ("name", "phone", "notes", "address")
+
+
+@dataclass(frozen=True)
+class CustomerChanges:
+    """
+    Value Object com as alterações parciais de um cliente (PATCH).
+
+    Os valores já chegam validados pelos seus VOs. Só os campos em
+    `fields` são gravados — os demais ficam como estão no banco, então
+    o repositório não precisa ler o cliente antes do UPDATE. Em `fields`,
+    None significa limpar o campo (ex.: remover o endereço).
+    """
+
+    name: Optional[CustomerName] = None
+    phone: Optional[CustomerPhone] = None
+    notes: Optional[str] = None
+    address: Optional[CustomerAddress] = None
+    fields: frozenset[str] = field(default_factory=frozenset)
+
+    def __post_init__(self):
+        unknown = self.fields - set(CUSTOMER_CHANGEABLE_FIELDS)
+        if unknown:
+            raise ValueError(f"Campos não alteráveis: {', '.join(sorted(unknown))}.")
+
+    @classmethod
+    def of(cls, **changes) -> "CustomerChanges":
+        """Alterações a partir dos campos informados (`CustomerChanges.of(notes=None)`)."""
+        return cls(**changes, fields=frozenset(changes))
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.fields
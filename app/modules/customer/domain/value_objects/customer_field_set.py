@@ -0,0 +1,65 @@
+from dataclasses import dataclass
+
+# Campos que o cliente pode pedir em `fields=` (mesmos nomes da resposta).
+# A listagem só conhece os do resumo; o perfil, todos.
+CUSTOMER_SUMMARY_FIELDS: tuple[str, ...] = (
+    "customer_id",
+    "name",
+    "email",
+    "phone",
+    "is_active",
+    "created_at",
+)
+
+CUSTOMER_PROFILE_FIELDS: tuple[str, ...] = CUSTOMER_SUMMARY_FIELDS + (
+    "document",
+    "address",
+    "notes",
+    "updated_at",
+    "version",
+)
+
+
+@dataclass(frozen=True)
+class CustomerFieldSet:
+    """
+    Value Object com os campos pedidos pelo cliente (sparse fieldset).
+
+    O repositório seleciona só as colunas desses campos e a resposta
+    omite os demais. `customer_id` sempre faz parte do conjunto.
+    """
+
+    names: frozenset[str]
+
+    def __post_init__(self):
+        if "customer_id" not in self.names:
+            raise ValueError("O conjunto de campos deve incluir customer_id.")
+
+        unknown = self.names - set(CUSTOMER_PROFILE_FIELDS)
+        if unknown:
+            raise ValueError(f"Campos desconhecidos: {', '.join(sorted(unknown))}.")
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.names
+
+    @classmethod
+    def parse(cls, raw: str, allowed: tuple[str, ...] = CUSTOMER_PROFILE_FIELDS) -> "CustomerFieldSet":
+        """
+        Lê a lista separada por vírgulas (ex: "name,phone").
+
+        Raises:
+            ValueError: Se vier vazia ou com campo fora de `allowed`
+        """
+        requested = {name.strip() for name in raw.split(",") if name.strip()}
+
+        if not requested:
+            raise ValueError("Informe ao menos um campo.")
+
+        unknown = requested - set(allowed)
+        if unknown:
+            raise ValueError(
+                f"Campos desconhecidos: {', '.join(sorted(unknown))}. "
+                f"Opções: {', '.join(allowed)}."
+            )
+
+        return cls(frozenset(requested | {"customer_id"}))
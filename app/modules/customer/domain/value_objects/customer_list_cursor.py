@@ -0,0 +1,73 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Literal, Union, get_args
+
+# Ordenações suportadas pela listagem (prefixo "-" = decrescente).
+# Cada coluna possui um índice (coluna, id) correspondente no banco;
+# "relevance" só vale com busca textual (maior relevância primeiro).
+CustomerSort = Literal["name", "created_at", "-created_at", "relevance"]
+
+CUSTOMER_SORT_OPTIONS: tuple[str, ...] = get_args(CustomerSort)
+
+
+@dataclass(frozen=True)
+class CustomerListCursor:
+    """
+    Value Object que representa a posição na listagem paginada por keyset.
+
+    Guarda a ordenação usada e a chave (valor da coluna de ordenação, id)
+    do último item entregue. O cliente recebe apenas a forma codificada
+    (opaca) e a devolve para obter a próxima página.
+    """
+
+    sort: str
+    value: Union[str, datetime, float]
+    customer_id: str
+
+    def __post_init__(self):
+        if self.sort not in CUSTOMER_SORT_OPTIONS:
+            raise ValueError(f"Ordenação inválida: '{self.sort}'.")
+        if not self.customer_id:
+            raise ValueError("Cursor sem identificador do cliente.")
+
+    @property
+    def column(self) -> str:
+        """Nome da coluna de ordenação (sem o prefixo de direção)."""
+        return self.sort.lstrip("-")
+
+    def encode(self) -> str:
+        """Serializa o cursor em uma string opaca e segura para URL."""
+        value = self.value.isoformat() if isinstance(self.value, datetime) else self.value
+        raw = json.dumps([self.sort, value, self.customer_id], separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> "CustomerListCursor":
+        """
+        Reconstrói o cursor a partir da string opaca.
+
+        Raises:
+            ValueError: Se o cursor estiver malformado
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            sort, value, customer_id = json.loads(base64.urlsafe_b64decode(padded))
+
+            if not isinstance(sort, str) or not isinstance(customer_id, str):
+                raise ValueError
+
+            if sort == "relevance":
+                if isinstance(value, bool) or not isinstance(value, (int, float)):
+                    raise ValueError
+                value = float(value)
+            elif not isinstance(value, str):
+                raise ValueError
+            elif sort.lstrip("-") == "created_at":
+                value = datetime.fromisoformat(value)
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+            raise ValueError("Cursor de paginação inválido.")
+
+        return cls(sort=sort, value=value, customer_id=customer_id)
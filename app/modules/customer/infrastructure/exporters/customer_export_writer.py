@@ -0,0 +1,105 @@
+import csv
+import io
+import json
+from typing import AsyncIterator, Literal
+
+from app.modules.customer.domain.read_models.customer_rm import CustomerExportRow
+
+CustomerExportFormat = Literal["csv", "ndjson"]
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+EXPORT_COLUMNS = (
+    "customer_id",
+    "name",
+    "email",
+    "phone",
+    "document",
+    "city",
+    "state",
+    "is_active",
+    "created_at",
+)
+
+# Tamanho aproximado de cada pedaço enviado ao cliente
+CHUNK_SIZE = 64 * 1024
+
+# Início de célula que planilhas interpretam como fórmula (CSV injection)
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _values(row: CustomerExportRow) -> list:
+    return [
+        row.customer_id,
+        row.name,
+        row.email,
+        row.phone,
+        row.document,
+        row.city,
+        row.state,
+        row.is_active,
+        row.created_at.isoformat(),
+    ]
+
+
+def _csv_cell(value):
+    # Texto livre (nome, e-mail...) vira literal com o prefixo "'"
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+async def write_csv(rows: AsyncIterator[CustomerExportRow]) -> AsyncIterator[bytes]:
+    """
+    Serializa as linhas em CSV (com cabeçalho), em pedaços de ~CHUNK_SIZE.
+
+    Células que começariam uma fórmula na planilha recebem o prefixo "'".
+    """
+    buffer = io.StringIO()
+    # Terminador padrão (\r\n): o writer só põe entre aspas os campos com
+    # caracteres do terminador, e um \r solto quebraria o registro
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+
+    async for row in rows:
+        writer.writerow([_csv_cell(value) for value in _values(row)])
+
+        if buffer.tell() >= CHUNK_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+async def write_ndjson(rows: AsyncIterator[CustomerExportRow]) -> AsyncIterator[bytes]:
+    """Serializa as linhas como um objeto JSON por linha, em pedaços de ~CHUNK_SIZE."""
+    lines: list[str] = []
+    size = 0
+
+    async for row in rows:
+        line = json.dumps(dict(zip(EXPORT_COLUMNS, _values(row))), ensure_ascii=False)
+        lines.append(line)
+        size += len(line) + 1
+
+        if size >= CHUNK_SIZE:
+            yield ("\n".join(lines) + "\n").encode()
+            lines, size = [], 0
+
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+def write_customer_rows(
+    rows: AsyncIterator[CustomerExportRow],
+    file_format: CustomerExportFormat,
+) -> AsyncIterator[bytes]:
+    """Seleciona o serializador incremental do formato informado."""
+    if file_format == "csv":
+        return write_csv(rows)
+
+    return write_ndjson(rows)
@@ -0,0 +1,142 @@
+import codecs
+import csv
+import json
+from typing import AsyncIterator, Literal, Optional
+
+from app.modules.customer.application.dtos.customer_dtos import ImportCustomerRowDTO
+
+CustomerImportFormat = Literal["csv", "ndjson"]
+
+# Colunas aceitas no arquivo (as demais são ignoradas)
+IMPORT_COLUMNS = tuple(
+    name for name in ImportCustomerRowDTO.model_fields if name not in ("row", "error")
+)
+
+# Limite de uma linha física: protege a memória contra arquivos sem quebra de linha
+MAX_LINE_LENGTH = 64 * 1024
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """
+    Converte o stream de bytes em linhas de texto (com o '\\n' final).
+
+    Decodifica incrementalmente (UTF-8, ignorando BOM), mantendo em
+    memória apenas a linha parcial corrente.
+
+    Raises:
+        ValueError: Se uma linha ultrapassar MAX_LINE_LENGTH
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    pending = ""
+
+    async for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split("\n")
+
+        for line in lines:
+            yield line + "\n"
+
+        if len(pending) > MAX_LINE_LENGTH:
+            raise ValueError(f"linha com mais de {MAX_LINE_LENGTH} caracteres.")
+
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield pending
+
+
+def _to_row(number: int, data: dict) -> ImportCustomerRowDTO:
+    # NDJSON pode trazer o endereço aninhado, como no POST /customers
+    if isinstance(data.get("address"), dict):
+        data = {**data["address"], **data}
+
+    values = {
+        key: str(value).strip() or None
+        for key, value in data.items()
+        if key in IMPORT_COLUMNS and value is not None
+    }
+    return ImportCustomerRowDTO(row=number, **values)
+
+
+async def read_csv_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[ImportCustomerRowDTO]:
+    """
+    Lê registros CSV (com cabeçalho) de forma incremental.
+
+    Campos entre aspas podem conter quebras de linha: as linhas físicas
+    são acumuladas até o número de aspas fechar um registro completo.
+
+    Raises:
+        ValueError: Se o cabeçalho não tiver as colunas obrigatórias
+            ou um registro ultrapassar MAX_LINE_LENGTH
+    """
+    header: Optional[list[str]] = None
+    record: list[str] = []
+    quotes = 0
+    number = 0
+
+    async for line in _iter_lines(chunks):
+        record.append(line)
+        quotes += line.count('"')
+        if quotes % 2:
+            # campo entre aspas continua na próxima linha
+            if sum(map(len, record)) > MAX_LINE_LENGTH:
+                raise ValueError(f"registro com mais de {MAX_LINE_LENGTH} caracteres.")
+            continue
+
+        fields = next(csv.reader(record), [])
+        record, quotes = [], 0
+
+        if not any(field.strip() for field in fields):
+            continue
+
+        if header is None:
+            header = [field.strip().lower() for field in fields]
+            missing = {"name", "email"} - set(header)
+            if missing:
+                raise ValueError(f"colunas obrigatórias ausentes: {', '.join(sorted(missing))}.")
+            continue
+
+        number += 1
+        if len(fields) != len(header):
+            yield ImportCustomerRowDTO(
+                row=number,
+                error=f"esperadas {len(header)} colunas, encontradas {len(fields)}.",
+            )
+            continue
+
+        yield _to_row(number, dict(zip(header, fields)))
+
+    if record:
+        yield ImportCustomerRowDTO(row=number + 1, error="aspas não fechadas no fim do arquivo.")
+
+
+async def read_ndjson_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[ImportCustomerRowDTO]:
+    """Lê um objeto JSON por linha de forma incremental (linhas vazias são ignoradas)."""
+    number = 0
+
+    async for line in _iter_lines(chunks):
+        if not line.strip():
+            continue
+
+        number += 1
+        try:
+            data = json.loads(line)
+        except ValueError:
+            yield ImportCustomerRowDTO(row=number, error="JSON inválido.")
+            continue
+
+        if not isinstance(data, dict):
+            yield ImportCustomerRowDTO(row=number, error="cada linha deve ser um objeto JSON.")
+            continue
+
+        yield _to_row(number, data)
+
+
+def read_customer_rows(
+    chunks: AsyncIterator[bytes],
+    file_format: CustomerImportFormat,
+) -> AsyncIterator[ImportCustomerRowDTO]:
+    """Seleciona o leitor incremental do formato informado."""
+    if file_format == "csv":
+        return read_csv_rows(chunks)
+
+    return read_ndjson_rows(chunks)
@@ -0,0 +1,25 @@
+from sqlalchemy import BigInteger, Boolean, SmallInteger
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.shared.infrastructure.database.base import Base
+
+
+class CustomerCounterModel(Base):
+    """
+    Model ORM da tabela 'customer_counters'.
+
+    Guarda o total de clientes por status, permitindo responder o `total`
+    da listagem sem contar a tabela `customers`.
+
+    A tabela é mantida por triggers de statement no banco (ver migrations
+    correspondentes), então qualquer escrita — inclusive em lote — mantém
+    os contadores consistentes na mesma transação. Cada status tem
+    várias linhas (`slot`) e cada conexão atualiza a sua, para escritas
+    concorrentes não esperarem pela mesma linha; o total é a soma.
+    """
+
+    __tablename__ = "customer_counters"
+
+    is_active: Mapped[bool] = mapped_column(Boolean, primary_key=True)
+    slot: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    total: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
@@ -1,10 +1,11 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, DateTime, String, Text
+from sqlalchemy import Boolean, DateTime, Index, Integer, String, Text, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.shared.infrastructure.database.base import BaseModel
+from app.modules.customer.infrastructure.search.search_text import build_search_text
 
 from app.modules.customer.domain.entities.customer_entity import CustomerEntity
 from app.modules.customer.domain.value_objects.customer_id import CustomerId
@@ -29,6 +30,44 @@ class CustomerModel(BaseModel):
 
     __tablename__ = "customers"
 
+    __table_args__ = (
+        # Listagem: um índice (coluna, id) por ordenação, cobrindo as colunas
+        # do CustomerSummary (INCLUDE) para servir páginas por index-only scan
+        Index(
+            "ix_customers_name_id_covering",
+            "name",
+            "id",
+            postgresql_include=["email", "phone", "is_active", "created_at"],
+        ),
+        Index(
+            "ix_customers_created_at_id_covering",
+            "created_at",
+            "id",
+            postgresql_include=["name", "email", "phone", "is_active"],
+        ),
+        Index(
+            "ix_customers_is_active_name_id",
+            "is_active",
+            "name",
+            "id",
+            postgresql_include=["email", "phone", "created_at"],
+        ),
+        Index(
+            "ix_customers_active_created_at_id",
+            "created_at",
+            "id",
+            postgresql_include=["name", "email", "phone", "is_active"],
+            postgresql_where=text("is_active"),
+        ),
+        # Busca por substring/similaridade sem acento (pg_trgm)
+        Index(
+            "ix_customers_search_text_trgm",
+            "search_text",
+            postgresql_using="gin",
+            postgresql_ops={"search_text": "gin_trgm_ops"},
+        ),
+    )
+
     # ─── Identificação ────────────────────────────────────────────────────────
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     name: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -45,11 +84,17 @@ class CustomerModel(BaseModel):
     address_state: Mapped[Optional[str]] = mapped_column(String(2), nullable=True)
     address_zip_code: Mapped[Optional[str]] = mapped_column(String(8), nullable=True)
 
+    # ─── Busca ───────────────────────────────────────────────────────────────
+    # Nome + e-mail sem acentos e em minúsculas, mantido a cada escrita
+    search_text: Mapped[str] = mapped_column(Text, nullable=False, server_default="")
+
     # ─── Metadados ───────────────────────────────────────────────────────────
     notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     is_active: Mapped[bool] = mapped_column(Boolean, nullable=False, default=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    # Lock otimista: incrementada a cada UPDATE
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
 
     # ─── Conversões ──────────────────────────────────────────────────────────
 
@@ -61,15 +106,35 @@ class CustomerModel(BaseModel):
         Extrai os valores primitivos de cada Value Object para
         armazenar no banco de dados.
         """
-        address = entity.address
+        return cls(**cls.values_from_entity(entity))
 
-        return cls(
+    @staticmethod
+    def values_from_entity(entity: CustomerEntity) -> dict:
+        """
+        Valores das colunas para uma entidade, indexados pelo nome do atributo.
+
+        Usado por `from_entity` e pelos INSERTs em lote (multi-row VALUES),
+        que não passam pela unit of work do ORM.
+        """
+        return dict(
             id=entity.id.value,
             name=entity.name.value,
             email=entity.email.value,
             phone=entity.phone.value if entity.phone else None,
             document=entity.document.value if entity.document else None,
-            # Endereço flat — todos None se não houver endereço
+            search_text=build_search_text(entity.name.value, entity.email.value),
+            **CustomerModel.address_values(entity.address),
+            notes=entity.notes,
+            is_active=entity.is_active,
+            created_at=entity.created_at,
+            updated_at=entity.updated_at,
+            version=entity.version,
+        )
+
+    @staticmethod
+    def address_values(address: Optional[CustomerAddress]) -> dict:
+        """Colunas do endereço flat — todas None se não houver endereço."""
+        return dict(
             address_street=address.street if address else None,
             address_number=address.number if address else None,
             address_complement=address.complement if address else None,
@@ -77,10 +142,6 @@ class CustomerModel(BaseModel):
             address_city=address.city if address else None,
             address_state=address.state if address else None,
             address_zip_code=address.zip_code if address else None,
-            notes=entity.notes,
-            is_active=entity.is_active,
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
         )
 
     def to_entity(self) -> CustomerEntity:
@@ -113,28 +174,5 @@ class CustomerModel(BaseModel):
             is_active=self.is_active,
             created_at=self.created_at,
             updated_at=self.updated_at,
+            version=self.version,
         )
-
-    def update_from_entity(self, entity: CustomerEntity) -> None:
-        """
-        Atualiza os campos do model a partir de uma entidade.
-
-        Usado no repositório para evitar deletar e recriar o registro,
-        preservando assim o histórico de auditoria do SQLAlchemy.
-        """
-        address = entity.address
-
-        self.name = entity.name.value
-        self.email = entity.email.value
-        self.phone = entity.phone.value if entity.phone else None
-        self.document = entity.document.value if entity.document else None
-        self.address_street = address.street if address else None
-        self.address_number = address.number if address else None
-        self.address_complement = address.complement if address else None
-        self.address_neighborhood = address.neighborhood if address else None
-        self.address_city = address.city if address else None
-        self.address_state = address.state if address else None
-        self.address_zip_code = address.zip_code if address else None
-        self.notes = entity.notes
-        self.is_active = entity.is_active
-        self.updated_at = entity.updated_at
@@ -1,20 +1,68 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Set, Tuple
 
-from sqlalchemy import func, or_, select
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, insert, not_, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.modules.customer.domain.entities.customer_entity import CustomerEntity
-from app.modules.customer.domain.exceptions.customers_exceptions import CustomerNotFoundError
+from app.modules.customer.domain.exceptions.customers_exceptions import (
+    CustomerAlreadyExistsError,
+    CustomerConcurrentUpdateError,
+    CustomerDocumentAlreadyExistsError,
+    CustomerNotFoundError,
+)
 from app.modules.customer.domain.read_models.customer_rm import (
+    CustomerExportRow,
     CustomerProfile,
     CustomerSummary,
 )
 from app.modules.customer.domain.repositories.customer_repository import CustomerRepository
+from app.modules.customer.domain.value_objects.customer_changes import CustomerChanges
 from app.modules.customer.domain.value_objects.customer_document import CustomerDocument
 from app.modules.customer.domain.value_objects.customer_email import CustomerEmail
+from app.modules.customer.domain.value_objects.customer_field_set import (
+    CUSTOMER_PROFILE_FIELDS,
+    CUSTOMER_SUMMARY_FIELDS,
+    CustomerFieldSet,
+)
 from app.modules.customer.domain.value_objects.customer_id import CustomerId
+from app.modules.customer.domain.value_objects.customer_list_cursor import (
+    CustomerListCursor,
+    CustomerSort,
+)
+from app.modules.customer.infrastructure.models.customer_counter_model import CustomerCounterModel
 from app.modules.customer.infrastructure.models.customer_model import CustomerModel
-
+from app.modules.customer.infrastructure.search.search_text import (
+    normalize_search_text,
+    search_text_for_new_name,
+)
+from app.shared.infrastructure.database.errors import unique_violation_constraint
+from app.shared.infrastructure.database.routing import replica_read
+
+# Campo da resposta → colunas que o alimentam (projeção de `fields`)
+_FIELD_COLUMNS = {
+    "customer_id": (CustomerModel.id,),
+    "name": (CustomerModel.name,),
+    "email": (CustomerModel.email,),
+    "phone": (CustomerModel.phone,),
+    "is_active": (CustomerModel.is_active,),
+    "created_at": (CustomerModel.created_at,),
+    "document": (CustomerModel.document,),
+    "address": (
+        CustomerModel.address_street,
+        CustomerModel.address_number,
+        CustomerModel.address_complement,
+        CustomerModel.address_neighborhood,
+        CustomerModel.address_city,
+        CustomerModel.address_state,
+        CustomerModel.address_zip_code,
+    ),
+    "notes": (CustomerModel.notes,),
+    "updated_at": (CustomerModel.updated_at,),
+    "version": (CustomerModel.version,),
+}
 
 class CustomerRepositoryImpl(CustomerRepository):
     """
@@ -26,60 +74,227 @@ class CustomerRepositoryImpl(CustomerRepository):
     - Montar Read Models diretamente das queries (sem passar pela entidade)
     """
 
-    def __init__(self, db: Session):
+    # Linhas buscadas por ida ao banco no streaming da exportação
+    EXPORT_BATCH_SIZE = 1000
+
+    def __init__(self, db: AsyncSession):
         self._db = db
 
     # ─── Comandos ─────────────────────────────────────────────────────────────
 
     async def create(self, customer: CustomerEntity) -> CustomerEntity:
         """
-        Persiste um novo cliente no banco.
+        Persiste um novo cliente com um único INSERT ... RETURNING.
+
+        A unicidade de e-mail e CPF é garantida pelos índices únicos:
+        a violação é traduzida para a exceção de domínio, sem consultas
+        prévias (que seriam sujeitas a corrida entre requisições).
 
         Args:
             customer: Entidade do cliente
 
         Returns:
             CustomerEntity: Entidade persistida
+
+        Raises:
+            CustomerAlreadyExistsError: Se o e-mail já estiver cadastrado
+            CustomerDocumentAlreadyExistsError: Se o CPF já estiver cadastrado
         """
-        model = CustomerModel.from_entity(customer)
+        stmt = (
+            insert(CustomerModel)
+            .values(CustomerModel.values_from_entity(customer))
+            .returning(CustomerModel)
+        )
 
-        self._db.add(model)
-        self._db.commit()
-        self._db.refresh(model)
+        try:
+            model = (await self._db.execute(stmt)).scalar_one()
+            await self._db.commit()
+        except IntegrityError as exc:
+            await self._db.rollback()
+            raise self._translate_integrity_error(exc, customer) from exc
 
         return model.to_entity()
 
+    async def create_many(self, customers: List[CustomerEntity]) -> Set[str]:
+        """
+        Persiste vários clientes com um único INSERT multi-row.
+
+        `ON CONFLICT DO NOTHING` cobre a corrida entre a verificação de
+        unicidade e o INSERT: linhas conflitantes são descartadas e ficam
+        de fora do RETURNING, sem abortar o restante do lote.
+
+        Args:
+            customers: Entidades a serem criadas
+
+        Returns:
+            Set[str]: IDs dos clientes efetivamente inseridos
+        """
+        if not customers:
+            return set()
+
+        stmt = (
+            pg_insert(CustomerModel)
+            .values([CustomerModel.values_from_entity(c) for c in customers])
+            .on_conflict_do_nothing()
+            .returning(CustomerModel.id)
+        )
+        inserted = set((await self._db.execute(stmt)).scalars().all())
+        await self._db.commit()
+
+        return inserted
+
     async def update(self, customer: CustomerEntity) -> CustomerEntity:
         """
-        Atualiza os dados de um cliente existente.
+        Atualiza os dados de um cliente com um único UPDATE ... RETURNING.
 
-        Atualiza in-place para preservar o objeto rastreado pelo SQLAlchemy.
+        O UPDATE só casa se a versão no banco ainda for a versão lida
+        (`customer.version`) e já incrementa a versão — duas requisições
+        concorrentes não sobrescrevem uma à outra em silêncio.
 
         Args:
             customer: Entidade com dados atualizados
 
         Returns:
-            CustomerEntity: Entidade atualizada
+            CustomerEntity: Entidade atualizada (com a nova versão)
 
         Raises:
             CustomerNotFoundError: Se o cliente não existir no banco
+            CustomerConcurrentUpdateError: Se a versão mudou desde a leitura
+        """
+        values = CustomerModel.values_from_entity(customer)
+        for column in ("id", "created_at", "version"):
+            values.pop(column)
+
+        stmt = (
+            update(CustomerModel)
+            .where(
+                CustomerModel.id == customer.id.value,
+                CustomerModel.version == customer.version,
+            )
+            .values(**values, version=CustomerModel.version + 1)
+            .returning(CustomerModel)
+            # o model pode já estar no identity map (lido pelo use case)
+            .execution_options(populate_existing=True)
+        )
+
+        try:
+            model = (await self._db.execute(stmt)).scalar_one_or_none()
+        except IntegrityError as exc:
+            await self._db.rollback()
+            raise self._translate_integrity_error(exc, customer) from exc
+
+        if model is None:
+            await self._raise_update_miss(customer.id)
+
+        await self._db.commit()
+        return model.to_entity()
+
+    async def update_fields(
+        self,
+        customer_id: CustomerId,
+        changes: CustomerChanges,
+        expected_version: Optional[int] = None,
+    ) -> CustomerEntity:
         """
-        stmt = select(CustomerModel).where(CustomerModel.id == customer.id.value)
-        model = self._db.execute(stmt).scalar_one_or_none()
+        Grava só os campos alterados com um único UPDATE ... RETURNING.
 
-        if not model:
-            raise CustomerNotFoundError(identifier=customer.id.value)
+        Sem leitura prévia: o WHERE confere id (e versão, se enviada) e a
+        linha só é consultada quando o UPDATE não casa, para decidir entre
+        404 e 409. Campos de `changes` não tocam índices únicos.
 
-        model.update_from_entity(customer)
+        Args:
+            customer_id: ID do cliente
+            changes: Campos a alterar
+            expected_version: Versão lida pelo cliente (opcional)
 
-        self._db.commit()
-        self._db.refresh(model)
+        Returns:
+            CustomerEntity: Entidade atualizada (com a nova versão)
 
+        Raises:
+            CustomerNotFoundError: Se o cliente não existir no banco
+            CustomerConcurrentUpdateError: Se a versão mudou desde a leitura
+        """
+        values = {}
+        if "name" in changes:
+            values["name"] = changes.name.value
+            values["search_text"] = search_text_for_new_name(changes.name.value, CustomerModel.email)
+        if "phone" in changes:
+            values["phone"] = changes.phone.value if changes.phone else None
+        if "notes" in changes:
+            values["notes"] = changes.notes
+        if "address" in changes:
+            values.update(CustomerModel.address_values(changes.address))
+
+        conditions = [CustomerModel.id == customer_id.value]
+        if expected_version is not None:
+            conditions.append(CustomerModel.version == expected_version)
+
+        stmt = (
+            update(CustomerModel)
+            .where(*conditions)
+            .values(**values, updated_at=datetime.utcnow(), version=CustomerModel.version + 1)
+            .returning(CustomerModel)
+            .execution_options(populate_existing=True)
+        )
+        model = (await self._db.execute(stmt)).scalar_one_or_none()
+
+        if model is None:
+            await self._raise_update_miss(customer_id)
+
+        await self._db.commit()
         return model.to_entity()
 
+    async def _raise_update_miss(self, customer_id: CustomerId) -> None:
+        """Nenhuma linha no UPDATE versionado: ou o cliente sumiu ou a versão mudou."""
+        exists_stmt = select(CustomerModel.id).where(CustomerModel.id == customer_id.value)
+        exists = (await self._db.execute(exists_stmt)).scalar_one_or_none() is not None
+        await self._db.rollback()
+
+        if not exists:
+            raise CustomerNotFoundError(identifier=customer_id.value)
+        raise CustomerConcurrentUpdateError(customer_id=customer_id.value)
+
+    async def set_active(self, customer_id: CustomerId, is_active: bool) -> Optional[CustomerEntity]:
+        """
+        Ativa ou desativa um cliente com um UPDATE condicional.
+
+        O UPDATE só toca a linha se o estado for diferente do pedido, então
+        repetir a operação não gera escrita (nem dispara os contadores).
+        Só quando nenhuma linha muda é feita a leitura do estado atual.
+
+        Args:
+            customer_id: ID do cliente
+            is_active: Estado desejado
+
+        Returns:
+            Optional[CustomerEntity]: Cliente no estado pedido ou None se não existir
+        """
+        stmt = (
+            update(CustomerModel)
+            .where(
+                CustomerModel.id == customer_id.value,
+                CustomerModel.is_active.is_not(is_active),
+            )
+            .values(
+                is_active=is_active,
+                updated_at=datetime.utcnow(),
+                version=CustomerModel.version + 1,
+            )
+            .returning(CustomerModel)
+            .execution_options(populate_existing=True)
+        )
+        model = (await self._db.execute(stmt)).scalar_one_or_none()
+
+        if model is None:
+            select_stmt = select(CustomerModel).where(CustomerModel.id == customer_id.value)
+            model = (await self._db.execute(select_stmt)).scalar_one_or_none()
+
+        await self._db.commit()
+        return model.to_entity() if model else None
+
     async def delete(self, customer_id: CustomerId) -> bool:
         """
-        Remove um cliente do banco.
+        Remove um cliente com um único DELETE ... RETURNING.
 
         Args:
             customer_id: ID do cliente a remover
@@ -87,16 +302,15 @@ class CustomerRepositoryImpl(CustomerRepository):
         Returns:
             bool: True se removido com sucesso, False se não encontrado
         """
-        stmt = select(CustomerModel).where(CustomerModel.id == customer_id.value)
-        model = self._db.execute(stmt).scalar_one_or_none()
-
-        if not model:
-            return False
-
-        self._db.delete(model)
-        self._db.commit()
+        stmt = (
+            delete(CustomerModel)
+            .where(CustomerModel.id == customer_id.value)
+            .returning(CustomerModel.id)
+        )
+        deleted = (await self._db.execute(stmt)).scalar_one_or_none()
+        await self._db.commit()
 
-        return True
+        return deleted is not None
 
     # ─── Queries — Entidade completa ──────────────────────────────────────────
 
@@ -111,7 +325,7 @@ class CustomerRepositoryImpl(CustomerRepository):
             Optional[CustomerEntity]: Entidade do cliente ou None
         """
         stmt = select(CustomerModel).where(CustomerModel.id == customer_id.value)
-        model = self._db.execute(stmt).scalar_one_or_none()
+        model = (await self._db.execute(stmt)).scalar_one_or_none()
 
         return model.to_entity() if model else None
 
@@ -126,7 +340,7 @@ class CustomerRepositoryImpl(CustomerRepository):
             Optional[CustomerEntity]: Entidade do cliente ou None
         """
         stmt = select(CustomerModel).where(CustomerModel.email == email.value)
-        model = self._db.execute(stmt).scalar_one_or_none()
+        model = (await self._db.execute(stmt)).scalar_one_or_none()
 
         return model.to_entity() if model else None
 
@@ -141,7 +355,7 @@ class CustomerRepositoryImpl(CustomerRepository):
             Optional[CustomerEntity]: Entidade do cliente ou None
         """
         stmt = select(CustomerModel).where(CustomerModel.document == document.value)
-        model = self._db.execute(stmt).scalar_one_or_none()
+        model = (await self._db.execute(stmt)).scalar_one_or_none()
 
         return model.to_entity() if model else None
 
@@ -158,7 +372,7 @@ class CustomerRepositoryImpl(CustomerRepository):
             bool: True se o e-mail já está cadastrado
         """
         stmt = select(CustomerModel.id).where(CustomerModel.email == email.value)
-        return self._db.execute(stmt).scalar_one_or_none() is not None
+        return (await self._db.execute(stmt)).scalar_one_or_none() is not None
 
     async def exists_by_document(self, document: CustomerDocument) -> bool:
         """
@@ -171,58 +385,146 @@ class CustomerRepositoryImpl(CustomerRepository):
             bool: True se o CPF já está cadastrado
         """
         stmt = select(CustomerModel.id).where(CustomerModel.document == document.value)
-        return self._db.execute(stmt).scalar_one_or_none() is not None
+        return (await self._db.execute(stmt)).scalar_one_or_none() is not None
+
+    async def find_existing_keys(
+        self,
+        emails: List[CustomerEmail],
+        documents: List[CustomerDocument],
+    ) -> Tuple[Set[str], Set[str]]:
+        """
+        Verifica em uma única consulta quais e-mails e CPFs já existem.
+
+        Usa os índices únicos de `email` e `document` (IN por lote).
+
+        Args:
+            emails: E-mails a verificar
+            documents: CPFs a verificar
+
+        Returns:
+            Tuple[Set[str], Set[str]]: E-mails e CPFs já cadastrados
+        """
+        email_values = {e.value for e in emails}
+        document_values = {d.value for d in documents}
+
+        conditions = []
+        if email_values:
+            conditions.append(CustomerModel.email.in_(email_values))
+        if document_values:
+            conditions.append(CustomerModel.document.in_(document_values))
+
+        if not conditions:
+            return set(), set()
+
+        stmt = select(CustomerModel.email, CustomerModel.document).where(or_(*conditions))
+        rows = (await self._db.execute(stmt)).all()
+
+        return (
+            {row.email for row in rows if row.email in email_values},
+            {row.document for row in rows if row.document in document_values},
+        )
 
     # ─── Queries — Read Models ────────────────────────────────────────────────
 
+    @replica_read
     async def list_summaries(
         self,
         is_active: Optional[bool] = None,
         search: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
+        sort: CustomerSort = "name",
+        after: Optional[CustomerListCursor] = None,
+        fields: Optional[CustomerFieldSet] = None,
     ) -> List[CustomerSummary]:
         """
         Lista resumos de clientes com filtros opcionais.
 
         Seleciona apenas as colunas necessárias para o Read Model,
         evitando carregar dados desnecessários (endereço, notes etc).
+        Com `fields`, só as colunas dos campos pedidos (mais id e a
+        coluna de ordenação, que o cursor usa).
+
+        Com `after` a paginação é por keyset: a condição
+        `(coluna, id) > (valor, id)` é resolvida direto no índice
+        (coluna, id), então a página N custa o mesmo que a primeira.
 
         Args:
             is_active: Filtrar por status ativo/inativo (None = todos)
-            search: Busca parcial por nome ou e-mail (case-insensitive)
+            search: Busca parcial por nome ou e-mail (sem acento/caixa)
             limit: Limite de registros por página
-            offset: Deslocamento para paginação
+            offset: Deslocamento para paginação (ignorado quando há cursor)
+            sort: Ordenação (sempre desempatada pelo id); "relevance"
+                ordena pela similaridade com `search`
+            after: Cursor da última posição entregue
+            fields: Campos pedidos (None = todos)
 
         Returns:
             List[CustomerSummary]: Lista de resumos de clientes
         """
-        stmt = select(
-            CustomerModel.id,
-            CustomerModel.name,
-            CustomerModel.email,
-            CustomerModel.phone,
-            CustomerModel.is_active,
-            CustomerModel.created_at,
-        )
+        rank = self._relevance(search) if sort == "relevance" and search else None
 
+        stmt = self._summary_select(rank, sort=sort, fields=fields)
         stmt = self._apply_filters(stmt, is_active=is_active, search=search)
-        stmt = stmt.order_by(CustomerModel.name).limit(limit).offset(offset)
+        stmt = self._apply_ordering(stmt, sort=sort, after=after, rank=rank)
+        stmt = self._apply_page(stmt, limit=limit, offset=offset, after=after)
 
-        rows = self._db.execute(stmt).all()
+        rows = (await self._db.execute(stmt)).all()
 
-        return [
-            CustomerSummary(
-                customer_id=row.id,
-                name=row.name,
-                email=row.email,
-                phone=row.phone,
-                is_active=row.is_active,
-                created_at=row.created_at,
-            )
-            for row in rows
-        ]
+        return [self._to_summary(row, with_relevance=rank is not None) for row in rows]
 
+    @replica_read
+    async def list_summaries_with_total(
+        self,
+        is_active: Optional[bool] = None,
+        search: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        sort: CustomerSort = "name",
+        after: Optional[CustomerListCursor] = None,
+        fields: Optional[CustomerFieldSet] = None,
+    ) -> Tuple[List[CustomerSummary], int]:
+        """
+        Lista resumos e devolve o total filtrado na mesma consulta.
+
+        O total vem de `count(*) OVER ()` calculado numa subquery com os
+        filtros (antes do keyset/LIMIT), evitando um segundo round trip
+        com o mesmo WHERE. Só quando a página vem vazia (cursor/offset
+        além do fim) o total é obtido por `count()`.
+
+        Args:
+            Os mesmos de `list_summaries`
+
+        Returns:
+            Tuple[List[CustomerSummary], int]: Página de resumos e total filtrado
+        """
+        rank = self._relevance(search) if sort == "relevance" and search else None
+
+        filtered = self._summary_select(rank, sort=sort, fields=fields).add_columns(func.count().over().label("total"))
+        filtered = self._apply_filters(filtered, is_active=is_active, search=search).subquery()
+
+        stmt = select(filtered)
+        stmt = self._apply_ordering(
+            stmt,
+            sort=sort,
+            after=after,
+            rank=filtered.c.relevance if rank is not None else None,
+            columns=filtered.c,
+        )
+        stmt = self._apply_page(stmt, limit=limit, offset=offset, after=after)
+
+        rows = (await self._db.execute(stmt)).all()
+
+        if rows:
+            total = rows[0].total
+        elif after is not None or offset:
+            total = await self.count(is_active=is_active, search=search)
+        else:
+            total = 0
+
+        return [self._to_summary(row, with_relevance=rank is not None) for row in rows], total
+
+    @replica_read
     async def count(
         self,
         is_active: Optional[bool] = None,
@@ -231,6 +533,11 @@ class CustomerRepositoryImpl(CustomerRepository):
         """
         Conta o total de clientes com filtros opcionais.
 
+        Sem busca textual o total é a soma das linhas de
+        `customer_counters` (alguns slots por status), sem varrer
+        `customers`. Com busca a contagem precisa percorrer os
+        resultados do filtro.
+
         Args:
             is_active: Filtrar por status ativo/inativo (None = todos)
             search: Busca parcial por nome ou e-mail
@@ -238,55 +545,239 @@ class CustomerRepositoryImpl(CustomerRepository):
         Returns:
             int: Total de clientes que atendem ao filtro
         """
+        if not (search and normalize_search_text(search)):
+            stmt = select(func.coalesce(func.sum(CustomerCounterModel.total), 0))
+            if is_active is not None:
+                stmt = stmt.where(CustomerCounterModel.is_active == is_active)
+
+            return int((await self._db.execute(stmt)).scalar_one())
+
         stmt = select(func.count(CustomerModel.id))
         stmt = self._apply_filters(stmt, is_active=is_active, search=search)
 
-        return self._db.execute(stmt).scalar_one()
+        return (await self._db.execute(stmt)).scalar_one()
+
+    @replica_read
+    async def stream_export_rows(
+        self,
+        is_active: Optional[bool] = None,
+        search: Optional[str] = None,
+    ) -> AsyncIterator[CustomerExportRow]:
+        """
+        Percorre os clientes filtrados com um cursor no servidor.
+
+        `session.stream` + `yield_per` buscam EXPORT_BATCH_SIZE linhas
+        por vez, então a memória não cresce com o tamanho da tabela.
+        A ordem (name, id) é servida pelo índice da listagem.
+
+        Args:
+            is_active: Filtrar por status ativo/inativo (None = todos)
+            search: Busca parcial por nome ou e-mail
 
-    async def get_profile(self, customer_id: CustomerId) -> Optional[CustomerProfile]:
+        Returns:
+            AsyncIterator[CustomerExportRow]: Linhas ordenadas por nome
+        """
+        stmt = select(
+            CustomerModel.id,
+            CustomerModel.name,
+            CustomerModel.email,
+            CustomerModel.phone,
+            CustomerModel.document,
+            CustomerModel.address_city,
+            CustomerModel.address_state,
+            CustomerModel.is_active,
+            CustomerModel.created_at,
+        )
+        stmt = self._apply_filters(stmt, is_active=is_active, search=search)
+        stmt = stmt.order_by(CustomerModel.name, CustomerModel.id)
+
+        result = await self._db.stream(
+            stmt.execution_options(yield_per=self.EXPORT_BATCH_SIZE)
+        )
+
+        async for row in result:
+            yield CustomerExportRow(
+                customer_id=row.id,
+                name=row.name,
+                email=row.email,
+                phone=row.phone,
+                document=row.document,
+                city=row.address_city,
+                state=row.address_state,
+                is_active=row.is_active,
+                created_at=row.created_at,
+            )
+
+    @replica_read
+    async def get_profile(
+        self,
+        customer_id: CustomerId,
+        fields: Optional[CustomerFieldSet] = None,
+    ) -> Optional[CustomerProfile]:
         """
         Busca o perfil completo do cliente como Read Model.
 
         Retorna todos os campos incluindo endereço, sem reconstituir VOs.
+        Seleciona colunas (não o model): nada entra no identity map da
+        sessão, e com `fields` o SELECT traz só as colunas pedidas —
+        `notes` e as sete de endereço ficam de fora das visões estreitas.
 
         Args:
             customer_id: ID do cliente
+            fields: Campos pedidos (None = todos)
 
         Returns:
             Optional[CustomerProfile]: Perfil do cliente ou None
         """
-        stmt = select(CustomerModel).where(CustomerModel.id == customer_id.value)
-        model = self._db.execute(stmt).scalar_one_or_none()
+        stmt = (
+            select(*self._columns(CUSTOMER_PROFILE_FIELDS, fields))
+            .where(CustomerModel.id == customer_id.value)
+        )
+        row = (await self._db.execute(stmt)).one_or_none()
 
-        if not model:
+        if not row:
             return None
 
+        values = row._mapping
         return CustomerProfile(
-            customer_id=model.id,
-            name=model.name,
-            email=model.email,
-            phone=model.phone,
-            document=model.document,
-            street=model.address_street,
-            number=model.address_number,
-            complement=model.address_complement,
-            neighborhood=model.address_neighborhood,
-            city=model.address_city,
-            state=model.address_state,
-            zip_code=model.address_zip_code,
-            notes=model.notes,
-            is_active=model.is_active,
-            created_at=model.created_at,
-            updated_at=model.updated_at,
+            customer_id=values["id"],
+            name=values.get("name"),
+            email=values.get("email"),
+            phone=values.get("phone"),
+            document=values.get("document"),
+            street=values.get("address_street"),
+            number=values.get("address_number"),
+            complement=values.get("address_complement"),
+            neighborhood=values.get("address_neighborhood"),
+            city=values.get("address_city"),
+            state=values.get("address_state"),
+            zip_code=values.get("address_zip_code"),
+            notes=values.get("notes"),
+            is_active=values.get("is_active"),
+            created_at=values.get("created_at"),
+            updated_at=values.get("updated_at"),
+            version=values.get("version"),
         )
 
     # ─── Helpers privados ─────────────────────────────────────────────────────
 
+    @staticmethod
+    def _translate_integrity_error(exc: IntegrityError, customer: CustomerEntity) -> Exception:
+        """Converte violação de índice único na exceção de domínio correspondente."""
+        constraint = unique_violation_constraint(exc)
+
+        if constraint == "ix_customers_email":
+            return CustomerAlreadyExistsError(email=customer.email.value)
+
+        if constraint == "ix_customers_document" and customer.document:
+            return CustomerDocumentAlreadyExistsError(document=customer.document.value)
+
+        return exc
+
+    @staticmethod
+    def _columns(
+        names: Tuple[str, ...],
+        fields: Optional[CustomerFieldSet],
+        required: Tuple[str, ...] = (),
+    ) -> list:
+        """Colunas dos campos pedidos (todos, se `fields` for None), na ordem de `names`."""
+        return [
+            column
+            for name in names
+            if fields is None or name in fields or name in required
+            for column in _FIELD_COLUMNS[name]
+        ]
+
+    @classmethod
+    def _summary_select(
+        cls,
+        rank=None,
+        sort: CustomerSort = "name",
+        fields: Optional[CustomerFieldSet] = None,
+    ):
+        """
+        Colunas do Read Model CustomerSummary (+ relevância, se houver).
+
+        A coluna de ordenação entra mesmo fora de `fields`: o keyset e o
+        next_cursor dependem dela.
+        """
+        sort_field = "created_at" if sort.lstrip("-") == "created_at" else "name"
+        stmt = select(*cls._columns(CUSTOMER_SUMMARY_FIELDS, fields, required=(sort_field,)))
+
+        return stmt.add_columns(rank.label("relevance")) if rank is not None else stmt
+
+    @staticmethod
+    def _to_summary(row, with_relevance: bool) -> CustomerSummary:
+        # Colunas fora da projeção (`fields`) ficam None
+        values = row._mapping
+        return CustomerSummary(
+            customer_id=values["id"],
+            name=values.get("name"),
+            email=values.get("email"),
+            phone=values.get("phone"),
+            is_active=values.get("is_active"),
+            created_at=values.get("created_at"),
+            relevance=values["relevance"] if with_relevance else None,
+        )
+
+    @staticmethod
+    def _apply_page(stmt, limit: int, offset: int, after: Optional[CustomerListCursor]):
+        """Aplica LIMIT e, apenas na paginação por offset, o OFFSET."""
+        stmt = stmt.limit(limit)
+
+        if after is None and offset:
+            stmt = stmt.offset(offset)
+
+        return stmt
+
+    @staticmethod
+    def _apply_ordering(
+        stmt,
+        sort: CustomerSort,
+        after: Optional[CustomerListCursor],
+        rank=None,
+        columns=CustomerModel,
+    ):
+        """
+        Aplica a ordenação (chave, id) e, se houver cursor, a condição keyset.
+
+        Args:
+            stmt: Statement SQLAlchemy base
+            sort: Ordenação solicitada
+            after: Cursor da última posição entregue
+            rank: Expressão de relevância (apenas para sort="relevance")
+            columns: Origem das colunas (o model ou `subquery.c`)
+
+        Returns:
+            Statement ordenado (e filtrado pelo cursor)
+        """
+        if sort == "relevance":
+            # Sem termo de busca não há relevância: cai na ordem por nome
+            column, descending = (rank, True) if rank is not None else (columns.name, False)
+        else:
+            column = getattr(columns, sort.lstrip("-"))
+            descending = sort.startswith("-")
+
+        key = tuple_(column, columns.id)
+
+        if descending:
+            if after is not None:
+                stmt = stmt.where(key < tuple_(after.value, after.customer_id))
+            return stmt.order_by(column.desc(), columns.id.desc())
+
+        if after is not None:
+            stmt = stmt.where(key > tuple_(after.value, after.customer_id))
+        return stmt.order_by(column, columns.id)
+
     @staticmethod
     def _apply_filters(stmt, is_active: Optional[bool], search: Optional[str]):
         """
         Aplica filtros reutilizáveis de status e busca textual a um statement.
 
+        A busca compara o termo normalizado (sem acento, minúsculo) com a
+        coluna `search_text`; o LIKE '%termo%' é atendido pelo índice GIN
+        de trigramas em vez de varrer a tabela.
+
         Args:
             stmt: Statement SQLAlchemy base
             is_active: Filtro de status ativo/inativo
@@ -296,15 +787,22 @@ class CustomerRepositoryImpl(CustomerRepository):
             Statement com filtros aplicados
         """
         if is_active is not None:
-            stmt = stmt.where(CustomerModel.is_active == is_active)
-
-        if search:
-            pattern = f"%{search.strip()}%"
-            stmt = stmt.where(
-                or_(
-                    CustomerModel.name.ilike(pattern),
-                    CustomerModel.email.ilike(pattern),
-                )
+            # Literal (e não parâmetro): com prepared statements o plano
+            # genérico não enxergaria o índice parcial `WHERE is_active`
+            stmt = stmt.where(CustomerModel.is_active if is_active else not_(CustomerModel.is_active))
+
+        term = normalize_search_text(search) if search else ""
+        if term:
+            escaped = (
+                term.replace("\\", "\\\\")
+                .replace("%", "\\%")
+                .replace("_", "\\_")
             )
+            stmt = stmt.where(CustomerModel.search_text.like(f"%{escaped}%", escape="\\"))
 
         return stmt
+
+    @staticmethod
+    def _relevance(search: str):
+        """Relevância (0..1) do termo normalizado em relação ao `search_text`."""
+        return func.word_similarity(normalize_search_text(search), CustomerModel.search_text)
@@ -0,0 +1,36 @@
+import re
+import unicodedata
+
+from sqlalchemy import literal
+from sqlalchemy.sql.elements import ColumnElement
+
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_search_text(value: str) -> str:
+    """
+    Normaliza texto para busca: sem acentos, minúsculo e com espaços únicos.
+
+    Espelha `lower(unaccent(...))` do Postgres, usado no backfill da coluna,
+    para que "joao" encontre "João".
+    """
+    decomposed = unicodedata.normalize("NFKD", value)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+
+    return _SPACES.sub(" ", stripped).strip().lower()
+
+
+def build_search_text(name: str, email: str) -> str:
+    """Monta o conteúdo da coluna `search_text` (mantida a cada escrita)."""
+    return normalize_search_text(f"{name} {email}")
+
+
+
+def search_text_for_new_name(name: str, email_column: ColumnElement) -> ColumnElement:
+    """
+    `build_search_text` para um UPDATE que troca só o nome.
+
+    O e-mail vem da própria linha: o VO já o guarda em minúsculas, sem
+    espaços nem acentos, então normalizá-lo não muda nada.
+    """
+    return literal(f"{normalize_search_text(name)} ") + email_column
@@ -1,5 +1,5 @@
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.shared.infrastructure.database.session import get_db
 
@@ -29,12 +29,18 @@ from app.modules.customer.application.usecases.toggle_customer_status_usecase im
 from app.modules.customer.application.usecases.delete_customer_usecase import (
     DeleteCustomerUseCase,
 )
+from app.modules.customer.application.usecases.export_customers_usecase import (
+    ExportCustomersUseCase,
+)
+from app.modules.customer.application.usecases.import_customers_usecase import (
+    ImportCustomersUseCase,
+)
 
 
 # ─── Infraestrutura ───────────────────────────────────────────────────────────
 
 
-def get_customer_repository(db: Session = Depends(get_db)) -> CustomerRepository:
+async def get_customer_repository(db: AsyncSession = Depends(get_db)) -> CustomerRepository:
     """Dependency para obter CustomerRepository."""
     return CustomerRepositoryImpl(db)
 
@@ -42,57 +48,71 @@ def get_customer_repository(db: Session = Depends(get_db)) -> CustomerRepository
 # ─── Use Cases ────────────────────────────────────────────────────────────────
 
 
-def get_create_customer_use_case(
+async def get_create_customer_use_case(
     repository: CustomerRepository = Depends(get_customer_repository),
 ) -> CreateCustomerUseCase:
     """Dependency para obter CreateCustomerUseCase."""
     return CreateCustomerUseCase(repository)
 
 
-def get_update_customer_use_case(
+async def get_update_customer_use_case(
     repository: CustomerRepository = Depends(get_customer_repository),
 ) -> UpdateCustomerUseCase:
     """Dependency para obter UpdateCustomerUseCase."""
     return UpdateCustomerUseCase(repository)
 
 
-def get_update_customer_address_use_case(
+async def get_update_customer_address_use_case(
     repository: CustomerRepository = Depends(get_customer_repository),
 ) -> UpdateCustomerAddressUseCase:
     """Dependency para obter UpdateCustomerAddressUseCase."""
     return UpdateCustomerAddressUseCase(repository)
 
 
-def get_customer_use_case(
+async def get_customer_use_case(
     repository: CustomerRepository = Depends(get_customer_repository),
 ) -> GetCustomerUseCase:
     """Dependency para obter GetCustomerUseCase."""
     return GetCustomerUseCase(repository)
 
 
-def get_list_customers_use_case(
+async def get_list_customers_use_case(
     repository: CustomerRepository = Depends(get_customer_repository),
 ) -> ListCustomersUseCase:
     """Dependency para obter ListCustomersUseCase."""
     return ListCustomersUseCase(repository)
 
 
-def get_activate_customer_use_case(
+async def get_activate_customer_use_case(
     repository: CustomerRepository = Depends(get_customer_repository),
 ) -> ActivateCustomerUseCase:
     """Dependency para obter ActivateCustomerUseCase."""
     return ActivateCustomerUseCase(repository)
 
 
-def get_deactivate_customer_use_case(
+async def get_deactivate_customer_use_case(
     repository: CustomerRepository = Depends(get_customer_repository),
 ) -> DeactivateCustomerUseCase:
     """Dependency para obter DeactivateCustomerUseCase."""
     return DeactivateCustomerUseCase(repository)
 
 
-def get_delete_customer_use_case(
+async def get_delete_customer_use_case(
     repository: CustomerRepository = Depends(get_customer_repository),
 ) -> DeleteCustomerUseCase:
     """Dependency para obter DeleteCustomerUseCase."""
     return DeleteCustomerUseCase(repository)
+
+
+async def get_import_customers_use_case(
+    repository: CustomerRepository = Depends(get_customer_repository),
+) -> ImportCustomersUseCase:
+    """Dependency para obter ImportCustomersUseCase."""
+    return ImportCustomersUseCase(repository)
+
+
+async def get_export_customers_use_case(
+    repository: CustomerRepository = Depends(get_customer_repository),
+) -> ExportCustomersUseCase:
+    """Dependency para obter ExportCustomersUseCase."""
+    return ExportCustomersUseCase(repository)
@@ -1,9 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Optional
 
-from app.modules.auth.presentation.dependencies.auth_deps import CurrentUser
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+
+from app.modules.auth.presentation.dependencies.auth_deps import CurrentPrincipal
 
 from app.modules.customer.application.dtos.customer_dtos import (
+    AddressInputDTO,
     CreateCustomerInputDTO,
+    CustomerListOutputDTO,
+    CustomerOutputDTO,
+    ExportCustomersInputDTO,
     ListCustomersInputDTO,
     UpdateAddressInputDTO,
     UpdateCustomerInputDTO,
@@ -19,9 +27,27 @@ from app.modules.customer.application.usecases.toggle_customer_status_usecase im
     DeactivateCustomerUseCase,
 )
 from app.modules.customer.application.usecases.delete_customer_usecase import DeleteCustomerUseCase
+from app.modules.customer.application.usecases.export_customers_usecase import ExportCustomersUseCase
+from app.modules.customer.application.usecases.import_customers_usecase import ImportCustomersUseCase
+
+from app.modules.customer.domain.value_objects.customer_field_set import (
+    CUSTOMER_PROFILE_FIELDS,
+    CUSTOMER_SUMMARY_FIELDS,
+)
+from app.modules.customer.domain.value_objects.customer_list_cursor import CustomerSort
+from app.modules.customer.infrastructure.exporters.customer_export_writer import (
+    EXPORT_MEDIA_TYPES,
+    CustomerExportFormat,
+    write_customer_rows,
+)
+from app.modules.customer.infrastructure.importers.customer_import_reader import (
+    CustomerImportFormat,
+    read_customer_rows,
+)
 
 from app.modules.customer.domain.exceptions.customers_exceptions import (
     CustomerAlreadyExistsError,
+    CustomerConcurrentUpdateError,
     CustomerDocumentAlreadyExistsError,
     CustomerDomainError,
     CustomerInactiveError,
@@ -34,19 +60,25 @@ from app.modules.customer.presentation.dependencies.customer_deps import (
     get_customer_use_case,
     get_deactivate_customer_use_case,
     get_delete_customer_use_case,
+    get_export_customers_use_case,
+    get_import_customers_use_case,
     get_list_customers_use_case,
     get_update_customer_address_use_case,
     get_update_customer_use_case,
 )
 
 from app.modules.customer.presentation.schemas.customer_schemas import (
+    AddressSchema,
     CreateCustomerSchema,
+    CustomerImportReportSchema,
+    CustomerListPartialSchema,
     CustomerListSchema,
+    CustomerPartialResponseSchema,
     CustomerResponseSchema,
-    CustomerSummarySchema,
     UpdateAddressSchema,
     UpdateCustomerSchema,
 )
+from app.shared.presentation.responses.typed_json_response import TypedJSONResponse
 
 
 router = APIRouter(
@@ -54,16 +86,29 @@ router = APIRouter(
     tags=["Customers"],
 )
 
+# Serializadores pré-compilados: os DTOs de saída vão direto para bytes.
+# Têm os mesmos campos dos schemas de resposta (que documentam a rota).
+_CUSTOMER_JSON = TypeAdapter(CustomerOutputDTO)
+_CUSTOMER_LIST_JSON = TypeAdapter(CustomerListOutputDTO)
+
 
 # ─────────────────────────────────────────────────────────────
 # Helpers
 # ─────────────────────────────────────────────────────────────
 
+def _address_input(address: Optional[AddressSchema]) -> Optional[AddressInputDTO]:
+    """Schema da requisição → DTO de entrada (modelos pydantic distintos)."""
+    return AddressInputDTO(**address.model_dump()) if address is not None else None
+
+
 def _handle_domain_error(exc: CustomerDomainError) -> HTTPException:
     if isinstance(exc, CustomerNotFoundError):
         return HTTPException(status_code=404, detail=str(exc))
 
-    if isinstance(exc, (CustomerAlreadyExistsError, CustomerDocumentAlreadyExistsError)):
+    if isinstance(
+        exc,
+        (CustomerAlreadyExistsError, CustomerDocumentAlreadyExistsError, CustomerConcurrentUpdateError),
+    ):
         return HTTPException(status_code=409, detail=str(exc))
 
     if isinstance(exc, CustomerInactiveError):
@@ -72,6 +117,38 @@ def _handle_domain_error(exc: CustomerDomainError) -> HTTPException:
     return HTTPException(status_code=400, detail=str(exc))
 
 
+# Content-Type aceito na importação → formato do arquivo
+_IMPORT_CONTENT_TYPES: dict[str, CustomerImportFormat] = {
+    "text/csv": "csv",
+    "application/csv": "csv",
+    "application/x-ndjson": "ndjson",
+    "application/ndjson": "ndjson",
+    "application/jsonl": "ndjson",
+}
+
+
+def _resolve_import_format(
+    request: Request,
+    file_format: CustomerImportFormat | None,
+) -> CustomerImportFormat:
+    if file_format:
+        return file_format
+
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type not in _IMPORT_CONTENT_TYPES:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Envie text/csv ou application/x-ndjson (ou informe ?format=).",
+        )
+
+    return _IMPORT_CONTENT_TYPES[content_type]
+
+
+def _omitted_fields(fields: frozenset[str] | None, allowed: tuple[str, ...]) -> set[str] | None:
+    """Campos fora do sparse fieldset pedido (None = resposta completa)."""
+    return set(allowed) - fields if fields is not None else None
+
+
 # ─────────────────────────────────────────────────────────────
 # Endpoints
 # ─────────────────────────────────────────────────────────────
@@ -83,9 +160,9 @@ def _handle_domain_error(exc: CustomerDomainError) -> HTTPException:
 )
 async def create_customer(
     body: CreateCustomerSchema,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     use_case: CreateCustomerUseCase = Depends(get_create_customer_use_case),
-) -> CustomerResponseSchema:
+) -> TypedJSONResponse:
     try:
         result = await use_case.execute(
             CreateCustomerInputDTO(
@@ -93,53 +170,127 @@ async def create_customer(
                 email=body.email,
                 phone=body.phone,
                 document=body.document,
-                address=body.address,
+                address=_address_input(body.address),
                 notes=body.notes,
             )
         )
-        return CustomerResponseSchema(**result.model_dump())
+        return TypedJSONResponse(result, _CUSTOMER_JSON, status_code=status.HTTP_201_CREATED)
 
     except CustomerDomainError as exc:
         raise _handle_domain_error(exc)
 
 
-@router.get("", response_model=CustomerListSchema)
+@router.get("", response_model=CustomerListSchema | CustomerListPartialSchema)
 async def list_customers(
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     search: str | None = Query(None, max_length=100),
     is_active: bool | None = Query(None),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    sort: CustomerSort | None = Query(None),
+    cursor: str | None = Query(None, max_length=512),
+    exact_total: bool = Query(True),
+    fields: str | None = Query(
+        None,
+        max_length=200,
+        description="Campos do item separados por vírgula (ex: name,phone); customer_id sempre vem",
+    ),
     use_case: ListCustomersUseCase = Depends(get_list_customers_use_case),
-) -> CustomerListSchema:
-
-    result = await use_case.execute(
-        ListCustomersInputDTO(
-            search=search,
-            is_active=is_active,
-            limit=limit,
-            offset=offset,
+) -> TypedJSONResponse:
+
+    try:
+        result = await use_case.execute(
+            ListCustomersInputDTO(
+                search=search,
+                is_active=is_active,
+                limit=limit,
+                offset=offset,
+                sort=sort,
+                cursor=cursor,
+                exact_total=exact_total,
+                fields=fields,
+            )
         )
+
+    except CustomerDomainError as exc:
+        raise _handle_domain_error(exc)
+
+    omitted = _omitted_fields(result.fields, CUSTOMER_SUMMARY_FIELDS)
+    return TypedJSONResponse(
+        result,
+        _CUSTOMER_LIST_JSON,
+        exclude={"items": {"__all__": omitted}} if omitted else None,
     )
 
-    return CustomerListSchema(
-        items=[CustomerSummarySchema(**item.model_dump()) for item in result.items],
-        total=result.total,
-        limit=result.limit,
-        offset=result.offset,
+
+@router.get("/export")
+async def export_customers(
+    current_user: CurrentPrincipal,
+    search: str | None = Query(None, max_length=100),
+    is_active: bool | None = Query(None),
+    file_format: CustomerExportFormat = Query("csv", alias="format"),
+    use_case: ExportCustomersUseCase = Depends(get_export_customers_use_case),
+) -> StreamingResponse:
+    """
+    Exporta os clientes filtrados em CSV ou NDJSON, em streaming.
+
+    As linhas vão do cursor do banco para a resposta em pedaços; a
+    sessão permanece aberta até o fim do envio.
+    """
+    rows = use_case.execute(ExportCustomersInputDTO(search=search, is_active=is_active))
+
+    return StreamingResponse(
+        write_customer_rows(rows, file_format),
+        media_type=EXPORT_MEDIA_TYPES[file_format],
+        headers={"Content-Disposition": f'attachment; filename="customers.{file_format}"'},
     )
 
 
-@router.get("/{customer_id}", response_model=CustomerResponseSchema)
+@router.post("/import", response_model=CustomerImportReportSchema)
+async def import_customers(
+    request: Request,
+    current_user: CurrentPrincipal,
+    file_format: CustomerImportFormat | None = Query(None, alias="format"),
+    use_case: ImportCustomersUseCase = Depends(get_import_customers_use_case),
+) -> CustomerImportReportSchema:
+    """
+    Importa clientes em lote a partir do corpo da requisição (CSV ou NDJSON).
+
+    O arquivo é lido em streaming e gravado em lotes; linhas inválidas
+    ou duplicadas não interrompem a importação e voltam no relatório.
+    Um erro de leitura no meio do arquivo encerra a importação e devolve
+    o relatório parcial com `file_error`.
+    """
+    rows = read_customer_rows(request.stream(), _resolve_import_format(request, file_format))
+
+    try:
+        result = await use_case.execute(rows)
+
+    except CustomerDomainError as exc:
+        raise _handle_domain_error(exc)
+
+    return CustomerImportReportSchema(**result.model_dump())
+
+
+@router.get("/{customer_id}", response_model=CustomerResponseSchema | CustomerPartialResponseSchema)
 async def get_customer(
     customer_id: str,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
+    fields: str | None = Query(
+        None,
+        max_length=200,
+        description="Campos separados por vírgula (ex: name,phone); customer_id sempre vem",
+    ),
     use_case: GetCustomerUseCase = Depends(get_customer_use_case),
-) -> CustomerResponseSchema:
+) -> TypedJSONResponse:
 
     try:
-        result = await use_case.execute(customer_id)
-        return CustomerResponseSchema(**result.model_dump())
+        result = await use_case.execute(customer_id, fields=fields)
+        return TypedJSONResponse(
+            result,
+            _CUSTOMER_JSON,
+            exclude=_omitted_fields(result.fields, CUSTOMER_PROFILE_FIELDS),
+        )
 
     except CustomerDomainError as exc:
         raise _handle_domain_error(exc)
@@ -149,9 +300,9 @@ async def get_customer(
 async def update_customer(
     customer_id: str,
     body: UpdateCustomerSchema,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     use_case: UpdateCustomerUseCase = Depends(get_update_customer_use_case),
-) -> CustomerResponseSchema:
+) -> TypedJSONResponse:
 
     try:
         result = await use_case.execute(
@@ -160,9 +311,10 @@ async def update_customer(
                 name=body.name,
                 phone=body.phone,
                 notes=body.notes,
+                version=body.version,
             ),
         )
-        return CustomerResponseSchema(**result.model_dump())
+        return TypedJSONResponse(result, _CUSTOMER_JSON)
 
     except CustomerDomainError as exc:
         raise _handle_domain_error(exc)
@@ -172,16 +324,16 @@ async def update_customer(
 async def update_customer_address(
     customer_id: str,
     body: UpdateAddressSchema,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     use_case: UpdateCustomerAddressUseCase = Depends(get_update_customer_address_use_case),
-) -> CustomerResponseSchema:
+) -> TypedJSONResponse:
 
     try:
         result = await use_case.execute(
             customer_id,
-            UpdateAddressInputDTO(address=body.address),
+            UpdateAddressInputDTO(address=_address_input(body.address), version=body.version),
         )
-        return CustomerResponseSchema(**result.model_dump())
+        return TypedJSONResponse(result, _CUSTOMER_JSON)
 
     except CustomerDomainError as exc:
         raise _handle_domain_error(exc)
@@ -190,13 +342,13 @@ async def update_customer_address(
 @router.patch("/{customer_id}/activate", response_model=CustomerResponseSchema)
 async def activate_customer(
     customer_id: str,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     use_case: ActivateCustomerUseCase = Depends(get_activate_customer_use_case),
-) -> CustomerResponseSchema:
+) -> TypedJSONResponse:
 
     try:
         result = await use_case.execute(customer_id)
-        return CustomerResponseSchema(**result.model_dump())
+        return TypedJSONResponse(result, _CUSTOMER_JSON)
 
     except CustomerDomainError as exc:
         raise _handle_domain_error(exc)
@@ -205,13 +357,13 @@ async def activate_customer(
 @router.patch("/{customer_id}/deactivate", response_model=CustomerResponseSchema)
 async def deactivate_customer(
     customer_id: str,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     use_case: DeactivateCustomerUseCase = Depends(get_deactivate_customer_use_case),
-) -> CustomerResponseSchema:
+) -> TypedJSONResponse:
 
     try:
         result = await use_case.execute(customer_id)
-        return CustomerResponseSchema(**result.model_dump())
+        return TypedJSONResponse(result, _CUSTOMER_JSON)
 
     except CustomerDomainError as exc:
         raise _handle_domain_error(exc)
@@ -220,7 +372,7 @@ async def deactivate_customer(
 @router.delete("/{customer_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_customer(
     customer_id: str,
-    current_user: CurrentUser,
+    current_user: CurrentPrincipal,
     use_case: DeleteCustomerUseCase = Depends(get_delete_customer_use_case),
 ) -> None:
 
@@ -61,6 +61,9 @@ class UpdateCustomerSchema(BaseModel):
     name: Optional[str] = Field(None, min_length=2, max_length=100, examples=["Maria Souza"])
     phone: Optional[str] = Field(None, examples=["11988887777"])
     notes: Optional[str] = Field(None, max_length=1000, examples=["Sem glúten"])
+    version: Optional[int] = Field(
+        None, ge=1, examples=[3], description="Versão lida; se mudou, responde 409"
+    )
 
 
 class UpdateAddressSchema(BaseModel):
@@ -71,6 +74,9 @@ class UpdateAddressSchema(BaseModel):
     address: Optional[AddressSchema] = Field(
         None, description="Novo endereço ou null para remover o existente"
     )
+    version: Optional[int] = Field(
+        None, ge=1, examples=[3], description="Versão lida; se mudou, responde 409"
+    )
 
 
 # ─── Schemas de response ──────────────────────────────────────────────────────
@@ -91,6 +97,7 @@ class CustomerResponseSchema(BaseModel):
     is_active: bool
     created_at: datetime
     updated_at: datetime
+    version: int
 
 
 class CustomerSummarySchema(BaseModel):
@@ -110,6 +117,70 @@ class CustomerListSchema(BaseModel):
     """Resposta paginada da listagem de clientes."""
 
     items: list[CustomerSummarySchema]
-    total: int
+    total: Optional[int] = Field(
+        ..., description="Total filtrado (null quando exact_total=false em buscas)"
+    )
     limit: int
     offset: int
+    has_more: bool = Field(False, description="Há itens após esta página")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor para a próxima página (null = última página)"
+    )
+
+
+# ─── Schemas de response parciais (sparse fieldsets) ─────────────────────────
+# Com `fields=` a resposta traz só os campos pedidos (customer_id sempre);
+# os demais não aparecem (nem como null).
+
+
+class CustomerSummaryPartialSchema(BaseModel):
+    """Item de listagem com `fields`."""
+
+    customer_id: str
+    name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    is_active: Optional[bool] = None
+    created_at: Optional[datetime] = None
+
+
+class CustomerListPartialSchema(CustomerListSchema):
+    """Listagem com `fields`: itens parciais, paginação completa."""
+
+    items: list[CustomerSummaryPartialSchema]
+
+
+class CustomerPartialResponseSchema(CustomerSummaryPartialSchema):
+    """Detalhes de um cliente com `fields`."""
+
+    document: Optional[str] = None
+    address: Optional[AddressResponseSchema] = None
+    notes: Optional[str] = None
+    updated_at: Optional[datetime] = None
+    version: Optional[int] = None
+
+
+# ─── Schemas de importação ────────────────────────────────────────────────────
+
+
+class CustomerImportErrorSchema(BaseModel):
+    """Erro de uma linha do arquivo importado."""
+
+    row: int = Field(..., description="Linha de dados (1 = primeira após o cabeçalho)")
+    message: str
+
+
+class CustomerImportReportSchema(BaseModel):
+    """Relatório da importação em lote."""
+
+    total_rows: int
+    imported: int
+    failed: int
+    errors: list[CustomerImportErrorSchema]
+    errors_truncated: bool = Field(
+        False, description="True se havia mais erros do que os listados"
+    )
+    file_error: Optional[CustomerImportErrorSchema] = Field(
+        None,
+        description="Erro de leitura que interrompeu o arquivo; as linhas anteriores foram gravadas",
+    )
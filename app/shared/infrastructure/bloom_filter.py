@@ -0,0 +1,72 @@
+import hashlib
+import math
+from typing import Dict, Iterable
+
+
+class BloomFilter:
+    """
+    Filtro de Bloom em memória: diz "certamente ausente" ou "talvez presente".
+
+    Dimensionado para `capacity` itens com taxa de falso positivo
+    `fp_rate`; acima da capacidade continua correto, mas a taxa real
+    sobe (ver `estimated_fp_rate`). Não há remoção: para descartar itens
+    cria-se um filtro novo.
+
+    Os `k` índices vêm de um único BLAKE2b de 128 bits por item
+    (hashing duplo de Kirsch-Mitzenmacher: h1 + i·h2).
+    """
+
+    def __init__(self, capacity: int, fp_rate: float):
+        if capacity <= 0:
+            raise ValueError("capacity deve ser positiva")
+        if not 0 < fp_rate < 1:
+            raise ValueError("fp_rate deve estar entre 0 e 1")
+
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+
+        # m = -n·ln(p) / ln(2)²  e  k = (m/n)·ln(2)
+        self.num_bits = max(8, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self._count = 0
+
+    def _indexes(self, item: str) -> Iterable[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, item: str) -> None:
+        for index in self._indexes(item):
+            self._bits[index >> 3] |= 1 << (index & 7)
+        self._count += 1
+
+    def __contains__(self, item: str) -> bool:
+        bits = self._bits
+        return all(bits[index >> 3] & (1 << (index & 7)) for index in self._indexes(item))
+
+    def __len__(self) -> int:
+        """Itens adicionados (repetidos contam de novo)."""
+        return self._count
+
+    @property
+    def size_bytes(self) -> int:
+        return len(self._bits)
+
+    def estimated_fp_rate(self) -> float:
+        """Taxa de falso positivo esperada com a ocupação atual."""
+        return (1 - math.exp(-self.num_hashes * self._count / self.num_bits)) ** self.num_hashes
+
+    def stats(self) -> Dict[str, float]:
+        return {
+            "items": self._count,
+            "capacity": self.capacity,
+            "size_bytes": self.size_bytes,
+            "num_hashes": self.num_hashes,
+            "target_fp_rate": self.fp_rate,
+            "estimated_fp_rate": self.estimated_fp_rate(),
+        }
@@ -0,0 +1,36 @@
+import re
+from typing import Optional
+
+from sqlalchemy.exc import IntegrityError
+
+# SQLSTATE de violação de unicidade no Postgres
+UNIQUE_VIOLATION = "23505"
+
+# SQLite não informa o nome da constraint: "UNIQUE constraint failed: tabela.coluna"
+_SQLITE_UNIQUE = re.compile(r"UNIQUE constraint failed: (\w+)\.(\w+)")
+
+
+def unique_violation_constraint(exc: IntegrityError) -> Optional[str]:
+    """
+    Nome da constraint/índice único violado, ou None se não for unicidade.
+
+    Lê o nome direto do driver (asyncpg ou psycopg2). No SQLite, usado em
+    desenvolvimento e testes, deriva o nome pela convenção `ix_<tabela>_<coluna>`
+    dos índices criados com `index=True, unique=True`.
+    """
+    orig = exc.orig
+    driver_error = getattr(orig, "__cause__", None) or orig
+
+    # asyncpg: UniqueViolationError(sqlstate, constraint_name)
+    if getattr(driver_error, "sqlstate", None) == UNIQUE_VIOLATION:
+        return getattr(driver_error, "constraint_name", None)
+
+    # psycopg2: pgcode + diag.constraint_name
+    if getattr(orig, "pgcode", None) == UNIQUE_VIOLATION:
+        return getattr(getattr(orig, "diag", None), "constraint_name", None)
+
+    match = _SQLITE_UNIQUE.search(str(orig))
+    if match:
+        return f"ix_{match.group(1)}_{match.group(2)}"
+
+    return None
@@ -0,0 +1,209 @@
+import asyncio
+import functools
+import inspect
+import itertools
+import logging
+from contextvars import ContextVar
+from typing import Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Ligado apenas durante a execução de um método marcado com @replica_read
+_replica_allowed: ContextVar[bool] = ContextVar("replica_allowed", default=False)
+
+# Atraso de replicação em segundos. Sem transação pendente de replay
+# (réplica em dia), o atraso é zero mesmo com o primário ocioso.
+_PG_REPLICA_LAG = text(
+    """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+class ReplicaRouter:
+    """
+    Escolhe a réplica de leitura e acompanha a saúde de cada uma.
+
+    Uma réplica sai do rodízio quando o atraso de replicação passa de
+    `max_lag` ou quando uma leitura estoura `read_timeout`; ela volta
+    na próxima verificação de atraso bem-sucedida.
+    """
+
+    def __init__(
+        self,
+        replicas: List[AsyncEngine],
+        max_lag: float,
+        read_timeout: float,
+    ):
+        self.replicas = replicas
+        self.max_lag = max_lag
+        self.read_timeout = read_timeout
+        self._healthy: Dict[AsyncEngine, bool] = {replica: True for replica in replicas}
+        self._cycle = itertools.cycle(replicas)
+
+    def choose(self) -> Optional[AsyncEngine]:
+        """Próxima réplica saudável (round-robin) ou None se não houver."""
+        for _ in range(len(self.replicas)):
+            replica = next(self._cycle)
+            if self._healthy[replica]:
+                return replica
+        return None
+
+    def has_healthy(self) -> bool:
+        return any(self._healthy.values())
+
+    def is_healthy(self, replica: AsyncEngine) -> bool:
+        return self._healthy.get(replica, False)
+
+    def mark_unhealthy(self, replica: AsyncEngine) -> None:
+        if self._healthy.get(replica):
+            logger.warning("Réplica %s fora do rodízio", replica.url.host or replica.url.database)
+            self._healthy[replica] = False
+
+    async def measure_lag(self, replica: AsyncEngine) -> float:
+        """Atraso de replicação em segundos (0 fora do Postgres)."""
+        if replica.dialect.name != "postgresql":
+            return 0.0
+
+        async with replica.connect() as conn:
+            return float((await conn.execute(_PG_REPLICA_LAG)).scalar_one())
+
+    async def refresh(self) -> None:
+        """Mede o atraso de todas as réplicas e atualiza o rodízio."""
+        for replica in self.replicas:
+            try:
+                lag = await self.measure_lag(replica)
+            except Exception:
+                logger.exception("Falha ao medir atraso da réplica")
+                self.mark_unhealthy(replica)
+                continue
+
+            if lag > self.max_lag:
+                self.mark_unhealthy(replica)
+            else:
+                self._healthy[replica] = True
+
+    async def monitor(self, interval: float) -> None:
+        """Loop de verificação de atraso (rodar como task no lifespan)."""
+        while True:
+            await self.refresh()
+            await asyncio.sleep(interval)
+
+    async def dispose(self) -> None:
+        for replica in self.replicas:
+            await replica.dispose()
+
+
+class RoutingSession(Session):
+    """
+    Session que decide o engine (primário ou réplica) a cada comando.
+
+    Vai para a réplica apenas quando:
+    - o comando roda dentro de um método marcado com @replica_read
+    - a sessão ainda não escreveu nada (read-your-writes: depois do
+      primeiro flush/INSERT/UPDATE/DELETE, tudo fica no primário)
+    - há réplica saudável no roteador
+
+    A réplica é escolhida uma vez por sessão: leituras da mesma requisição
+    (ex.: página e total) saem da mesma réplica, com o mesmo atraso. Só
+    se ela sair do rodízio a sessão passa para outra.
+
+    O roteador é recebido via `info={"replica_router": ...}` no sessionmaker.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or isinstance(clause, UpdateBase):
+            self.info["has_writes"] = True
+
+        router: Optional[ReplicaRouter] = self.info.get("replica_router")
+
+        if router and _replica_allowed.get() and not self.info.get("has_writes"):
+            replica = self.info.get("replica")
+            if replica is None or not router.is_healthy(replica):
+                replica = router.choose()
+            if replica is not None:
+                self.info["replica"] = replica
+                return replica.sync_engine
+
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+
+async def run_on_replica(db: AsyncSession, call: Callable[[], Awaitable[T]]) -> T:
+    """
+    Executa uma leitura na réplica, com fallback para o primário.
+
+    Se a réplica não responder em `read_timeout` (ou falhar), a leitura
+    é cancelada, a réplica sai do rodízio e a mesma leitura é refeita no
+    primário. Como só sessões sem escrita chegam aqui, descartar a
+    transação corrente não perde nada.
+    """
+    info = db.sync_session.info
+    router: Optional[ReplicaRouter] = info.get("replica_router")
+
+    if router is None or info.get("has_writes") or not router.has_healthy():
+        return await call()
+
+    token = _replica_allowed.set(True)
+    try:
+        return await asyncio.wait_for(call(), timeout=router.read_timeout)
+    except (asyncio.TimeoutError, DBAPIError, OSError) as exc:
+        replica = info.pop("replica", None)
+        if replica is not None:
+            router.mark_unhealthy(replica)
+        logger.warning("Leitura na réplica falhou (%r); refazendo no primário", exc)
+    finally:
+        _replica_allowed.reset(token)
+
+    try:
+        await db.rollback()
+    except Exception:
+        await db.invalidate()
+
+    return await call()
+
+
+def replica_read(method):
+    """
+    Marca um método de repositório (com `self._db`) como leitura elegível à réplica.
+
+    Métodos async comuns ganham o fallback de `run_on_replica`. Em async
+    generators (streaming) só a abertura do cursor é roteada — não há
+    timeout, pois a duração depende do consumidor.
+    """
+    if inspect.isasyncgenfunction(method):
+
+        @functools.wraps(method)
+        async def stream_wrapper(self, *args, **kwargs):
+            iterator = method(self, *args, **kwargs)
+
+            # O engine é escolhido ao abrir o cursor (primeiro item)
+            token = _replica_allowed.set(True)
+            try:
+                first = await iterator.__anext__()
+            except StopAsyncIteration:
+                return
+            finally:
+                _replica_allowed.reset(token)
+
+            yield first
+            async for item in iterator:
+                yield item
+
+        return stream_wrapper
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        return await run_on_replica(self._db, lambda: method(self, *args, **kwargs))
+
+    return wrapper
@@ -1,39 +1,83 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
+from typing import AsyncGenerator, Optional
+
+from fastapi import Request
+
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.core.config import settings
+from app.shared.infrastructure.database.routing import ReplicaRouter, RoutingSession
 
 
-# Cria engine do SQLAlchemy
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,  # Verifica conexão antes de usar
-    pool_size=10,        # Tamanho do pool de conexões
-    max_overflow=20,     # Máximo de conexões extras
-)
+# Drivers síncronos (usados pelo Alembic) → equivalente assíncrono
+_ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
 
-# Cria session factory
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
-    bind=engine,
-)
+
+def to_async_url(url: str) -> URL:
+    """
+    Converte a DATABASE_URL (síncrona, usada pelo Alembic) para o
+    driver assíncrono equivalente usado pela aplicação.
+    """
+    parsed = make_url(url)
+    driver = _ASYNC_DRIVERS.get(parsed.drivername)
+
+    return parsed.set(drivername=driver) if driver else parsed
 
 
-def get_db() -> Generator[Session, None, None]:
+def create_engine(url: str) -> AsyncEngine:
+    """Engine assíncrona com o pool usado pela aplicação."""
+    return create_async_engine(
+        to_async_url(url),
+        pool_pre_ping=True,  # Verifica conexão antes de usar
+        pool_size=10,        # Tamanho do pool de conexões
+        max_overflow=20,     # Máximo de conexões extras
+    )
+
+
+def create_replica_router() -> ReplicaRouter:
+    """Réplicas de leitura — usadas apenas por métodos marcados com @replica_read."""
+    return ReplicaRouter(
+        replicas=[create_engine(url) for url in settings.DATABASE_REPLICA_URLS],
+        max_lag=settings.DATABASE_REPLICA_MAX_LAG_SECONDS,
+        read_timeout=settings.DATABASE_REPLICA_READ_TIMEOUT_SECONDS,
+    )
+
+
+def make_session_factory(
+    primary: AsyncEngine,
+    router: Optional[ReplicaRouter] = None,
+) -> async_sessionmaker[AsyncSession]:
+    """Session factory com roteamento primário/réplica (se houver réplicas)."""
+    return async_sessionmaker(
+        bind=primary,
+        sync_session_class=RoutingSession,
+        info={"replica_router": router} if router and router.replicas else {},
+        autoflush=False,
+        expire_on_commit=False,  # evita SELECT implícito ao acessar atributos após commit
+    )
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
-    Dependency do FastAPI para obter sessão do banco.
-    
+    Dependency do FastAPI para obter sessão assíncrona do banco.
+
+    A session factory (e o engine) vêm do container criado no lifespan.
+
     Uso:
 ```python
     @router.get("/users")
-    def get_users(db: Session = Depends(get_db)):
+    async def get_users(db: AsyncSession = Depends(get_db)):
         ...
 ```
     """
-    db = SessionLocal()
-    try:
+    async with request.app.state.container.session_factory() as db:
         yield db
-    finally:
-        db.close()
@@ -2,18 +2,34 @@ from fastapi import Request
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
 from sqlalchemy.exc import SQLAlchemyError
-from app.modules.auth.domain.exceptions.auth_exceptions import AuthException
+from app.modules.auth.domain.exceptions.auth_exceptions import (
+    AuthException,
+    UserConcurrentUpdateException,
+)
+from app.modules.auth.infrastructure.security.password_hashing_executor import (
+    PasswordHashingBusyError,
+)
 from app.modules.customer.domain.exceptions.customers_exceptions import (
     CustomerDomainError,
     CustomerNotFoundError,
     CustomerAlreadyExistsError,
+    CustomerConcurrentUpdateError,
     CustomerDocumentAlreadyExistsError,
     CustomerInactiveError,
 )
 
 
 async def auth_exception_handler(request: Request, exc: AuthException):
-    return JSONResponse(status_code=401, content={"detail": str(exc)})
+    status_code = 409 if isinstance(exc, UserConcurrentUpdateException) else 401
+    return JSONResponse(status_code=status_code, content={"detail": str(exc)})
+
+
+async def password_hashing_busy_handler(request: Request, exc: PasswordHashingBusyError):
+    return JSONResponse(
+        status_code=503,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
 
 
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
@@ -31,7 +47,10 @@ async def generic_exception_handler(request: Request, exc: Exception):
 async def customer_exception_handler(request: Request, exc: CustomerDomainError):
     if isinstance(exc, CustomerNotFoundError):
         status_code = 404
-    elif isinstance(exc, (CustomerAlreadyExistsError, CustomerDocumentAlreadyExistsError)):
+    elif isinstance(
+        exc,
+        (CustomerAlreadyExistsError, CustomerDocumentAlreadyExistsError, CustomerConcurrentUpdateError),
+    ):
         status_code = 409
     elif isinstance(exc, CustomerInactiveError):
         status_code = 422
@@ -0,0 +1,202 @@
+import json
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from fastapi import FastAPI, status
+from fastapi.responses import JSONResponse
+from redis.exceptions import RedisError
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.shared.security.rate_limiter import RateLimit, RateLimiter, RateLimitResult
+
+logger = logging.getLogger(__name__)
+
+RouteKey = Tuple[str, str]  # (método, caminho)
+
+# Corpo máximo lido pelo middleware nas rotas com `body_field` (login,
+# recuperação de senha etc. mandam poucos bytes)
+MAX_BUFFERED_BODY = 8 * 1024
+
+
+@dataclass(frozen=True)
+class RateLimitRule:
+    """
+    Limite aplicado a uma rota.
+
+    - `name`: prefixo da chave no Redis (ex.: "login_ip")
+    - `body_field`: campo do corpo JSON que identifica o cliente
+      (normalizado em minúsculas); None usa o IP
+    """
+
+    name: str
+    limit: int
+    window_seconds: int
+    body_field: Optional[str] = None
+
+
+class RateLimitMiddleware:
+    """
+    Middleware ASGI que limita rotas configuradas antes de chegar ao handler.
+
+    Todas as regras da rota (ex.: IP e email) são avaliadas em uma única
+    ida ao Redis (GCRA atômico). Respostas levam `RateLimit-Limit`,
+    `RateLimit-Remaining` e `RateLimit-Reset` da regra mais restritiva;
+    bloqueios respondem 429 com `Retry-After`.
+
+    Nas regras com `body_field`, o corpo é lido antes da rota; acima de
+    `MAX_BUFFERED_BODY` bytes a requisição é recusada com 413, sem ler o
+    resto nem consultar o Redis.
+
+    Se o Redis falhar, a requisição segue sem limite (o erro é logado).
+    """
+
+    def __init__(self, app: ASGIApp, rules: Mapping[RouteKey, Sequence[RateLimitRule]]):
+        self.app = app
+        self.rules = {(method.upper(), path): tuple(route_rules) for (method, path), route_rules in rules.items()}
+        self._limiter: Optional[RateLimiter] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        rules = self.rules.get((scope.get("method", ""), scope.get("path", ""))) if scope["type"] == "http" else None
+        if not rules:
+            await self.app(scope, receive, send)
+            return
+
+        if any(rule.body_field for rule in rules):
+            buffered = await _buffer_body(scope, receive)
+            if buffered is None:
+                response = JSONResponse(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    content={"detail": "Corpo da requisição muito grande."},
+                )
+                await response(scope, receive, send)
+                return
+            body, receive = buffered
+        else:
+            body = b""
+
+        limits = _resolve_limits(scope, body, rules)
+        if not limits:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            result = await self._get_limiter(scope).check(limits)
+        except RedisError:
+            logger.warning("Rate limit indisponível para %s; requisição liberada", scope["path"], exc_info=True)
+            await self.app(scope, receive, send)
+            return
+
+        headers = _rate_limit_headers(result)
+
+        if not result.allowed:
+            headers["Retry-After"] = str(max(result.retry_after_seconds, 1))
+            response = JSONResponse(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                content={"detail": "Muitas tentativas. Tente novamente mais tarde."},
+                headers=headers,
+            )
+            await response(scope, receive, send)
+            return
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response_headers = MutableHeaders(scope=message)
+                for name, value in headers.items():
+                    response_headers.append(name, value)
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
+
+    def _get_limiter(self, scope: Scope) -> RateLimiter:
+        # Cliente Redis só existe depois do lifespan
+        if self._limiter is None:
+            self._limiter = RateLimiter(scope["app"].state.redis)
+        return self._limiter
+
+
+def _resolve_limits(scope: Scope, body: bytes, rules: Sequence[RateLimitRule]) -> List[RateLimit]:
+    client = scope.get("client")
+    ip = client[0] if client else "unknown"
+
+    payload: Dict = {}
+    if body:
+        try:
+            decoded = json.loads(body)
+        except ValueError:
+            decoded = None
+        if isinstance(decoded, dict):
+            payload = decoded
+
+    limits = []
+    for rule in rules:
+        if rule.body_field is None:
+            identity = ip
+        else:
+            value = payload.get(rule.body_field)
+            if not isinstance(value, str) or not value.strip():
+                continue  # corpo inválido: a validação responde 422 e o limite por IP vale
+            identity = value.strip().lower()
+
+        limits.append(RateLimit(f"{rule.name}:{identity}", rule.limit, rule.window_seconds))
+
+    return limits
+
+
+async def _buffer_body(scope: Scope, receive: Receive) -> Optional[Tuple[bytes, Receive]]:
+    """
+    Lê o corpo inteiro e devolve um `receive` que o entrega de novo à rota.
+
+    Devolve None se o corpo passar de `MAX_BUFFERED_BODY` bytes (pelo
+    Content-Length ou pelo que já chegou).
+    """
+    content_length = dict(scope.get("headers", [])).get(b"content-length")
+    if content_length is not None and content_length.isdigit() and int(content_length) > MAX_BUFFERED_BODY:
+        return None
+
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            break
+        chunk = message.get("body", b"")
+        size += len(chunk)
+        if size > MAX_BUFFERED_BODY:
+            return None
+        chunks.append(chunk)
+        if not message.get("more_body", False):
+            break
+
+    body = b"".join(chunks)
+    replayed = False
+
+    async def replay() -> Message:
+        nonlocal replayed
+        if not replayed:
+            replayed = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        return await receive()
+
+    return body, replay
+
+
+def _rate_limit_headers(result: RateLimitResult) -> Dict[str, str]:
+    return {
+        "RateLimit-Limit": str(result.limit),
+        "RateLimit-Remaining": str(result.remaining),
+        "RateLimit-Reset": str(result.reset_seconds),
+    }
+
+
+def setup_rate_limit(
+    app: FastAPI,
+    rules: Mapping[RouteKey, Sequence[RateLimitRule]],
+    prefix: str = "",
+) -> None:
+    """Registra o rate limit das rotas (caminhos relativos a `prefix`)."""
+    app.add_middleware(
+        RateLimitMiddleware,
+        rules={(method, f"{prefix}{path}"): route_rules for (method, path), route_rules in rules.items()},
+    )
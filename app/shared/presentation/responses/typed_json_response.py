@@ -0,0 +1,36 @@
+from typing import Any, Mapping, Optional
+
+from pydantic import TypeAdapter
+from starlette.responses import Response
+
+
+class TypedJSONResponse(Response):
+    """
+    Resposta JSON serializada direto em bytes pelo pydantic-core.
+
+    Para saídas confiáveis (DTOs e schemas montados pela própria
+    aplicação): retornar uma Response faz o FastAPI pular a revalidação
+    contra o `response_model` e o `jsonable_encoder`. O `response_model`
+    da rota continua documentando o contrato no OpenAPI.
+
+    `adapter` deve ser criado uma vez, no import do módulo da rota.
+    Como a rota devolve a Response pronta, o `status_code` do decorator
+    não se aplica: passe-o aqui. `exclude` segue o formato do pydantic
+    (ex: sparse fieldsets).
+    """
+
+    media_type = "application/json"
+
+    def __init__(
+        self,
+        content: Any,
+        adapter: TypeAdapter,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        exclude: Any = None,
+    ):
+        super().__init__(
+            adapter.dump_json(content, exclude=exclude),
+            status_code=status_code,
+            headers=headers,
+        )
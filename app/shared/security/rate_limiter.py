@@ -1,26 +1,114 @@
-from fastapi import HTTPException, status
-from redis import Redis
+import math
+from dataclasses import dataclass
+from typing import Sequence
 
+from redis.asyncio import Redis
 
-def rate_limit(
-    redis: Redis,
-    key: str,
-    limit: int,
-    window_seconds: int,
-):
-    pipe = redis.pipeline()
+# GCRA (generic cell rate algorithm) sobre várias chaves em uma ida ao Redis.
+# Cada chave guarda o TAT (theoretical arrival time, em ms): o instante em
+# que o balde estaria vazio de novo. Uma requisição custa `intervalo =
+# janela / limite` e é aceita se o TAT resultante não passar de agora +
+# janela — equivale a uma janela deslizante, sem o estouro na virada de
+# janela do contador fixo. A requisição só consome das chaves se todas
+# aceitarem (atômico: IP e email não divergem).
+#
+# Tempos em ms inteiros (intervalo mínimo de 1 ms, ou seja, até 1000 req/s por chave).
+# KEYS[i] = chave; ARGV[2i-1] = limite, ARGV[2i] = janela (s)
+# Retorna {aceita (0/1), limite, restantes, reset (ms), retry-after (ms)}
+# da chave mais restritiva.
+GCRA_LUA = """
+local clock = redis.call('TIME')
+local now = clock[1] * 1000 + math.floor(clock[2] / 1000)
 
-    pipe.incr(key)
-    pipe.ttl(key)
+local tats = {}
+local denied = false
+local best = nil
 
-    count, ttl = pipe.execute()
+for i, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[2 * i - 1])
+    local period = tonumber(ARGV[2 * i]) * 1000
+    local interval = math.max(math.floor(period / limit), 1)
 
-    # primeira vez que a chave aparece
-    if ttl in (-1, -2):
-        redis.expire(key, window_seconds)
+    local tat = tonumber(redis.call('GET', key) or now)
+    if tat < now then
+        tat = now
+    end
 
-    if count > limit:
-        raise HTTPException(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            detail="Muitas tentativas. Tente novamente mais tarde.",
+    local new_tat = tat + interval
+    local allow_at = new_tat - period
+    local result
+
+    if allow_at > now then
+        denied = true
+        result = {0, limit, 0, tat - now, allow_at - now}
+    else
+        result = {1, limit, math.floor((now - allow_at) / interval), new_tat - now, 0}
+    end
+    tats[i] = new_tat
+
+    if best == nil
+        or result[5] > best[5]
+        or (result[5] == best[5] and result[3] < best[3]) then
+        best = result
+    end
+end
+
+if denied then
+    best[1] = 0
+    return best
+end
+
+for i, key in ipairs(KEYS) do
+    redis.call('SET', key, tats[i], 'PX', tats[i] - now)
+end
+
+return best
+"""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Limite de `limit` requisições por `window_seconds` para uma chave."""
+
+    key: str
+    limit: int
+    window_seconds: int
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    reset_seconds: int
+    retry_after_seconds: int
+
+
+class RateLimiter:
+    """
+    Rate limiter GCRA atômico sobre o Redis.
+
+    `check` avalia todas as chaves em um único EVALSHA e devolve o
+    estado da mais restritiva (a que bloqueou ou a com menos restantes).
+    """
+
+    def __init__(self, redis: Redis):
+        self._script = redis.register_script(GCRA_LUA)
+
+    async def check(self, limits: Sequence[RateLimit]) -> RateLimitResult:
+        args = []
+        for rate_limit in limits:
+            args += [rate_limit.limit, rate_limit.window_seconds]
+
+        allowed, limit, remaining, reset_ms, retry_ms = await self._script(
+            keys=[f"rate_limit:{rate_limit.key}" for rate_limit in limits],
+            args=args,
+        )
+
+        return RateLimitResult(
+            allowed=bool(allowed),
+            limit=int(limit),
+            remaining=int(remaining),
+            reset_seconds=math.ceil(int(reset_ms) / 1000),
+            retry_after_seconds=math.ceil(int(retry_ms) / 1000),
         )
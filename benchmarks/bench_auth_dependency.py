@@ -0,0 +1,96 @@
+"""
+Benchmark: custo da autenticação JWT por requisição.
+
+Compara, em µs por requisição:
+- antes: dois decodes com verificação HMAC (verify_token_type + get_user_id_from_token)
+- cache frio: um único `JWTHandler.verify` (primeira vez que o token aparece)
+- cache quente: `verify` de um token já visto (sem decode nem HMAC)
+
+E mede uma requisição completa (ASGI, sem rede) numa rota protegida
+apenas por `get_access_token`, com o cache de tokens ligado e desligado.
+
+Não precisa de banco nem Redis:
+
+    PYTHONPATH=. python benchmarks/bench_auth_dependency.py --iterations 20000
+"""
+import argparse
+import asyncio
+from time import perf_counter
+
+import httpx
+from fastapi import Depends, FastAPI
+
+from app.core.config import settings
+from app.core.constants import TOKEN_TYPE_ACCESS
+from app.modules.auth.infrastructure.security.jwt_handler import JWTHandler
+from app.modules.auth.infrastructure.security.verified_token_cache import VerifiedTokenCache
+from app.modules.auth.presentation.dependencies.auth_deps import get_access_token, get_jwt_handler
+
+# Cache de tokens verificados do handler medido (esvaziado para medir o caminho frio)
+verified_tokens = VerifiedTokenCache(maxsize=settings.JWT_VERIFIED_CACHE_SIZE)
+
+
+def _per_call_us(fn, iterations: int) -> float:
+    started = perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (perf_counter() - started) / iterations * 1_000_000
+
+
+def bench_handler(handler: JWTHandler, token: str, iterations: int) -> None:
+    def before():
+        verified_tokens.clear()
+        handler.verify_token_type(token, TOKEN_TYPE_ACCESS)
+        verified_tokens.clear()
+        handler.get_user_id_from_token(token)
+
+    def cold():
+        verified_tokens.clear()
+        handler.verify(token, expected_type=TOKEN_TYPE_ACCESS)
+
+    def warm():
+        handler.verify(token, expected_type=TOKEN_TYPE_ACCESS)
+
+    print(f"{'caminho':<28} | {'µs/req':>8}")
+    for name, fn in (("antes (2 decodes)", before), ("cache frio (1 decode)", cold), ("cache quente", warm)):
+        fn()  # aquecimento
+        print(f"{name:<28} | {_per_call_us(fn, iterations):>8.1f}")
+
+
+async def bench_request(handler: JWTHandler, token: str, iterations: int) -> None:
+    app = FastAPI()
+    # sem lifespan (e sem container): o handler vem direto
+    app.dependency_overrides[get_jwt_handler] = lambda: handler
+
+    @app.get("/protegida", dependencies=[Depends(get_access_token)])
+    async def protected():
+        return {}
+
+    headers = {"Authorization": f"Bearer {token}"}
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for label, clear in (("requisição, cache desligado", True), ("requisição, cache ligado", False)):
+            await client.get("/protegida", headers=headers)  # aquecimento
+
+            started = perf_counter()
+            for _ in range(iterations):
+                if clear:
+                    verified_tokens.clear()
+                response = await client.get("/protegida", headers=headers)
+                assert response.status_code == 200
+            elapsed = (perf_counter() - started) / iterations * 1_000_000
+
+            print(f"{label:<28} | {elapsed:>8.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+
+    handler = JWTHandler(verified_tokens)
+    access_token = handler.create_access_token("00000000-0000-0000-0000-000000000001")
+
+    bench_handler(handler, access_token, args.iterations)
+    asyncio.run(bench_request(handler, access_token, max(args.iterations // 10, 1)))
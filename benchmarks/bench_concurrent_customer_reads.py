@@ -0,0 +1,87 @@
+"""
+Teste de carga: leituras concorrentes de clientes não devem serializar.
+
+Dispara N chamadas simultâneas de `CustomerRepositoryImpl.list_summaries`,
+cada uma precedida de um `pg_sleep` que simula uma query lenta, e mede:
+
+- tempo total (wall clock) x soma das latências individuais
+- maior atraso observado no event loop (lag)
+
+Com o driver síncrono o tempo total ficava próximo da soma das latências
+(as queries rodavam uma atrás da outra) e o lag igual à query mais lenta.
+Com AsyncSession o tempo total deve ficar próximo da latência de UMA query.
+
+Uso (requer Postgres acessível via DATABASE_URL):
+
+    PYTHONPATH=. python benchmarks/bench_concurrent_customer_reads.py --concurrency 20 --delay 0.2
+"""
+import argparse
+import asyncio
+from time import perf_counter
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.modules.customer.infrastructure.repositories.customer_repository_impl import (
+    CustomerRepositoryImpl,
+)
+from app.shared.infrastructure.database.session import create_engine, make_session_factory
+
+# Engine própria do benchmark (na app, quem cria é o container no lifespan)
+engine = create_engine(settings.DATABASE_URL)
+SessionLocal = make_session_factory(engine)
+
+
+async def _read(delay: float) -> float:
+    started = perf_counter()
+
+    async with SessionLocal() as db:
+        await db.execute(text("SELECT pg_sleep(:delay)"), {"delay": delay})
+        await CustomerRepositoryImpl(db).list_summaries(limit=50)
+
+    return perf_counter() - started
+
+
+async def _monitor_loop_lag(stop: asyncio.Event, interval: float = 0.01) -> float:
+    max_lag = 0.0
+
+    while not stop.is_set():
+        started = perf_counter()
+        await asyncio.sleep(interval)
+        max_lag = max(max_lag, perf_counter() - started - interval)
+
+    return max_lag
+
+
+async def main(concurrency: int, delay: float) -> None:
+    # aquece o pool para não medir abertura de conexões
+    await asyncio.gather(*(_read(0) for _ in range(concurrency)))
+
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(_monitor_loop_lag(stop))
+
+    started = perf_counter()
+    latencies = await asyncio.gather(*(_read(delay) for _ in range(concurrency)))
+    wall = perf_counter() - started
+
+    stop.set()
+    max_lag = await monitor
+    await engine.dispose()
+
+    serial = sum(latencies)
+
+    print(f"leituras concorrentes : {concurrency}")
+    print(f"latência média        : {serial / concurrency * 1000:.1f} ms")
+    print(f"tempo total           : {wall * 1000:.1f} ms")
+    print(f"soma das latências    : {serial * 1000:.1f} ms")
+    print(f"razão total/soma      : {wall / serial:.2f} (1.00 = totalmente serializado)")
+    print(f"maior lag do loop     : {max_lag * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--delay", type=float, default=0.2, help="pg_sleep por leitura (s)")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.concurrency, args.delay))
@@ -0,0 +1,134 @@
+"""
+Benchmark: latência da busca de clientes conforme a tabela cresce.
+
+Cria um schema temporário com a tabela `customers` (mesmos índices do
+modelo, incluindo o GIN de trigramas em `search_text`), popula com
+10k / 100k / 1M linhas via generate_series e mede p50/p95 de
+`CustomerRepositoryImpl.list_summaries(search=...)` ordenado por relevância.
+
+Com o GIN de trigramas a latência deve ficar praticamente plana entre os
+tamanhos; com o antigo `ILIKE '%x%'` ela crescia linearmente (seq scan).
+
+Uso (requer Postgres com pg_trgm/unaccent acessível via DATABASE_URL):
+
+    PYTHONPATH=. python benchmarks/bench_customer_search.py --sizes 10000 100000 1000000
+"""
+import argparse
+import asyncio
+import statistics
+from time import perf_counter
+
+from sqlalchemy import event, text
+
+from app.core.config import settings
+from app.modules.customer.infrastructure.models.customer_model import CustomerModel
+from app.modules.customer.infrastructure.repositories.customer_repository_impl import (
+    CustomerRepositoryImpl,
+)
+from app.shared.infrastructure.database.session import create_engine, make_session_factory
+
+# Engine própria do benchmark (na app, quem cria é o container no lifespan)
+engine = create_engine(settings.DATABASE_URL)
+SessionLocal = make_session_factory(engine)
+
+SCHEMA = "bench_customer_search"
+
+# Termos seletivos: cada um casa com poucas linhas independentemente do tamanho
+TERMS = ["cliente4242@", "77777 cliente", "souza 123", "conceicao 9876"]
+
+_SEED = f"""
+INSERT INTO {SCHEMA}.customers (
+    id, name, email, document, is_active, search_text, created_at, updated_at
+)
+SELECT
+    md5(g::text),
+    name,
+    email,
+    lpad(g::text, 11, '0'),
+    g % 5 <> 0,
+    lower(public.unaccent(name || ' ' || email)),
+    now() - g * interval '1 minute',
+    now()
+FROM (
+    SELECT
+        g,
+        (ARRAY['João', 'Maria', 'José', 'Ana'])[1 + g % 4]
+            || ' ' || (ARRAY['Souza', 'Silva', 'Conceição'])[1 + g % 3]
+            || ' ' || g AS name,
+        'cliente' || g || '@exemplo.com' AS email
+    FROM generate_series(:start, :stop) AS g
+) AS seed
+"""
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _use_bench_schema(dbapi_connection, connection_record):
+    # Mantém `public` no path para as extensões (pg_trgm/unaccent)
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"SET search_path TO {SCHEMA}, public")
+    cursor.close()
+
+
+async def _setup() -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS unaccent"))
+        await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        await conn.run_sync(CustomerModel.__table__.create)
+
+
+async def _grow_to(current: int, size: int) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(text(_SEED), {"start": current + 1, "stop": size})
+        await conn.execute(text(f"ANALYZE {SCHEMA}.customers"))
+
+
+async def _measure(runs: int) -> list[float]:
+    latencies = []
+
+    async with SessionLocal() as db:
+        repository = CustomerRepositoryImpl(db)
+
+        for i in range(runs):
+            started = perf_counter()
+            await repository.list_summaries(
+                search=TERMS[i % len(TERMS)],
+                sort="relevance",
+                limit=20,
+            )
+            latencies.append(perf_counter() - started)
+
+    return latencies
+
+
+async def main(sizes: list[int], runs: int) -> None:
+    await _setup()
+
+    try:
+        print(f"{'linhas':>10} | {'p50 (ms)':>9} | {'p95 (ms)':>9}")
+        current = 0
+
+        for size in sorted(sizes):
+            await _grow_to(current, size)
+            current = size
+
+            await _measure(len(TERMS))  # aquecimento (cache/plano)
+            latencies = sorted(await _measure(runs))
+
+            p50 = statistics.median(latencies) * 1000
+            p95 = latencies[int(len(latencies) * 0.95) - 1] * 1000
+            print(f"{size:>10} | {p50:>9.2f} | {p95:>9.2f}")
+    finally:
+        async with engine.begin() as conn:
+            await conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--runs", type=int, default=200, help="buscas por tamanho")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.sizes, args.runs))
@@ -0,0 +1,237 @@
+"""
+Benchmark: custo da resolução de dependencies por requisição.
+
+Mede requisições completas (ASGI, sem rede) em rotas vazias que só
+resolvem as dependencies de login, login com Google e esqueci a senha:
+
+- sem dependencies: custo base do FastAPI
+- antes: dependencies síncronas (threadpool) que constroem JWTHandler,
+  RedisSessionRepository (registra 6 scripts Lua), verificador do
+  Google, outbox e use cases a cada requisição
+- container: as dependencies atuais, que só leem os singletons do
+  AppContainer (por requisição sobram sessão, repositório e use case)
+
+A diferença para a linha base é o custo de resolução. Nenhuma rota
+executa o use case, então não precisa de banco nem Redis:
+
+    PYTHONPATH=. python benchmarks/bench_dependency_resolution.py --requests 3000
+"""
+import argparse
+import asyncio
+from time import perf_counter
+
+import httpx
+from fastapi import Depends, FastAPI, Request
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.container import AppContainer
+from app.infra.redis.email_outbox import RedisEmailOutbox
+from app.infra.redis.redis_client import create_redis_client
+from app.infra.redis.session_repository import RedisSessionRepository
+from app.modules.auth.application.usecases.forgot_password_usecase import ForgotPasswordUseCase
+from app.modules.auth.application.usecases.google_login_usecase import GoogleLoginUseCase
+from app.modules.auth.application.usecases.login_usecase import LoginUseCase
+from app.modules.auth.infrastructure.cache.revoked_token_filter import RevokedTokenFilter
+from app.modules.auth.infrastructure.cache.session_epoch_cache import SessionEpochCache
+from app.modules.auth.infrastructure.cache.user_cache import UserCache
+from app.modules.auth.infrastructure.repositories.google_token_verifier_impl import GoogleTokenVerifierImpl
+from app.modules.auth.infrastructure.repositories.jwt_service_impl import JwtServiceImpl
+from app.modules.auth.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from app.modules.auth.infrastructure.security.google_cert_cache import GoogleCertCache
+from app.modules.auth.infrastructure.security.jwt_handler import JWTHandler
+from app.modules.auth.infrastructure.security.password_hasher import PasswordHasher
+from app.modules.auth.infrastructure.security.password_hashing_executor import PasswordHashingExecutor
+from app.modules.auth.presentation.dependencies.auth_deps import (
+    get_forgot_password_usecase,
+    get_google_login_usecase,
+    get_login_usecase,
+)
+from app.modules.auth.infrastructure.security.verified_token_cache import VerifiedTokenCache
+from app.shared.infrastructure.database.session import (
+    create_engine,
+    create_replica_router,
+    make_session_factory,
+)
+
+
+# ─── Dependencies como eram antes do container ───────────────────────────────
+
+
+async def old_get_db(request: Request):
+    async with request.app.state.container.session_factory() as db:
+        yield db
+
+
+def old_get_redis(request: Request) -> Redis:
+    return request.app.state.container.redis
+
+
+def old_get_password_hasher(request: Request) -> PasswordHashingExecutor:
+    return request.app.state.container.password_hashing
+
+
+def old_get_user_cache(request: Request):
+    return request.app.state.container.user_cache
+
+
+def old_get_session_epoch_cache(request: Request):
+    return request.app.state.container.session_epoch_cache
+
+
+def old_get_revoked_token_filter(request: Request):
+    return request.app.state.container.revoked_token_filter
+
+
+def old_get_session_repository(
+    redis: Redis = Depends(old_get_redis),
+    epoch_cache=Depends(old_get_session_epoch_cache),
+    revoked_filter=Depends(old_get_revoked_token_filter),
+):
+    return RedisSessionRepository(redis, epoch_cache, revoked_filter)
+
+
+def old_get_user_repository(
+    db: AsyncSession = Depends(old_get_db),
+    user_cache=Depends(old_get_user_cache),
+):
+    return UserRepositoryImpl(db, user_cache)
+
+
+def old_get_login_usecase(
+    user_repository=Depends(old_get_user_repository),
+    password_hasher=Depends(old_get_password_hasher),
+):
+    return LoginUseCase(user_repository, password_hasher)
+
+
+def old_get_forgot_password_usecase(
+    user_repository=Depends(old_get_user_repository),
+    redis: Redis = Depends(old_get_redis),
+):
+    return ForgotPasswordUseCase(
+        user_repository=user_repository, redis=redis, email_outbox=RedisEmailOutbox(redis)
+    )
+
+
+def old_get_google_login_usecase(
+    request: Request,
+    user_repository=Depends(old_get_user_repository),
+    session_repository=Depends(old_get_session_repository),
+):
+    verifier = GoogleTokenVerifierImpl(request.app.state.container.google_cert_cache)
+    return GoogleLoginUseCase(
+        user_repository=user_repository,
+        google_token_verifier=verifier,
+        jwt_service=JwtServiceImpl(JWTHandler(), session_repository),
+    )
+
+
+# ─── Apps ────────────────────────────────────────────────────────────────────
+
+
+def build_container() -> AppContainer:
+    # Mesmos singletons do lifespan, sem iniciar caches nem tarefas (sem Redis)
+    redis = create_redis_client()
+    session_epoch_cache = SessionEpochCache(
+        redis,
+        ttl_seconds=settings.SESSION_EPOCH_CACHE_TTL_SECONDS,
+        maxsize=settings.SESSION_EPOCH_CACHE_MAX_SIZE,
+    )
+    revoked_token_filter = RevokedTokenFilter(
+        redis,
+        capacity=settings.REVOKED_TOKEN_FILTER_CAPACITY,
+        fp_rate=settings.REVOKED_TOKEN_FILTER_FP_RATE,
+        rebuild_interval=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    )
+    session_repository = RedisSessionRepository(redis, session_epoch_cache, revoked_token_filter)
+    verified_tokens = VerifiedTokenCache(maxsize=settings.JWT_VERIFIED_CACHE_SIZE)
+    jwt_handler = JWTHandler(verified_tokens)
+    engine = create_engine(settings.DATABASE_URL)
+    replica_router = create_replica_router()
+    google_http = httpx.AsyncClient()
+    google_cert_cache = GoogleCertCache(google_http)
+
+    return AppContainer(
+        redis=redis,
+        engine=engine,
+        replica_router=replica_router,
+        session_factory=make_session_factory(engine, replica_router),
+        password_hashing=PasswordHashingExecutor(PasswordHasher(), workers=1, max_queue=1),
+        verified_tokens=verified_tokens,
+        jwt_handler=jwt_handler,
+        session_epoch_cache=session_epoch_cache,
+        revoked_token_filter=revoked_token_filter,
+        session_repository=session_repository,
+        jwt_service=JwtServiceImpl(jwt_handler, session_repository),
+        user_cache=UserCache(
+            redis, ttl_seconds=settings.USER_CACHE_TTL_SECONDS, maxsize=settings.USER_CACHE_MAX_SIZE
+        ),
+        google_http=google_http,
+        google_cert_cache=google_cert_cache,
+        google_token_verifier=GoogleTokenVerifierImpl(google_cert_cache),
+        email_outbox=RedisEmailOutbox(redis),
+    )
+
+
+def build_app(container: AppContainer) -> FastAPI:
+    app = FastAPI()
+    app.state.container = container
+
+    @app.post("/base")
+    async def base():
+        return {}
+
+    routes = (
+        ("login", old_get_login_usecase, get_login_usecase),
+        ("google", old_get_google_login_usecase, get_google_login_usecase),
+        ("forgot", old_get_forgot_password_usecase, get_forgot_password_usecase),
+    )
+    for name, old, new in routes:
+        app.add_api_route(f"/antes/{name}", _empty, methods=["POST"], dependencies=[Depends(old)])
+        app.add_api_route(f"/container/{name}", _empty, methods=["POST"], dependencies=[Depends(new)])
+
+    return app
+
+
+async def _empty():
+    return {}
+
+
+async def _per_request_us(client: httpx.AsyncClient, path: str, requests: int) -> float:
+    for _ in range(20):  # aquecimento
+        await client.post(path)
+
+    started = perf_counter()
+    for _ in range(requests):
+        response = await client.post(path)
+        assert response.status_code == 200, response.text
+    return (perf_counter() - started) / requests * 1_000_000
+
+
+async def main(requests: int) -> None:
+    container = build_container()
+    transport = httpx.ASGITransport(app=build_app(container))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        base = await _per_request_us(client, "/base", requests)
+        print(f"{'rota':<10} | {'modo':<10} | {'µs/req':>8} | {'resolução µs':>12}")
+        print(f"{'-':<10} | {'sem deps':<10} | {base:>8.1f} | {0:>12.1f}")
+
+        for name in ("login", "google", "forgot"):
+            for mode in ("antes", "container"):
+                elapsed = await _per_request_us(client, f"/{mode}/{name}", requests)
+                print(f"{name:<10} | {mode:<10} | {elapsed:>8.1f} | {elapsed - base:>12.1f}")
+
+    container.password_hashing.shutdown()
+    await container.google_http.aclose()
+    await container.redis.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=3000)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests))
@@ -0,0 +1,137 @@
+"""
+Teste de carga: latência das rotas de clientes durante uma rajada de logins.
+
+Monta um app ASGI em processo com duas rotas:
+- POST /login: busca as credenciais (`--io-ms` de I/O) e verifica uma
+  senha bcrypt (custo `--rounds`)
+- GET /customers: simula uma leitura de clientes (`--io-ms` de I/O assíncrono)
+
+Mede, por `--duration` segundos, quantas GET /customers completam e o
+seu p50/p99, sozinho e durante `--logins` logins simultâneos e
+contínuos, em dois modos:
+- inline: `PasswordHasher.verify` direto no handler (bloqueia o event loop)
+- executor: `PasswordHashingExecutor` (threads dedicadas + fila limitada)
+
+No modo executor, logins acima da capacidade recebem 503 na hora;
+a contagem aparece na última coluna.
+
+    PYTHONPATH=. python benchmarks/bench_login_storm.py --rounds 12 --logins 20
+"""
+import argparse
+import asyncio
+from time import perf_counter
+
+import httpx
+from fastapi import FastAPI
+
+from app.modules.auth.infrastructure.security.password_hasher import PasswordHasher
+from app.modules.auth.infrastructure.security.password_hashing_executor import (
+    PasswordHashingBusyError,
+    PasswordHashingExecutor,
+)
+from app.shared.presentation.exceptions.exception_handlers import password_hashing_busy_handler
+
+PASSWORD = "senha-de-teste-123"
+
+
+def build_app(mode: str, hasher: PasswordHasher, executor: PasswordHashingExecutor, io_ms: float) -> FastAPI:
+    app = FastAPI()
+    app.add_exception_handler(PasswordHashingBusyError, password_hashing_busy_handler)
+    stored_hash = hasher.hash(PASSWORD)
+
+    @app.post("/login")
+    async def login():
+        await asyncio.sleep(io_ms / 1000)  # busca das credenciais no banco
+        if mode == "inline":
+            ok = hasher.verify(PASSWORD, stored_hash)
+        else:
+            ok = await executor.verify(PASSWORD, stored_hash)
+        return {"ok": ok}
+
+    @app.get("/customers")
+    async def customers():
+        await asyncio.sleep(io_ms / 1000)
+        return [{"id": i, "name": f"Cliente {i}"} for i in range(20)]
+
+    return app
+
+
+def _percentile(values, q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))] * 1000
+
+
+async def _customer_latencies(client: httpx.AsyncClient, duration: float, concurrency: int):
+    latencies = []
+    deadline = perf_counter() + duration
+
+    async def worker():
+        while perf_counter() < deadline:
+            started = perf_counter()
+            response = await client.get("/customers")
+            assert response.status_code == 200
+            latencies.append(perf_counter() - started)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies
+
+
+async def run(mode: str, args) -> None:
+    hasher = PasswordHasher("bcrypt", args.rounds)
+    executor = PasswordHashingExecutor(hasher, workers=args.workers, max_queue=args.max_queue)
+
+    app = build_app(mode, hasher, executor, args.io_ms)
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        baseline = await _customer_latencies(client, args.duration, args.concurrency)
+
+        stop = asyncio.Event()
+        statuses = {"ok": 0, "busy": 0}
+
+        async def login_loop():
+            while not stop.is_set():
+                response = await client.post("/login")
+                statuses["ok" if response.status_code == 200 else "busy"] += 1
+                if response.status_code == 503:
+                    await asyncio.sleep(0.05)
+
+        storm = [asyncio.create_task(login_loop()) for _ in range(args.logins)]
+        await asyncio.sleep(0.2)  # deixa a rajada encher a fila
+
+        during = await _customer_latencies(client, args.duration, args.concurrency)
+
+        stop.set()
+        await asyncio.gather(*storm)
+
+    executor.shutdown()
+
+    for label, latencies in (("sozinho", baseline), ("durante logins", during)):
+        print(
+            f"{mode:<9} | {label:<15} | {len(latencies):>6} | {_percentile(latencies, 0.50):>8.1f} | "
+            f"{_percentile(latencies, 0.99):>8.1f} | {statuses['ok'] if label != 'sozinho' else '-':>6} | "
+            f"{statuses['busy'] if label != 'sozinho' else '-':>5}"
+        )
+
+    if mode == "executor":
+        stats = executor.stats()
+        print(
+            f"{'':<9} | fila p99 {stats['queue_wait_p99_ms']:.1f} ms, "
+            f"hash p99 {stats['hash_time_p99_ms']:.1f} ms, rejeitados {stats['rejected']}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--logins", type=int, default=20, help="logins simultâneos na rajada")
+    parser.add_argument("--workers", type=int, default=0, help="0 = núcleos - 1")
+    parser.add_argument("--max-queue", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=5.0, help="segundos de medição por cenário")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--io-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    print(f"{'modo':<9} | {'cenário':<15} | {'reqs':>6} | {'p50 ms':>8} | {'p99 ms':>8} | {'logins':>6} | {'503':>5}")
+    for mode in ("inline", "executor"):
+        asyncio.run(run(mode, args))
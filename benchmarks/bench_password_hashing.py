@@ -0,0 +1,71 @@
+"""
+Benchmark: custo de hash de senha por esquema, para dimensionar logins.
+
+Para cada esquema (bcrypt e argon2id):
+- calibra o custo para `--target-ms` por hash neste hardware
+  (mesma rotina de PASSWORD_HASH_CALIBRATE; o custo configurado é o piso)
+- mede hashes/s em uma thread (≈ um núcleo) e com `--threads` threads
+  (o mesmo pool do PasswordHashingExecutor)
+
+Capacidade de login ≈ hashes/s por núcleo × núcleos dedicados ao hash
+(PASSWORD_HASH_WORKERS). argon2id é ignorado se argon2-cffi não estiver
+instalado.
+
+    PYTHONPATH=. python benchmarks/bench_password_hashing.py --target-ms 250
+"""
+import argparse
+import os
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+
+from passlib.exc import MissingBackendError
+
+from app.modules.auth.infrastructure.security.password_hasher import (
+    SUPPORTED_SCHEMES,
+    PasswordHasher,
+    calibrate_cost,
+    measure_hash_ms,
+)
+
+
+def hashes_per_second(hasher: PasswordHasher, threads: int, duration: float) -> float:
+    deadline = perf_counter() + duration
+
+    def worker() -> int:
+        done = 0
+        while perf_counter() < deadline:
+            hasher.hash("senha-de-benchmark")
+            done += 1
+        return done
+
+    started = perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        total = sum(pool.map(lambda _: worker(), range(threads)))
+    return total / (perf_counter() - started)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--target-ms", type=float, default=250.0)
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--duration", type=float, default=5.0, help="segundos por medição")
+    args = parser.parse_args()
+
+    print(f"núcleos: {os.cpu_count()}, alvo: {args.target_ms:.0f} ms/hash")
+    print(f"{'esquema':<8} | {'custo':>5} | {'ms/hash':>8} | {'hash/s 1 núcleo':>15} | {f'hash/s {args.threads} threads':>17}")
+
+    for scheme in SUPPORTED_SCHEMES:
+        try:
+            cost = calibrate_cost(scheme, args.target_ms)
+        except MissingBackendError:
+            print(f"{scheme:<8} | argon2-cffi não instalado")
+            continue
+
+        hasher = PasswordHasher(scheme, cost)
+        single = hashes_per_second(hasher, 1, args.duration)
+        pooled = hashes_per_second(hasher, args.threads, args.duration)
+
+        print(
+            f"{scheme:<8} | {cost:>5} | {measure_hash_ms(scheme, cost):>8.1f} | "
+            f"{single:>15.2f} | {pooled:>17.2f}"
+        )
@@ -0,0 +1,115 @@
+"""
+Benchmark: latência adicionada por requisição pelo rate limit.
+
+Monta um app ASGI em processo com POST /login (corpo com email) e
+mede p50/p99 de `--requests` requisições sequenciais em três cenários:
+- sem limite: linha de base
+- contador fixo: o limitador antigo, INCR+TTL em pipeline e EXPIRE
+  separado, chamado duas vezes (IP e email) — até 4 idas ao Redis
+- GCRA: RateLimitMiddleware com as regras de IP e email avaliadas em
+  um único EVALSHA
+
+Os limites são altos o bastante para nenhuma requisição ser bloqueada;
+a coluna "+p50" é o custo do rate limit sobre a linha de base. Usa o
+Redis configurado em REDIS_* (chaves com prefixo "bench:", apagadas ao
+final).
+
+    PYTHONPATH=. python benchmarks/bench_rate_limiter.py --requests 2000
+"""
+import argparse
+import asyncio
+from time import perf_counter
+
+import httpx
+from fastapi import FastAPI, Request
+from pydantic import BaseModel
+from redis.asyncio import Redis
+
+from app.infra.redis.redis_client import create_redis_client
+from app.shared.presentation.middlewares.rate_limit_middleware import RateLimitRule, setup_rate_limit
+
+LIMIT = 1_000_000
+
+
+class LoginBody(BaseModel):
+    email: str
+
+
+async def fixed_window(redis: Redis, key: str, limit: int, window_seconds: int) -> None:
+    # limitador anterior (não atômico): INCR+TTL e, na primeira vez, EXPIRE
+    pipe = redis.pipeline()
+    pipe.incr(key)
+    pipe.ttl(key)
+    count, ttl = await pipe.execute()
+
+    if ttl in (-1, -2):
+        await redis.expire(key, window_seconds)
+
+    assert count <= limit
+
+
+def build_app(mode: str, redis: Redis) -> FastAPI:
+    app = FastAPI()
+    app.state.redis = redis
+
+    @app.post("/login")
+    async def login(request: Request, body: LoginBody):
+        if mode == "contador fixo":
+            await fixed_window(redis, f"bench:login_ip:{request.client.host}", LIMIT, 60)
+            await fixed_window(redis, f"bench:login_email:{body.email.lower()}", LIMIT, 60)
+        return {"ok": True}
+
+    if mode == "GCRA":
+        setup_rate_limit(app, {
+            ("POST", "/login"): (
+                RateLimitRule("bench:login_ip", limit=LIMIT, window_seconds=60),
+                RateLimitRule("bench:login_email", limit=LIMIT, window_seconds=60, body_field="email"),
+            ),
+        })
+
+    return app
+
+
+def _percentile(values, q: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))] * 1000
+
+
+async def measure(mode: str, redis: Redis, requests: int):
+    transport = httpx.ASGITransport(app=build_app(mode, redis))
+    latencies = []
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for i in range(requests + 50):
+            started = perf_counter()
+            response = await client.post("/login", json={"email": f"user{i % 100}@bench.local"})
+            assert response.status_code == 200, response.text
+            if i >= 50:  # aquecimento (conexões do pool, carga do script)
+                latencies.append(perf_counter() - started)
+
+    return _percentile(latencies, 0.50), _percentile(latencies, 0.99)
+
+
+async def main(args) -> None:
+    redis = create_redis_client()
+
+    try:
+        print(f"{'cenário':<14} | {'p50 ms':>8} | {'p99 ms':>8} | {'+p50 ms':>8}")
+        baseline = None
+        for mode in ("sem limite", "contador fixo", "GCRA"):
+            p50, p99 = await measure(mode, redis, args.requests)
+            baseline = p50 if baseline is None else baseline
+            print(f"{mode:<14} | {p50:>8.3f} | {p99:>8.3f} | {p50 - baseline:>8.3f}")
+    finally:
+        keys = [key async for key in redis.scan_iter("*bench:*")]
+        if keys:
+            await redis.delete(*keys)
+        await redis.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000, help="requisições por cenário")
+    args = parser.parse_args()
+
+    asyncio.run(main(args))
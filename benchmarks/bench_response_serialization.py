@@ -0,0 +1,123 @@
+"""
+Benchmark: serialização de uma página de clientes (read models → bytes).
+
+Compara, em µs por página, numa rota real do FastAPI (ASGI, sem rede):
+
+- antes: DTO validado por item, `CustomerSummarySchema(**model_dump())`
+  por item e revalidação contra o `response_model` + jsonable_encoder
+  + json.dumps pelo FastAPI (três passagens do pydantic por linha)
+- TypeAdapter: DTOs montados sem validação (`from_read_model`) e
+  `TypeAdapter.dump_json` direto em bytes (TypedJSONResponse)
+
+A coluna "serialização" desconta uma rota vazia (custo fixo do ASGI).
+Não precisa de banco:
+
+    PYTHONPATH=. python benchmarks/bench_response_serialization.py --items 200
+"""
+import argparse
+import asyncio
+from dataclasses import asdict
+from datetime import datetime, timezone
+from time import perf_counter
+
+import httpx
+from fastapi import FastAPI, Response
+
+from app.modules.customer.application.dtos.customer_dtos import (
+    CustomerListOutputDTO,
+    CustomerSummaryOutputDTO,
+)
+from app.modules.customer.domain.read_models.customer_rm import CustomerSummary
+from app.modules.customer.presentation.routes.customer_routes import _CUSTOMER_LIST_JSON
+from app.modules.customer.presentation.schemas.customer_schemas import (
+    CustomerListSchema,
+    CustomerSummarySchema,
+)
+from app.shared.presentation.responses.typed_json_response import TypedJSONResponse
+
+
+def make_page(items: int) -> list[CustomerSummary]:
+    created_at = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+    return [
+        CustomerSummary(
+            customer_id=f"00000000-0000-0000-0000-{i:012d}",
+            name=f"Cliente Número {i}",
+            email=f"cliente{i}@exemplo.com",
+            phone="11999999999" if i % 2 else None,
+            is_active=bool(i % 5),
+            created_at=created_at,
+        )
+        for i in range(items)
+    ]
+
+
+def build_app(page: list[CustomerSummary]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/vazia")
+    async def empty():
+        return Response(b"{}", media_type="application/json")
+
+    @app.get("/antes", response_model=CustomerListSchema)
+    async def before():
+        summaries = [
+            CustomerSummaryOutputDTO(**{k: v for k, v in asdict(s).items() if k != "relevance"})
+            for s in page
+        ]
+        result = CustomerListOutputDTO(items=summaries, total=len(page), limit=len(page), offset=0)
+        return CustomerListSchema(
+            items=[CustomerSummarySchema(**item.model_dump()) for item in result.items],
+            total=result.total,
+            limit=result.limit,
+            offset=result.offset,
+            has_more=result.has_more,
+            next_cursor=result.next_cursor,
+        )
+
+    @app.get("/typeadapter", response_model=CustomerListSchema)
+    async def fast():
+        result = CustomerListOutputDTO(
+            items=[CustomerSummaryOutputDTO.from_read_model(s) for s in page],
+            total=len(page),
+            limit=len(page),
+            offset=0,
+        )
+        return TypedJSONResponse(result, _CUSTOMER_LIST_JSON)
+
+    return app
+
+
+async def _per_request_us(client: httpx.AsyncClient, path: str, requests: int) -> tuple[float, bytes]:
+    response = await client.get(path)  # aquecimento
+    assert response.status_code == 200
+
+    started = perf_counter()
+    for _ in range(requests):
+        await client.get(path)
+    return (perf_counter() - started) / requests * 1_000_000, response.content
+
+
+async def main(items: int, requests: int) -> None:
+    transport = httpx.ASGITransport(app=build_app(make_page(items)))
+
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        base, _ = await _per_request_us(client, "/vazia", requests)
+        before, before_body = await _per_request_us(client, "/antes", requests)
+        fast, fast_body = await _per_request_us(client, "/typeadapter", requests)
+
+    assert httpx.Response(200, content=before_body).json() == httpx.Response(200, content=fast_body).json()
+
+    print(f"página de {items} itens, {len(fast_body)} bytes")
+    print(f"{'caminho':<12} | {'µs/req':>8} | {'serialização µs':>15}")
+    for name, elapsed in (("antes", before), ("TypeAdapter", fast)):
+        print(f"{name:<12} | {elapsed:>8.1f} | {elapsed - base:>15.1f}")
+    print(f"ganho: {(before - base) / (fast - base):.1f}x na serialização")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.items, args.requests))
@@ -0,0 +1,52 @@
+"""
+Benchmark: filtro de Bloom dos access tokens revogados.
+
+Para cada taxa de falso positivo alvo, monta um filtro com `--revoked`
+jtis revogados e mede:
+- memória do filtro (bytes) e número de funções de hash
+- taxa de falso positivo real, consultando `--lookups` jtis não revogados
+  (cada falso positivo é uma ida ao Redis que o filtro não evitou)
+- custo de uma consulta em µs (comparar com o round trip ao Redis)
+
+Também mostra a degradação quando o filtro recebe o dobro da capacidade.
+Não precisa de Redis:
+
+    PYTHONPATH=. python benchmarks/bench_revoked_token_filter.py --revoked 100000
+"""
+import argparse
+import uuid
+from time import perf_counter
+
+from app.shared.infrastructure.bloom_filter import BloomFilter
+
+
+def bench(capacity: int, inserted: int, fp_rate: float, lookups: int) -> None:
+    bloom = BloomFilter(capacity, fp_rate)
+    for _ in range(inserted):
+        bloom.add(str(uuid.uuid4()))
+
+    probes = [str(uuid.uuid4()) for _ in range(lookups)]
+
+    started = perf_counter()
+    false_positives = sum(1 for jti in probes if jti in bloom)
+    per_lookup = (perf_counter() - started) / lookups * 1_000_000
+
+    print(
+        f"{fp_rate:>8.4f} | {capacity:>9} | {inserted:>9} | {bloom.size_bytes / 1024:>9.1f} | "
+        f"{bloom.num_hashes:>2} | {false_positives / lookups:>9.5f} | "
+        f"{bloom.estimated_fp_rate():>9.5f} | {per_lookup:>6.2f}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--revoked", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"{'alvo':>8} | {'capacid.':>9} | {'itens':>9} | {'KiB':>9} | {'k':>2} | {'fp real':>9} | {'fp estim.':>9} | {'µs':>6}")
+    for fp_rate in (0.01, 0.001, 0.0001):
+        bench(args.revoked, args.revoked, fp_rate, args.lookups)
+
+    # acima da capacidade: continua correto, mas mais consultas vão ao Redis
+    bench(args.revoked, 2 * args.revoked, 0.001, args.lookups)
@@ -0,0 +1,163 @@
+import asyncio
+import os
+import uuid
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.modules.customer.domain.entities.customer_entity import CustomerEntity
+from app.modules.customer.domain.value_objects.customer_email import CustomerEmail
+from app.modules.customer.domain.value_objects.customer_name import CustomerName
+from app.modules.customer.infrastructure.models.customer_model import CustomerModel
+from app.modules.customer.infrastructure.repositories.customer_repository_impl import (
+    CustomerRepositoryImpl,
+)
+from app.shared.infrastructure.database.session import to_async_url
+
+# Banco Postgres descartável (URL síncrona, como a DATABASE_URL do Alembic)
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL não definido (requer Postgres)"
+)
+
+# Mesmo número de slots da migration dos contadores
+SLOTS = 16
+
+ACTUAL_TOTALS = text(
+    """
+    SELECT count(*),
+           count(*) FILTER (WHERE is_active),
+           count(*) FILTER (WHERE NOT is_active)
+      FROM customers
+    """
+)
+
+
+@pytest.fixture(scope="module")
+def database_url():
+    """Aplica as migrations (head): os contadores dependem dos triggers."""
+    original = settings.DATABASE_URL
+    settings.DATABASE_URL = TEST_DATABASE_URL
+    try:
+        command.upgrade(Config(str(Path(__file__).parents[1] / "alembic.ini")), "head")
+    finally:
+        settings.DATABASE_URL = original
+
+    return TEST_DATABASE_URL
+
+
+def _customer(active: bool = True) -> CustomerEntity:
+    customer = CustomerEntity.create(
+        name=CustomerName("Cliente Contador"),
+        email=CustomerEmail(f"{uuid.uuid4().hex}@exemplo.com"),
+    )
+    if not active:
+        customer.deactivate()
+    return customer
+
+
+def _run(database_url, scenario):
+    async def wrapper():
+        engine = create_async_engine(to_async_url(database_url), poolclass=NullPool)
+        try:
+            async with engine.begin() as conn:
+                await conn.execute(text("DELETE FROM customers"))
+            await scenario(engine)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(wrapper())
+
+
+async def _totals(db: AsyncSession) -> tuple[int, int, int]:
+    """(todos, ativos, inativos) pelos contadores, conferidos com a contagem real."""
+    repository = CustomerRepositoryImpl(db)
+    counted = (
+        await repository.count(),
+        await repository.count(is_active=True),
+        await repository.count(is_active=False),
+    )
+    assert counted == tuple((await db.execute(ACTUAL_TOTALS)).one())
+    return counted
+
+
+def test_counters_follow_every_kind_of_write(database_url):
+    async def scenario(engine):
+        async with AsyncSession(engine) as db:
+            repository = CustomerRepositoryImpl(db)
+            assert await _totals(db) == (0, 0, 0)
+
+            first = await repository.create(_customer())
+            second = await repository.create(_customer())
+            assert await _totals(db) == (2, 2, 0)
+
+            await repository.set_active(first.id, False)
+            assert await _totals(db) == (2, 1, 1)
+
+            # Repetir não grava nada (nem mexe nos contadores)
+            await repository.set_active(first.id, False)
+            assert await _totals(db) == (2, 1, 1)
+
+            await repository.set_active(first.id, True)
+            assert await _totals(db) == (2, 2, 0)
+
+            # Lote do import: um INSERT multi-row, um disparo do trigger
+            inserted = await repository.create_many(
+                [_customer(), _customer(), _customer(active=False)]
+            )
+            assert len(inserted) == 3
+            assert await _totals(db) == (5, 4, 1)
+
+            await repository.delete(second.id)
+            assert await _totals(db) == (4, 3, 1)
+
+            # Edição sem troca de status não altera os totais
+            customer = await repository.get_by_id(first.id)
+            customer.update_notes(notes="sem efeito nos contadores")
+            await repository.update(customer)
+            assert await _totals(db) == (4, 3, 1)
+
+    _run(database_url, scenario)
+
+
+def test_concurrent_writers_do_not_wait_for_each_other(database_url):
+    async def scenario(engine):
+        async def slot(conn) -> int:
+            return (await conn.execute(text(f"SELECT pg_backend_pid() % {SLOTS}"))).scalar_one()
+
+        insert = CustomerModel.__table__.insert()
+        connections = []
+        try:
+            first = await engine.connect()
+            connections.append(first)
+
+            # Outra conexão que caia em outro slot
+            while True:
+                second = await engine.connect()
+                connections.append(second)
+                if await slot(second) != await slot(first):
+                    break
+
+            # A primeira escrita segura a linha do seu slot até o fim da transação
+            await first.execute(insert.values(CustomerModel.values_from_entity(_customer())))
+
+            await second.execute(text("SET lock_timeout = '2s'"))
+            await second.execute(insert.values(CustomerModel.values_from_entity(_customer())))
+            await second.commit()
+
+            await first.rollback()
+        finally:
+            for conn in connections:
+                await conn.close()
+
+        async with AsyncSession(engine) as db:
+            assert await _totals(db) == (1, 1, 0)
+
+    _run(database_url, scenario)
@@ -0,0 +1,97 @@
+import asyncio
+import csv
+import io
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from app.modules.customer.domain.read_models.customer_rm import CustomerExportRow
+from app.modules.customer.infrastructure.exporters import customer_export_writer
+from app.modules.customer.infrastructure.exporters.customer_export_writer import (
+    EXPORT_COLUMNS,
+    write_customer_rows,
+)
+
+CREATED_AT = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+
+
+def _row(i: int, **overrides) -> CustomerExportRow:
+    values = dict(
+        customer_id=f"00000000-0000-0000-0000-{i:012d}",
+        name=f"Cliente {i}",
+        email=f"cliente{i}@exemplo.com",
+        phone="11999999999",
+        document=None,
+        city="São Paulo",
+        state="SP",
+        is_active=True,
+        created_at=CREATED_AT,
+    )
+    return CustomerExportRow(**{**values, **overrides})
+
+
+def _write(rows, file_format) -> list[bytes]:
+    async def source():
+        for row in rows:
+            yield row
+
+    async def collect():
+        return [chunk async for chunk in write_customer_rows(source(), file_format)]
+
+    return asyncio.run(collect())
+
+
+def test_csv_header_and_escaping():
+    rows = [
+        _row(1, name='Silva, "Maria"', city="Linha 1\nLinha 2"),
+        _row(2, name="=HYPERLINK(\"http://x\")", email="@SUM(1)", city="+55", state="-1"),
+        _row(3, name="\tTab", city="\rCR", phone=None, is_active=False),
+    ]
+
+    text = b"".join(_write(rows, "csv")).decode()
+    records = list(csv.reader(io.StringIO(text, newline="")))
+
+    assert records[0] == list(EXPORT_COLUMNS)
+    assert len(records) == 4
+
+    first = dict(zip(EXPORT_COLUMNS, records[1]))
+    assert first["name"] == 'Silva, "Maria"'
+    assert first["city"] == "Linha 1\nLinha 2"
+    assert first["created_at"] == "2024-01-15T10:30:00+00:00"
+
+    # Nada começa uma fórmula quando aberto numa planilha
+    second = dict(zip(EXPORT_COLUMNS, records[2]))
+    assert second["name"] == "'=HYPERLINK(\"http://x\")"
+    assert (second["email"], second["city"], second["state"]) == ("'@SUM(1)", "'+55", "'-1")
+
+    third = dict(zip(EXPORT_COLUMNS, records[3]))
+    assert (third["name"], third["city"]) == ("'\tTab", "'\rCR")
+    assert (third["phone"], third["is_active"]) == ("", "False")
+
+
+def test_ndjson_keeps_values_as_they_are():
+    rows = [_row(1, name="=1+1", document="12345678909"), _row(2, phone=None)]
+
+    lines = b"".join(_write(rows, "ndjson")).decode().splitlines()
+    items = [json.loads(line) for line in lines]
+
+    assert list(items[0]) == list(EXPORT_COLUMNS)
+    assert items[0]["name"] == "=1+1" and items[0]["city"] == "São Paulo"
+    assert items[1]["phone"] is None and items[1]["is_active"] is True
+
+
+@pytest.mark.parametrize("file_format", ["csv", "ndjson"])
+def test_output_is_streamed_in_chunks_of_whole_lines(monkeypatch, file_format):
+    rows = [_row(i) for i in range(50)]
+    [whole] = _write(rows, file_format)
+
+    monkeypatch.setattr(customer_export_writer, "CHUNK_SIZE", 512)
+    chunks = _write(rows, file_format)
+
+    assert len(chunks) > 5
+    assert all(chunk.endswith(b"\n") for chunk in chunks)
+    # Cada pedaço fecha na linha que passou do limite
+    longest = max(len(line) for line in whole.decode().splitlines(keepends=True))
+    assert all(len(chunk.decode()) < 512 + longest for chunk in chunks)
+    assert b"".join(chunks) == whole
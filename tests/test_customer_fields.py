@@ -0,0 +1,143 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.modules.auth.domain.read_models.authenticated_principal import AuthenticatedPrincipal
+from app.modules.auth.presentation.dependencies.auth_deps import get_current_principal
+from app.modules.customer.domain.entities.customer_entity import CustomerEntity
+from app.modules.customer.domain.value_objects.customer_address import CustomerAddress
+from app.modules.customer.domain.value_objects.customer_email import CustomerEmail
+from app.modules.customer.domain.value_objects.customer_field_set import (
+    CUSTOMER_SUMMARY_FIELDS,
+    CustomerFieldSet,
+)
+from app.modules.customer.domain.value_objects.customer_name import CustomerName
+from app.modules.customer.domain.value_objects.customer_phone import CustomerPhone
+from app.modules.customer.infrastructure.models.customer_model import CustomerModel
+from app.modules.customer.infrastructure.repositories.customer_repository_impl import (
+    CustomerRepositoryImpl,
+)
+from app.modules.customer.presentation.dependencies.customer_deps import get_customer_repository
+from app.modules.customer.presentation.routes.customer_routes import router
+from app.shared.infrastructure.database.base import Base
+from app.shared.infrastructure.database.session import make_session_factory
+
+
+CUSTOMER = CustomerEntity.create(
+    name=CustomerName("Maria Silva"),
+    email=CustomerEmail("maria@exemplo.com"),
+    phone=CustomerPhone("11999999999"),
+    address=CustomerAddress(
+        street="Rua das Flores",
+        number="123",
+        neighborhood="Centro",
+        city="São Paulo",
+        state="SP",
+        zip_code="01310100",
+    ),
+    notes="Alergia a amendoim",
+)
+
+
+def test_parse_always_includes_customer_id():
+    assert CustomerFieldSet.parse("name, phone").names == {"customer_id", "name", "phone"}
+
+    for raw in ("", " , ", "name,senha"):
+        with pytest.raises(ValueError):
+            CustomerFieldSet.parse(raw)
+
+    # notes não faz parte do resumo da listagem
+    with pytest.raises(ValueError):
+        CustomerFieldSet.parse("name,notes", allowed=CUSTOMER_SUMMARY_FIELDS)
+
+
+def _run(tmp_path, scenario):
+    async def wrapper():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'customers.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(
+                CustomerModel.__table__.insert().values(CustomerModel.values_from_entity(CUSTOMER))
+            )
+
+        statements = []
+        event.listen(
+            engine.sync_engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        try:
+            await scenario(make_session_factory(engine), statements)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(wrapper())
+
+
+def _selected_columns(statement: str) -> str:
+    return statement.split("FROM")[0]
+
+
+def test_repository_selects_only_requested_columns(tmp_path):
+    async def scenario(session_factory, statements):
+        async with session_factory() as db:
+            repository = CustomerRepositoryImpl(db)
+
+            profile = await repository.get_profile(CUSTOMER.id, fields=CustomerFieldSet.parse("name,phone"))
+            columns = _selected_columns(statements[-1])
+            assert "notes" not in columns and "address_street" not in columns and "email" not in columns
+            assert (profile.customer_id, profile.name, profile.phone) == (
+                CUSTOMER.id.value, "Maria Silva", "11999999999",
+            )
+            assert profile.notes is None and profile.street is None
+
+            full = await repository.get_profile(CUSTOMER.id)
+            assert full.notes == "Alergia a amendoim" and full.city == "São Paulo"
+
+            # a coluna de ordenação vem junto (o cursor precisa dela)
+            fields = CustomerFieldSet.parse("phone", allowed=CUSTOMER_SUMMARY_FIELDS)
+            [summary] = await repository.list_summaries(sort="-created_at", fields=fields)
+            columns = _selected_columns(statements[-1])
+            assert "created_at" in columns and "email" not in columns and "name" not in columns
+            assert summary.phone == "11999999999" and summary.created_at is not None
+            assert summary.email is None
+
+    _run(tmp_path, scenario)
+
+
+def test_routes_return_only_requested_fields(tmp_path):
+    async def scenario(session_factory, statements):
+        async def repository():
+            async with session_factory() as db:
+                yield CustomerRepositoryImpl(db)
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_customer_repository] = repository
+        app.dependency_overrides[get_current_principal] = lambda: AuthenticatedPrincipal(
+            user_id="u1", is_active=True
+        )
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            page = (await client.get("/customers", params={"fields": "name,phone"})).json()
+            assert page["items"] == [
+                {"customer_id": CUSTOMER.id.value, "name": "Maria Silva", "phone": "11999999999"}
+            ]
+            assert {"total", "limit", "offset", "has_more", "next_cursor"} <= set(page)
+
+            detail = (await client.get(f"/customers/{CUSTOMER.id.value}", params={"fields": "address"})).json()
+            assert set(detail) == {"customer_id", "address"}
+            assert detail["address"]["city"] == "São Paulo"
+
+            full = (await client.get(f"/customers/{CUSTOMER.id.value}")).json()
+            assert full["notes"] == "Alergia a amendoim" and full["version"] == 1
+
+            response = await client.get("/customers", params={"fields": "name,notes"})
+            assert response.status_code == 400
+
+    _run(tmp_path, scenario)
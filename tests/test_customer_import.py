@@ -0,0 +1,252 @@
+import asyncio
+import json
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.modules.customer.application.usecases.import_customers_usecase import ImportCustomersUseCase
+from app.modules.customer.domain.exceptions.customers_exceptions import CustomerValidationError
+from app.modules.customer.infrastructure.importers.customer_import_reader import (
+    MAX_LINE_LENGTH,
+    read_csv_rows,
+    read_ndjson_rows,
+)
+from app.modules.customer.infrastructure.models.customer_model import CustomerModel
+from app.modules.customer.infrastructure.repositories.customer_repository_impl import (
+    CustomerRepositoryImpl,
+)
+from app.shared.infrastructure.database.base import Base
+from app.shared.infrastructure.database.session import make_session_factory
+
+
+async def _chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+def _split(data: bytes, size: int) -> list[bytes]:
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def _read(reader, *parts: bytes):
+    async def collect():
+        return [row async for row in reader(_chunks(*parts))]
+
+    return asyncio.run(collect())
+
+
+# ─── Leitor CSV ──────────────────────────────────────────────────────────────
+
+CSV = (
+    "name,email,notes\r\n"
+    'Ana,ana@exemplo.com,"primeira linha\nsegunda linha"\r\n'
+    '"Bruno ""Bê"" Souza",bruno@exemplo.com,"vírgula, e ""aspas"""\n'
+    "\n"
+    "Carla,carla@exemplo.com,\n"
+).encode()
+
+
+def test_csv_quoted_newlines_and_escaped_quotes():
+    rows = _read(read_csv_rows, CSV)
+
+    assert [(r.row, r.name, r.email) for r in rows] == [
+        (1, "Ana", "ana@exemplo.com"),
+        (2, 'Bruno "Bê" Souza', "bruno@exemplo.com"),
+        (3, "Carla", "carla@exemplo.com"),
+    ]
+    assert rows[0].notes == "primeira linha\nsegunda linha"
+    assert rows[1].notes == 'vírgula, e "aspas"'
+    assert rows[2].notes is None
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7, 16])
+def test_csv_chunk_boundaries_do_not_change_the_result(size):
+    # Pedaços pequenos cortam campos entre aspas, o "" e caracteres UTF-8
+    expected = [row.model_dump() for row in _read(read_csv_rows, CSV)]
+
+    assert [row.model_dump() for row in _read(read_csv_rows, *_split(CSV, size))] == expected
+
+
+def test_csv_row_errors_are_reported_per_row():
+    data = (
+        "\ufeffName,Email\n"
+        "Ana,ana@exemplo.com\n"
+        "so-uma-coluna\n"
+        'Bruno,"bruno@exemplo.com\n'
+    ).encode()
+
+    rows = _read(read_csv_rows, data)
+
+    assert rows[0].name == "Ana" and rows[0].error is None
+    assert (rows[1].row, rows[1].error) == (2, "esperadas 2 colunas, encontradas 1.")
+    assert (rows[2].row, rows[2].error) == (3, "aspas não fechadas no fim do arquivo.")
+
+
+def test_csv_without_required_columns_is_rejected():
+    with pytest.raises(ValueError, match="email"):
+        _read(read_csv_rows, b"name,phone\nAna,11999999999\n")
+
+
+def test_line_longer_than_limit_is_rejected():
+    with pytest.raises(ValueError, match="caracteres"):
+        _read(read_csv_rows, b"name,email\n", b"x" * (MAX_LINE_LENGTH + 1))
+
+
+# ─── Leitor NDJSON ───────────────────────────────────────────────────────────
+
+
+def test_ndjson_rows():
+    lines = [
+        json.dumps({"name": "Ana", "email": "ana@exemplo.com", "extra": 1}),
+        "",
+        json.dumps(
+            {
+                "name": "Bruno",
+                "email": "bruno@exemplo.com",
+                "phone": None,
+                "address": {"city": "São Paulo", "state": "SP"},
+            },
+            ensure_ascii=False,
+        ),
+        "{quebrado",
+        "[1, 2]",
+    ]
+    data = "\n".join(lines).encode()
+
+    rows = _read(read_ndjson_rows, *_split(data, 5))
+
+    assert [(r.row, r.name, r.error) for r in rows] == [
+        (1, "Ana", None),
+        (2, "Bruno", None),
+        (3, None, "JSON inválido."),
+        (4, None, "cada linha deve ser um objeto JSON."),
+    ]
+    assert rows[1].phone is None
+    assert (rows[1].city, rows[1].state) == ("São Paulo", "SP")
+
+
+# ─── Caso de uso (lotes e ON CONFLICT) ───────────────────────────────────────
+
+
+def _run(tmp_path, scenario):
+    async def wrapper():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'customers.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        inserts = []
+        event.listen(
+            engine.sync_engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: (
+                inserts.append(statement) if statement.startswith("INSERT INTO customers") else None
+            ),
+        )
+        try:
+            await scenario(make_session_factory(engine), inserts)
+        finally:
+            await engine.dispose()
+
+    asyncio.run(wrapper())
+
+
+def _csv(*emails: str) -> bytes:
+    lines = ["name,email"] + [f"Cliente {i},{email}" for i, email in enumerate(emails)]
+    return "\n".join(lines).encode()
+
+
+async def _emails(db) -> list[str]:
+    return sorted((await db.execute(select(CustomerModel.email))).scalars().all())
+
+
+class _StaleUniquenessRepository(CustomerRepositoryImpl):
+    """Simula a corrida: a verificação prévia não enxerga o que foi gravado."""
+
+    async def find_existing_keys(self, emails, documents):
+        return set(), set()
+
+
+def test_import_runs_in_batches_and_reports_duplicates(tmp_path):
+    async def scenario(session_factory, inserts):
+        async with session_factory() as db:
+            use_case = ImportCustomersUseCase(CustomerRepositoryImpl(db), batch_size=3)
+            await use_case.execute(read_csv_rows(_chunks(_csv("ja@exemplo.com"))))
+            inserts.clear()
+
+            report = await use_case.execute(
+                read_csv_rows(
+                    _chunks(
+                        _csv(
+                            "a@exemplo.com",
+                            "b@exemplo.com",
+                            "a@exemplo.com",   # repetido no mesmo lote
+                            "ja@exemplo.com",  # já cadastrado
+                            "invalido",
+                            "c@exemplo.com",
+                            "d@exemplo.com",
+                        )
+                    )
+                )
+            )
+
+            assert (report.total_rows, report.imported, report.failed) == (7, 4, 3)
+            errors = {error.row: error.message for error in report.errors}
+            assert set(errors) == {3, 4, 5}
+            assert "repetido no arquivo (linha 1)" in errors[3]
+            assert "já cadastrado" in errors[4]
+            assert report.file_error is None
+
+            # 6 linhas válidas em lotes de 3 → 2 INSERTs multi-row
+            assert len(inserts) == 2
+            assert await _emails(db) == [
+                "a@exemplo.com", "b@exemplo.com", "c@exemplo.com", "d@exemplo.com", "ja@exemplo.com",
+            ]
+
+    _run(tmp_path, scenario)
+
+
+def test_conflict_on_insert_is_skipped_and_reported(tmp_path):
+    async def scenario(session_factory, inserts):
+        async with session_factory() as db:
+            use_case = ImportCustomersUseCase(_StaleUniquenessRepository(db))
+            await use_case.execute(read_csv_rows(_chunks(_csv("ja@exemplo.com"))))
+
+            report = await use_case.execute(
+                read_csv_rows(_chunks(_csv("a@exemplo.com", "ja@exemplo.com", "b@exemplo.com")))
+            )
+
+            # ON CONFLICT DO NOTHING descarta só a linha conflitante
+            assert (report.imported, report.failed) == (2, 1)
+            assert report.errors[0].row == 2
+            assert "durante a importação" in report.errors[0].message
+            assert await _emails(db) == ["a@exemplo.com", "b@exemplo.com", "ja@exemplo.com"]
+
+    _run(tmp_path, scenario)
+
+
+def test_read_error_mid_file_returns_partial_report(tmp_path):
+    async def scenario(session_factory, inserts):
+        async with session_factory() as db:
+            use_case = ImportCustomersUseCase(CustomerRepositoryImpl(db), batch_size=2)
+
+            report = await use_case.execute(
+                read_csv_rows(
+                    _chunks(
+                        _csv("a@exemplo.com", "b@exemplo.com", "c@exemplo.com") + b"\n",
+                        b"x" * (MAX_LINE_LENGTH + 1),
+                    )
+                )
+            )
+
+            # O lote já gravado e o pendente entram; a leitura parou na linha 4
+            assert (report.total_rows, report.imported, report.failed) == (3, 3, 0)
+            assert report.file_error.row == 4
+            assert "caracteres" in report.file_error.message
+            assert await _emails(db) == ["a@exemplo.com", "b@exemplo.com", "c@exemplo.com"]
+
+            # Sem nenhuma linha lida continua sendo erro de validação
+            with pytest.raises(CustomerValidationError):
+                await use_case.execute(read_csv_rows(_chunks(b"nome,telefone\n")))
+
+    _run(tmp_path, scenario)
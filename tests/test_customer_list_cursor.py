@@ -0,0 +1,151 @@
+import asyncio
+import base64
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.modules.auth.domain.read_models.authenticated_principal import AuthenticatedPrincipal
+from app.modules.auth.presentation.dependencies.auth_deps import get_current_principal
+from app.modules.customer.application.dtos.customer_dtos import ListCustomersInputDTO
+from app.modules.customer.application.usecases.list_customers_usecase import ListCustomersUseCase
+from app.modules.customer.domain.entities.customer_entity import CustomerEntity
+from app.modules.customer.domain.value_objects.customer_email import CustomerEmail
+from app.modules.customer.domain.value_objects.customer_list_cursor import CustomerListCursor
+from app.modules.customer.domain.value_objects.customer_name import CustomerName
+from app.modules.customer.infrastructure.models.customer_model import CustomerModel
+from app.modules.customer.infrastructure.repositories.customer_repository_impl import (
+    CustomerRepositoryImpl,
+)
+from app.modules.customer.presentation.dependencies.customer_deps import get_customer_repository
+from app.modules.customer.presentation.routes.customer_routes import router
+from app.shared.infrastructure.database.base import Base
+from app.shared.infrastructure.database.session import make_session_factory
+
+
+CREATED_AT = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+
+# Nomes repetidos: o desempate pelo id tem de manter a ordem entre páginas
+NAMES = ["Ana", "Bruno", "Bruno", "Bruno", "Carla", "Davi", "Davi", "Eva", "Fábio", "Gil", "Gil"]
+
+
+def _token(payload: bytes) -> str:
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def test_cursor_round_trip():
+    for cursor in (
+        CustomerListCursor(sort="name", value="Maria Silva", customer_id="c1"),
+        CustomerListCursor(sort="-created_at", value=CREATED_AT, customer_id="c2"),
+        CustomerListCursor(sort="relevance", value=0.75, customer_id="c3"),
+    ):
+        token = cursor.encode()
+        assert "=" not in token and "/" not in token and "+" not in token
+        assert CustomerListCursor.decode(token) == cursor
+
+
+@pytest.mark.parametrize(
+    "token",
+    [
+        "nao-e-base64!",
+        _token(b"\xff\xfe"),
+        _token(b"{}"),
+        _token(b"[1,2]"),
+        _token(b'["name","Ana"]'),
+        _token(b'["senha","Ana","c1"]'),
+        _token(b'["name",1,"c1"]'),
+        _token(b'["name","Ana",""]'),
+        _token(b'["-created_at","ontem","c1"]'),
+        _token(b'["relevance",true,"c1"]'),
+    ],
+)
+def test_malformed_cursor_is_rejected(token):
+    with pytest.raises(ValueError):
+        CustomerListCursor.decode(token)
+
+
+def _run(tmp_path, scenario):
+    async def wrapper():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'customers.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            for i, name in enumerate(NAMES):
+                entity = CustomerEntity.create(
+                    name=CustomerName(name),
+                    email=CustomerEmail(f"cliente{i}@exemplo.com"),
+                )
+                values = CustomerModel.values_from_entity(entity)
+                # Datas repetidas aos pares, também desempatadas pelo id
+                values["created_at"] = CREATED_AT + timedelta(minutes=i // 2)
+                await conn.execute(CustomerModel.__table__.insert().values(values))
+        try:
+            await scenario(make_session_factory(engine))
+        finally:
+            await engine.dispose()
+
+    asyncio.run(wrapper())
+
+
+def test_keyset_pages_follow_the_full_ordering(tmp_path):
+    async def scenario(session_factory):
+        async with session_factory() as db:
+            use_case = ListCustomersUseCase(CustomerRepositoryImpl(db))
+
+            for sort in ("name", "created_at", "-created_at"):
+                expected = (await use_case.execute(ListCustomersInputDTO(sort=sort, limit=100))).items
+
+                pages, cursor = [], None
+                while True:
+                    page = await use_case.execute(ListCustomersInputDTO(sort=sort, limit=3, cursor=cursor))
+                    pages.append(page.items)
+                    cursor = page.next_cursor
+                    if not page.has_more:
+                        break
+
+                seen = [item.customer_id for items in pages for item in items]
+                assert seen == [item.customer_id for item in expected], sort
+                assert len(set(seen)) == len(NAMES)
+                assert [len(items) for items in pages] == [3, 3, 3, 2]
+                assert cursor is None
+
+                if sort == "name":
+                    assert [item.name for item in expected] == sorted(NAMES)
+
+    _run(tmp_path, scenario)
+
+
+def test_invalid_cursor_returns_400(tmp_path):
+    async def scenario(session_factory):
+        async def repository():
+            async with session_factory() as db:
+                yield CustomerRepositoryImpl(db)
+
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_customer_repository] = repository
+        app.dependency_overrides[get_current_principal] = lambda: AuthenticatedPrincipal(
+            user_id="u1", is_active=True
+        )
+
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = (await client.get("/customers", params={"limit": 2})).json()
+            cursor = first["next_cursor"]
+
+            response = await client.get("/customers", params={"limit": 2, "cursor": cursor})
+            assert response.status_code == 200
+
+            # Adulterado, malformado ou de outra ordenação
+            for params in (
+                {"cursor": cursor[:-4] + "AAAA"},
+                {"cursor": "%%%"},
+                {"cursor": _token(b'["name",{"x":1},"c1"]')},
+                {"cursor": cursor, "sort": "-created_at"},
+            ):
+                response = await client.get("/customers", params={"limit": 2, **params})
+                assert response.status_code == 400, params
+                assert "cursor" in response.json()["detail"]
+
+    _run(tmp_path, scenario)
@@ -0,0 +1,138 @@
+import asyncio
+import os
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.modules.customer.domain.value_objects.customer_list_cursor import CustomerListCursor
+from app.modules.customer.infrastructure.repositories.customer_repository_impl import (
+    CustomerRepositoryImpl,
+)
+from app.shared.infrastructure.database.session import to_async_url
+
+# Banco Postgres descartável (URL síncrona, como a DATABASE_URL do Alembic)
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_DATABASE_URL, reason="TEST_DATABASE_URL não definido (requer Postgres)"
+)
+
+ROWS = 20_000
+
+SEED = text(
+    """
+    INSERT INTO customers (id, name, email, is_active, search_text, created_at, updated_at)
+    SELECT md5(i::text)::uuid::text,
+           'Cliente ' || i,
+           'cliente' || i || '@exemplo.com',
+           i % 5 <> 0,
+           '',
+           now() - i * interval '1 minute',
+           now()
+      FROM generate_series(1, :rows) AS i
+    """
+)
+
+# Formatos de listagem usados pela API (sem busca textual, que usa o GIN)
+SHAPES = {
+    "ativos por nome": dict(is_active=True),
+    "inativos por nome": dict(is_active=False),
+    "todos por nome": dict(),
+    "todos por nome, página seguinte": dict(
+        after=CustomerListCursor(sort="name", value="Cliente 5000", customer_id="0"),
+    ),
+    "ativos mais recentes": dict(is_active=True, sort="-created_at"),
+    "todos por data": dict(sort="created_at"),
+}
+
+
+@pytest.fixture(scope="module")
+def database_url():
+    """Aplica as migrations (head) e popula a tabela com visibility map em dia."""
+    original = settings.DATABASE_URL
+    settings.DATABASE_URL = TEST_DATABASE_URL
+    try:
+        command.upgrade(Config(str(Path(__file__).parents[1] / "alembic.ini")), "head")
+    finally:
+        settings.DATABASE_URL = original
+
+    engine = create_engine(TEST_DATABASE_URL, isolation_level="AUTOCOMMIT")
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("DELETE FROM customers"))
+            conn.execute(SEED, {"rows": ROWS})
+            # Index-only scan depende das páginas marcadas como all-visible
+            conn.execute(text("VACUUM ANALYZE customers"))
+    finally:
+        engine.dispose()
+
+    return TEST_DATABASE_URL
+
+
+def _plan_nodes(plan: dict):
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from _plan_nodes(child)
+
+
+async def _explain(url: str, method: str, **kwargs) -> list[dict]:
+    """Executa o método do repositório e devolve o plano das queries em customers."""
+    engine = create_async_engine(to_async_url(url), poolclass=NullPool)
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if "FROM customers" in statement:
+            captured.append((statement, parameters))
+
+    try:
+        event.listen(engine.sync_engine, "before_cursor_execute", capture)
+        async with AsyncSession(engine) as db:
+            await getattr(CustomerRepositoryImpl(db), method)(**kwargs)
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+        plans = []
+        async with engine.connect() as conn:
+            # Tabela de teste pequena: sem isso o planner pode preferir seq scan
+            await conn.execute(text("SET enable_seqscan = off"))
+            await conn.execute(text("SET enable_bitmapscan = off"))
+
+            for statement, parameters in captured:
+                result = await conn.exec_driver_sql(
+                    "EXPLAIN (FORMAT JSON) " + statement, parameters
+                )
+                plans.append(result.scalar_one()[0]["Plan"])
+
+        return plans
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_list_summaries_uses_index_only_scan(database_url, shape):
+    plans = asyncio.run(_explain(database_url, "list_summaries", **SHAPES[shape]))
+
+    assert plans
+    for plan in plans:
+        nodes = list(_plan_nodes(plan))
+        scans = [node for node in nodes if node.get("Relation Name") == "customers"]
+
+        assert scans
+        assert all(node["Node Type"] == "Index Only Scan" for node in scans), scans
+        assert not any(node["Node Type"] == "Sort" for node in nodes), nodes
+
+
+def test_list_summaries_with_total_uses_index_only_scan(database_url):
+    plans = asyncio.run(_explain(database_url, "list_summaries_with_total", is_active=True))
+
+    assert plans
+    for plan in plans:
+        scans = [node for node in _plan_nodes(plan) if node.get("Relation Name") == "customers"]
+
+        assert scans
+        assert all(node["Node Type"] == "Index Only Scan" for node in scans), scans
@@ -0,0 +1,176 @@
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.modules.auth.domain.read_models.authenticated_principal import AuthenticatedPrincipal
+from app.modules.auth.presentation.dependencies.auth_deps import get_current_principal
+from app.modules.customer.domain.entities.customer_entity import CustomerEntity
+from app.modules.customer.domain.exceptions.customers_exceptions import (
+    CustomerConcurrentUpdateError,
+    CustomerNotFoundError,
+)
+from app.modules.customer.domain.value_objects.customer_email import CustomerEmail
+from app.modules.customer.domain.value_objects.customer_name import CustomerName
+from app.modules.customer.infrastructure.models.customer_model import CustomerModel
+from app.modules.customer.infrastructure.repositories.customer_repository_impl import (
+    CustomerRepositoryImpl,
+)
+from app.modules.customer.infrastructure.search.search_text import build_search_text
+from app.modules.customer.presentation.dependencies.customer_deps import get_customer_repository
+from app.modules.customer.presentation.routes.customer_routes import router
+from app.shared.infrastructure.database.base import Base
+from app.shared.infrastructure.database.session import make_session_factory
+
+
+CUSTOMER = CustomerEntity.create(
+    name=CustomerName("Maria Silva"),
+    email=CustomerEmail("maria@exemplo.com"),
+)
+
+
+def _run(tmp_path, scenario):
+    async def wrapper():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'customers.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(
+                CustomerModel.__table__.insert().values(CustomerModel.values_from_entity(CUSTOMER))
+            )
+        try:
+            await scenario(make_session_factory(engine))
+        finally:
+            await engine.dispose()
+
+    asyncio.run(wrapper())
+
+
+def test_update_with_stale_entity_is_rejected(tmp_path):
+    async def scenario(session_factory):
+        # Duas requisições leem a mesma versão
+        async with session_factory() as first_db, session_factory() as second_db:
+            first = await CustomerRepositoryImpl(first_db).get_by_id(CUSTOMER.id)
+            second = await CustomerRepositoryImpl(second_db).get_by_id(CUSTOMER.id)
+            assert first.version == second.version == 1
+
+            first.update_notes(notes="primeira")
+            updated = await CustomerRepositoryImpl(first_db).update(first)
+            assert updated.version == 2 and updated.notes == "primeira"
+
+            second.update_notes(notes="segunda")
+            with pytest.raises(CustomerConcurrentUpdateError):
+                await CustomerRepositoryImpl(second_db).update(second)
+
+        async with session_factory() as db:
+            stored = await CustomerRepositoryImpl(db).get_by_id(CUSTOMER.id)
+            assert (stored.version, stored.notes) == (2, "primeira")
+
+            await CustomerRepositoryImpl(db).delete(CUSTOMER.id)
+            with pytest.raises(CustomerNotFoundError):
+                await CustomerRepositoryImpl(db).update(stored)
+
+    _run(tmp_path, scenario)
+
+
+def _app(session_factory) -> FastAPI:
+    async def repository():
+        async with session_factory() as db:
+            yield CustomerRepositoryImpl(db)
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_customer_repository] = repository
+    app.dependency_overrides[get_current_principal] = lambda: AuthenticatedPrincipal(
+        user_id="u1", is_active=True
+    )
+    return app
+
+
+def test_patch_increments_version_and_stale_version_returns_409(tmp_path):
+    async def scenario(session_factory):
+        app = _app(session_factory)
+
+        path = f"/customers/{CUSTOMER.id.value}"
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.patch(path, json={"name": "Maria Souza", "version": 1})
+            assert response.status_code == 200
+            assert response.json()["version"] == 2
+
+            # Sem version o PATCH vale sobre a versão atual
+            response = await client.patch(path, json={"notes": "Sem glúten"})
+            assert response.json()["version"] == 3
+
+            response = await client.patch(path, json={"name": "Outra", "version": 2})
+            assert response.status_code == 409
+
+            response = await client.patch(
+                f"{path}/address", json={"address": None, "version": 1}
+            )
+            assert response.status_code == 409
+
+            current = (await client.get(path)).json()
+            assert (current["name"], current["notes"], current["version"]) == (
+                "Maria Souza", "Sem glúten", 3,
+            )
+
+    _run(tmp_path, scenario)
+
+
+def test_patch_is_a_single_update_without_prior_read(tmp_path):
+    async def scenario(session_factory):
+        statements = []
+        engine = session_factory.kw["bind"].sync_engine
+        event.listen(
+            engine, "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement.split()[0].upper()),
+        )
+
+        path = f"/customers/{CUSTOMER.id.value}"
+        address = {
+            "street": "Rua das Flores", "number": "10", "neighborhood": "Centro",
+            "city": "São Paulo", "state": "SP", "zip_code": "01001000",
+        }
+        transport = httpx.ASGITransport(app=_app(session_factory))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            statements.clear()
+            response = await client.patch(path, json={"name": "José Souza", "version": 1})
+            assert response.status_code == 200
+            assert statements == ["UPDATE"]
+
+            statements.clear()
+            response = await client.patch(f"{path}/address", json={"address": address})
+            assert response.status_code == 200
+            assert statements == ["UPDATE"]
+
+            # Só os campos enviados mudam
+            body = response.json()
+            assert (body["name"], body["email"], body["version"]) == (
+                "José Souza", "maria@exemplo.com", 3,
+            )
+            assert body["address"]["city"] == "São Paulo"
+
+            # Sem linha no UPDATE, uma leitura decide entre 404 e 409
+            statements.clear()
+            response = await client.patch(path, json={"notes": "x", "version": 1})
+            assert response.status_code == 409
+            assert statements == ["UPDATE", "SELECT"]
+
+            missing = "/customers/00000000-0000-4000-8000-000000000000"
+            assert (await client.patch(missing, json={"notes": "x"})).status_code == 404
+            assert (await client.patch(f"{missing}/address", json={"address": None})).status_code == 404
+
+            response = await client.patch(f"{path}/address", json={"address": None, "version": 3})
+            assert response.json()["address"] is None
+
+        # search_text acompanha o novo nome, como numa gravação completa
+        async with session_factory() as db:
+            search_text = (
+                await db.execute(select(CustomerModel.search_text).where(CustomerModel.id == CUSTOMER.id.value))
+            ).scalar_one()
+        assert search_text == build_search_text("José Souza", "maria@exemplo.com")
+
+    _run(tmp_path, scenario)
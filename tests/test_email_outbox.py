@@ -0,0 +1,211 @@
+import asyncio
+import os
+import socket
+import uuid
+from email import message_from_string, policy
+
+import pytest
+from redis.asyncio import Redis
+
+from app.infra.email.email_outbox_worker import EmailOutboxWorker
+from app.infra.email.smtp_sender import SmtpSender
+from app.infra.redis.email_outbox import RedisEmailOutbox
+from app.modules.auth.application.services.email_outbox import EmailMessage
+
+controller_module = pytest.importorskip("aiosmtpd.controller")
+
+# Redis descartável (os testes usam streams com nomes aleatórios)
+TEST_REDIS_URL = os.getenv("TEST_REDIS_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_REDIS_URL, reason="TEST_REDIS_URL não definido (requer Redis)"
+)
+
+
+class _SmtpStub:
+    """
+    Servidor SMTP local (aiosmtpd) que guarda as mensagens recebidas.
+
+    `rcpt_replies[email]` é a lista de respostas ao RCPT TO daquele
+    destinatário, consumidas em ordem; esgotada, o destinatário é aceito.
+    """
+
+    def __init__(self):
+        self.received = []
+        self.connections = 0
+        self.rcpt_replies = {}
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        self.connections += 1
+        session.host_name = hostname
+        return responses
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        replies = self.rcpt_replies.get(address)
+        if replies:
+            return replies.pop(0)
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.received.append((envelope.rcpt_tos[0], envelope.content.decode()))
+        return "250 Message accepted for delivery"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp_stub():
+    stub = _SmtpStub()
+    controller = controller_module.Controller(stub, hostname="127.0.0.1", port=_free_port())
+    controller.start()
+    yield stub, controller.port
+    controller.stop()
+
+
+def _run(smtp_port, scenario, **worker_options):
+    async def wrapper():
+        redis = Redis.from_url(TEST_REDIS_URL, decode_responses=True)
+        prefix = f"test:email:{uuid.uuid4().hex}"
+        outbox = RedisEmailOutbox(redis, stream=f"{prefix}:outbox")
+        sender = SmtpSender("127.0.0.1", smtp_port, sender="nao-responda@teste.com")
+        worker = EmailOutboxWorker(
+            redis,
+            sender,
+            stream=f"{prefix}:outbox",
+            group="test-workers",
+            dead_letter_stream=f"{prefix}:dead",
+            block_ms=100,
+            **worker_options,
+        )
+
+        task = asyncio.create_task(worker.run())
+        try:
+            await scenario(outbox, worker, sender, redis, prefix)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            await redis.delete(f"{prefix}:outbox", f"{prefix}:dead")
+            await redis.aclose()
+
+    asyncio.run(wrapper())
+
+
+async def _until(condition, timeout: float = 10.0):
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "tempo esgotado"
+        await asyncio.sleep(0.05)
+
+
+def test_worker_sends_batch_over_one_connection(smtp_stub):
+    stub, port = smtp_stub
+
+    async def scenario(outbox, worker, sender, redis, prefix):
+        for i in range(5):
+            await outbox.enqueue(EmailMessage(f"user{i}@teste.com", "Recuperação de senha", f"link {i}"))
+
+        await _until(lambda: len(stub.received) == 5)
+        await _until(lambda: worker.sent == 5)
+
+        assert sorted(to for to, _ in stub.received) == [f"user{i}@teste.com" for i in range(5)]
+        mime = message_from_string(stub.received[0][1], policy=policy.default)
+        assert mime["Subject"] == "Recuperação de senha"
+        assert mime["From"] == "nao-responda@teste.com"
+        assert stub.connections == 1
+        assert await redis.xlen(f"{prefix}:outbox") == 0
+
+    _run(port, scenario)
+
+
+def test_transient_failure_is_retried(smtp_stub):
+    stub, port = smtp_stub
+    stub.rcpt_replies["lento@teste.com"] = ["451 4.7.1 Tente mais tarde"]
+
+    async def scenario(outbox, worker, sender, redis, prefix):
+        await outbox.enqueue(EmailMessage("lento@teste.com", "Assunto", "corpo"))
+
+        await _until(lambda: worker.sent == 1)
+
+        assert worker.retried == 1
+        assert [to for to, _ in stub.received] == ["lento@teste.com"]
+        assert await redis.xlen(f"{prefix}:dead") == 0
+
+    _run(port, scenario, retry_after=0.2)
+
+
+def test_permanent_failure_and_exhausted_retries_go_to_dead_letter(smtp_stub):
+    stub, port = smtp_stub
+    stub.rcpt_replies["inexistente@teste.com"] = ["550 5.1.1 Usuário desconhecido"]
+    stub.rcpt_replies["fora@teste.com"] = ["451 4.3.0 Indisponível"] * 10
+
+    async def scenario(outbox, worker, sender, redis, prefix):
+        await outbox.enqueue(EmailMessage("inexistente@teste.com", "Assunto", "corpo"))
+        await outbox.enqueue(EmailMessage("fora@teste.com", "Assunto", "corpo"))
+        await outbox.enqueue(EmailMessage("ok@teste.com", "Assunto", "corpo"))
+
+        await _until(lambda: worker.dead_lettered == 2)
+
+        dead = {fields["to"]: fields for _, fields in await redis.xrange(f"{prefix}:dead")}
+        assert set(dead) == {"inexistente@teste.com", "fora@teste.com"}
+        assert "550" in dead["inexistente@teste.com"]["error"]
+        assert [to for to, _ in stub.received] == ["ok@teste.com"]
+        assert await redis.xlen(f"{prefix}:outbox") == 0
+
+    _run(port, scenario, retry_after=0.1, max_attempts=3)
+
+
+def test_messages_wait_in_outbox_while_smtp_is_down():
+    port = _free_port()  # nada escutando
+
+    async def scenario(outbox, worker, sender, redis, prefix):
+        await outbox.enqueue(EmailMessage("user@teste.com", "Assunto", "corpo"))
+
+        await _until(lambda: worker.retried >= 1)
+
+        assert worker.sent == 0
+        assert worker.dead_lettered == 0
+        assert await redis.xlen(f"{prefix}:outbox") == 1
+
+    _run(port, scenario, retry_after=30.0)
+
+
+def test_dead_letter_stream_drops_entries_past_retention(smtp_stub):
+    stub, port = smtp_stub
+    stub.rcpt_replies["inexistente@teste.com"] = ["550 5.1.1 Usuário desconhecido"]
+
+    async def scenario(outbox, worker, sender, redis, prefix):
+        # Dead letter antigo, com link de reset já vencido
+        await redis.xadd(f"{prefix}:dead", {"to": "antigo@teste.com", "body": "token"}, id="1-0")
+
+        await outbox.enqueue(EmailMessage("inexistente@teste.com", "Assunto", "corpo"))
+        await _until(lambda: worker.dead_lettered == 1)
+
+        dead = [fields["to"] for _, fields in await redis.xrange(f"{prefix}:dead")]
+        assert dead == ["inexistente@teste.com"]
+
+    _run(port, scenario, dead_letter_retention=3600)
+
+
+def test_outbox_stream_is_capped():
+    async def scenario():
+        redis = Redis.from_url(TEST_REDIS_URL, decode_responses=True)
+        stream = f"test:email:{uuid.uuid4().hex}:outbox"
+        outbox = RedisEmailOutbox(redis, stream=stream, maxlen=10)
+        try:
+            for i in range(500):
+                await outbox.enqueue(EmailMessage(f"user{i}@teste.com", "Assunto", "corpo"))
+
+            # MAXLEN ~ corta em nós inteiros do stream (até 100 entradas cada)
+            assert await redis.xlen(stream) <= 10 + 100
+            last = await redis.xrevrange(stream, count=1)
+            assert last[0][1]["to"] == "user499@teste.com"
+        finally:
+            await redis.delete(stream)
+            await redis.aclose()
+
+    asyncio.run(scenario())
@@ -0,0 +1,190 @@
+import asyncio
+import json
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+from google.auth import crypt, jwt
+
+from app.modules.auth.infrastructure.repositories.google_token_verifier_impl import (
+    GoogleTokenVerifierImpl,
+)
+from app.modules.auth.infrastructure.security.google_cert_cache import GoogleCertCache
+
+
+# Servidor local no lugar de googleapis.com: serve os certificados das
+# chaves em `keys` com o max-age configurado e conta os downloads.
+
+
+class _SigningKey:
+    def __init__(self, kid: str):
+        self.kid = kid
+        key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, kid)])
+        now = datetime.now(timezone.utc)
+        cert = (
+            x509.CertificateBuilder()
+            .subject_name(name)
+            .issuer_name(name)
+            .public_key(key.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(now - timedelta(days=1))
+            .not_valid_after(now + timedelta(days=1))
+            .sign(key, hashes.SHA256())
+        )
+        self.cert_pem = cert.public_bytes(serialization.Encoding.PEM).decode()
+        private_pem = key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+        self.signer = crypt.RSASigner.from_string(private_pem, key_id=kid)
+
+    def id_token(self, **overrides) -> str:
+        now = int(time.time())
+        payload = {
+            "iss": "https://accounts.google.com",
+            "sub": "1234567890",
+            "email": "maria@gmail.com",
+            "email_verified": True,
+            "name": "Maria Silva",
+            "iat": now,
+            "exp": now + 3600,
+            **overrides,
+        }
+        return jwt.encode(self.signer, payload).decode()
+
+
+class _CertServer:
+    def __init__(self, max_age: int = 3600):
+        self.keys = [_SigningKey("kid-1")]
+        self.max_age = max_age
+        self.hits = 0
+
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.hits += 1
+                body = json.dumps({key.kid: key.cert_pem for key in server.keys}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Cache-Control", f"public, max-age={server.max_age}")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}/oauth2/v1/certs"
+        threading.Thread(target=self._httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def cert_server():
+    server = _CertServer()
+    yield server
+    server.close()
+
+
+def _run(cert_server, scenario, **cache_options):
+    async def wrapper():
+        async with httpx.AsyncClient() as client:
+            cache = GoogleCertCache(client, certs_url=cert_server.url, **cache_options)
+            await scenario(cache, GoogleTokenVerifierImpl(cache))
+
+    asyncio.run(wrapper())
+
+
+def test_verifies_locally_with_cached_certs(cert_server):
+    async def scenario(cache, verifier):
+        for _ in range(5):
+            email, name = await verifier.verify(cert_server.keys[0].id_token())
+            assert email.value == "maria@gmail.com"
+            assert name.value == "Maria Silva"
+
+        # logins concorrentes também compartilham um único download
+        tokens = [cert_server.keys[0].id_token() for _ in range(10)]
+        await asyncio.gather(*(verifier.verify(token) for token in tokens))
+
+        assert cert_server.hits == 1
+
+    _run(cert_server, scenario)
+
+
+def test_rejects_invalid_tokens(cert_server):
+    intruder = _SigningKey("kid-1")  # mesmo kid, chave que o servidor não publica
+
+    async def scenario(cache, verifier):
+        for token in (
+            intruder.id_token(),
+            cert_server.keys[0].id_token(iss="https://evil.example.com"),
+            cert_server.keys[0].id_token(email_verified=False),
+            cert_server.keys[0].id_token(exp=int(time.time()) - 600),
+        ):
+            with pytest.raises(ValueError):
+                await verifier.verify(token)
+
+    _run(cert_server, scenario)
+
+
+def test_unknown_kid_forces_refresh(cert_server):
+    unpublished = _SigningKey("kid-3")
+
+    async def scenario(cache, verifier):
+        await verifier.verify(cert_server.keys[0].id_token())
+        await asyncio.sleep(0.3)
+
+        # o Google passou a assinar com uma chave nova
+        cert_server.keys.append(_SigningKey("kid-2"))
+        await verifier.verify(cert_server.keys[1].id_token())
+        assert cert_server.hits == 2
+
+        # kid desconhecido de novo, dentro do intervalo mínimo: sem novo download
+        with pytest.raises(ValueError):
+            await verifier.verify(unpublished.id_token())
+        assert cert_server.hits == 2
+
+    _run(cert_server, scenario, min_refresh_interval=0.25)
+
+
+def test_refetches_after_max_age_and_keeps_stale_certs_on_failure(cert_server):
+    cert_server.max_age = 0
+
+    async def scenario(cache, verifier):
+        await verifier.verify(cert_server.keys[0].id_token())
+        await verifier.verify(cert_server.keys[0].id_token())
+        assert cert_server.hits == 2
+
+        # Google fora do ar: continua verificando com os certificados anteriores
+        cert_server.close()
+        await verifier.verify(cert_server.keys[0].id_token())
+
+    _run(cert_server, scenario)
+
+
+def test_background_refresh(cert_server):
+    cert_server.max_age = 1
+
+    async def scenario(cache, verifier):
+        await cache.refresh()
+        task = asyncio.create_task(cache.maintain())
+        await asyncio.sleep(1.5)
+        task.cancel()
+
+        assert cert_server.hits >= 2
+
+    _run(cert_server, scenario, refresh_margin=0.5, min_refresh_interval=0.1)
@@ -0,0 +1,20 @@
+import asyncio
+import logging
+
+from app.infra.email.logging_email_outbox import LoggingEmailOutbox
+from app.modules.auth.application.services.email_outbox import EmailMessage
+
+
+def test_message_is_written_to_the_log(caplog):
+    message = EmailMessage(
+        "maria@exemplo.com",
+        "Recuperação de senha",
+        "Clique no link: https://seuapp.com/reset-password?token=abc123",
+    )
+
+    with caplog.at_level(logging.WARNING, logger="app.infra.email.logging_email_outbox"):
+        asyncio.run(LoggingEmailOutbox().enqueue(message))
+
+    [record] = caplog.records
+    assert "maria@exemplo.com" in record.getMessage()
+    assert "reset-password?token=abc123" in record.getMessage()
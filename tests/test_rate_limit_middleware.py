@@ -0,0 +1,145 @@
+import asyncio
+import json
+
+import httpx
+from fastapi import FastAPI, Request
+from redis.exceptions import RedisError
+
+from app.shared.presentation.middlewares.rate_limit_middleware import (
+    MAX_BUFFERED_BODY,
+    RateLimitMiddleware,
+    RateLimitRule,
+)
+from app.shared.security.rate_limiter import RateLimitResult
+
+RULES = {
+    ("POST", "/login"): (
+        RateLimitRule("login_ip", limit=5, window_seconds=60),
+        RateLimitRule("login_email", limit=3, window_seconds=60, body_field="email"),
+    ),
+}
+
+
+class _StubLimiter:
+    """Devolve um resultado fixo e guarda os limites consultados."""
+
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+        self.calls = []
+
+    async def check(self, limits):
+        self.calls.append(list(limits))
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+def _post(limiter, payload: dict, chunk_size: int = 7, content_length: bool = False):
+    received = []
+
+    app = FastAPI()
+
+    @app.post("/login")
+    async def login(request: Request):
+        received.append(await request.json())
+        return {"ok": True}
+
+    middleware = RateLimitMiddleware(app, RULES)
+    middleware._limiter = limiter
+
+    body = json.dumps(payload).encode()
+
+    async def chunks():
+        # Corpo em vários pedaços: o middleware precisa juntá-los e repassá-los
+        for start in range(0, len(body), chunk_size):
+            yield body[start:start + chunk_size]
+
+    async def request():
+        transport = httpx.ASGITransport(app=middleware, client=("10.0.0.1", 1234))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            # Com Content-Length o corpo vai inteiro; sem ele, em pedaços
+            return await client.post("/login", content=body if content_length else chunks())
+
+    return asyncio.run(request()), received
+
+
+def test_allowed_request_reports_remaining_and_reaches_handler_with_full_body():
+    limiter = _StubLimiter(RateLimitResult(True, limit=3, remaining=2, reset_seconds=20, retry_after_seconds=0))
+    payload = {"email": "  Maria@Exemplo.com ", "password": "x" * 200}
+
+    response, received = _post(limiter, payload)
+
+    assert response.status_code == 200
+    assert received == [payload]
+    assert response.headers["RateLimit-Limit"] == "3"
+    assert response.headers["RateLimit-Remaining"] == "2"
+    assert response.headers["RateLimit-Reset"] == "20"
+    assert "Retry-After" not in response.headers
+
+    # IP e email (normalizado) avaliados juntos
+    [limits] = limiter.calls
+    assert [limit.key for limit in limits] == ["login_ip:10.0.0.1", "login_email:maria@exemplo.com"]
+
+
+def test_denied_request_returns_429_with_retry_after():
+    limiter = _StubLimiter(RateLimitResult(False, limit=3, remaining=0, reset_seconds=40, retry_after_seconds=17))
+
+    response, received = _post(limiter, {"email": "maria@exemplo.com", "password": "x"})
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "17"
+    assert response.headers["RateLimit-Remaining"] == "0"
+    assert received == []
+
+
+def test_retry_after_is_at_least_one_second():
+    limiter = _StubLimiter(RateLimitResult(False, limit=3, remaining=0, reset_seconds=1, retry_after_seconds=0))
+
+    response, _ = _post(limiter, {"email": "maria@exemplo.com"})
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_body_without_identity_is_limited_by_ip_only():
+    limiter = _StubLimiter(RateLimitResult(True, limit=5, remaining=4, reset_seconds=12, retry_after_seconds=0))
+
+    response, received = _post(limiter, {"password": "x"})
+
+    assert response.status_code == 200
+    assert received == [{"password": "x"}]
+    assert [limit.key for limit in limiter.calls[0]] == ["login_ip:10.0.0.1"]
+
+
+def test_redis_failure_lets_the_request_through():
+    limiter = _StubLimiter(error=RedisError("fora do ar"))
+    payload = {"email": "maria@exemplo.com", "password": "x" * 50}
+
+    response, received = _post(limiter, payload)
+
+    assert response.status_code == 200
+    assert received == [payload]
+    assert "RateLimit-Limit" not in response.headers
+
+
+def test_oversized_streamed_body_is_rejected_without_reaching_redis():
+    limiter = _StubLimiter(RateLimitResult(True, limit=5, remaining=4, reset_seconds=12, retry_after_seconds=0))
+    payload = {"email": "maria@exemplo.com", "password": "x" * MAX_BUFFERED_BODY}
+
+    response, received = _post(limiter, payload, chunk_size=1024)
+
+    assert response.status_code == 413
+    assert received == []
+    assert limiter.calls == []
+
+
+def test_oversized_content_length_is_rejected_before_reading_the_body():
+    limiter = _StubLimiter(RateLimitResult(True, limit=5, remaining=4, reset_seconds=12, retry_after_seconds=0))
+    payload = {"email": "maria@exemplo.com", "password": "x" * MAX_BUFFERED_BODY}
+
+    response, received = _post(limiter, payload, content_length=True)
+
+    assert response.status_code == 413
+    assert received == []
+    assert limiter.calls == []
@@ -0,0 +1,76 @@
+import asyncio
+import os
+import uuid
+
+import pytest
+from redis.asyncio import Redis
+
+from app.shared.security.rate_limiter import RateLimit, RateLimiter
+
+# Redis descartável (cada teste usa chaves aleatórias)
+TEST_REDIS_URL = os.getenv("TEST_REDIS_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_REDIS_URL, reason="TEST_REDIS_URL não definido (requer Redis)"
+)
+
+
+def _key() -> str:
+    return uuid.uuid4().hex
+
+
+def _run(scenario):
+    async def wrapper():
+        redis = Redis.from_url(TEST_REDIS_URL, decode_responses=True)
+        try:
+            await scenario(RateLimiter(redis), redis)
+        finally:
+            await redis.aclose()
+
+    asyncio.run(wrapper())
+
+
+def test_burst_is_allowed_then_refused_then_recovers():
+    async def scenario(limiter, redis):
+        # 4 por 2 s: uma requisição a cada 500 ms, rajada de até 4
+        rate_limit = RateLimit(_key(), limit=4, window_seconds=2)
+
+        results = [await limiter.check([rate_limit]) for _ in range(4)]
+        assert all(result.allowed for result in results)
+        assert [result.remaining for result in results] == [3, 2, 1, 0]
+
+        refused = await limiter.check([rate_limit])
+        assert not refused.allowed
+        assert refused.remaining == 0
+        assert refused.retry_after_seconds == 1  # ~500 ms, arredondado para cima
+
+        # Recusas não consomem: passado um intervalo, cabe exatamente mais uma
+        await asyncio.sleep(0.55)
+        assert (await limiter.check([rate_limit])).allowed
+        assert not (await limiter.check([rate_limit])).allowed
+
+    _run(scenario)
+
+
+def test_multiple_keys_are_refused_atomically():
+    async def scenario(limiter, redis):
+        strict = RateLimit(_key(), limit=1, window_seconds=60)
+        loose = RateLimit(_key(), limit=10, window_seconds=60)
+
+        first = await limiter.check([strict, loose])
+        assert first.allowed
+        # A chave mais restritiva é a que aparece na resposta
+        assert (first.limit, first.remaining) == (1, 0)
+
+        refused = await limiter.check([loose, strict])
+        assert not refused.allowed
+        assert refused.limit == 1
+        assert 0 < refused.retry_after_seconds <= 60
+
+        # A recusa não consumiu da chave que ainda aceitava
+        alone = await limiter.check([loose])
+        assert alone.allowed and alone.remaining == 8
+
+        assert await redis.pttl(f"rate_limit:{loose.key}") > 0
+
+    _run(scenario)
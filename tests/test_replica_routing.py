@@ -0,0 +1,164 @@
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.modules.customer.domain.entities.customer_entity import CustomerEntity
+from app.modules.customer.domain.value_objects.customer_email import CustomerEmail
+from app.modules.customer.domain.value_objects.customer_name import CustomerName
+from app.modules.customer.infrastructure.models.customer_model import CustomerModel
+from app.modules.customer.infrastructure.repositories.customer_repository_impl import (
+    CustomerRepositoryImpl,
+)
+from app.shared.infrastructure.database.base import Base
+from app.shared.infrastructure.database.routing import ReplicaRouter, run_on_replica
+from app.shared.infrastructure.database.session import make_session_factory
+
+
+# Primário e réplica são dois arquivos SQLite distintos: cada um recebe
+# um cliente diferente, então o resultado da leitura revela o engine usado.
+
+
+def _customer(name: str) -> CustomerEntity:
+    return CustomerEntity.create(
+        name=CustomerName(name),
+        email=CustomerEmail(f"{name.lower()}@exemplo.com"),
+    )
+
+
+async def _setup(tmp_path, read_timeout: float = 1.0):
+    primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+
+    for engine, name in ((primary, "Primario"), (replica, "Replica")):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(
+                CustomerModel.__table__.insert().values(
+                    CustomerModel.values_from_entity(_customer(name))
+                )
+            )
+
+    router = ReplicaRouter([replica], max_lag=5.0, read_timeout=read_timeout)
+    return primary, router, make_session_factory(primary, router)
+
+
+async def _names(repository: CustomerRepositoryImpl) -> list[str]:
+    return [summary.name for summary in await repository.list_summaries()]
+
+
+def test_read_only_methods_go_to_replica(tmp_path):
+    async def scenario():
+        primary, router, session_factory = await _setup(tmp_path)
+        try:
+            async with session_factory() as db:
+                repository = CustomerRepositoryImpl(db)
+
+                assert await _names(repository) == ["Replica"]
+                assert await repository.count() == 0  # sem contadores na réplica
+
+                # Métodos não marcados continuam no primário
+                primary_names = (await db.execute(select(CustomerModel.name))).scalars().all()
+                assert primary_names == ["Primario"]
+        finally:
+            await router.dispose()
+            await primary.dispose()
+
+    asyncio.run(scenario())
+
+
+def test_session_that_wrote_keeps_reading_from_primary(tmp_path):
+    async def scenario():
+        primary, router, session_factory = await _setup(tmp_path)
+        try:
+            async with session_factory() as db:
+                repository = CustomerRepositoryImpl(db)
+                await repository.create(_customer("Novo"))
+
+                assert await _names(repository) == ["Novo", "Primario"]
+
+            # Nova sessão (nova requisição) volta a ler da réplica
+            async with session_factory() as db:
+                assert await _names(CustomerRepositoryImpl(db)) == ["Replica"]
+        finally:
+            await router.dispose()
+            await primary.dispose()
+
+    asyncio.run(scenario())
+
+
+def test_session_keeps_the_replica_it_first_read_from(tmp_path):
+    async def scenario():
+        primary, router, session_factory = await _setup(tmp_path)
+        second = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica2.db'}")
+        async with second.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(
+                CustomerModel.__table__.insert().values(
+                    CustomerModel.values_from_entity(_customer("Segunda"))
+                )
+            )
+        router = ReplicaRouter([*router.replicas, second], max_lag=5.0, read_timeout=1.0)
+        session_factory = make_session_factory(primary, router)
+        try:
+            # Rodízio entre sessões, mas cada sessão fica na sua réplica
+            async with session_factory() as db:
+                repository = CustomerRepositoryImpl(db)
+                assert await _names(repository) == ["Replica"]
+                assert await _names(repository) == ["Replica"]
+
+            async with session_factory() as db:
+                repository = CustomerRepositoryImpl(db)
+                assert await _names(repository) == ["Segunda"]
+                assert await _names(repository) == ["Segunda"]
+
+                # Fora do rodízio, a sessão passa para outra réplica
+                router.mark_unhealthy(second)
+                assert await _names(repository) == ["Replica"]
+        finally:
+            await router.dispose()
+            await primary.dispose()
+
+    asyncio.run(scenario())
+
+
+def test_lagging_replica_falls_back_to_primary(tmp_path):
+    async def scenario():
+        primary, router, session_factory = await _setup(tmp_path)
+
+        async def lagging(replica):
+            return router.max_lag + 1
+
+        router.measure_lag = lagging
+        try:
+            await router.refresh()
+
+            async with session_factory() as db:
+                assert await _names(CustomerRepositoryImpl(db)) == ["Primario"]
+        finally:
+            await router.dispose()
+            await primary.dispose()
+
+    asyncio.run(scenario())
+
+
+def test_slow_replica_read_is_retried_on_primary(tmp_path):
+    async def scenario():
+        primary, router, session_factory = await _setup(tmp_path, read_timeout=0.05)
+        try:
+            async with session_factory() as db:
+                repository = CustomerRepositoryImpl(db)
+
+                async def slow_on_replica():
+                    names = await repository.list_summaries.__wrapped__(repository)
+                    if "replica" in db.sync_session.info:
+                        await asyncio.sleep(1)  # réplica lenta
+                    return [summary.name for summary in names]
+
+                assert await run_on_replica(db, slow_on_replica) == ["Primario"]
+                assert not router.has_healthy()
+        finally:
+            await router.dispose()
+            await primary.dispose()
+
+    asyncio.run(scenario())
@@ -0,0 +1,131 @@
+import asyncio
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.modules.auth.domain.read_models.authenticated_principal import AuthenticatedPrincipal
+from app.modules.auth.presentation.dependencies.auth_deps import get_current_principal
+from app.modules.auth.infrastructure.cache.revoked_token_filter import RevokedTokenFilter
+from app.shared.infrastructure.bloom_filter import BloomFilter
+
+
+def test_bloom_filter_false_positive_rate_stays_near_target():
+    bloom = BloomFilter(capacity=10_000, fp_rate=0.01)
+    members = [f"revogado-{i}" for i in range(10_000)]
+    for jti in members:
+        bloom.add(jti)
+
+    # Sem falso negativo
+    assert all(jti in bloom for jti in members)
+
+    probes = 50_000
+    false_positives = sum(f"valido-{i}" in bloom for i in range(probes))
+    assert false_positives / probes < 0.015
+    assert 0.005 < bloom.estimated_fp_rate() < 0.015
+
+    # ~1,2 byte por item para 1%
+    assert bloom.size_bytes < 12_000
+
+
+def test_bloom_filter_over_capacity_reports_higher_rate():
+    bloom = BloomFilter(capacity=1_000, fp_rate=0.01)
+    for i in range(3_000):
+        bloom.add(f"revogado-{i}")
+
+    assert bloom.estimated_fp_rate() > 0.1
+    assert bloom.stats()["items"] == 3_000
+
+
+class _IndexRedis:
+    """
+    Redis mínimo para a reconstrução: devolve o índice de revogações e,
+    enquanto a "leitura" está em andamento, roda `during_read`.
+    """
+
+    def __init__(self, revoked, during_read=None):
+        self.revoked = revoked
+        self.during_read = during_read
+
+    def pipeline(self, transaction=True):
+        return _IndexPipeline(self)
+
+
+class _IndexPipeline:
+    def __init__(self, redis: _IndexRedis):
+        self._redis = redis
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def zremrangebyscore(self, *args):
+        pass
+
+    def zrange(self, *args):
+        pass
+
+    async def execute(self):
+        await asyncio.sleep(0)
+        if self._redis.during_read is not None:
+            self._redis.during_read()
+        return [0, list(self._redis.revoked)]
+
+
+def _filter(redis) -> RevokedTokenFilter:
+    return RevokedTokenFilter(redis, capacity=1_000, fp_rate=0.001, rebuild_interval=60)
+
+
+def test_revocation_during_rebuild_survives_the_swap():
+    redis = _IndexRedis(["antigo"])
+    revoked = _filter(redis)
+    assert revoked.might_contain("qualquer")  # sem filtro: tudo vai ao Redis
+
+    asyncio.run(revoked.rebuild())
+    assert revoked.ready
+    assert revoked.might_contain("antigo")
+    assert not revoked.might_contain("novo")
+
+    # Publicado enquanto o índice é lido: não está no índice lido,
+    # mas tem de estar no filtro novo
+    redis.revoked = ["antigo"]
+    redis.during_read = lambda: revoked.add("novo")
+
+    assert asyncio.run(revoked.rebuild())
+    assert revoked.might_contain("novo")
+    assert revoked.might_contain("antigo")
+
+
+def test_rebuild_is_dropped_if_channel_was_lost_meanwhile():
+    redis = _IndexRedis(["antigo"])
+    revoked = _filter(redis)
+    redis.during_read = revoked._discard
+
+    assert not asyncio.run(revoked.rebuild())
+    assert not revoked.ready
+    assert revoked.stats() == {"ready": False}
+
+
+def test_filter_stats_endpoint(monkeypatch):
+    revoked = _filter(_IndexRedis([f"jti-{i}" for i in range(10)]))
+    asyncio.run(revoked.rebuild())
+    monkeypatch.setattr(
+        app.state, "container", SimpleNamespace(revoked_token_filter=revoked), raising=False
+    )
+
+    # Sem token a rota não responde
+    assert TestClient(app).get("/health/revoked-token-filter").status_code == 403
+
+    app.dependency_overrides[get_current_principal] = lambda: AuthenticatedPrincipal(user_id="1", is_active=True)
+    try:
+        body = TestClient(app).get("/health/revoked-token-filter").json()
+    finally:
+        app.dependency_overrides.clear()
+
+    assert body["ready"] is True
+    assert body["items"] == 10 and body["capacity"] == 1_000
+    assert body["size_bytes"] > 0
+    assert body["target_fp_rate"] == 0.001
+    assert 0 <= body["estimated_fp_rate"] < 0.001
@@ -0,0 +1,194 @@
+import asyncio
+import os
+import time
+import uuid
+
+import pytest
+from redis.asyncio import Redis
+
+from app.infra.redis.session_repository import RedisSessionRepository
+from app.modules.auth.domain.repositories.session_repository import RefreshRotation
+
+# Redis descartável (cada teste usa usuários e jtis aleatórios)
+TEST_REDIS_URL = os.getenv("TEST_REDIS_URL")
+
+pytestmark = pytest.mark.skipif(
+    not TEST_REDIS_URL, reason="TEST_REDIS_URL não definido (requer Redis)"
+)
+
+TTL = 3600
+
+
+def _id() -> str:
+    return uuid.uuid4().hex
+
+
+def _run(scenario, **repository_options):
+    async def wrapper():
+        redis = Redis.from_url(TEST_REDIS_URL, decode_responses=True)
+        try:
+            await scenario(RedisSessionRepository(redis, **repository_options), redis)
+        finally:
+            await redis.aclose()
+
+    asyncio.run(wrapper())
+
+
+async def _session_ids(repository: RedisSessionRepository, user_id: str) -> list[str]:
+    return [session.session_id for session in await repository.get_user_sessions(user_id)]
+
+
+# ─── Rotação do refresh token ────────────────────────────────────────────────
+
+
+def test_rotation_replaces_the_session():
+    async def scenario(repository, redis):
+        user, old, new = _id(), _id(), _id()
+        await repository.store_refresh_token(old, user, TTL)
+
+        assert await repository.rotate_refresh_token(old, user, new, TTL) is RefreshRotation.ROTATED
+
+        assert await _session_ids(repository, user) == [new]
+        assert await redis.get(f"refresh:{new}") == user
+        assert await redis.exists(f"refresh:{old}") == 0
+        assert 0 < await redis.ttl(f"used_refresh:{old}") <= TTL
+        assert await repository.get_session_epoch(user) == 0
+
+    _run(scenario)
+
+
+def test_reuse_revokes_all_sessions_and_bumps_epoch():
+    async def scenario(repository, redis):
+        user, old, new, other = _id(), _id(), _id(), _id()
+        await repository.store_refresh_token(old, user, TTL)
+        await repository.store_refresh_token(other, user, TTL)
+        await repository.rotate_refresh_token(old, user, new, TTL)
+
+        # O token antigo volta: alguém o copiou
+        assert await repository.rotate_refresh_token(old, user, _id(), TTL) is RefreshRotation.REUSED
+
+        assert await _session_ids(repository, user) == []
+        assert await repository.get_session_epoch(user) == 1
+
+        # Sessões que existiam deixam de valer, inclusive a recém-rotacionada
+        for jti in (new, other):
+            assert await repository.rotate_refresh_token(jti, user, _id(), TTL) is RefreshRotation.INVALID
+        assert await repository.get_session_epoch(user) == 1
+
+    _run(scenario)
+
+
+def test_token_of_another_user_is_invalid():
+    async def scenario(repository, redis):
+        owner, intruder, jti = _id(), _id(), _id()
+        await repository.store_refresh_token(jti, owner, TTL)
+
+        assert await repository.rotate_refresh_token(jti, intruder, _id(), TTL) is RefreshRotation.INVALID
+
+        # Nada muda para nenhum dos dois
+        assert await _session_ids(repository, owner) == [jti]
+        assert await _session_ids(repository, intruder) == []
+        assert await repository.get_session_epoch(owner) == 0
+        assert await repository.get_session_epoch(intruder) == 0
+        assert await repository.rotate_refresh_token(jti, owner, _id(), TTL) is RefreshRotation.ROTATED
+
+    _run(scenario)
+
+
+def test_unknown_token_is_invalid():
+    async def scenario(repository, redis):
+        user = _id()
+        assert await repository.rotate_refresh_token(_id(), user, _id(), TTL) is RefreshRotation.INVALID
+        assert await repository.get_session_epoch(user) == 0
+
+    _run(scenario)
+
+
+def test_concurrent_rotations_of_the_same_token():
+    async def scenario(repository, redis):
+        user, jti = _id(), _id()
+        await repository.store_refresh_token(jti, user, TTL)
+
+        results = await asyncio.gather(
+            repository.rotate_refresh_token(jti, user, _id(), TTL),
+            repository.rotate_refresh_token(jti, user, _id(), TTL),
+        )
+
+        # Só uma vence; a outra é tratada como reuso
+        assert sorted(result.value for result in results) == ["reused", "rotated"]
+        assert await _session_ids(repository, user) == []
+
+    _run(scenario)
+
+
+# ─── Índice de sessões ───────────────────────────────────────────────────────
+
+
+def test_session_cap_drops_the_oldest_session():
+    async def scenario(repository, redis):
+        user, first, second, third = _id(), _id(), _id(), _id()
+        for offset, jti in enumerate((first, second, third)):
+            await repository.store_refresh_token(jti, user, TTL + offset)
+
+        assert await _session_ids(repository, user) == [second, third]
+
+        # Fora do índice o refresh não vale mais, mesmo que a chave ainda exista
+        assert await repository.rotate_refresh_token(first, user, _id(), TTL) is RefreshRotation.INVALID
+        assert await repository.rotate_refresh_token(third, user, _id(), TTL) is RefreshRotation.ROTATED
+
+    _run(scenario, max_sessions=2)
+
+
+def test_expired_sessions_are_pruned_from_the_index():
+    async def scenario(repository, redis):
+        user, live, expired = _id(), _id(), _id()
+        await repository.store_refresh_token(live, user, TTL)
+        await redis.zadd(f"user_sessions:{user}", {expired: 1})
+
+        sessions = await repository.get_user_sessions(user)
+
+        assert [session.session_id for session in sessions] == [live]
+        assert await redis.zscore(f"user_sessions:{user}", expired) is None
+        assert 0 < await redis.ttl(f"user_sessions:{user}") <= TTL
+
+    _run(scenario)
+
+
+def test_legacy_set_index_is_migrated():
+    async def scenario(repository, redis):
+        user, short, long, gone = _id(), _id(), _id(), _id()
+        index = f"user_sessions:{user}"
+        await redis.set(f"refresh:{short}", user, ex=600)
+        await redis.set(f"refresh:{long}", user, ex=TTL)
+        await redis.sadd(index, short, long, gone)
+
+        before = time.time()
+        sessions = await repository.get_user_sessions(user)
+
+        # Cada sessão herda a expiração do seu refresh; sem refresh, sai
+        assert [session.session_id for session in sessions] == [short, long]
+        for session, ttl in zip(sessions, (600, TTL)):
+            assert abs(session.expires_at.timestamp() - (before + ttl)) <= 2
+        assert await redis.type(index) == "zset"
+        assert 0 < await redis.ttl(index) <= TTL
+
+    _run(scenario)
+
+
+def test_writes_on_a_legacy_index_migrate_it_first():
+    async def scenario(repository, redis):
+        user, legacy, new, stored = _id(), _id(), _id(), _id()
+        index = f"user_sessions:{user}"
+        await redis.set(f"refresh:{legacy}", user, ex=TTL)
+        await redis.sadd(index, legacy)
+
+        assert await repository.rotate_refresh_token(legacy, user, new, TTL) is RefreshRotation.ROTATED
+        assert await redis.type(index) == "zset"
+
+        await redis.delete(index)
+        await redis.sadd(index, new)
+        await repository.store_refresh_token(stored, user, TTL)
+
+        assert sorted(await _session_ids(repository, user)) == sorted([new, stored])
+
+    _run(scenario)
@@ -0,0 +1,65 @@
+import asyncio
+from datetime import datetime, timezone
+
+import httpx
+from fastapi import FastAPI
+
+from app.modules.auth.domain.read_models.authenticated_principal import AuthenticatedPrincipal
+from app.modules.auth.domain.read_models.session_info import SessionInfo
+from app.modules.auth.presentation.dependencies.auth_deps import (
+    get_current_principal,
+    get_session_repository,
+)
+from app.modules.auth.presentation.routes.auth_routes import router
+
+EXPIRES_AT = datetime(2030, 1, 15, 10, 30, tzinfo=timezone.utc)
+
+
+class _Sessions:
+    """Sessões em memória, por usuário (só o que a listagem consulta)."""
+
+    def __init__(self, sessions: dict[str, list[SessionInfo]]):
+        self.sessions = sessions
+
+    async def get_user_sessions(self, user_id: str) -> list[SessionInfo]:
+        return self.sessions.get(user_id, [])
+
+
+def _get(path: str, headers: dict) -> httpx.Response:
+    sessions = _Sessions(
+        {
+            "u1": [
+                SessionInfo(session_id="jti-1", expires_at=EXPIRES_AT),
+                SessionInfo(session_id="jti-2", expires_at=EXPIRES_AT),
+            ],
+            "u2": [SessionInfo(session_id="jti-3", expires_at=EXPIRES_AT)],
+        }
+    )
+
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[get_session_repository] = lambda: sessions
+    app.dependency_overrides[get_current_principal] = lambda: AuthenticatedPrincipal(
+        user_id="u1", is_active=True
+    )
+
+    async def request():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            return await client.get(path, headers=headers)
+
+    return asyncio.run(request())
+
+
+def test_list_sessions_returns_only_the_callers_sessions():
+    response = _get("/auth/sessions", {"Authorization": "Bearer token"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 2
+    assert [session["id"] for session in body["sessions"]] == ["jti-1", "jti-2"]
+    assert datetime.fromisoformat(body["sessions"][0]["expires_at"]) == EXPIRES_AT
+
+
+def test_list_sessions_requires_a_bearer_token():
+    assert _get("/auth/sessions", {}).status_code == 403
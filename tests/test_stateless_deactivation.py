@@ -0,0 +1,176 @@
+import asyncio
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.modules.auth.domain.entities.user_entity import UserEntity
+from app.modules.auth.domain.read_models.authenticated_principal import AuthenticatedPrincipal
+from app.modules.auth.domain.value_objects.email_vo import Email
+from app.modules.auth.domain.value_objects.name_vo import Name
+from app.modules.auth.domain.value_objects.password_vo import Password
+from app.modules.auth.infrastructure.repositories.jwt_service_impl import JwtServiceImpl
+from app.modules.auth.infrastructure.repositories.user_repository_impl import UserRepositoryImpl
+from app.modules.auth.infrastructure.security.jwt_handler import JWTHandler
+from app.modules.auth.presentation.dependencies.auth_deps import (
+    get_current_principal,
+    get_jwt_handler,
+    get_principal_from_claims,
+    get_session_repository,
+)
+from app.modules.auth.presentation.routes.auth_routes import router as auth_router
+from app.modules.customer.domain.entities.customer_entity import CustomerEntity
+from app.modules.customer.domain.value_objects.customer_email import CustomerEmail
+from app.modules.customer.domain.value_objects.customer_name import CustomerName
+from app.modules.customer.infrastructure.models.customer_model import CustomerModel
+from app.modules.customer.infrastructure.repositories.customer_repository_impl import (
+    CustomerRepositoryImpl,
+)
+from app.modules.customer.presentation.dependencies.customer_deps import get_customer_repository
+from app.modules.customer.presentation.routes.customer_routes import router as customer_router
+from app.shared.domain.value_objects.id_vo import UserId
+from app.shared.infrastructure.database.base import Base
+from app.shared.infrastructure.database.session import make_session_factory
+
+
+class _EpochSessions:
+    """Épocas de sessão e blacklist em memória (só o que o modo stateless consulta)."""
+
+    def __init__(self):
+        self.epochs: dict[str, int] = {}
+        self.blacklist: set[str] = set()
+        self.revoked_refresh: set[str] = set()
+
+    async def blacklist_access_token(self, jti: str, expires_at) -> None:
+        self.blacklist.add(jti)
+
+    async def is_access_token_blacklisted(self, jti: str) -> bool:
+        return jti in self.blacklist
+
+    async def revoke_refresh_token(self, jti: str, user_id: str) -> None:
+        self.revoked_refresh.add(jti)
+
+    async def get_session_epoch(self, user_id: str) -> int:
+        return self.epochs.get(user_id, 0)
+
+    async def revoke_all_sessions(self, user_id: str) -> None:
+        self.epochs[user_id] = self.epochs.get(user_id, 0) + 1
+
+
+USER = UserEntity(
+    id=UserId.new(),
+    nome=Name("Maria Silva"),
+    email=Email("maria@exemplo.com"),
+    password=Password("$argon2id$v=19$m=65536,t=3,p=4$" + "a" * 40),
+)
+
+
+def test_stateless_principal_is_rejected_after_deactivation(tmp_path):
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'users.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        session_factory = make_session_factory(engine)
+
+        sessions = _EpochSessions()
+        jwt_handler = JWTHandler()
+
+        app = FastAPI()
+        app.dependency_overrides[get_session_repository] = lambda: sessions
+        app.dependency_overrides[get_jwt_handler] = lambda: jwt_handler
+
+        @app.get("/me")
+        async def me(principal: AuthenticatedPrincipal = Depends(get_principal_from_claims)):
+            return {"user_id": principal.user_id}
+
+        try:
+            async with session_factory() as db:
+                user = await UserRepositoryImpl(db, session_repository=sessions).create(USER)
+
+            token = await JwtServiceImpl(jwt_handler, sessions).create_access_token(
+                str(user.id), is_active=True
+            )
+            headers = {"Authorization": f"Bearer {token}"}
+
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                assert (await client.get("/me", headers=headers)).status_code == 200
+
+                # Edição que mantém o usuário ativo não derruba a sessão
+                async with session_factory() as db:
+                    repository = UserRepositoryImpl(db, session_repository=sessions)
+                    user = await repository.update(user.change_name(Name("Maria Souza")))
+                assert (await client.get("/me", headers=headers)).status_code == 200
+
+                # O token ainda diz active=true, mas a época avançou
+                async with session_factory() as db:
+                    repository = UserRepositoryImpl(db, session_repository=sessions)
+                    await repository.update(user.deactivate())
+
+                response = await client.get("/me", headers=headers)
+                assert response.status_code == 401
+                assert response.json()["detail"] == "Sessão revogada"
+        finally:
+            await engine.dispose()
+
+    asyncio.run(scenario())
+
+
+CUSTOMER = CustomerEntity.create(
+    name=CustomerName("João Souza"),
+    email=CustomerEmail("joao@exemplo.com"),
+)
+
+
+def test_stateless_principal_is_rejected_after_logout(tmp_path):
+    async def scenario():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'customers.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(
+                CustomerModel.__table__.insert().values(CustomerModel.values_from_entity(CUSTOMER))
+            )
+        session_factory = make_session_factory(engine)
+
+        async def customer_repository():
+            async with session_factory() as db:
+                yield CustomerRepositoryImpl(db)
+
+        sessions = _EpochSessions()
+        jwt_handler = JWTHandler()
+
+        # AUTH_STATELESS ligado: rotas de clientes autenticam só pelas claims
+        app = FastAPI()
+        app.include_router(auth_router)
+        app.include_router(customer_router)
+        app.dependency_overrides[get_current_principal] = get_principal_from_claims
+        app.dependency_overrides[get_session_repository] = lambda: sessions
+        app.dependency_overrides[get_jwt_handler] = lambda: jwt_handler
+        app.dependency_overrides[get_customer_repository] = customer_repository
+
+        user_id = str(USER.id)
+        access_token = await JwtServiceImpl(jwt_handler, sessions).create_access_token(user_id)
+        refresh_token, refresh_jti = jwt_handler.create_refresh_token(user_id)
+        headers = {"Authorization": f"Bearer {access_token}"}
+        path = f"/customers/{CUSTOMER.id.value}"
+
+        try:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                assert (await client.get(path, headers=headers)).status_code == 200
+
+                response = await client.post(
+                    "/auth/logout", json={"refresh_token": refresh_token}, headers=headers
+                )
+                assert response.status_code == 204
+                assert sessions.revoked_refresh == {refresh_jti}
+
+                # Mesma época de sessão: só a blacklist derruba o token
+                assert sessions.epochs == {}
+                response = await client.get(path, headers=headers)
+                assert response.status_code == 401
+                assert response.json()["detail"] == "Token revogado"
+        finally:
+            await engine.dispose()
+
+    asyncio.run(scenario())
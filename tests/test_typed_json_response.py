@@ -0,0 +1,96 @@
+import json
+from datetime import datetime, timezone
+
+from fastapi.encoders import jsonable_encoder
+
+from app.modules.customer.application.dtos.customer_dtos import (
+    AddressOutputDTO,
+    CustomerListOutputDTO,
+    CustomerOutputDTO,
+    CustomerSummaryOutputDTO,
+)
+from app.modules.customer.domain.read_models.customer_rm import CustomerSummary
+from app.modules.customer.presentation.routes.customer_routes import (
+    _CUSTOMER_JSON,
+    _CUSTOMER_LIST_JSON,
+)
+from app.modules.customer.presentation.schemas.customer_schemas import (
+    CustomerListSchema,
+    CustomerResponseSchema,
+    CustomerSummarySchema,
+)
+from app.shared.presentation.responses.typed_json_response import TypedJSONResponse
+
+
+# O caminho rápido tem de produzir o mesmo JSON que o caminho antigo
+# (schema de resposta + jsonable_encoder do FastAPI)
+
+CREATED_AT = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+
+
+def _summary(i: int) -> CustomerSummary:
+    return CustomerSummary(
+        customer_id=f"00000000-0000-0000-0000-{i:012d}",
+        name=f"Cliente Ação {i}",
+        email=f"cliente{i}@exemplo.com",
+        phone=None if i % 2 else "11999999999",
+        is_active=bool(i % 3),
+        created_at=CREATED_AT,
+        relevance=0.5,
+    )
+
+
+def test_customer_list_matches_response_schema():
+    result = CustomerListOutputDTO(
+        items=[CustomerSummaryOutputDTO.from_read_model(_summary(i)) for i in range(3)],
+        total=3,
+        limit=50,
+        offset=0,
+        has_more=False,
+    )
+
+    expected = jsonable_encoder(
+        CustomerListSchema(
+            items=[CustomerSummarySchema(**item.model_dump()) for item in result.items],
+            total=result.total,
+            limit=result.limit,
+            offset=result.offset,
+            has_more=result.has_more,
+            next_cursor=result.next_cursor,
+        )
+    )
+
+    response = TypedJSONResponse(result, _CUSTOMER_LIST_JSON)
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == expected
+    assert "relevance" not in response.body.decode()
+
+
+def test_customer_matches_response_schema():
+    result = CustomerOutputDTO(
+        customer_id="00000000-0000-0000-0000-000000000001",
+        name="Maria Silva",
+        email="maria@exemplo.com",
+        phone="11999999999",
+        document="12345678909",
+        address=AddressOutputDTO(
+            street="Rua das Flores",
+            number="123",
+            complement=None,
+            neighborhood="Centro",
+            city="São Paulo",
+            state="SP",
+            zip_code="01310100",
+        ),
+        notes=None,
+        is_active=True,
+        created_at=CREATED_AT,
+        updated_at=CREATED_AT,
+        version=2,
+    )
+
+    response = TypedJSONResponse(result, _CUSTOMER_JSON, status_code=201)
+
+    assert response.status_code == 201
+    assert json.loads(response.body) == jsonable_encoder(CustomerResponseSchema(**result.model_dump()))